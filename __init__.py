@@ -1 +1,21 @@
-from .grafo import Grafo
\ No newline at end of file
+from .grafo import Grafo, VisaoGrafo
+from .adjacencia import AdjacenciaCSR, AdjacenciaDict
+from .matriz import MatrizDensa, MatrizEsparsa
+from .carregador import ListaArestas, iterar_blocos_arestas, ler_arestas
+from .estatisticas import EstatisticasGrafo, MetadadosPesos
+from .cache import ArvoreCaminhos, CacheArvores, CacheArvoresPorThread
+from .consultas import ExecutorConsultas
+from .caminhos import CicloNegativo
+from .distancias import floyd_warshall_blocos
+from .analise import centralidade_grau, centralidade_proximidade, nucleos_k, pagerank
+from .arvore_geradora import kruskal, prim
+from .exportacao import exportar_csv, exportar_matrix_market, exportar_npz
+from .metricas import Metricas, instrumentar
+from .resultados import (
+    MatrizDistancias, ResultadoBusca, ResultadoCaminho, ResultadoCaminhos, ResultadoComponentes, ResultadoPageRank,
+    ResultadoArvoreGeradora,
+)
+from .componentes import (
+    UniaoBusca, componentes_da_adjacencia, componentes_de_arestas, componentes_fortes, uniao_da_adjacencia,
+)
+from .vertices import TabelaVertices
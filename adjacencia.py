@@ -0,0 +1,548 @@
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from itertools import accumulate
+import sys
+from types import MappingProxyType
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele a construção usa apenas a biblioteca padrão
+    np = None
+
+# Linha devolvida pelo `AdjacenciaDict` para vértices sem arestas, sem inserir a chave
+_LINHA_VAZIA = MappingProxyType({})
+
+
+def _tipo_indice(qtd_indices):
+    """
+    Escolhe o typecode de `array` usado para guardar ids de vértices.
+
+    Ids que cabem em 32 bits ocupam metade da memória de um inteiro de 64 bits.
+    """
+    return 'i' if qtd_indices < 2**31 else 'q'
+
+
+def _eh_indice(v):
+    return isinstance(v, int) or np is not None and isinstance(v, np.integer)
+
+
+class LinhaCSR:
+    """
+    Visão somente leitura da lista de adjacência de um vértice armazenado em CSR.
+
+    Imita a interface de um dicionário `{vizinho: peso}` para que os algoritmos
+    do `Grafo` funcionem sem alterações sobre qualquer um dos backends. As fatias
+    são `memoryview`s, portanto nenhum dado é copiado. A iteração segue a ordem da
+    linha; a consulta de um vizinho (`linha[v]`, `v in linha`) é uma busca binária no
+    índice ordenado da adjacência (veja `AdjacenciaCSR._indice_ordenado`).
+    """
+
+    __slots__ = ('_vizinhos', '_pesos', '_adjacencia', '_inicio')
+
+    def __init__(self, vizinhos, pesos, adjacencia, inicio):
+        self._vizinhos = vizinhos
+        self._pesos = pesos
+        self._adjacencia = adjacencia
+        self._inicio = inicio
+
+    def __iter__(self):
+        return iter(self._vizinhos)
+
+    def __len__(self):
+        return len(self._vizinhos)
+
+    def _posicao(self, v):
+        # Posição de `v` na linha, ou -1 se ele não for vizinho
+        if not self._vizinhos or not _eh_indice(v):
+            return -1
+        ordenados, posicoes = self._adjacencia._indice_ordenado()
+        inicio = self._inicio
+        fim = inicio + len(self._vizinhos)
+        i = bisect_left(ordenados, v, inicio, fim)
+        if i < fim and ordenados[i] == v:
+            return posicoes[i] - inicio
+        return -1
+
+    def __contains__(self, v):
+        return self._posicao(v) >= 0
+
+    def __getitem__(self, v):
+        i = self._posicao(v)
+        if i < 0:
+            raise KeyError(v)
+        return self._pesos[i]
+
+    def get(self, v, padrao=None):
+        try:
+            return self[v]
+        except KeyError:
+            return padrao
+
+    def keys(self):
+        return iter(self._vizinhos)
+
+    def values(self):
+        return iter(self._pesos)
+
+    def items(self):
+        return zip(self._vizinhos, self._pesos)
+
+
+class AdjacenciaCSR:
+    """
+    Armazena a adjacência do grafo no formato CSR (compressed sparse row).
+
+    Os vizinhos do vértice `v` ocupam o intervalo `offsets[v]:offsets[v+1]` dos buffers
+    `vizinhos` e `pesos`. Cada aresta custa um id e um float em buffers contíguos,
+    em vez de uma entrada de dicionário Python.
+
+    A classe expõe a mesma interface de leitura de um `defaultdict(dict)`
+    (`grafo[v]`, `v in grafo`, `keys()`, `values()`, `items()`), de forma que o
+    `Grafo` pode alternar entre os backends sem mudar os algoritmos.
+
+    Alterações (`adicionar`, `remover`) não reescrevem os buffers: a linha de cada vértice
+    alterado é copiada para um dicionário de sobreposição, consultado antes dos buffers.
+    Quando a sobreposição cresce além de `FRACAO_COMPACTACAO` das entradas, ou quando
+    `compactar` é chamado, tudo é reconstruído em CSR. Ler os buffers (`buffers()` ou as
+    propriedades abaixo, cada uma equivalente a uma chamada de `buffers()`) nunca altera a
+    estrutura: com alterações pendentes, a leitura devolve uma cópia compactada, e a adjacência
+    pode ser consultada por várias threads ao mesmo tempo.
+
+    Atributos:
+        offsets (buffer): Posição inicial da lista de vizinhos de cada vértice (qtd_indices + 1 posições).
+        vizinhos (buffer): Ids dos vizinhos de todos os vértices, em sequência.
+        pesos (buffer): Pesos das arestas, alinhados com `vizinhos`.
+        qtd_indices (int): Quantidade de posições de vértice (maior id + 1).
+        dirigido (bool): Se True, cada aresta u->v aparece apenas na linha de `u`.
+    """
+
+    # Fração das entradas que pode ficar na sobreposição antes de uma compactação automática
+    FRACAO_COMPACTACAO = 0.25
+    MINIMO_COMPACTACAO = 4096
+
+    def __init__(self, offsets, vizinhos, pesos, dirigido=False):
+        self._definir_buffers(offsets, vizinhos, pesos)
+        self.qtd_indices = self._qtd_base
+        self.dirigido = dirigido
+
+    def _definir_buffers(self, offsets, vizinhos, pesos):
+        self._buffer_offsets = offsets
+        self._buffer_vizinhos = vizinhos
+        self._buffer_pesos = pesos
+        self._offsets = memoryview(offsets)
+        self._vizinhos = memoryview(vizinhos)
+        self._pesos = memoryview(pesos)
+        self._qtd_base = len(offsets) - 1
+        self._ordenado = None
+        self._alteradas = {}
+        self._entradas_alteradas = 0
+        self._qtd_presentes = None
+
+    @property
+    def offsets(self):
+        return self.buffers()[0]
+
+    @property
+    def vizinhos(self):
+        return self.buffers()[1]
+
+    @property
+    def pesos(self):
+        return self.buffers()[2]
+
+    def buffers(self):
+        """
+        Retorna (offsets, vizinhos, pesos) com todas as arestas, sem alterar a adjacência.
+
+        Sem alterações pendentes são os próprios buffers, sem cópia. Caso contrário os buffers
+        são reconstruídos em O(V + E) a partir da sobreposição, mas não substituem os atuais:
+        para incorporar as alterações de vez, chame `compactar`.
+        """
+        if self.compactada:
+            return self._buffer_offsets, self._buffer_vizinhos, self._buffer_pesos
+        novo = AdjacenciaCSR.de_adjacencia(self, self.qtd_indices)
+        return novo._buffer_offsets, novo._buffer_vizinhos, novo._buffer_pesos
+
+    @classmethod
+    def de_arestas(cls, origens, destinos, pesos, qtd_indices, dirigido=False):
+        """
+        Constrói a adjacência CSR a partir de uma lista de arestas.
+
+        Em grafos não direcionados cada aresta é espelhada nos dois vértices; com `dirigido`,
+        a aresta u->v entra apenas na linha de `u` (a adjacência reversa é montada trocando
+        `origens` e `destinos`). Arestas repetidas são unificadas como no backend de dicionários:
+        o vizinho mantém a posição da primeira ocorrência e o peso da última.
+
+        Parâmetros:
+            origens (sequence): Vértice inicial de cada aresta.
+            destinos (sequence): Vértice final de cada aresta.
+            pesos (sequence): Peso de cada aresta.
+            qtd_indices (int): Quantidade de posições de vértice (maior id + 1).
+            dirigido (bool): Não espelha as arestas.
+        """
+
+        if np is not None:
+            return cls._de_arestas_numpy(origens, destinos, pesos, qtd_indices, dirigido)
+
+        # Contagem de graus (laços contam uma única vez, como no dicionário)
+        graus = array('q', bytes(8 * qtd_indices))
+        for u, v in zip(origens, destinos):
+            graus[u] += 1
+            if u != v and not dirigido:
+                graus[v] += 1
+
+        offsets = array('q', [0])
+        offsets.extend(accumulate(graus))
+        total = offsets[-1]
+
+        # Preenchimento estável: cada linha mantém a ordem de leitura das arestas
+        tipo = _tipo_indice(qtd_indices)
+        vizinhos = array(tipo, bytes(array(tipo).itemsize * total))
+        pesos_csr = array('d', bytes(8 * total))
+        cursor = array('q', offsets[:-1])
+        for u, v, peso in zip(origens, destinos, pesos):
+            k = cursor[u]
+            vizinhos[k] = v
+            pesos_csr[k] = peso
+            cursor[u] = k + 1
+            if u != v and not dirigido:
+                k = cursor[v]
+                vizinhos[k] = u
+                pesos_csr[k] = peso
+                cursor[v] = k + 1
+
+        # Remove vizinhos repetidos compactando os buffers no próprio lugar
+        dono = array('q', [-1]) * qtd_indices
+        posicao = array('q', bytes(8 * qtd_indices))
+        escrita = 0
+        novos_offsets = array('q', [0])
+        for u in range(qtd_indices):
+            for k in range(offsets[u], offsets[u + 1]):
+                v = vizinhos[k]
+                if dono[v] == u:
+                    pesos_csr[posicao[v]] = pesos_csr[k]
+                else:
+                    dono[v] = u
+                    posicao[v] = escrita
+                    vizinhos[escrita] = v
+                    pesos_csr[escrita] = pesos_csr[k]
+                    escrita += 1
+            novos_offsets.append(escrita)
+        del vizinhos[escrita:]
+        del pesos_csr[escrita:]
+
+        return cls(novos_offsets, vizinhos, pesos_csr, dirigido)
+
+    @classmethod
+    def de_adjacencia(cls, adjacencia, qtd_indices):
+        """
+        Constrói a adjacência CSR copiando as linhas de outra adjacência (por exemplo, um `AdjacenciaDict`).
+
+        A ordem dos vizinhos de cada vértice é preservada.
+
+        Parâmetros:
+            adjacencia (mapping): Estrutura no formato `{vertice: {vizinho: peso}}`.
+            qtd_indices (int): Quantidade de posições de vértice (maior id + 1).
+        """
+
+        offsets = array('q', [0])
+        vizinhos = array(_tipo_indice(qtd_indices))
+        pesos = array('d')
+        for v in range(qtd_indices):
+            if v in adjacencia:
+                linha = adjacencia[v]
+                vizinhos.extend(linha.keys())
+                pesos.extend(linha.values())
+            offsets.append(len(vizinhos))
+        return cls(offsets, vizinhos, pesos, getattr(adjacencia, 'dirigido', False))
+
+    @classmethod
+    def _de_arestas_numpy(cls, origens, destinos, pesos, qtd_indices, dirigido=False):
+        """
+        Mesma construção de `de_arestas`, feita com ordenações vetorizadas do NumPy.
+        """
+
+        origens = np.asarray(origens, dtype=np.int64)
+        destinos = np.asarray(destinos, dtype=np.int64)
+        pesos = np.asarray(pesos, dtype=np.float64)
+
+        # Cada aresta u-v gera as entradas u->v (sequência 2i) e v->u (sequência 2i+1)
+        nao_laco = origens != destinos
+        if dirigido:
+            nao_laco = np.zeros(len(origens), dtype=bool)
+        sequencia = np.arange(len(origens), dtype=np.int64) * 2
+        linha = np.concatenate((origens, destinos[nao_laco]))
+        coluna = np.concatenate((destinos, origens[nao_laco]))
+        peso = np.concatenate((pesos, pesos[nao_laco]))
+        sequencia = np.concatenate((sequencia, sequencia[nao_laco] + 1))
+
+        # Unifica entradas repetidas: posição da primeira ocorrência, peso da última
+        ordem = np.lexsort((sequencia, coluna, linha))
+        linha, coluna, peso, sequencia = linha[ordem], coluna[ordem], peso[ordem], sequencia[ordem]
+        if len(linha):
+            novo = np.empty(len(linha), dtype=bool)
+            novo[0] = True
+            novo[1:] = (linha[1:] != linha[:-1]) | (coluna[1:] != coluna[:-1])
+            inicio = np.flatnonzero(novo)
+            fim = np.append(inicio[1:], len(linha)) - 1
+            linha, coluna, sequencia, peso = linha[inicio], coluna[inicio], sequencia[inicio], peso[fim]
+
+        ordem = np.lexsort((sequencia, linha))
+        offsets = np.zeros(qtd_indices + 1, dtype=np.int64)
+        np.cumsum(np.bincount(linha, minlength=qtd_indices), out=offsets[1:])
+        vizinhos = coluna[ordem].astype(np.int32 if _tipo_indice(qtd_indices) == 'i' else np.int64)
+
+        return cls(offsets, vizinhos, np.ascontiguousarray(peso[ordem]), dirigido)
+
+    def grau(self, v):
+        linha = self._alteradas.get(v)
+        if linha is not None:
+            return len(linha)
+        if 0 <= v < self._qtd_base:
+            return self._offsets[v + 1] - self._offsets[v]
+        return 0
+
+    def bytes_utilizados(self):
+        """
+        Retorna a memória ocupada pelos buffers CSR, em bytes (sem contar a sobreposição de alterações).
+        """
+        return self._offsets.nbytes + self._vizinhos.nbytes + self._pesos.nbytes
+
+    def _indice_ordenado(self):
+        """
+        Retorna (ordenados, posicoes): os vizinhos de cada linha dos buffers em ordem crescente e,
+        para cada um, a sua posição em `vizinhos`.
+
+        As linhas guardam os vizinhos na ordem de leitura, que as buscas preservam; este índice
+        auxiliar permite consultar o peso de uma aresta por busca binária, em O(log grau). Ele é
+        montado no primeiro uso, em O(E log E), e descartado junto com os buffers.
+        """
+        ordenado = self._ordenado
+        if ordenado is None:
+            if np is not None:
+                offsets = np.asarray(self._offsets, dtype=np.int64)
+                vizinhos = np.asarray(self._vizinhos)[:offsets[-1]]
+                linha = np.repeat(np.arange(self._qtd_base, dtype=np.int64), np.diff(offsets))
+                ordem = np.lexsort((vizinhos, linha))
+                ordenados = array('q', vizinhos[ordem].astype(np.int64).tobytes())
+                posicoes = array('q', ordem.astype(np.int64).tobytes())
+            else:
+                offsets, vizinhos = self._offsets, self._vizinhos
+                posicoes = array('q')
+                for v in range(self._qtd_base):
+                    posicoes.extend(sorted(range(offsets[v], offsets[v + 1]), key=vizinhos.__getitem__))
+                ordenados = array('q', (vizinhos[k] for k in posicoes))
+            # Atribuição única: leitores simultâneos veem o índice completo ou nenhum
+            ordenado = self._ordenado = (memoryview(ordenados), memoryview(posicoes))
+        return ordenado
+
+    def _linha_editavel(self, v):
+        linha = self._alteradas.get(v)
+        if linha is None:
+            linha = self._alteradas[v] = dict(self[v].items())
+            self._entradas_alteradas += len(linha)
+        return linha
+
+    def adicionar(self, u, v, peso):
+        """
+        Insere a aresta u-v (ou atualiza seu peso) nas linhas dos dois vértices (só na de `u`, se dirigido).
+
+        Retorna:
+            float | None: O peso anterior da aresta, ou None se ela não existia.
+        """
+        self.qtd_indices = max(self.qtd_indices, u + 1, v + 1)
+        linha = self._linha_editavel(u)
+        anterior = linha.get(v)
+        linha[v] = peso
+        espelhar = u != v and not self.dirigido
+        if espelhar:
+            self._linha_editavel(v)[u] = peso
+        if anterior is None:
+            self._entradas_alteradas += 2 if espelhar else 1
+        self._qtd_presentes = None
+        self._verificar_compactacao()
+        return anterior
+
+    def remover(self, u, v):
+        """
+        Remove a aresta u-v das linhas dos dois vértices (só da de `u`, se dirigido).
+
+        Retorna:
+            float: O peso da aresta removida.
+
+        Exceções:
+            KeyError: Se a aresta não existir.
+        """
+        if v not in self[u]:
+            raise KeyError((u, v))
+        peso = self._linha_editavel(u).pop(v)
+        if u != v and not self.dirigido:
+            self._linha_editavel(v).pop(u)
+        self._qtd_presentes = None
+        return peso
+
+    def _verificar_compactacao(self):
+        limite = max(self.MINIMO_COMPACTACAO, self.FRACAO_COMPACTACAO * len(self._vizinhos))
+        if self._entradas_alteradas > limite:
+            self.compactar()
+
+    @property
+    def compactada(self):
+        """
+        Indica que não há alterações pendentes na sobreposição: os buffers já descrevem o grafo todo.
+        """
+        return not self._alteradas and self.qtd_indices == self._qtd_base
+
+    def compactar(self):
+        """
+        Incorpora as alterações pendentes aos buffers CSR, reconstruindo-os em O(V + E).
+        """
+        if not self.compactada:
+            self._definir_buffers(*self.buffers())
+
+    def __getitem__(self, v):
+        linha = self._alteradas.get(v)
+        if linha is not None:
+            return linha
+        if 0 <= v < self._qtd_base:
+            inicio, fim = self._offsets[v], self._offsets[v + 1]
+        else:
+            inicio = fim = 0
+        return LinhaCSR(self._vizinhos[inicio:fim], self._pesos[inicio:fim], self, inicio)
+
+    def __contains__(self, v):
+        if not _eh_indice(v):
+            return False
+        linha = self._alteradas.get(v)
+        if linha is not None:
+            return len(linha) > 0
+        return 0 <= v < self._qtd_base and self._offsets[v + 1] > self._offsets[v]
+
+    def __iter__(self):
+        if self._alteradas:
+            return (v for v in range(self.qtd_indices) if v in self)
+        offsets = self._offsets
+        return (v for v in range(self._qtd_base) if offsets[v + 1] > offsets[v])
+
+    def __len__(self):
+        # Calculado sob demanda para que abrir um snapshot mapeado em memória não percorra os offsets
+        if self._qtd_presentes is None:
+            self._qtd_presentes = sum(1 for _ in self)
+        return self._qtd_presentes
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        return (self[v] for v in self)
+
+    def items(self):
+        return ((v, self[v]) for v in self)
+
+
+class AdjacenciaDict(defaultdict):
+    """
+    Backend original do `Grafo`: um `defaultdict(dict)` no formato `{vertice: {vizinho: peso}}`.
+
+    Mantido como opção para comparar consumo de memória e desempenho com o `AdjacenciaCSR`.
+    Ler a linha de um vértice sem arestas (por exemplo, um sumidouro de um grafo dirigido)
+    devolve uma linha vazia somente leitura, sem inserir a chave: as consultas não alteram o
+    grafo. Só `adicionar` cria linhas.
+
+    Atributos:
+        qtd_indices (int): Quantidade de posições de vértice (maior id + 1).
+        dirigido (bool): Se True, cada aresta u->v aparece apenas na linha de `u`.
+    """
+
+    def __init__(self, dirigido=False):
+        super().__init__(dict)
+        self.qtd_indices = 0
+        self.dirigido = dirigido
+
+    def __missing__(self, v):
+        return _LINHA_VAZIA
+
+    @classmethod
+    def de_arestas(cls, origens, destinos, pesos, qtd_indices, dirigido=False):
+        """
+        Constrói o dicionário de adjacência a partir de uma lista de arestas.
+
+        Parâmetros:
+            origens (sequence): Vértice inicial de cada aresta.
+            destinos (sequence): Vértice final de cada aresta.
+            pesos (sequence): Peso de cada aresta.
+            qtd_indices (int): Quantidade de posições de vértice (maior id + 1).
+            dirigido (bool): Não espelha as arestas (u->v entra apenas na linha de `u`).
+        """
+
+        adjacencia = cls(dirigido)
+        adjacencia.qtd_indices = qtd_indices
+        for u, v, peso in zip(origens, destinos, pesos):
+            adjacencia.setdefault(u, {})[v] = peso
+            if not dirigido:
+                adjacencia.setdefault(v, {})[u] = peso
+        return adjacencia
+
+    @classmethod
+    def de_adjacencia(cls, adjacencia, qtd_indices):
+        """
+        Constrói o dicionário de adjacência copiando as linhas de outra adjacência (por exemplo, um `AdjacenciaCSR`).
+
+        Parâmetros:
+            adjacencia (mapping): Estrutura no formato `{vertice: {vizinho: peso}}`.
+            qtd_indices (int): Quantidade de posições de vértice (maior id + 1).
+        """
+
+        resultado = cls(getattr(adjacencia, 'dirigido', False))
+        resultado.qtd_indices = qtd_indices
+        for v, linha in adjacencia.items():
+            resultado[v] = dict(linha.items())
+        return resultado
+
+    def grau(self, v):
+        return len(self[v]) if v in self else 0
+
+    def adicionar(self, u, v, peso):
+        """
+        Insere a aresta u-v (ou atualiza seu peso). Retorna o peso anterior, ou None.
+        """
+        self.qtd_indices = max(self.qtd_indices, u + 1, v + 1)
+        linha = self.setdefault(u, {})
+        anterior = linha.get(v)
+        linha[v] = peso
+        if not self.dirigido:
+            self.setdefault(v, {})[u] = peso
+        return anterior
+
+    def remover(self, u, v):
+        """
+        Remove a aresta u-v e retorna seu peso. Vértices que ficam sem vizinhos deixam o dicionário.
+
+        Exceções:
+            KeyError: Se a aresta não existir.
+        """
+        if u not in self or v not in self[u]:
+            raise KeyError((u, v))
+        peso = self[u].pop(v)
+        if not self.dirigido and v in self:
+            self[v].pop(u, None)
+        for w in (u, v):
+            if w in self and not self[w]:
+                del self[w]
+        return peso
+
+    def compactar(self):
+        """
+        Sem efeito: o dicionário é alterado diretamente. Existe para manter a mesma interface do CSR.
+        """
+
+    def bytes_utilizados(self):
+        """
+        Retorna uma estimativa da memória ocupada pelos dicionários e seus valores, em bytes.
+        """
+        total = sys.getsizeof(self)
+        for v, vizinhos in self.items():
+            total += sys.getsizeof(v) + sys.getsizeof(vizinhos)
+            total += sum(sys.getsizeof(u) + sys.getsizeof(peso) for u, peso in vizinhos.items())
+        return total
@@ -0,0 +1,260 @@
+from array import array
+import math
+
+try:
+    from .adjacencia import AdjacenciaCSR
+    from .caminhos import preencher_distancias
+    from .percursos import largura_por_niveis
+except ImportError:
+    from adjacencia import AdjacenciaCSR
+    from caminhos import preencher_distancias
+    from percursos import largura_por_niveis
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: necessário apenas para as medidas deste módulo
+    np = None
+
+
+def _exigir_numpy(nome):
+    if np is None:
+        raise ImportError(f'{nome} requer o pacote numpy')
+
+
+def _como_csr(adjacencia):
+    """
+    Retorna a adjacência no backend CSR compactado, convertendo o dicionário (ou copiando um CSR
+    com alterações pendentes) uma única vez.
+    """
+    if isinstance(adjacencia, AdjacenciaCSR) and adjacencia.compactada:
+        return adjacencia
+    return AdjacenciaCSR.de_adjacencia(adjacencia, adjacencia.qtd_indices)
+
+
+def _vetores_csr(adjacencia):
+    """
+    Retorna (offsets, vizinhos, pesos) da adjacência como vetores NumPy, só com as arestas em uso.
+    """
+    offsets, vizinhos, pesos = _como_csr(adjacencia).buffers()
+    offsets = np.asarray(offsets, dtype=np.int64)
+    qtd_arestas = int(offsets[-1]) if len(offsets) else 0
+    return offsets, np.asarray(vizinhos)[:qtd_arestas], np.asarray(pesos)[:qtd_arestas]
+
+
+def pagerank(adjacencia, amortecimento=0.85, tolerancia=1e-6, max_iteracoes=100, ponderado=False, inicial=None):
+    """
+    Calcula o PageRank por iteração de potência, como produto matriz-vetor esparso sobre o CSR.
+
+    Cada iteração divide o PageRank de cada vértice entre as suas arestas de saída (uma leitura
+    por aresta, `contribuicao[origem]`) e soma o que chega a cada destino com `numpy.bincount`;
+    não há laço em Python por vértice. A massa dos vértices sem arestas de saída e o salto
+    aleatório (1 - amortecimento) são espalhados igualmente entre todos os vértices. A iteração
+    para quando a diferença L1 entre duas iterações fica abaixo de `qtd_indices * tolerancia`
+    (o critério do NetworkX) ou ao atingir `max_iteracoes`.
+
+    Em grafos não dirigidos cada aresta é percorrida nos dois sentidos.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Arestas de saída (outros backends são convertidos para CSR).
+        amortecimento (float): Probabilidade de seguir uma aresta em vez de saltar (padrão: 0.85).
+        tolerancia (float): Tolerância por vértice do critério de parada.
+        max_iteracoes (int): Limite de iterações.
+        ponderado (bool): Divide o PageRank proporcionalmente aos pesos das arestas.
+        inicial (sequence): Valores iniciais por índice (normalizados para somar 1); padrão: uniforme.
+
+    Retorna:
+        tuple: (valores, iteracoes, erro, convergiu), com `valores` indexado pelo índice denso.
+
+    Exceções:
+        ValueError: Se os parâmetros forem inválidos ou, com `ponderado`, houver pesos negativos.
+        ImportError: Se o NumPy não estiver instalado.
+    """
+
+    _exigir_numpy('pagerank')
+    if not 0 <= amortecimento < 1:
+        raise ValueError(f'O amortecimento deve estar em [0, 1): {amortecimento}')
+    if max_iteracoes < 1:
+        raise ValueError(f'max_iteracoes deve ser positivo: {max_iteracoes}')
+
+    offsets, vizinhos, pesos = _vetores_csr(adjacencia)
+    n = len(offsets) - 1
+    if n <= 0:
+        return np.zeros(0), 0, 0.0, True
+
+    graus = np.diff(offsets)
+    # Vértice de origem de cada aresta, calculado uma vez: a leitura por aresta de cada iteração
+    origens = np.repeat(np.arange(n), graus)
+    if ponderado:
+        pesos = pesos.astype(np.float64, copy=False)
+        if len(pesos) and pesos.min() < 0:
+            raise ValueError('O PageRank ponderado não admite pesos negativos')
+        saida = np.bincount(origens, weights=pesos, minlength=n)
+    else:
+        saida = graus.astype(np.float64)
+    sem_saida = saida == 0
+    inverso = np.divide(1.0, saida, out=np.zeros(n), where=~sem_saida)
+
+    if inicial is None:
+        valores = np.full(n, 1.0 / n)
+    else:
+        valores = np.asarray(inicial, dtype=np.float64)
+        if valores.shape != (n,) or valores.min() < 0 or valores.sum() <= 0:
+            raise ValueError(f'Os valores iniciais devem ser {n} números não negativos com soma positiva')
+        valores = valores / valores.sum()
+
+    limite = n * tolerancia
+    erro = math.inf
+    for iteracao in range(1, max_iteracoes + 1):
+        por_aresta = (valores * inverso)[origens]
+        if ponderado:
+            por_aresta *= pesos
+        # Sem arestas o `bincount` devolve inteiros, mesmo com pesos
+        novos = np.bincount(vizinhos, weights=por_aresta, minlength=n).astype(np.float64, copy=False)
+        novos *= amortecimento
+        novos += (amortecimento * valores[sem_saida].sum() + 1.0 - amortecimento) / n
+        erro = float(np.abs(novos - valores).sum())
+        valores = novos
+        if erro < limite:
+            return valores, iteracao, erro, True
+    return valores, max_iteracoes, erro, False
+
+
+def centralidade_grau(graus, qtd_indices):
+    """
+    Normaliza os graus pela maior quantidade possível de vizinhos (qtd_indices - 1).
+
+    Parâmetros:
+        graus (sequence): Grau de cada vértice, indexado pelo índice denso.
+        qtd_indices (int): Quantidade de índices de vértice.
+
+    Retorna:
+        numpy.ndarray: Centralidade de grau de cada vértice (float64).
+    """
+
+    _exigir_numpy('centralidade_grau')
+    graus = np.asarray(graus, dtype=np.float64)
+    return graus / (qtd_indices - 1) if qtd_indices > 1 else np.zeros(len(graus))
+
+
+def centralidade_proximidade(adjacencia, vertices=None, unitario=True, potenciais=None):
+    """
+    Calcula a centralidade de proximidade (closeness) de cada vértice.
+
+    Para cada vértice v, com r vértices alcançáveis (contando v) à distância total S, a
+    proximidade é (r - 1) / S, escalada por (r - 1) / (n - 1) (correção de Wasserman e Faust),
+    de modo que grafos desconexos não favoreçam componentes pequenos. Vértices que não alcançam
+    ninguém ficam com 0.
+
+    Sem pesos, cada busca é a BFS por níveis (`largura_por_niveis`), vetorizada sobre o CSR, e a
+    soma dos níveis sai dos próprios vetores da busca. Com pesos, o Dijkstra preenche um vetor
+    tipado reaproveitado entre as origens, e soma e contagem são reduções do NumPy sobre ele.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência percorrida a partir de cada vértice
+            (em grafos dirigidos, a adjacência de entrada mede as distâncias *até* o vértice).
+        vertices (sequence): Índices dos vértices calculados (padrão: todos).
+        unitario (bool): Indica que todas as arestas têm peso 1.
+        potenciais (array): Potenciais de Johnson, para grafos com pesos negativos.
+
+    Retorna:
+        numpy.ndarray: Proximidade de cada vértice de `vertices`, na mesma ordem.
+
+    Exceções:
+        ImportError: Se o NumPy não estiver instalado.
+    """
+
+    _exigir_numpy('centralidade_proximidade')
+    adjacencia = _como_csr(adjacencia)
+    n = adjacencia.qtd_indices
+    indices = range(n) if vertices is None else vertices
+    valores = np.zeros(len(indices))
+    if n <= 1:
+        return valores
+
+    if not unitario:
+        distancias = array('d', [math.inf]) * n
+        vista = np.frombuffer(distancias, dtype=np.float64)
+
+    for posicao, v in enumerate(indices):
+        if unitario:
+            ordem, niveis, _ = largura_por_niveis(adjacencia, v)
+            alcancados, total = len(ordem), float(niveis.sum())
+        else:
+            preencher_distancias(adjacencia, v, distancias, False, potenciais)
+            finitas = vista[vista != math.inf]
+            alcancados, total = len(finitas), float(finitas.sum())
+            vista.fill(math.inf)
+        if total > 0:
+            valores[posicao] = (alcancados - 1) ** 2 / (total * (n - 1))
+    return valores
+
+
+def nucleos_k(adjacencia, reversa=None):
+    """
+    Calcula o número de núcleo (k-core) de cada vértice pelo algoritmo de Batagelj e Zaversnik.
+
+    O número de núcleo de v é o maior k tal que v pertence a um subgrafo em que todos os vértices
+    têm grau pelo menos k. Os vértices ficam em um vetor ordenado por grau, com o início de cada
+    faixa de grau guardado à parte (baldes); removendo sempre o de menor grau, cada vizinho com
+    grau maior desce uma faixa com uma troca de posições, em O(1). O total é O(V + E).
+
+    A montagem dos graus e a ordenação inicial (por contagem) são vetorizadas; a remoção é
+    inerentemente sequencial e percorre listas Python, que são mais rápidas que o acesso
+    elemento a elemento aos vetores do NumPy. Laços são ignorados. Em grafos dirigidos, o grau
+    é o de entrada mais o de saída, como no NetworkX.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        reversa (AdjacenciaCSR | AdjacenciaDict): Arestas de entrada de um grafo dirigido.
+
+    Retorna:
+        numpy.ndarray: Número de núcleo de cada vértice (int64), indexado pelo índice denso.
+
+    Exceções:
+        ImportError: Se o NumPy não estiver instalado.
+    """
+
+    _exigir_numpy('nucleos_k')
+    offsets, vizinhos, _ = _vetores_csr(adjacencia)
+    n = len(offsets) - 1
+    if n <= 0:
+        return np.zeros(0, dtype=np.int64)
+    origens = np.repeat(np.arange(n), np.diff(offsets))
+    if reversa is not None:
+        # Junta as arestas de saída e de entrada em um único CSR, agrupado por vértice
+        offsets_r, vizinhos_r, _ = _vetores_csr(reversa)
+        origens = np.concatenate((origens, np.repeat(np.arange(n), np.diff(offsets_r))))
+        vizinhos = np.concatenate((vizinhos, vizinhos_r))
+        ordem = np.argsort(origens, kind='stable')
+        origens, vizinhos = origens[ordem], vizinhos[ordem]
+    sem_laco = origens != vizinhos
+    origens, vizinhos = origens[sem_laco], vizinhos[sem_laco]
+
+    graus = np.bincount(origens, minlength=n)
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(graus, out=offsets[1:])
+    # Ordenação por contagem: `vert` em ordem de grau, `pos` a posição de cada vértice em `vert`
+    # e `inicio[g]` a primeira posição da faixa de grau g
+    vert = np.argsort(graus, kind='stable')
+    pos = np.empty(n, dtype=np.int64)
+    pos[vert] = np.arange(n)
+    inicio = np.zeros(int(graus.max()) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(graus)[:-1], out=inicio[1:])
+
+    grau, vert, pos, inicio = graus.tolist(), vert.tolist(), pos.tolist(), inicio.tolist()
+    linhas, vizinhos = offsets.tolist(), vizinhos.tolist()
+    for i in range(n):
+        v = vert[i]
+        grau_v = grau[v]
+        for u in vizinhos[linhas[v]:linhas[v + 1]]:
+            grau_u = grau[u]
+            if grau_u > grau_v:
+                # Troca u com o primeiro vértice da sua faixa e encolhe a faixa
+                pos_u, primeiro = pos[u], inicio[grau_u]
+                w = vert[primeiro]
+                if u != w:
+                    pos[u], pos[w] = primeiro, pos_u
+                    vert[pos_u], vert[primeiro] = w, u
+                inicio[grau_u] = primeiro + 1
+                grau[u] = grau_u - 1
+    return np.array(grau, dtype=np.int64)
@@ -0,0 +1,199 @@
+from array import array
+import heapq
+
+try:
+    from .componentes import UniaoBusca, _comprimir_numpy
+except ImportError:
+    from componentes import UniaoBusca, _comprimir_numpy
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele as arestas são ordenadas e filtradas em Python puro
+    np = None
+
+# Arestas examinadas por bloco no Kruskal: cada bloco começa por um filtro vetorizado
+TAMANHO_BLOCO_KRUSKAL = 1 << 16
+
+
+def arestas_do_grafo(adjacencia):
+    """
+    Extrai as arestas da adjacência como vetores (origens, destinos, pesos), sem laços.
+
+    Em grafos não dirigidos cada aresta aparece uma única vez (u < v); em grafos dirigidos cada
+    arco aparece uma vez, e a direção é ignorada pelos algoritmos de árvore geradora. No CSR
+    com NumPy a extração é vetorizada; nos demais casos as linhas são percorridas em Python.
+
+    Retorna:
+        tuple: (origens, destinos, pesos) como vetores NumPy ou `array` ('q', 'q', 'd').
+    """
+    dirigido = adjacencia.dirigido
+    if np is not None and hasattr(adjacencia, 'offsets'):
+        offsets, destinos, pesos = adjacencia.buffers()
+        offsets = np.asarray(offsets, dtype=np.int64)
+        qtd_arestas = int(offsets[-1]) if len(offsets) else 0
+        destinos = np.asarray(destinos)[:qtd_arestas].astype(np.int64)
+        pesos = np.asarray(pesos)[:qtd_arestas]
+        origens = np.repeat(np.arange(len(offsets) - 1, dtype=np.int64), np.diff(offsets))
+        manter = origens != destinos if dirigido else origens < destinos
+        return origens[manter], destinos[manter], pesos[manter]
+
+    origens, destinos, pesos = array('q'), array('q'), array('d')
+    for u, linha in adjacencia.items():
+        for v, peso in linha.items():
+            if v > u or (dirigido and v != u):
+                origens.append(u)
+                destinos.append(v)
+                pesos.append(peso)
+    return origens, destinos, pesos
+
+
+def kruskal(adjacencia, qtd_arestas_floresta=None):
+    """
+    Floresta geradora mínima pelo algoritmo de Kruskal.
+
+    As arestas são ordenadas pelo peso de uma só vez (`numpy.argsort` estável) e percorridas em
+    blocos. No início de cada bloco a floresta é comprimida e as arestas cujas extremidades já
+    estão na mesma árvore são descartadas de forma vetorizada; só as restantes passam, uma a
+    uma, pela `UniaoBusca`. Em grafos densos quase todas as arestas pesadas caem no filtro, e o
+    laço em Python fica proporcional a V. A busca para assim que a floresta fica completa.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        qtd_arestas_floresta (int): Quantidade de arestas da floresta completa (vértices com arestas
+                                    menos componentes), se conhecida; permite parar mais cedo.
+
+    Retorna:
+        tuple: (origens, destinos, pesos) das arestas escolhidas, em ordem crescente de peso.
+    """
+
+    origens, destinos, pesos = arestas_do_grafo(adjacencia)
+    uniao = UniaoBusca(adjacencia.qtd_indices)
+    unir = uniao.unir
+    escolhidas_o, escolhidas_d, escolhidas_p = array('q'), array('q'), array('d')
+    meta = len(origens) if qtd_arestas_floresta is None else qtd_arestas_floresta
+
+    if np is None:
+        ordem = sorted(range(len(pesos)), key=pesos.__getitem__)
+        for i in ordem:
+            if len(escolhidas_o) >= meta:
+                break
+            if unir(origens[i], destinos[i]):
+                escolhidas_o.append(origens[i])
+                escolhidas_d.append(destinos[i])
+                escolhidas_p.append(pesos[i])
+        return escolhidas_o, escolhidas_d, escolhidas_p
+
+    origens, destinos = np.asarray(origens, dtype=np.int64), np.asarray(destinos, dtype=np.int64)
+    pesos = np.asarray(pesos, dtype=np.float64)
+    ordem = np.argsort(pesos, kind='stable')
+    pai = np.frombuffer(uniao.pai, dtype=np.int64)
+    tamanho_bloco = max(TAMANHO_BLOCO_KRUSKAL, adjacencia.qtd_indices)
+    for inicio in range(0, len(ordem), tamanho_bloco):
+        if len(escolhidas_o) >= meta:
+            break
+        bloco = ordem[inicio:inicio + tamanho_bloco]
+        o, d = origens[bloco], destinos[bloco]
+        if inicio:
+            _comprimir_numpy(pai)
+            candidatas = pai[o] != pai[d]
+            bloco, o, d = bloco[candidatas], o[candidatas], d[candidatas]
+        for u, v, peso in zip(o.tolist(), d.tolist(), pesos[bloco].tolist()):
+            if unir(u, v):
+                escolhidas_o.append(u)
+                escolhidas_d.append(v)
+                escolhidas_p.append(peso)
+                if len(escolhidas_o) >= meta:
+                    break
+    return escolhidas_o, escolhidas_d, escolhidas_p
+
+
+def prim(adjacencia, reversa=None):
+    """
+    Floresta geradora mínima pelo algoritmo de Prim com heap preguiçoso.
+
+    As arestas que saem da árvore são empilhadas sem atualização de chave; entradas cujo destino
+    já entrou na árvore são descartadas ao sair do heap. Quando o heap esvazia, uma nova árvore
+    começa no menor índice ainda fora da floresta, de modo que grafos desconexos produzem uma
+    árvore por componente. O custo é O(E log E).
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        reversa (AdjacenciaCSR | AdjacenciaDict): Arestas de entrada de um grafo dirigido; junto com
+                                                  `adjacencia`, faz a direção ser ignorada.
+
+    Retorna:
+        tuple: (origens, destinos, pesos) das arestas escolhidas, árvore por árvore, na ordem de
+               entrada de cada vértice (`origens` é o vértice da árvore que o alcançou).
+    """
+
+    linhas = (adjacencia,) if reversa is None else (adjacencia, reversa)
+    na_floresta = bytearray(adjacencia.qtd_indices)
+    escolhidas_o, escolhidas_d, escolhidas_p = array('q'), array('q'), array('d')
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    for raiz in range(adjacencia.qtd_indices):
+        if na_floresta[raiz]:
+            continue
+        na_floresta[raiz] = 1
+        heap = []
+        u = raiz
+        while True:
+            for linha in linhas:
+                if u in linha:
+                    for v, peso in linha[u].items():
+                        if not na_floresta[v]:
+                            heappush(heap, (peso, v, u))
+            # Descarta as entradas que apontam para vértices já incorporados
+            while heap and na_floresta[heap[0][1]]:
+                heappop(heap)
+            if not heap:
+                break
+            peso, u, pai = heappop(heap)
+            na_floresta[u] = 1
+            escolhidas_o.append(pai)
+            escolhidas_d.append(u)
+            escolhidas_p.append(peso)
+    return escolhidas_o, escolhidas_d, escolhidas_p
+
+
+def agrupar_por_componente(origens, destinos, pesos, componentes, qtd_componentes):
+    """
+    Reordena as arestas da floresta por componente, mantendo a ordem relativa dentro de cada um.
+
+    Parâmetros:
+        origens, destinos, pesos (sequence): Arestas da floresta.
+        componentes (sequence): Componente de cada índice de vértice (veja `ResultadoComponentes.rotulos`).
+        qtd_componentes (int): Quantidade de componentes.
+
+    Retorna:
+        tuple: (origens, destinos, pesos, inicios) como `array`; as arestas da árvore do componente
+               `i` ocupam as posições inicios[i]:inicios[i + 1].
+    """
+    if np is not None:
+        o = np.asarray(origens, dtype=np.int64)
+        rotulos = np.asarray(componentes, dtype=np.int64)[o]
+        ordem = np.argsort(rotulos, kind='stable')
+        inicios = np.zeros(qtd_componentes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rotulos, minlength=qtd_componentes), out=inicios[1:])
+        return (
+            array('q', o[ordem].tobytes()),
+            array('q', np.asarray(destinos, dtype=np.int64)[ordem].tobytes()),
+            array('d', np.asarray(pesos, dtype=np.float64)[ordem].tobytes()),
+            array('q', inicios.tobytes()),
+        )
+
+    # Ordenação por contagem pelo componente da origem
+    inicios = array('q', bytes(8 * (qtd_componentes + 1)))
+    for u in origens:
+        inicios[componentes[u] + 1] += 1
+    for i in range(qtd_componentes):
+        inicios[i + 1] += inicios[i]
+    proxima = array('q', inicios[:-1])
+    qtd = len(origens)
+    novas_o, novas_d, novas_p = array('q', bytes(8 * qtd)), array('q', bytes(8 * qtd)), array('d', bytes(8 * qtd))
+    for u, v, peso in zip(origens, destinos, pesos):
+        componente = componentes[u]
+        k = proxima[componente]
+        novas_o[k], novas_d[k], novas_p[k] = u, v, peso
+        proxima[componente] = k + 1
+    return novas_o, novas_d, novas_p, inicios
@@ -0,0 +1,395 @@
+"""
+Benchmark reprodutível das operações do `Grafo`.
+
+Gera grafos sintéticos com semente fixa (Erdős–Rényi, grade, caminho e lei de potência, com ou
+sem pesos) em várias escalas, grava cada um no formato de entrada da biblioteca e mede, para cada
+operação, o tempo de parede, o pico de memória residente (RSS) e as arestas processadas por segundo.
+Opcionalmente executa as mesmas operações no networkx, como referência de tempo e de correção.
+
+Uso:
+    python benchmark.py --escalas pequena media --networkx --saida resultados.json
+    python benchmark.py --comparar resultados.json   # acusa regressões em relação a uma execução anterior
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+
+try:
+    import resource
+except ImportError:  # Indisponível no Windows: o pico de memória não é medido
+    resource = None
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: só é registrado no ambiente do benchmark
+    np = None
+
+try:
+    from .grafo import Grafo
+except ImportError:
+    from grafo import Grafo
+
+# Quantidade aproximada de vértices de cada escala
+ESCALAS = {'pequena': 1_000, 'media': 100_000, 'grande': 1_000_000}
+# Grau médio dos grafos de Erdős–Rényi e arestas por vértice novo na lei de potência
+GRAU_MEDIO = 8
+ARESTAS_POR_VERTICE = 4
+PESO_MAXIMO = 100
+OPERACOES = (
+    'armazenar_grafo', 'busca_largura', 'busca_profundidade',
+    'encontrar_componentes_conexos', 'calcular_caminho_minimo', 'caminho_ponto_a_ponto',
+)
+
+
+def gerar_erdos_renyi(n, aleatorio, grau_medio=GRAU_MEDIO):
+    """
+    Grafo G(n, m) de Erdős–Rényi com m = n * grau_medio / 2 arestas distintas, sem laços.
+
+    Retorna:
+        list: Pares (u, v) com os vértices numerados de 1 a n.
+    """
+    alvo = n * grau_medio // 2
+    arestas = set()
+    while len(arestas) < alvo:
+        u, v = aleatorio.randint(1, n), aleatorio.randint(1, n)
+        if u != v:
+            arestas.add((u, v) if u < v else (v, u))
+    return sorted(arestas)
+
+
+def gerar_grade(n, aleatorio):
+    """
+    Grade quadrada de lado ⌊√n⌋, com cada vértice ligado aos vizinhos da direita e de baixo.
+    """
+    lado = max(2, math.isqrt(n))
+    arestas = []
+    for linha in range(lado):
+        for coluna in range(lado):
+            v = linha * lado + coluna + 1
+            if coluna + 1 < lado:
+                arestas.append((v, v + 1))
+            if linha + 1 < lado:
+                arestas.append((v, v + lado))
+    return arestas
+
+
+def gerar_caminho(n, aleatorio):
+    """
+    Caminho 1 - 2 - ... - n: o pior caso de profundidade para as buscas.
+    """
+    return [(v, v + 1) for v in range(1, n)]
+
+
+def gerar_lei_potencia(n, aleatorio, arestas_por_vertice=ARESTAS_POR_VERTICE):
+    """
+    Grafo de Barabási–Albert: cada vértice novo se liga a `arestas_por_vertice` vértices já
+    existentes, escolhidos com probabilidade proporcional ao grau (distribuição de graus em lei de potência).
+    """
+    inicial = arestas_por_vertice + 1
+    arestas = [(u, v) for u in range(1, inicial + 1) for v in range(u + 1, inicial + 1)]
+    # Cada vértice aparece aqui uma vez por aresta: sortear desta lista é sortear proporcionalmente ao grau
+    extremos = [v for aresta in arestas for v in aresta]
+    for v in range(inicial + 1, n + 1):
+        escolhidos = set()
+        while len(escolhidos) < arestas_por_vertice:
+            escolhidos.add(aleatorio.choice(extremos))
+        for u in escolhidos:
+            arestas.append((u, v))
+            extremos.extend((u, v))
+    return arestas
+
+
+GERADORES = {
+    'erdos_renyi': gerar_erdos_renyi,
+    'grade': gerar_grade,
+    'caminho': gerar_caminho,
+    'lei_potencia': gerar_lei_potencia,
+}
+
+
+def gravar_grafo(arestas, caminho, ponderado, aleatorio):
+    """
+    Grava as arestas no formato de entrada do `Grafo` (quantidade de vértices e uma aresta por linha).
+
+    Retorna:
+        int: A quantidade de vértices.
+    """
+    n = max(max(u, v) for u, v in arestas)
+    with open(caminho, 'w') as arquivo:
+        arquivo.write(f"{n}\n")
+        if ponderado:
+            arquivo.writelines(f"{u} {v} {aleatorio.randint(1, PESO_MAXIMO)}\n" for u, v in arestas)
+        else:
+            arquivo.writelines(f"{u} {v}\n" for u, v in arestas)
+    return n
+
+
+def _zerar_pico_memoria():
+    # No Linux, escrever 5 em clear_refs zera o VmHWM: o pico passa a ser medido por operação
+    try:
+        with open('/proc/self/clear_refs', 'w') as arquivo:
+            arquivo.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def _pico_memoria():
+    """
+    Retorna o pico de memória residente do processo, em MB (None se não puder ser medido).
+    """
+    try:
+        with open('/proc/self/status') as arquivo:
+            for linha in arquivo:
+                if linha.startswith('VmHWM:'):
+                    return int(linha.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss é dado em bytes no macOS e em KB nos demais sistemas
+    return pico / (1024 * 1024) if sys.platform == 'darwin' else pico / 1024
+
+
+def medir(funcao, repeticoes):
+    """
+    Executa `funcao` `repeticoes` vezes e mede a melhor execução.
+
+    Retorna:
+        tuple: (resultado da última execução, melhor tempo em segundos, pico de RSS em MB).
+               Quando o pico não pode ser zerado entre as operações, é o pico do processo até ali.
+    """
+    melhor = math.inf
+    _zerar_pico_memoria()
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return resultado, melhor, _pico_memoria()
+
+
+def operacoes_grafos(caminho, origem, destino, backend):
+    """
+    Operações do `Grafo`, cada uma com uma função de normalização do resultado para comparação.
+
+    Cada operação roda sobre um grafo recém-carregado (sem caches) e não grava nada em disco.
+    """
+    grafo = {}
+
+    def carregar():
+        grafo['g'] = Grafo(caminho, backend=backend)
+        return grafo['g']
+
+    def novo():
+        # Caches de árvores e componentes são descartados para medir o cálculo, não a consulta
+        g = grafo['g']
+        g.cache_arvores.limpar()
+        g._componentes = None
+        g._uniao = None
+        return g
+
+    return {
+        'armazenar_grafo': (carregar, lambda g: None),
+        'busca_largura': (
+            lambda: novo().busca_largura(origem, None),
+            lambda r: {v: nivel for v, nivel, _ in r},
+        ),
+        'busca_profundidade': (
+            lambda: novo().busca_profundidade(origem, None),
+            lambda r: set(r.vertices()),
+        ),
+        'encontrar_componentes_conexos': (
+            lambda: novo().encontrar_componentes_conexos(),
+            lambda r: {frozenset(c) for c in r},
+        ),
+        'calcular_caminho_minimo': (
+            lambda: novo().calcular_caminho_minimo(origem),
+            lambda r: {v: d for v, d in r.items() if d < math.inf},
+        ),
+        'caminho_ponto_a_ponto': (
+            lambda: novo().calcular_caminho_minimo(origem, destino),
+            lambda r: r.distancia,
+        ),
+    }
+
+
+def operacoes_networkx(nx, caminho, origem, destino, ponderado):
+    """
+    As mesmas operações no networkx, com os resultados no mesmo formato de `operacoes_grafos`.
+    """
+    grafo = {}
+    peso = 'weight' if ponderado else None
+
+    def carregar():
+        with open(caminho, 'rb') as arquivo:
+            next(arquivo)
+            dados = (('weight', float),) if ponderado else False
+            grafo['g'] = nx.read_edgelist(arquivo, nodetype=int, data=dados)
+        return grafo['g']
+
+    def ponto_a_ponto():
+        try:
+            return nx.shortest_path_length(grafo['g'], origem, destino, weight=peso)
+        except nx.NetworkXNoPath:
+            return math.inf
+
+    return {
+        'armazenar_grafo': (carregar, lambda g: None),
+        'busca_largura': (lambda: nx.single_source_shortest_path_length(grafo['g'], origem), dict),
+        'busca_profundidade': (lambda: list(nx.dfs_preorder_nodes(grafo['g'], origem)), set),
+        'encontrar_componentes_conexos': (
+            lambda: list(nx.connected_components(grafo['g'])),
+            lambda r: {frozenset(c) for c in r},
+        ),
+        'calcular_caminho_minimo': (
+            lambda: nx.single_source_dijkstra_path_length(grafo['g'], origem, weight=peso),
+            dict,
+        ),
+        'caminho_ponto_a_ponto': (ponto_a_ponto, lambda r: r),
+    }
+
+
+def _iguais(a, b):
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(math.isclose(a[v], b[v]) for v in a)
+    if isinstance(a, float) or isinstance(b, float):
+        return a == b or math.isclose(a, b)
+    return a == b
+
+
+def executar(geradores, escalas, pesos, semente, repeticoes, backend, usar_networkx, progresso=print):
+    """
+    Executa o benchmark em todas as combinações de gerador, escala e pesos.
+
+    Retorna:
+        list: Um dicionário por (grafo, biblioteca, operação) com tempo, pico de RSS e arestas/s.
+              Com o networkx, as linhas do `Grafo` informam em `confere` se o resultado coincidiu.
+    """
+    nx = None
+    if usar_networkx:
+        import networkx as nx
+
+    resultados = []
+    with tempfile.TemporaryDirectory() as diretorio:
+        for nome in geradores:
+            for escala in escalas:
+                for ponderado in pesos:
+                    # Cada combinação tem sua própria semente: incluir ou remover uma não muda as demais
+                    aleatorio = random.Random(f"{semente}-{nome}-{escala}-{ponderado}")
+                    arestas = GERADORES[nome](ESCALAS[escala], aleatorio)
+                    caminho = os.path.join(diretorio, f"{nome}_{escala}.txt")
+                    n = gravar_grafo(arestas, caminho, ponderado, aleatorio)
+                    base = {
+                        'gerador': nome, 'escala': escala, 'ponderado': ponderado,
+                        'vertices': n, 'arestas': len(arestas),
+                    }
+                    bibliotecas = [('grafos', operacoes_grafos(caminho, 1, n, backend))]
+                    if nx is not None:
+                        bibliotecas.append(('networkx', operacoes_networkx(nx, caminho, 1, n, ponderado)))
+
+                    normalizados, linhas = {}, {}
+                    for biblioteca, operacoes in bibliotecas:
+                        for operacao in OPERACOES:
+                            funcao, normalizar = operacoes[operacao]
+                            resultado, tempo, pico = medir(funcao, repeticoes)
+                            normalizados[biblioteca, operacao] = normalizar(resultado)
+                            linhas[biblioteca, operacao] = dict(
+                                base, biblioteca=biblioteca, operacao=operacao, tempo_s=tempo,
+                                pico_rss_mb=pico, arestas_por_s=len(arestas) / tempo if tempo else None,
+                                confere=None,
+                            )
+                            progresso(
+                                f"{nome:>13} {escala:>8} {'ponderado' if ponderado else 'simples':>9} "
+                                f"{biblioteca:>8} {operacao:>30} {tempo:10.4f}s"
+                            )
+
+                    if nx is not None:
+                        for operacao in OPERACOES[1:]:
+                            linhas['grafos', operacao]['confere'] = _iguais(
+                                normalizados['grafos', operacao], normalizados['networkx', operacao]
+                            )
+                    resultados.extend(linhas.values())
+                    os.remove(caminho)
+    return resultados
+
+
+def ambiente():
+    """
+    Descreve o ambiente de execução, gravado junto com os resultados.
+    """
+    return {
+        'python': platform.python_version(),
+        'implementacao': platform.python_implementation(),
+        'plataforma': platform.platform(),
+        'processador': platform.processor() or platform.machine(),
+        'numpy': np.__version__ if np is not None else None,
+    }
+
+
+def comparar(atuais, anteriores, tolerancia):
+    """
+    Compara os tempos com os de uma execução anterior.
+
+    Retorna:
+        list: (chave, tempo anterior, tempo atual) das operações mais lentas que anterior * (1 + tolerancia).
+    """
+    def chave(linha):
+        return (linha['gerador'], linha['escala'], linha['ponderado'], linha['biblioteca'], linha['operacao'])
+
+    referencia = {chave(linha): linha['tempo_s'] for linha in anteriores}
+    regressoes = []
+    for linha in atuais:
+        anterior = referencia.get(chave(linha))
+        if anterior is not None and linha['tempo_s'] > anterior * (1 + tolerancia):
+            regressoes.append((chave(linha), anterior, linha['tempo_s']))
+    return regressoes
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--geradores', nargs='+', choices=sorted(GERADORES), default=sorted(GERADORES))
+    parser.add_argument('--escalas', nargs='+', choices=list(ESCALAS), default=['pequena', 'media'])
+    parser.add_argument('--pesos', choices=('nao', 'sim', 'ambos'), default='ambos',
+                        help="Gera grafos sem pesos, com pesos inteiros aleatórios ou ambos (padrão)")
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--repeticoes', type=int, default=3, help="Execuções por operação; vale a melhor")
+    parser.add_argument('--backend', choices=('csr', 'dict'), default='csr')
+    parser.add_argument('--networkx', action='store_true', help="Executa também o networkx e confere os resultados")
+    parser.add_argument('--saida', help="Arquivo JSON onde os resultados são gravados")
+    parser.add_argument('--comparar', help="JSON de uma execução anterior para detectar regressões de tempo")
+    parser.add_argument('--tolerancia', type=float, default=0.2,
+                        help="Aumento relativo de tempo aceito antes de acusar regressão (padrão: 0.2)")
+    args = parser.parse_args(argumentos)
+
+    pesos = {'nao': [False], 'sim': [True], 'ambos': [False, True]}[args.pesos]
+    resultados = executar(
+        args.geradores, args.escalas, pesos, args.semente, args.repeticoes, args.backend, args.networkx
+    )
+    relatorio = {'ambiente': ambiente(), 'parametros': vars(args), 'resultados': resultados}
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+
+    falhas = [linha for linha in resultados if linha['confere'] is False]
+    for linha in falhas:
+        print(f"DIVERGÊNCIA: {linha['gerador']} {linha['escala']} {linha['operacao']}", file=sys.stderr)
+
+    regressoes = []
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as arquivo:
+            regressoes = comparar(resultados, json.load(arquivo)['resultados'], args.tolerancia)
+        for chave, anterior, atual in regressoes:
+            print(f"REGRESSÃO: {' '.join(map(str, chave))}: {anterior:.4f}s -> {atual:.4f}s", file=sys.stderr)
+    return 1 if falhas or regressoes else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+from collections import OrderedDict
+import math
+import threading
+
+try:
+    from .caminhos import reconstruir_caminho
+except ImportError:
+    from caminhos import reconstruir_caminho
+
+
+class ArvoreCaminhos:
+    """
+    Árvore de caminhos mínimos a partir de uma origem: distâncias e antecessores dos vértices alcançados.
+
+    Atributos:
+        origem (int): Vértice raiz da árvore.
+        distancias (dict): Distância mínima de cada vértice alcançado.
+        antecessor (dict): Antecessor de cada vértice alcançado (None para a origem).
+        algoritmo (str): Nome do algoritmo que calculou a árvore.
+    """
+
+    def __init__(self, origem, distancias, antecessor, algoritmo):
+        self.origem = origem
+        self.distancias = distancias
+        self.antecessor = antecessor
+        self.algoritmo = algoritmo
+
+    def __len__(self):
+        return len(self.distancias)
+
+    def __contains__(self, vertice):
+        return vertice in self.distancias
+
+    def distancia(self, destino):
+        return self.distancias.get(destino, math.inf)
+
+    def caminho(self, destino):
+        """
+        Caminho da origem até `destino`, em O(tamanho do caminho); [] se ele não for alcançável.
+        """
+        if destino not in self.antecessor:
+            return []
+        return reconstruir_caminho(self.antecessor, destino)
+
+
+class CacheArvores:
+    """
+    Cache LRU de árvores de caminhos mínimos, indexado pela origem.
+
+    Quando a quantidade de árvores passa de `capacidade`, ou a soma dos vértices guardados passa
+    de `max_vertices`, as árvores usadas há mais tempo são descartadas. O cache guarda a versão
+    do grafo em que as árvores foram calculadas e se esvazia sozinho quando ela muda.
+
+    Atributos:
+        capacidade (int): Quantidade máxima de árvores guardadas.
+        max_vertices (int): Limite opcional para a soma dos tamanhos das árvores.
+        acertos (int): Consultas respondidas pelo cache.
+        falhas (int): Consultas que não encontraram a árvore.
+        descartes (int): Árvores removidas para respeitar os limites.
+    """
+
+    def __init__(self, capacidade=32, max_vertices=None):
+        self.capacidade = capacidade
+        self.max_vertices = max_vertices
+        self.acertos = 0
+        self.falhas = 0
+        self.descartes = 0
+        self._arvores = OrderedDict()
+        self._qtd_vertices = 0
+        self._versao = None
+
+    def __len__(self):
+        return len(self._arvores)
+
+    def __contains__(self, origem):
+        return origem in self._arvores
+
+    def obter(self, origem, versao):
+        """
+        Retorna a árvore de `origem` calculada na `versao` atual do grafo, ou None.
+        """
+        if versao != self._versao:
+            self.limpar()
+            self._versao = versao
+        arvore = self._arvores.get(origem)
+        if arvore is None:
+            self.falhas += 1
+            return None
+        self._arvores.move_to_end(origem)
+        self.acertos += 1
+        return arvore
+
+    def guardar(self, arvore, versao):
+        if self.capacidade <= 0:
+            return
+        if versao != self._versao:
+            self.limpar()
+            self._versao = versao
+        anterior = self._arvores.pop(arvore.origem, None)
+        if anterior is not None:
+            self._qtd_vertices -= len(anterior)
+        self._arvores[arvore.origem] = arvore
+        self._qtd_vertices += len(arvore)
+
+        while len(self._arvores) > 1 and (
+            len(self._arvores) > self.capacidade
+            or (self.max_vertices is not None and self._qtd_vertices > self.max_vertices)
+        ):
+            _, descartada = self._arvores.popitem(last=False)
+            self._qtd_vertices -= len(descartada)
+            self.descartes += 1
+
+    def limpar(self):
+        """
+        Descarta todas as árvores; os contadores são mantidos.
+        """
+        self._arvores.clear()
+        self._qtd_vertices = 0
+
+    def contadores(self):
+        return {'acertos': self.acertos, 'falhas': self.falhas, 'descartes': self.descartes, 'arvores': len(self)}
+
+
+class CacheArvoresPorThread:
+    """
+    Cache de árvores com a mesma interface de `CacheArvores`, mas com um cache LRU por thread.
+
+    Usado pela `VisaoGrafo`: consultas simultâneas em threads diferentes nunca alteram o mesmo
+    `OrderedDict`, então o cache dispensa travas. O custo é que uma árvore calculada em uma
+    thread não é vista pelas outras, e `limpar` só afeta a thread que o chama.
+    """
+
+    def __init__(self, capacidade=32, max_vertices=None):
+        self.capacidade = capacidade
+        self.max_vertices = max_vertices
+        self._local = threading.local()
+
+    def _cache(self):
+        cache = getattr(self._local, 'cache', None)
+        if cache is None:
+            cache = self._local.cache = CacheArvores(self.capacidade, self.max_vertices)
+        return cache
+
+    def __len__(self):
+        return len(self._cache())
+
+    def __contains__(self, origem):
+        return origem in self._cache()
+
+    def obter(self, origem, versao):
+        return self._cache().obter(origem, versao)
+
+    def guardar(self, arvore, versao):
+        self._cache().guardar(arvore, versao)
+
+    def limpar(self):
+        self._cache().limpar()
+
+    def contadores(self):
+        return self._cache().contadores()
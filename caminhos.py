@@ -0,0 +1,623 @@
+from array import array
+from collections import deque
+import heapq
+import math
+
+try:
+    from .metricas import operacoes_heap
+except ImportError:
+    from metricas import operacoes_heap
+
+# Maior peso inteiro para o qual a fila de baldes de Dial é escolhida em vez do heap
+LIMITE_DIAL = 256
+
+
+def _registrar_dijkstra(metricas, adjacencias, fixados, remocoes_antes):
+    """
+    Registra nas métricas os vértices fixados por um Dijkstra, as arestas relaxadas a partir deles
+    e as entradas obsoletas do heap (remoções que não fixaram nenhum vértice).
+
+    `adjacencias` traz, para cada conjunto de `fixados`, a adjacência usada para expandi-lo.
+    """
+    qtd_fixados = sum(len(vertices) for vertices in fixados)
+    remocoes = metricas.contadores.get('heap_remocoes', 0) - remocoes_antes
+    metricas.incrementar('vertices_fixados', qtd_fixados)
+    metricas.incrementar('heap_obsoletas', remocoes - qtd_fixados)
+    metricas.incrementar('arestas_relaxadas', sum(
+        len(adjacencia[u]) for adjacencia, vertices in zip(adjacencias, fixados) for u in vertices
+    ))
+
+
+class CicloNegativo(ValueError):
+    """
+    O grafo tem um ciclo de peso total negativo, então as distâncias mínimas não estão definidas.
+
+    Em grafos não dirigidos, qualquer aresta negativa já forma um ciclo assim (ida e volta).
+
+    Atributos:
+        ciclo (list): Vértices de um ciclo negativo, na ordem das arestas (índices densos nos
+                      algoritmos deste módulo, rótulos quando levantada pelo `Grafo`).
+    """
+
+    def __init__(self, ciclo):
+        super().__init__(f'O grafo possui um ciclo de peso negativo passando por {len(ciclo)} vértice(s)')
+        self.ciclo = ciclo
+
+def reconstruir_caminho(antecessor, destino):
+    """
+    Monta o caminho até `destino` seguindo os antecessores, em O(tamanho do caminho).
+
+    Parâmetros:
+        antecessor (mapping): Antecessor de cada vértice alcançado (None para a origem).
+        destino (int): Último vértice do caminho.
+
+    Retorna:
+        list: Os vértices do caminho, da origem ao destino.
+    """
+    caminho = []
+    atual = destino
+    while atual is not None:
+        caminho.append(atual)
+        atual = antecessor[atual]
+    caminho.reverse()
+    return caminho
+
+
+def _unir_caminhos(antecessor, sucessor, encontro):
+    """
+    Junta as metades de uma busca bidirecional no vértice de encontro.
+    """
+    caminho = reconstruir_caminho(antecessor, encontro)
+    atual = sucessor[encontro]
+    while atual is not None:
+        caminho.append(atual)
+        atual = sucessor[atual]
+    return caminho
+
+
+def bfs_ponto_a_ponto(adjacencia, origem, destino):
+    """
+    BFS entre dois vértices que termina assim que o destino é descoberto.
+
+    Apenas os vértices alcançados são registrados (em dicionários), então o custo
+    de cada consulta depende da região explorada, e não do tamanho do grafo.
+
+    Retorna:
+        tuple: (caminho, distancia); ([], inf) se o destino não for alcançável.
+    """
+
+    # Em grafos dirigidos o destino pode ter apenas arestas de entrada: só a origem é verificada
+    if origem not in adjacencia:
+        return ([origem], 0) if origem == destino else ([], math.inf)
+    if origem == destino:
+        return [origem], 0
+
+    antecessor = {origem: None}
+    fila = deque([origem])
+
+    while fila:
+        u = fila.popleft()
+        for v in adjacencia[u]:
+            if v not in antecessor:
+                antecessor[v] = u
+                if v == destino:
+                    caminho = reconstruir_caminho(antecessor, destino)
+                    return caminho, len(caminho) - 1
+                fila.append(v)
+
+    return [], math.inf
+
+
+def bfs_bidirecional(adjacencia, origem, destino, adjacencia_reversa=None):
+    """
+    BFS bidirecional: alterna a expansão de um nível inteiro a partir da origem e do destino,
+    sempre pelo lado de fronteira menor, até as duas buscas se encontrarem.
+
+    Em grafos com fator de ramificação b e distância d, visita cerca de 2·b^(d/2) vértices
+    em vez de b^d.
+
+    Parâmetros:
+        adjacencia (mapping): Adjacência usada a partir da origem.
+        origem (int): Vértice inicial.
+        destino (int): Vértice final.
+        adjacencia_reversa (mapping): Adjacência usada a partir do destino (padrão: a mesma, grafo não direcionado).
+
+    Retorna:
+        tuple: (caminho, distancia); ([], inf) se o destino não for alcançável.
+    """
+
+    if adjacencia_reversa is None:
+        adjacencia_reversa = adjacencia
+    if origem not in adjacencia or destino not in adjacencia_reversa:
+        return ([origem], 0) if origem == destino else ([], math.inf)
+    if origem == destino:
+        return [origem], 0
+
+    antecessor = {origem: None}
+    sucessor = {destino: None}
+    distancia_frente = {origem: 0}
+    distancia_tras = {destino: 0}
+    fronteira_frente = [origem]
+    fronteira_tras = [destino]
+
+    while fronteira_frente and fronteira_tras:
+        if len(fronteira_frente) <= len(fronteira_tras):
+            fronteira, adj, pais, dist, outro = fronteira_frente, adjacencia, antecessor, distancia_frente, distancia_tras
+        else:
+            fronteira, adj, pais, dist, outro = fronteira_tras, adjacencia_reversa, sucessor, distancia_tras, distancia_frente
+
+        # Expande o nível inteiro antes de decidir: o melhor encontro do nível é o ótimo
+        melhor = math.inf
+        encontro = None
+        proxima = []
+        for u in fronteira:
+            for v in adj[u]:
+                if v not in dist:
+                    dist[v] = dist[u] + 1
+                    pais[v] = u
+                    proxima.append(v)
+                if v in outro and dist[v] + outro[v] < melhor:
+                    melhor = dist[v] + outro[v]
+                    encontro = v
+
+        if encontro is not None:
+            return _unir_caminhos(antecessor, sucessor, encontro), melhor
+
+        if pais is antecessor:
+            fronteira_frente = proxima
+        else:
+            fronteira_tras = proxima
+
+    return [], math.inf
+
+
+def dijkstra_ponto_a_ponto(adjacencia, origem, destino, heuristica=None, potenciais=None, metricas=None):
+    """
+    Dijkstra entre dois vértices que termina quando o destino é fixado (retirado do heap).
+
+    Com `heuristica`, a busca vira A*: a prioridade de cada vértice é a distância conhecida
+    mais a estimativa `heuristica(vertice, destino)`. A estimativa precisa ser admissível
+    (nunca maior que a distância real) para que o caminho encontrado seja mínimo. Se ela não
+    for consistente, um vértice já fixado pode receber depois uma distância menor: nesse caso
+    ele é reaberto (sai de `fixados` e volta ao heap), como no A* com reabertura.
+
+    Com `potenciais`, a busca usa os pesos reduzidos de Johnson (veja `arvore_dijkstra`).
+    Com `metricas` (veja `metricas.instrumentar`), as operações do heap são contadas.
+
+    Retorna:
+        tuple: (caminho, distancia); ([], inf) se o destino não for alcançável.
+    """
+
+    if origem not in adjacencia:
+        return ([origem], 0) if origem == destino else ([], math.inf)
+
+    distancias = {origem: 0}
+    antecessor = {origem: None}
+    fixados = set()
+    estimativa = (lambda v: heuristica(v, destino)) if heuristica is not None else (lambda v: 0)
+    pq = [(estimativa(origem), origem)]
+    inserir, remover = operacoes_heap(metricas)
+    remocoes_antes = metricas.contadores.get('heap_remocoes', 0) if metricas is not None else 0
+
+    while pq:
+        _, u = remover(pq)
+        if u in fixados:
+            continue
+        if u == destino:
+            distancia = distancias[destino]
+            if potenciais is not None:
+                distancia += potenciais[destino] - potenciais[origem]
+            if metricas is not None:
+                # O destino também é fixado, mas suas arestas não chegam a ser relaxadas
+                _registrar_dijkstra(metricas, (adjacencia,), (fixados,), remocoes_antes + 1)
+                metricas.incrementar('vertices_fixados')
+            return reconstruir_caminho(antecessor, destino), distancia
+        fixados.add(u)
+
+        dist_u = distancias[u]
+        h = potenciais
+        for v, peso in adjacencia[u].items():
+            nova = dist_u + peso if h is None else dist_u + peso + h[u] - h[v]
+            if nova < distancias.get(v, math.inf):
+                distancias[v] = nova
+                antecessor[v] = u
+                # Só acontece com heurística inconsistente: o vértice fixado é reaberto
+                fixados.discard(v)
+                inserir(pq, (nova + estimativa(v), v))
+
+    if metricas is not None:
+        _registrar_dijkstra(metricas, (adjacencia,), (fixados,), remocoes_antes)
+    return [], math.inf
+
+
+def dijkstra_bidirecional(adjacencia, origem, destino, adjacencia_reversa=None, metricas=None):
+    """
+    Dijkstra bidirecional: duas buscas simultâneas, a partir da origem e do destino.
+
+    A cada passo avança o lado cujo heap tem o menor topo. A busca termina quando a soma
+    dos topos dos dois heaps não pode mais melhorar o melhor caminho já encontrado.
+
+    Parâmetros:
+        adjacencia (mapping): Adjacência usada a partir da origem.
+        origem (int): Vértice inicial.
+        destino (int): Vértice final.
+        adjacencia_reversa (mapping): Adjacência usada a partir do destino (padrão: a mesma, grafo não direcionado).
+        metricas (Metricas): Métricas que recebem as contagens do heap (padrão: nenhuma).
+
+    Retorna:
+        tuple: (caminho, distancia); ([], inf) se o destino não for alcançável.
+    """
+
+    if adjacencia_reversa is None:
+        adjacencia_reversa = adjacencia
+    if origem not in adjacencia or destino not in adjacencia_reversa:
+        return ([origem], 0) if origem == destino else ([], math.inf)
+    if origem == destino:
+        return [origem], 0
+
+    lados = (
+        (adjacencia, {origem: 0}, {origem: None}, [(0, origem)], set()),
+        (adjacencia_reversa, {destino: 0}, {destino: None}, [(0, destino)], set()),
+    )
+    melhor = math.inf
+    encontro = None
+    inserir, remover = operacoes_heap(metricas)
+    remocoes_antes = metricas.contadores.get('heap_remocoes', 0) if metricas is not None else 0
+
+    while lados[0][3] and lados[1][3]:
+        if lados[0][3][0][0] + lados[1][3][0][0] >= melhor:
+            break
+
+        lado = 0 if lados[0][3][0][0] <= lados[1][3][0][0] else 1
+        adj, dist, pais, pq, fixados = lados[lado]
+        _, dist_outro, _, _, _ = lados[1 - lado]
+
+        dist_u, u = remover(pq)
+        if u in fixados:
+            continue
+        fixados.add(u)
+
+        for v, peso in adj[u].items():
+            nova = dist_u + peso
+            if nova < dist.get(v, math.inf):
+                dist[v] = nova
+                pais[v] = u
+                inserir(pq, (nova, v))
+            if v in dist_outro and dist[v] + dist_outro[v] < melhor:
+                melhor = dist[v] + dist_outro[v]
+                encontro = v
+
+    if metricas is not None:
+        _registrar_dijkstra(
+            metricas, (adjacencia, adjacencia_reversa), (lados[0][4], lados[1][4]), remocoes_antes
+        )
+    if encontro is None:
+        return [], math.inf
+    return _unir_caminhos(lados[0][2], lados[1][2], encontro), melhor
+
+
+def arvore_bfs(adjacencia, origem):
+    """
+    BFS a partir de `origem` que registra distância e antecessor de cada vértice alcançado.
+
+    Retorna:
+        tuple: (distancias, antecessor), dicionários com apenas os vértices alcançados.
+    """
+
+    distancias = {origem: 0}
+    antecessor = {origem: None}
+    if origem not in adjacencia:
+        return distancias, antecessor
+
+    fila = deque([origem])
+    while fila:
+        u = fila.popleft()
+        proxima = distancias[u] + 1
+        for v in adjacencia[u]:
+            if v not in distancias:
+                distancias[v] = proxima
+                antecessor[v] = u
+                fila.append(v)
+
+    return distancias, antecessor
+
+
+def arvore_dijkstra(adjacencia, origem, potenciais=None, metricas=None):
+    """
+    Dijkstra a partir de `origem` que registra distância e antecessor de cada vértice alcançado.
+
+    Com `potenciais` (veja `potenciais_johnson`), cada aresta u->v é usada com o peso reduzido
+    peso + h[u] - h[v], que nunca é negativo; as distâncias devolvidas já são as originais.
+
+    Com `metricas` (veja `metricas.instrumentar`), as operações do heap são contadas e, ao
+    final, os vértices fixados, as arestas relaxadas e as entradas obsoletas são registrados.
+
+    Retorna:
+        tuple: (distancias, antecessor), dicionários com apenas os vértices alcançados.
+    """
+
+    distancias = {origem: 0}
+    antecessor = {origem: None}
+    if origem not in adjacencia:
+        return distancias, antecessor
+
+    h = potenciais
+    pq = [(0, origem)]
+    inserir, remover = operacoes_heap(metricas)
+    remocoes_antes = metricas.contadores.get('heap_remocoes', 0) if metricas is not None else 0
+    while pq:
+        dist_u, u = remover(pq)
+        if dist_u > distancias[u]:
+            continue
+        for v, peso in adjacencia[u].items():
+            nova = dist_u + peso if h is None else dist_u + peso + h[u] - h[v]
+            if nova < distancias.get(v, math.inf):
+                distancias[v] = nova
+                antecessor[v] = u
+                inserir(pq, (nova, v))
+
+    if metricas is not None:
+        # Cada vértice alcançado sai do heap uma única vez com a distância final
+        _registrar_dijkstra(metricas, (adjacencia,), (distancias,), remocoes_antes)
+    if h is not None:
+        base = h[origem]
+        distancias = {v: distancia - base + h[v] for v, distancia in distancias.items()}
+    return distancias, antecessor
+
+
+def arvore_spfa(adjacencia, origem):
+    """
+    Bellman-Ford com fila (SPFA) a partir de `origem`; aceita pesos negativos.
+
+    Só os vértices cuja distância diminuiu voltam para a fila, então em grafos sem ciclos
+    negativos o custo costuma ficar bem abaixo do limite O(V * E) do Bellman-Ford. Um ciclo
+    negativo é detectado quando o caminho mínimo conhecido de algum vértice passa a ter tantas
+    arestas quanto o grafo tem vértices e os antecessores desse vértice fecham um ciclo.
+
+    Retorna:
+        tuple: (distancias, antecessor), dicionários com apenas os vértices alcançados.
+
+    Exceções:
+        CicloNegativo: Se algum ciclo negativo for alcançável a partir de `origem`.
+    """
+
+    distancias = {origem: 0}
+    antecessor = {origem: None}
+    arestas = {origem: 0}
+    if origem not in adjacencia:
+        return distancias, antecessor
+
+    limite = max(adjacencia.qtd_indices, origem + 1)
+    fila = deque([origem])
+    na_fila = {origem}
+    while fila:
+        u = fila.popleft()
+        na_fila.discard(u)
+        dist_u = distancias[u]
+        for v, peso in adjacencia[u].items():
+            nova = dist_u + peso
+            if nova < distancias.get(v, math.inf):
+                distancias[v] = nova
+                antecessor[v] = u
+                arestas[v] = arestas[u] + 1
+                if arestas[v] >= limite:
+                    # Caminho com `limite` arestas repete vértices: confirma o ciclo nos antecessores
+                    ciclo = _ciclo_antecessores(antecessor, v)
+                    if ciclo is not None:
+                        raise CicloNegativo(ciclo)
+                if v not in na_fila:
+                    na_fila.add(v)
+                    fila.append(v)
+
+    return distancias, antecessor
+
+
+def _ciclo_antecessores(antecessor, v):
+    """
+    Procura um ciclo seguindo os antecessores a partir de `v`; retorna None se a cadeia terminar.
+
+    Um ciclo na árvore de antecessores de um Bellman-Ford tem sempre peso total negativo.
+    """
+    posicao = {}
+    cadeia = []
+    while v is not None and v not in posicao:
+        posicao[v] = len(cadeia)
+        cadeia.append(v)
+        v = antecessor.get(v)
+    if v is None:
+        return None
+    ciclo = cadeia[posicao[v]:]
+    ciclo.reverse()
+    return ciclo
+
+
+def potenciais_johnson(adjacencia, qtd_indices):
+    """
+    Calcula os potenciais da reponderação de Johnson com um SPFA a partir de uma origem virtual.
+
+    A origem virtual tem aresta de peso 0 para todos os vértices, então h[v] é o menor peso
+    de um caminho que termina em `v` (no máximo 0). Com esses potenciais, o peso reduzido
+    peso + h[u] - h[v] de toda aresta u->v é não negativo e os caminhos mínimos são preservados:
+    o Dijkstra volta a servir para grafos com pesos negativos.
+
+    Retorna:
+        array: Vetor float64 com o potencial de cada índice.
+
+    Exceções:
+        CicloNegativo: Se o grafo tiver um ciclo negativo.
+    """
+
+    h = array('d', bytes(8 * qtd_indices))
+    antecessor = {}
+    arestas = array('q', bytes(8 * qtd_indices))
+    # Todos começam com distância 0 (a aresta da origem virtual) e na fila
+    fila = deque(v for v in range(qtd_indices) if v in adjacencia)
+    na_fila = bytearray(qtd_indices)
+    for v in fila:
+        na_fila[v] = 1
+    limite = max(qtd_indices, 1)
+    while fila:
+        u = fila.popleft()
+        na_fila[u] = 0
+        h_u = h[u]
+        for v, peso in adjacencia[u].items():
+            nova = h_u + peso
+            if nova < h[v]:
+                h[v] = nova
+                antecessor[v] = u
+                arestas[v] = arestas[u] + 1
+                if arestas[v] >= limite:
+                    ciclo = _ciclo_antecessores(antecessor, v)
+                    if ciclo is not None:
+                        raise CicloNegativo(ciclo)
+                if not na_fila[v]:
+                    na_fila[v] = 1
+                    fila.append(v)
+    return h
+
+
+def arvore_0_1(adjacencia, origem, destino=None):
+    """
+    BFS 0-1: caminhos mínimos quando todos os pesos são 0 ou 1, com um deque no lugar do heap.
+
+    Arestas de peso 0 entram no início do deque e as de peso 1 no fim, então os vértices saem
+    em ordem crescente de distância em O(V + E), sem o fator log do Dijkstra.
+
+    Parâmetros:
+        adjacencia (mapping): Adjacência do grafo.
+        origem (int): Vértice inicial.
+        destino (int): Se informado, a busca termina assim que ele é fixado.
+
+    Retorna:
+        tuple: (distancias, antecessor), dicionários com apenas os vértices alcançados.
+    """
+
+    distancias = {origem: 0}
+    antecessor = {origem: None}
+    if origem not in adjacencia:
+        return distancias, antecessor
+
+    fixados = set()
+    fila = deque([origem])
+    while fila:
+        u = fila.popleft()
+        if u in fixados:
+            continue
+        fixados.add(u)
+        if u == destino:
+            break
+
+        dist_u = distancias[u]
+        for v, peso in adjacencia[u].items():
+            nova = dist_u + peso
+            if nova < distancias.get(v, math.inf):
+                distancias[v] = nova
+                antecessor[v] = u
+                if peso == 0:
+                    fila.appendleft(v)
+                else:
+                    fila.append(v)
+
+    return distancias, antecessor
+
+
+def arvore_dial(adjacencia, origem, peso_maximo, destino=None):
+    """
+    Algoritmo de Dial: Dijkstra com fila de baldes, para pesos inteiros não negativos pequenos.
+
+    Usa `peso_maximo + 1` baldes circulares indexados pela distância; inserir e retirar custam O(1),
+    e o total é O(E + V·peso_maximo) no pior caso.
+
+    Parâmetros:
+        adjacencia (mapping): Adjacência do grafo.
+        origem (int): Vértice inicial.
+        peso_maximo (int): Maior peso de aresta do grafo.
+        destino (int): Se informado, a busca termina assim que ele é fixado.
+
+    Retorna:
+        tuple: (distancias, antecessor), dicionários com apenas os vértices alcançados.
+    """
+
+    distancias = {origem: 0}
+    antecessor = {origem: None}
+    if origem not in adjacencia:
+        return distancias, antecessor
+
+    qtd_baldes = int(peso_maximo) + 1
+    baldes = [[] for _ in range(qtd_baldes)]
+    baldes[0].append(origem)
+    pendentes = 1
+    atual = 0
+
+    while pendentes:
+        balde = baldes[atual % qtd_baldes]
+        # Arestas de peso 0 inserem no próprio balde em uso, por isso o laço relê o tamanho
+        while balde:
+            u = balde.pop()
+            pendentes -= 1
+            if distancias[u] != atual:
+                continue  # entrada obsoleta: o vértice já foi fixado com distância menor
+            if u == destino:
+                return distancias, antecessor
+
+            for v, peso in adjacencia[u].items():
+                nova = atual + peso
+                if nova < distancias.get(v, math.inf):
+                    distancias[v] = nova
+                    antecessor[v] = u
+                    baldes[int(nova) % qtd_baldes].append(v)
+                    pendentes += 1
+        atual += 1
+
+    return distancias, antecessor
+
+
+def preencher_distancias(adjacencia, origem, distancias, unitario=False, potenciais=None):
+    """
+    Calcula as distâncias mínimas de `origem` para todos os vértices, direto em um vetor tipado.
+
+    Usa BFS quando todos os pesos são 1 e Dijkstra caso contrário. O vetor funciona como
+    tabela de distâncias da própria busca, portanto nenhuma estrutura do tamanho do grafo
+    é alocada por consulta além dele.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        origem (int): Vértice de origem.
+        distancias (array): Vetor com `qtd_indices` posições, preenchido com infinito pelo chamador.
+        unitario (bool): Indica que todas as arestas têm peso 1.
+        potenciais (array): Potenciais de Johnson, para grafos com pesos negativos (veja `arvore_dijkstra`).
+    """
+
+    distancias[origem] = 0
+    if origem not in adjacencia:
+        return
+
+    if unitario:
+        fila = deque([origem])
+        while fila:
+            u = fila.popleft()
+            proxima = distancias[u] + 1
+            for v in adjacencia[u]:
+                if distancias[v] == math.inf:
+                    distancias[v] = proxima
+                    fila.append(v)
+        return
+
+    h = potenciais
+    pq = [(0.0, origem)]
+    while pq:
+        dist_u, u = heapq.heappop(pq)
+        if dist_u > distancias[u]:
+            continue
+        for v, peso in adjacencia[u].items():
+            nova = dist_u + peso if h is None else dist_u + peso + h[u] - h[v]
+            if nova < distancias[v]:
+                distancias[v] = nova
+                heapq.heappush(pq, (nova, v))
+
+    if h is not None:
+        # Desfaz a reponderação: d(origem, v) = d'(origem, v) - h[origem] + h[v]
+        base = h[origem]
+        for v in range(len(distancias)):
+            if distancias[v] != math.inf:
+                distancias[v] += h[v] - base
@@ -0,0 +1,323 @@
+from array import array
+import bz2
+import gzip
+import io
+import os
+
+TAMANHO_BLOCO = 1 << 24  # 16 MiB por leitura
+
+_ASSINATURAS = (
+    (b'\x1f\x8b', gzip.open),
+    (b'BZh', bz2.open),
+)
+
+class ListaArestas:
+    """
+    Resultado da leitura de um arquivo de arestas.
+
+    Os rótulos dos vértices são guardados como inteiros em buffers tipados. Se algum rótulo não
+    for um número inteiro, a lista passa a ser textual: `origens` e `destinos` viram listas de
+    strings (inclusive os rótulos numéricos lidos antes), e a tradução para índices densos fica
+    a cargo de `TabelaVertices`.
+
+    Atributos:
+        qtd_vertices (int): Quantidade de vértices declarada na primeira linha do arquivo.
+        origens (array | list): Primeiro vértice de cada aresta, na ordem do arquivo.
+        destinos (array | list): Segundo vértice de cada aresta, na ordem do arquivo.
+        pesos (array): Peso de cada aresta (1 quando a linha não informa peso).
+        ponderado (bool): Indica se alguma linha informou peso.
+    """
+
+    def __init__(self):
+        self.qtd_vertices = 0
+        self.origens = array('q')
+        self.destinos = array('q')
+        self.pesos = array('d')
+        self.ponderado = False
+
+    def __len__(self):
+        return len(self.origens)
+
+    @property
+    def qtd_indices(self):
+        """
+        Quantidade de posições necessárias para indexar os vértices diretamente pelo id (maior id + 1).
+
+        Só faz sentido para rótulos inteiros; veja `TabelaVertices` para os demais.
+        """
+        return max(max(self.origens, default=-1), max(self.destinos, default=-1)) + 1
+
+    @property
+    def textual(self):
+        return isinstance(self.origens, list)
+
+    def tornar_textual(self):
+        """
+        Converte os rótulos já lidos para strings (a lista passa a aceitar qualquer rótulo).
+        """
+        if not self.textual:
+            self.origens = list(map(str, self.origens))
+            self.destinos = list(map(str, self.destinos))
+
+    def acrescentar(self, origens, destinos):
+        """
+        Acrescenta as extremidades de um lote de arestas, tornando a lista textual se necessário.
+        """
+        if self.textual or isinstance(origens, list) or isinstance(destinos, list):
+            self.tornar_textual()
+            self.origens.extend(origens if isinstance(origens, list) else map(str, origens))
+            self.destinos.extend(destinos if isinstance(destinos, list) else map(str, destinos))
+        else:
+            self.origens.extend(origens)
+            self.destinos.extend(destinos)
+
+    def estender(self, outra):
+        """
+        Acrescenta as arestas de `outra` ao final desta lista.
+        """
+        self.acrescentar(outra.origens, outra.destinos)
+        self.pesos.extend(outra.pesos)
+        self.ponderado = self.ponderado or outra.ponderado
+
+
+def abrir_entrada(fonte):
+    """
+    Abre a fonte de arestas em modo binário, descompactando gzip/bz2 quando necessário.
+
+    A compressão é detectada pelos bytes iniciais do conteúdo, não pela extensão.
+
+    Parâmetros:
+        fonte (str | os.PathLike | file): Caminho do arquivo ou objeto de arquivo já aberto.
+
+    Retorna:
+        tuple: O objeto de arquivo binário e um booleano indicando se ele deve ser fechado pelo chamador.
+    """
+
+    if isinstance(fonte, (str, bytes, os.PathLike)):
+        arquivo = open(fonte, 'rb')
+        inicio = arquivo.read(3)
+        arquivo.seek(0)
+        for assinatura, abrir in _ASSINATURAS:
+            if inicio.startswith(assinatura):
+                arquivo.close()
+                return abrir(fonte, 'rb'), True
+        return arquivo, True
+
+    if isinstance(fonte, io.TextIOBase):
+        return fonte, False
+
+    if hasattr(fonte, 'peek'):
+        inicio = fonte.peek(3)[:3]
+    elif fonte.seekable():
+        posicao = fonte.tell()
+        inicio = fonte.read(3)
+        fonte.seek(posicao)
+    else:
+        inicio = b''
+    for assinatura, abrir in _ASSINATURAS:
+        if inicio.startswith(assinatura):
+            return abrir(fonte, 'rb'), False
+    return fonte, False
+
+
+def _converter_rotulos(tokens):
+    """
+    Converte os rótulos de uma coluna para inteiros ou, se algum não for inteiro, para strings.
+    """
+    try:
+        return array('q', map(int, tokens))
+    except (ValueError, OverflowError):
+        return [token.decode() for token in tokens]
+
+
+def _interpretar_bloco(bloco, arestas):
+    """
+    Converte um bloco de linhas completas em arestas.
+
+    Quando todas as linhas têm o mesmo número de colunas (2 ou 3), os tokens do bloco
+    inteiro são convertidos de uma só vez, coluna a coluna; caso contrário o bloco é
+    lido linha a linha, aceitando linhas com e sem peso misturadas.
+    """
+
+    qtd_linhas = bloco.count(b'\n')
+
+    if qtd_linhas:
+        # Cada fim de linha vira um token marcador. A contagem total de tokens não basta (linhas
+        # de 1 e de 4 colunas somam o mesmo que duas de 2 e 3): o bloco só é uniforme com n colunas
+        # se o marcador ocupa exatamente cada (n + 1)-ésima posição
+        tokens = bloco.replace(b'\n', b' \0\n').split()
+        if tokens.count(b'\0') == qtd_linhas:
+            if len(tokens) == 4 * qtd_linhas and tokens[3::4].count(b'\0') == qtd_linhas:
+                arestas.acrescentar(_converter_rotulos(tokens[0::4]), _converter_rotulos(tokens[1::4]))
+                arestas.pesos.extend(map(float, tokens[2::4]))
+                arestas.ponderado = True
+                return
+            if len(tokens) == 3 * qtd_linhas and tokens[2::3].count(b'\0') == qtd_linhas:
+                arestas.acrescentar(_converter_rotulos(tokens[0::3]), _converter_rotulos(tokens[1::3]))
+                arestas.pesos.extend(array('d', [1.0]) * qtd_linhas)
+                return
+
+    origens, destinos = [], []
+    for linha in bloco.split(b'\n'):
+        numeros = linha.split()
+        if len(numeros) >= 3:
+            peso = float(numeros[2])
+            arestas.ponderado = True
+        elif len(numeros) == 2:
+            peso = 1.0
+        else:
+            continue
+        origens.append(numeros[0])
+        destinos.append(numeros[1])
+        arestas.pesos.append(peso)
+    arestas.acrescentar(_converter_rotulos(origens), _converter_rotulos(destinos))
+
+
+def iterar_blocos_arestas(fonte='entrada.txt', tamanho_bloco=TAMANHO_BLOCO, progresso=None):
+    """
+    Lê um arquivo de arestas em blocos grandes e gera as arestas de cada bloco separadamente.
+
+    Permite processar entradas maiores que a memória: cada `ListaArestas` gerada contém apenas
+    as arestas de um bloco e pode ser descartada depois de usada.
+
+    Parâmetros:
+        fonte (str | os.PathLike | file): Caminho ou objeto de arquivo (texto ou binário).
+                                          Conteúdo gzip ou bz2 é descompactado automaticamente.
+        tamanho_bloco (int): Quantidade de bytes lidos por vez.
+        progresso (callable): Função opcional chamada após cada bloco como
+                              `progresso(bytes_lidos, arestas_lidas)`, com os totais acumulados.
+
+    Gera:
+        ListaArestas: As arestas de um bloco, com `qtd_vertices` do cabeçalho do arquivo.
+    """
+
+    arquivo, fechar = abrir_entrada(fonte)
+    qtd_vertices = 0
+    arestas_lidas = 0
+    bytes_lidos = 0
+    resto = b''
+    cabecalho_lido = False
+    gerados = 0
+
+    def interpretar(bloco):
+        arestas = ListaArestas()
+        arestas.qtd_vertices = qtd_vertices
+        _interpretar_bloco(bloco, arestas)
+        return arestas
+
+    try:
+        while True:
+            bloco = arquivo.read(tamanho_bloco)
+            if not bloco:
+                break
+            if isinstance(bloco, str):
+                bloco = bloco.encode()
+            bytes_lidos += len(bloco)
+            bloco = resto + bloco
+
+            # Processa apenas linhas completas; o final incompleto segue para o próximo bloco
+            corte = bloco.rfind(b'\n') + 1
+            resto = bloco[corte:]
+            bloco = bloco[:corte]
+
+            if not cabecalho_lido:
+                bloco = bloco.lstrip()
+                if not bloco:
+                    continue
+                fim_cabecalho = bloco.find(b'\n')
+                qtd_vertices = int(bloco[:fim_cabecalho])
+                bloco = bloco[fim_cabecalho + 1:]
+                cabecalho_lido = True
+
+            arestas = interpretar(bloco)
+            arestas_lidas += len(arestas)
+            if progresso is not None:
+                progresso(bytes_lidos, arestas_lidas)
+            gerados += 1
+            yield arestas
+
+        if resto.strip():
+            if cabecalho_lido:
+                arestas = interpretar(resto + b'\n')
+            else:
+                qtd_vertices = int(resto)
+                arestas = interpretar(b'')
+            arestas_lidas += len(arestas)
+            if progresso is not None:
+                progresso(bytes_lidos, arestas_lidas)
+            yield arestas
+        elif not gerados:
+            # Garante ao menos um bloco, para que o chamador conheça `qtd_vertices`
+            yield interpretar(b'')
+    finally:
+        if fechar:
+            arquivo.close()
+
+
+def ler_intervalo(caminho, inicio, fim, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Gera as arestas das linhas que começam entre os bytes `inicio` (inclusive) e `fim` (exclusive).
+
+    Usado para dividir um arquivo sem compressão entre vários processos: intervalos adjacentes
+    cobrem cada linha exatamente uma vez. A linha de cabeçalho é ignorada.
+
+    Parâmetros:
+        caminho (str | os.PathLike): Arquivo de arestas sem compressão.
+        inicio (int): Primeiro byte do intervalo.
+        fim (int): Byte seguinte ao último do intervalo.
+        tamanho_bloco (int): Quantidade de bytes lidos por vez.
+
+    Gera:
+        ListaArestas: As arestas de cada bloco lido (sem `qtd_vertices`).
+    """
+
+    with open(caminho, 'rb') as arquivo:
+        if inicio == 0:
+            arquivo.readline()  # cabeçalho com a quantidade de vértices
+        else:
+            # A linha que contém o byte inicio - 1 pertence ao intervalo anterior
+            arquivo.seek(inicio - 1)
+            arquivo.readline()
+        posicao = arquivo.tell()
+
+        while posicao < fim:
+            bloco = arquivo.read(min(tamanho_bloco, fim - posicao))
+            if not bloco:
+                break
+            if not bloco.endswith(b'\n'):
+                # Completa a linha iniciada dentro do intervalo, mesmo que termine depois de `fim`
+                bloco += arquivo.readline()
+                if not bloco.endswith(b'\n'):
+                    bloco += b'\n'
+            posicao = arquivo.tell()
+
+            arestas = ListaArestas()
+            _interpretar_bloco(bloco, arestas)
+            yield arestas
+
+
+def ler_arestas(fonte='entrada.txt', tamanho_bloco=TAMANHO_BLOCO, progresso=None):
+    """
+    Lê um arquivo de arestas em blocos grandes e devolve as arestas em buffers tipados.
+
+    Formato esperado do arquivo:
+    - Primeira linha: número de vértices (inteiro).
+    - Linhas seguintes: vértice1 vértice2 [peso], onde 'peso' é opcional. Os vértices costumam
+      ser inteiros, mas qualquer rótulo sem espaços é aceito (veja `ListaArestas.textual`).
+
+    Parâmetros:
+        fonte (str | os.PathLike | file): Caminho ou objeto de arquivo (texto ou binário).
+                                          Conteúdo gzip ou bz2 é descompactado automaticamente.
+        tamanho_bloco (int): Quantidade de bytes lidos por vez.
+        progresso (callable): Função opcional chamada após cada bloco como
+                              `progresso(bytes_lidos, arestas_lidas)`.
+
+    Retorna:
+        ListaArestas: As arestas lidas e a quantidade de vértices do cabeçalho.
+    """
+
+    arestas = ListaArestas()
+    for bloco in iterar_blocos_arestas(fonte, tamanho_bloco, progresso):
+        arestas.qtd_vertices = bloco.qtd_vertices
+        arestas.estender(bloco)
+    return arestas
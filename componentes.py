@@ -0,0 +1,504 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import io
+import os
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele as uniões são feitas aresta por aresta
+    np = None
+
+try:
+    from .adjacencia import AdjacenciaCSR
+    from .carregador import TAMANHO_BLOCO, abrir_entrada, iterar_blocos_arestas, ler_intervalo
+    from .resultados import ResultadoComponentes
+    from .vertices import TabelaVertices
+except ImportError:
+    from adjacencia import AdjacenciaCSR
+    from carregador import TAMANHO_BLOCO, abrir_entrada, iterar_blocos_arestas, ler_intervalo
+    from resultados import ResultadoComponentes
+    from vertices import TabelaVertices
+
+# Maior id inteiro usado diretamente como índice da floresta em `componentes_de_arestas`
+LIMITE_IDS_DIRETOS = 1 << 24
+
+
+class UniaoBusca:
+    """
+    Estrutura de união e busca (disjoint-set) sobre os índices dos vértices.
+
+    `encontrar` usa compressão de caminho (por divisão pela metade) e `unir` usa união por posto,
+    de modo que cada operação custa, na prática, tempo constante. A estrutura cresce sob demanda,
+    o que permite processar uma lista de arestas sem conhecer antes o maior id.
+
+    Atributos:
+        pai (array): Pai de cada id na floresta; raízes apontam para si mesmas.
+        posto (bytearray): Limite superior da altura de cada árvore (usado apenas nas raízes).
+        presente (bytearray): 1 para os ids que apareceram em alguma aresta ou foram marcados.
+    """
+
+    def __init__(self, qtd_indices=0):
+        self.pai = array('q', range(qtd_indices))
+        self.posto = bytearray(qtd_indices)
+        self.presente = bytearray(qtd_indices)
+
+    def __len__(self):
+        return len(self.pai)
+
+    def garantir(self, qtd_indices):
+        """
+        Aumenta a estrutura para acomodar ids até `qtd_indices - 1`.
+        """
+        atual = len(self.pai)
+        if qtd_indices > atual:
+            self.pai.extend(range(atual, qtd_indices))
+            self.posto.extend(bytes(qtd_indices - atual))
+            self.presente.extend(bytes(qtd_indices - atual))
+
+    def encontrar(self, x):
+        pai = self.pai
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]
+            x = pai[x]
+        return x
+
+    def unir(self, a, b):
+        """
+        Une os conjuntos de `a` e `b`. Retorna False se eles já estavam no mesmo conjunto.
+        """
+        ra, rb = self.encontrar(a), self.encontrar(b)
+        if ra == rb:
+            return False
+        posto = self.posto
+        if posto[ra] < posto[rb]:
+            ra, rb = rb, ra
+        self.pai[rb] = ra
+        if posto[ra] == posto[rb]:
+            posto[ra] += 1
+        return True
+
+    def unir_arestas(self, origens, destinos):
+        """
+        Une as extremidades de cada aresta e marca os vértices como presentes.
+
+        Com NumPy, as uniões de um lote inteiro são feitas de forma vetorizada por `_unir_numpy`.
+        """
+        if not len(origens):
+            return
+        if np is not None:
+            origens = np.asarray(origens, dtype=np.int64)
+            destinos = np.asarray(destinos, dtype=np.int64)
+            self.garantir(int(max(origens.max(), destinos.max())) + 1)
+            presente = np.frombuffer(self.presente, dtype=np.uint8)
+            presente[origens] = 1
+            presente[destinos] = 1
+            _unir_numpy(np.frombuffer(self.pai, dtype=np.int64), origens, destinos)
+            return
+
+        self.garantir(max(max(origens), max(destinos)) + 1)
+        presente, encontrar, posto, pai = self.presente, self.encontrar, self.posto, self.pai
+        for a, b in zip(origens, destinos):
+            presente[a] = presente[b] = 1
+            ra, rb = encontrar(a), encontrar(b)
+            if ra != rb:
+                if posto[ra] < posto[rb]:
+                    ra, rb = rb, ra
+                pai[rb] = ra
+                if posto[ra] == posto[rb]:
+                    posto[ra] += 1
+
+    def unir_floresta(self, pai, presente):
+        """
+        Incorpora uma floresta parcial (calculada, por exemplo, em outro processo).
+
+        Parâmetros:
+            pai (buffer): Vetor de pais da outra floresta.
+            presente (buffer): Marcas de presença da outra floresta.
+        """
+        qtd = len(pai)
+        self.garantir(qtd)
+        if np is not None:
+            pai = np.frombuffer(pai, dtype=np.int64)
+            np.frombuffer(self.presente, dtype=np.uint8)[:qtd] |= np.frombuffer(presente, dtype=np.uint8)
+            filhos = np.flatnonzero(pai != np.arange(qtd))
+            if len(filhos):
+                _unir_numpy(np.frombuffer(self.pai, dtype=np.int64), filhos, pai[filhos])
+            return
+
+        for v in range(qtd):
+            if presente[v]:
+                self.presente[v] = 1
+            if pai[v] != v:
+                self.unir(v, pai[v])
+
+    def raizes(self):
+        """
+        Retorna a raiz de cada id, comprimindo a floresta inteira.
+        """
+        if np is not None:
+            pai = np.frombuffer(self.pai, dtype=np.int64)
+            _comprimir_numpy(pai)
+            return pai
+        pai, encontrar = self.pai, self.encontrar
+        for v in range(len(pai)):
+            pai[v] = encontrar(v)
+        return pai
+
+    def componentes(self, tabela=None):
+        """
+        Rotula os componentes dos ids presentes.
+
+        Os componentes são numerados de 0 em diante na ordem do menor vértice de cada um;
+        ids ausentes recebem o rótulo -1.
+
+        Parâmetros:
+            tabela (TabelaVertices): Rótulos dos ids, repassados ao resultado.
+
+        Retorna:
+            ResultadoComponentes: Vetor de rótulos e tamanho de cada componente.
+        """
+        raizes = self.raizes()
+        if np is not None:
+            presente = np.frombuffer(self.presente, dtype=np.uint8).astype(bool)
+            rotulos = np.full(len(raizes), -1, dtype=np.int64)
+            if presente.any():
+                _, primeiro, inverso = np.unique(raizes[presente], return_index=True, return_inverse=True)
+                # np.unique ordena pelas raízes; renumera pela ordem do primeiro vértice de cada componente
+                ordem = np.argsort(primeiro, kind='stable')
+                novo = np.empty_like(ordem)
+                novo[ordem] = np.arange(len(ordem))
+                rotulos[presente] = novo[inverso]
+            tamanhos = np.bincount(rotulos[rotulos >= 0], minlength=0) if presente.any() else np.zeros(0, np.int64)
+            return ResultadoComponentes(array('q', rotulos.tobytes()), array('q', tamanhos.tobytes()), tabela)
+
+        rotulos = array('q', [-1]) * len(raizes)
+        tamanhos = array('q')
+        rotulo_da_raiz = {}
+        for v, raiz in enumerate(raizes):
+            if self.presente[v]:
+                rotulo = rotulo_da_raiz.get(raiz)
+                if rotulo is None:
+                    rotulo = rotulo_da_raiz[raiz] = len(tamanhos)
+                    tamanhos.append(0)
+                rotulos[v] = rotulo
+                tamanhos[rotulo] += 1
+        return ResultadoComponentes(rotulos, tamanhos, tabela)
+
+
+def _comprimir_numpy(pai):
+    """
+    Faz cada id apontar diretamente para a raiz (saltos de ponteiro até estabilizar).
+    """
+    while True:
+        avo = pai[pai]
+        if np.array_equal(avo, pai):
+            return
+        pai[:] = avo
+
+
+def _raizes_numpy(pai, vertices):
+    raizes = pai[vertices]
+    while True:
+        proximas = pai[raizes]
+        if np.array_equal(proximas, raizes):
+            return raizes
+        raizes = proximas
+
+
+def _unir_numpy(pai, origens, destinos):
+    """
+    Une as extremidades de um lote de arestas de forma vetorizada.
+
+    A cada rodada, a raiz maior de cada aresta é pendurada na raiz menor. Quando várias arestas
+    disputam a mesma raiz apenas uma atribuição prevalece, então as arestas ainda não resolvidas
+    voltam para a rodada seguinte. Como os pais sempre apontam para ids menores, a floresta nunca
+    forma ciclos; extremidades são comprimidas a cada rodada para manter os caminhos curtos.
+    """
+    while len(origens):
+        raizes_o = _raizes_numpy(pai, origens)
+        raizes_d = _raizes_numpy(pai, destinos)
+        pai[origens] = raizes_o
+        pai[destinos] = raizes_d
+
+        pendentes = raizes_o != raizes_d
+        if not pendentes.any():
+            return
+        origens, destinos = origens[pendentes], destinos[pendentes]
+        raizes_o, raizes_d = raizes_o[pendentes], raizes_d[pendentes]
+        maior = np.maximum(raizes_o, raizes_d)
+        menor = np.minimum(raizes_o, raizes_d)
+        pai[maior] = menor
+
+
+def uniao_da_adjacencia(adjacencia):
+    """
+    Monta a `UniaoBusca` de uma adjacência já construída, com os vértices que têm arestas marcados como presentes.
+
+    Em grafos dirigidos, os conjuntos são os componentes fracamente conexos (a direção é ignorada).
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+
+    Retorna:
+        UniaoBusca: A floresta com um conjunto por componente conexo.
+    """
+    uniao = UniaoBusca(adjacencia.qtd_indices)
+    if np is not None and hasattr(adjacencia, 'offsets'):
+        # No CSR, a linha de cada entrada é recuperada dos offsets, sem laço em Python
+        offsets, vizinhos, _ = adjacencia.buffers()
+        graus = np.diff(np.asarray(offsets))
+        origens = np.repeat(np.arange(adjacencia.qtd_indices, dtype=np.int64), graus)
+        uniao.unir_arestas(origens, vizinhos)
+    else:
+        # Em grafos dirigidos cada aresta aparece uma única vez, e o destino também é marcado
+        dirigido = getattr(adjacencia, 'dirigido', False)
+        for v, vizinhos in adjacencia.items():
+            uniao.presente[v] = 1
+            for u in vizinhos:
+                if dirigido:
+                    uniao.presente[u] = 1
+                    uniao.unir(v, u)
+                elif u > v:
+                    uniao.unir(v, u)
+    return uniao
+
+
+def componentes_da_adjacencia(adjacencia, tabela=None):
+    """
+    Rotula os componentes conexos de uma adjacência já montada.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        tabela (TabelaVertices): Rótulos dos índices da adjacência (padrão: o próprio índice).
+
+    Retorna:
+        ResultadoComponentes: Vetor de rótulos (indexado pelo índice) e tamanho de cada componente.
+    """
+    return uniao_da_adjacencia(adjacencia).componentes(tabela)
+
+
+def componentes_fortes(adjacencia, tabela=None):
+    """
+    Rotula os componentes fortemente conexos com o algoritmo de Tarjan, em versão iterativa.
+
+    A recursão é substituída por uma pilha explícita de vértices e pelo cursor da próxima aresta
+    de cada um (`posicao`), então grafos com caminhos de milhões de vértices não estouram a pilha
+    do Python. A busca percorre diretamente os buffers `offsets`/`vizinhos` do CSR; outros
+    backends são convertidos antes.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência de saída do grafo.
+        tabela (TabelaVertices): Rótulos dos índices da adjacência, repassados ao resultado.
+
+    Retorna:
+        ResultadoComponentes: Componente de cada vértice (-1 para vértices sem arestas), numerados
+                              na ordem do menor índice de cada um.
+    """
+
+    if not hasattr(adjacencia, 'offsets'):
+        adjacencia = AdjacenciaCSR.de_adjacencia(adjacencia, adjacencia.qtd_indices)
+    qtd = adjacencia.qtd_indices
+    offsets, vizinhos, _ = adjacencia.buffers()
+    offsets, vizinhos = memoryview(offsets), memoryview(vizinhos)
+
+    ordem = array('q', [-1]) * qtd
+    baixo = array('q', bytes(8 * qtd))
+    posicao = array('q', bytes(8 * qtd))
+    na_pilha = bytearray(qtd)
+    componente = array('q', [-1]) * qtd
+    pilha = array('q')
+    proximo = qtd_componentes = 0
+
+    for raiz in range(qtd):
+        # Vértices sem arestas de saída só entram na busca se alguma aresta chegar até eles
+        if ordem[raiz] >= 0 or offsets[raiz + 1] == offsets[raiz]:
+            continue
+        ordem[raiz] = baixo[raiz] = proximo
+        proximo += 1
+        posicao[raiz] = offsets[raiz]
+        pilha.append(raiz)
+        na_pilha[raiz] = 1
+        chamadas = [raiz]
+
+        while chamadas:
+            v = chamadas[-1]
+            k, fim = posicao[v], offsets[v + 1]
+            while k < fim:
+                w = vizinhos[k]
+                k += 1
+                if ordem[w] < 0:
+                    # Desce para `w`; a exploração de `v` continua da aresta seguinte
+                    posicao[v] = k
+                    ordem[w] = baixo[w] = proximo
+                    proximo += 1
+                    posicao[w] = offsets[w]
+                    pilha.append(w)
+                    na_pilha[w] = 1
+                    chamadas.append(w)
+                    break
+                if na_pilha[w] and ordem[w] < baixo[v]:
+                    baixo[v] = ordem[w]
+            else:
+                chamadas.pop()
+                if chamadas and baixo[v] < baixo[chamadas[-1]]:
+                    baixo[chamadas[-1]] = baixo[v]
+                if baixo[v] == ordem[v]:
+                    while True:
+                        w = pilha.pop()
+                        na_pilha[w] = 0
+                        componente[w] = qtd_componentes
+                        if w == v:
+                            break
+                    qtd_componentes += 1
+
+    # Renumera na ordem do menor índice de cada componente, como em `UniaoBusca.componentes`
+    novo = array('q', [-1]) * qtd_componentes
+    rotulos = array('q', [-1]) * qtd
+    tamanhos = array('q')
+    for v in range(qtd):
+        c = componente[v]
+        if c >= 0:
+            if novo[c] < 0:
+                novo[c] = len(tamanhos)
+                tamanhos.append(0)
+            rotulos[v] = novo[c]
+            tamanhos[novo[c]] += 1
+    return ResultadoComponentes(rotulos, tamanhos, tabela)
+
+
+def _incorporar_rotulos(uniao, tabela, pai, presente, rotulo):
+    """
+    Une a uma floresta com rótulos internados em `tabela` uma floresta parcial já comprimida.
+
+    Parâmetros:
+        pai (buffer): Raiz de cada índice da floresta parcial.
+        presente (buffer): Marcas de presença da floresta parcial.
+        rotulo (callable): Rótulo de cada índice da floresta parcial.
+    """
+    indice = {v: tabela.internar(rotulo(v)) for v in range(len(pai)) if presente[v]}
+    uniao.garantir(len(tabela))
+    for v, i in indice.items():
+        uniao.presente[i] = 1
+        uniao.unir(i, indice[pai[v]])
+
+
+def _reinternar(uniao, rotulo):
+    """
+    Converte uma floresta para índices internados em uma nova `TabelaVertices`.
+    """
+    nova, tabela = UniaoBusca(), TabelaVertices()
+    _incorporar_rotulos(nova, tabela, uniao.raizes(), uniao.presente, rotulo)
+    return nova, tabela
+
+
+def _ids_diretos(arestas):
+    """
+    Indica se os rótulos inteiros do bloco podem indexar a floresta diretamente.
+    """
+    if not len(arestas):
+        return True
+    if np is not None:
+        extremos = [f(np.frombuffer(c, dtype=np.int64)) for c in (arestas.origens, arestas.destinos) for f in (np.min, np.max)]
+    else:
+        extremos = [f(c) for c in (arestas.origens, arestas.destinos) for f in (min, max)]
+    return min(extremos) >= 0 and max(extremos) < LIMITE_IDS_DIRETOS
+
+
+def _unir_blocos(blocos):
+    """
+    Une as arestas de cada bloco e retorna (uniao, tabela).
+
+    Rótulos inteiros pequenos e não negativos são usados diretamente como ids (tabela None).
+    Ao encontrar o primeiro id fora desse limite, ou o primeiro bloco textual, a floresta já
+    montada é convertida para rótulos internados em uma `TabelaVertices`.
+    """
+    uniao, tabela, textual = UniaoBusca(), None, False
+    for arestas in blocos:
+        if arestas.textual and not textual:
+            rotulo = str if tabela is None else (lambda v, anterior=tabela.rotulo: str(anterior(v)))
+            uniao, tabela = _reinternar(uniao, rotulo)
+            textual = True
+        elif tabela is None and not _ids_diretos(arestas):
+            uniao, tabela = _reinternar(uniao, int)
+
+        if tabela is None:
+            uniao.unir_arestas(arestas.origens, arestas.destinos)
+        else:
+            if textual:
+                arestas.tornar_textual()
+            internar = tabela.internar
+            origens = array('q', map(internar, arestas.origens))
+            destinos = array('q', map(internar, arestas.destinos))
+            uniao.unir_arestas(origens, destinos)
+    return uniao, tabela
+
+
+def _componentes_intervalo(caminho, inicio, fim, tamanho_bloco):
+    """
+    Processo trabalhador: calcula a floresta parcial das arestas de um intervalo de bytes do arquivo.
+    """
+    uniao, tabela = _unir_blocos(ler_intervalo(caminho, inicio, fim, tamanho_bloco))
+    uniao.raizes()
+    return uniao.pai.tobytes(), bytes(uniao.presente), None if tabela is None else list(tabela)
+
+
+def componentes_de_arestas(fonte='entrada.txt', workers=1, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Rotula os componentes conexos direto da lista de arestas, sem montar a adjacência.
+
+    As arestas são lidas em blocos e unidas em uma `UniaoBusca`, então a memória usada é
+    proporcional à quantidade de vértices mais um bloco, não à quantidade de arestas.
+    Rótulos inteiros até `LIMITE_IDS_DIRETOS` indexam a floresta diretamente; rótulos maiores,
+    negativos ou textuais são internados em uma `TabelaVertices` à medida que aparecem.
+
+    Com `workers` > 1 e um arquivo sem compressão, o arquivo é dividido em intervalos de bytes;
+    cada processo monta a floresta do seu intervalo e as florestas são unidas no final.
+
+    Parâmetros:
+        fonte (str | os.PathLike | file): Arquivo de arestas (mesmo formato de `ler_arestas`).
+        workers (int): Quantidade de processos (padrão: 1; None usa os.cpu_count()).
+        tamanho_bloco (int): Quantidade de bytes lidos por vez.
+
+    Retorna:
+        ResultadoComponentes: Vetor de rótulos (indexado pelo índice) e tamanho de cada componente.
+    """
+
+    workers = workers or os.cpu_count() or 1
+
+    if workers > 1 and isinstance(fonte, (str, os.PathLike)):
+        arquivo, _ = abrir_entrada(fonte)
+        comprimido = not isinstance(arquivo, io.BufferedReader)
+        arquivo.close()
+        if not comprimido:
+            tamanho = os.path.getsize(fonte)
+            cortes = [tamanho * i // workers for i in range(workers + 1)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                tarefas = [
+                    executor.submit(_componentes_intervalo, os.fspath(fonte), inicio, fim, tamanho_bloco)
+                    for inicio, fim in zip(cortes, cortes[1:])
+                ]
+                parciais = [tarefa.result() for tarefa in tarefas]
+
+            uniao = UniaoBusca()
+            if any(rotulos is not None for _, _, rotulos in parciais):
+                # Algum intervalo internou seus rótulos: todas as florestas passam pela mesma tabela
+                textual = any(
+                    not isinstance(rotulo, int) for _, _, rotulos in parciais if rotulos is not None for rotulo in rotulos
+                )
+                converter = str if textual else int
+                tabela = TabelaVertices()
+                for pai, presente, rotulos in parciais:
+                    if rotulos is None:
+                        rotulo = converter
+                    else:
+                        rotulo = lambda v, rotulos=rotulos: converter(rotulos[v])
+                    _incorporar_rotulos(uniao, tabela, array('q', pai), presente, rotulo)
+                return uniao.componentes(tabela)
+            for pai, presente, _ in parciais:
+                uniao.unir_floresta(array('q', pai), presente)
+            return uniao.componentes(TabelaVertices.faixa(0, len(uniao)))
+
+    uniao, tabela = _unir_blocos(iterar_blocos_arestas(fonte, tamanho_bloco))
+    if tabela is None:
+        tabela = TabelaVertices.faixa(0, len(uniao))
+    return uniao.componentes(tabela)
@@ -0,0 +1,150 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import functools
+import os
+
+try:
+    from .grafo import Grafo, VisaoGrafo
+except ImportError:
+    from grafo import Grafo, VisaoGrafo
+
+# Visão do grafo de cada processo trabalhador, aberta uma única vez por `_inicializar_processo`
+_VISAO = {}
+
+
+def _inicializar_processo(caminho_grafo):
+    """
+    Prepara um processo trabalhador: mapeia o snapshot do grafo e o congela.
+
+    Todos os processos mapeiam o mesmo arquivo, então as arestas são compartilhadas somente
+    leitura entre eles, como em `caminhos_minimos_lote`.
+    """
+    _VISAO['visao'] = Grafo.carregar(caminho_grafo).congelar()
+
+
+def _no_processo(consulta, *args):
+    return consulta(_VISAO['visao'], *args)
+
+
+# As consultas devolvem tipos simples (listas, dicionários, `ResultadoCaminho`), que podem ser
+# enviados de volta pelos processos trabalhadores; os rótulos já vêm traduzidos
+
+def _busca_largura(visao, v, profundidade_maxima, direcao, modo):
+    return list(visao.busca_largura(v, None, profundidade_maxima, direcao, modo))
+
+
+def _busca_profundidade(visao, v, profundidade_maxima, direcao):
+    return list(visao.busca_profundidade(v, None, profundidade_maxima, direcao))
+
+
+def _caminho_minimo(visao, origem, destino, bidirecional, direcao):
+    return visao.calcular_caminho_minimo(origem, destino, bidirecional, direcao=direcao)
+
+
+def _distancias(visao, origem, direcao):
+    return dict(visao.calcular_caminho_minimo(origem, direcao=direcao))
+
+
+class ExecutorConsultas:
+    """
+    Executa consultas de BFS, DFS e caminhos mínimos sobre uma `VisaoGrafo` a partir de código asyncio.
+
+    Cada consulta é uma corrotina: o cálculo roda em um pool de threads (padrão) ou de processos,
+    e o laço de eventos continua livre enquanto isso. Com threads, todas compartilham a mesma
+    visão em memória; como o cálculo em Python puro disputa o GIL, threads rendem mais quando a
+    aplicação também espera E/S ou quando a busca é vetorizada (`modo='niveis'`). Com
+    `processos=True`, cada processo mapeia o mesmo snapshot binário do grafo (o arquivo de
+    `Grafo.carregar`, ou um snapshot temporário) e as consultas rodam de fato em paralelo.
+
+    Exemplo:
+        async with ExecutorConsultas(grafo.congelar()) as executor:
+            caminhos = await asyncio.gather(*(executor.caminho_minimo(1, v) for v in destinos))
+
+    Parâmetros:
+        grafo (VisaoGrafo | Grafo): Grafo consultado; um `Grafo` é congelado na criação do executor.
+        workers (int): Quantidade de threads ou processos (padrão: o do `concurrent.futures`).
+        processos (bool): Usa um pool de processos em vez de threads.
+
+    Atributos:
+        visao (VisaoGrafo): A visão consultada.
+    """
+
+    def __init__(self, grafo, workers=None, processos=False):
+        self.visao = grafo if isinstance(grafo, VisaoGrafo) else grafo.congelar()
+        self._temporario = None
+        if processos:
+            caminho, temporario = self.visao._snapshot_compartilhado()
+            if temporario:
+                self._temporario = caminho
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers, initializer=_inicializar_processo, initargs=(os.fspath(caminho),)
+            )
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='consultas_grafo')
+        self._processos = processos
+
+    async def _executar(self, consulta, *args):
+        loop = asyncio.get_running_loop()
+        if self._processos:
+            tarefa = functools.partial(_no_processo, consulta, *args)
+        else:
+            tarefa = functools.partial(consulta, self.visao, *args)
+        return await loop.run_in_executor(self._executor, tarefa)
+
+    async def busca_largura(self, v, profundidade_maxima=None, direcao='saida', modo='fila'):
+        """
+        BFS a partir de `v` (veja `Grafo.busca_largura`).
+
+        Retorna:
+            list: Tuplas (vertice, nivel, pai) na ordem de visita.
+        """
+        return await self._executar(_busca_largura, v, profundidade_maxima, direcao, modo)
+
+    async def busca_profundidade(self, v, profundidade_maxima=None, direcao='saida'):
+        """
+        DFS a partir de `v` (veja `Grafo.busca_profundidade`).
+
+        Retorna:
+            list: Tuplas (vertice, nivel, pai) na ordem de visita.
+        """
+        return await self._executar(_busca_profundidade, v, profundidade_maxima, direcao)
+
+    async def caminho_minimo(self, origem, destino, bidirecional=False, direcao='saida'):
+        """
+        Caminho mínimo entre dois vértices (veja `Grafo.calcular_caminho_minimo`).
+
+        Retorna:
+            ResultadoCaminho: Caminho, distância e algoritmo usado.
+        """
+        return await self._executar(_caminho_minimo, origem, destino, bidirecional, direcao)
+
+    async def distancias(self, origem, direcao='saida'):
+        """
+        Distâncias mínimas de `origem` para todos os vértices (veja `Grafo.calcular_caminho_minimo`).
+
+        Retorna:
+            dict: {vertice: distancia}, com distância infinita para os vértices inalcançáveis.
+        """
+        return await self._executar(_distancias, origem, direcao)
+
+    def fechar(self):
+        """
+        Encerra o pool, esperando as consultas em andamento, e remove o snapshot temporário.
+        """
+        self._executor.shutdown(wait=True)
+        if self._temporario is not None:
+            os.remove(self._temporario)
+            self._temporario = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *excecao):
+        # O encerramento espera as consultas pendentes: roda fora do laço de eventos
+        await asyncio.get_running_loop().run_in_executor(None, self.fechar)
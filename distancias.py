@@ -0,0 +1,87 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele as distâncias entre todos os pares vêm do Dijkstra repetido
+    np = None
+
+# Linhas processadas juntas no Floyd-Warshall: a faixa de linhas e o painel do bloco cabem na cache
+TAMANHO_BLOCO_FLOYD = 128
+# O Floyd-Warshall (O(V³) em NumPy) é escolhido quando V² <= RAZAO_FLOYD * E; abaixo disso,
+# o Dijkstra repetido (O(V * E log V) em Python) sai mais barato
+RAZAO_FLOYD = 128
+
+
+def preencher_matriz_inicial(adjacencia, dist):
+    """
+    Preenche `dist` (n x n) com os pesos das arestas: infinito sem aresta e 0 na diagonal.
+
+    Laços negativos são mantidos na diagonal, onde o Floyd-Warshall os acusa como ciclo negativo.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo, indexada pelos índices densos.
+        dist (numpy.ndarray): Matriz (possivelmente mapeada de um arquivo) a preencher.
+    """
+
+    n = len(dist)
+    dist.fill(np.inf)
+    if hasattr(adjacencia, 'offsets'):
+        offsets, colunas, pesos = adjacencia.buffers()
+        offsets = np.asarray(offsets, dtype=np.int64)[:n + 1]
+        linhas = np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+        colunas = np.asarray(colunas)[:len(linhas)]
+        pesos = np.asarray(pesos)[:len(linhas)]
+        dentro = colunas < n
+        dist[linhas[dentro], colunas[dentro]] = pesos[dentro]
+    else:
+        for u in adjacencia:
+            if u < n:
+                for v, peso in adjacencia[u].items():
+                    if v < n:
+                        dist[u, v] = peso
+    diagonal = np.arange(n)
+    dist[diagonal, diagonal] = np.minimum(dist[diagonal, diagonal], 0)
+
+
+def floyd_warshall_blocos(dist, tamanho_bloco=TAMANHO_BLOCO_FLOYD):
+    """
+    Floyd-Warshall vetorizado e em blocos, no próprio lugar.
+
+    Os vértices intermediários são tratados em blocos de `tamanho_bloco`. Para cada bloco, as
+    linhas do próprio bloco (o painel) são relaxadas primeiro; depois cada faixa de linhas do
+    restante da matriz é relaxada contra o painel, com uma operação NumPy por vértice
+    intermediário. A faixa e o painel ficam na cache durante todo o bloco, em vez de a matriz
+    inteira ser percorrida uma vez por vértice. Faixas que não alcançam nenhum vértice do bloco
+    são puladas, o que acelera bastante grafos pouco conexos.
+
+    Parâmetros:
+        dist (numpy.ndarray): Matriz n x n de pesos (veja `preencher_matriz_inicial`), float32 ou
+                              float64; pode ser um `numpy.memmap`.
+        tamanho_bloco (int): Quantidade de vértices intermediários (e de linhas) por bloco.
+
+    Retorna:
+        numpy.ndarray: A própria `dist`, com as distâncias mínimas. Ciclos negativos deixam
+                       valores negativos na diagonal.
+    """
+
+    n = len(dist)
+    temporario = np.empty((min(tamanho_bloco, n), n), dtype=dist.dtype)
+    for inicio in range(0, n, tamanho_bloco):
+        fim = min(inicio + tamanho_bloco, n)
+
+        # Painel: as linhas do bloco, relaxadas pelos intermediários do próprio bloco
+        painel = dist[inicio:fim]
+        for k in range(inicio, fim):
+            auxiliar = temporario[:fim - inicio]
+            np.add(painel[:, k, None], dist[k], out=auxiliar)
+            np.minimum(painel, auxiliar, out=painel)
+
+        for linha in range(0, n, tamanho_bloco):
+            if linha == inicio:
+                continue
+            faixa = dist[linha:linha + tamanho_bloco]
+            if not np.isfinite(faixa[:, inicio:fim]).any():
+                continue
+            auxiliar = temporario[:len(faixa)]
+            for k in range(inicio, fim):
+                np.add(faixa[:, k, None], painel[k - inicio], out=auxiliar)
+                np.minimum(faixa, auxiliar, out=faixa)
+    return dist
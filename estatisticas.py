@@ -0,0 +1,263 @@
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+import heapq
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele os graus são calculados com a biblioteca padrão
+    np = None
+
+
+@dataclass
+class EstatisticasGrafo:
+    """
+    Estatísticas de grau do grafo, calculadas a partir da adjacência em memória.
+
+    Atributos:
+        qtd_vertices (int): Quantidade de vértices declarada no arquivo de entrada.
+        qtd_arestas (int): Quantidade de arestas distintas (repetições no arquivo contam uma vez).
+        graus (buffer): Grau de cada vértice, indexado pelo índice denso (laços contam 2).
+        grau_medio (float): Soma dos graus dividida pela quantidade de vértices.
+        grau_maximo (int): Maior grau do grafo.
+        distribuicao (dict): Distribuição empírica {grau: fração dos vértices com esse grau},
+                             para todos os graus de 1 até `grau_maximo`.
+        contagem_graus (Counter): Quantidade de vértices com cada grau positivo.
+
+    Depois de alterações no grafo, os métodos `ajustar_*` atualizam as contagens em O(1);
+    os campos derivados são recalculados por `atualizar_resumo` em O(grau máximo).
+    """
+
+    qtd_vertices: int
+    qtd_arestas: int
+    graus: object = field(repr=False)
+    grau_medio: float
+    grau_maximo: int
+    distribuicao: dict = field(repr=False)
+    contagem_graus: Counter = field(repr=False, default_factory=Counter)
+    _desatualizado: bool = field(repr=False, default=False)
+
+    def ajustar_grau(self, v, delta):
+        """
+        Soma `delta` ao grau do vértice `v`, aumentando o vetor de graus se necessário.
+        """
+        if v >= len(self.graus):
+            extra = v + 1 - len(self.graus)
+            if np is not None and isinstance(self.graus, np.ndarray):
+                self.graus = np.concatenate((self.graus, np.zeros(extra, dtype=self.graus.dtype)))
+            else:
+                self.graus.extend(array('q', bytes(8 * extra)))
+        antigo = int(self.graus[v])
+        novo = antigo + delta
+        self.graus[v] = novo
+        if antigo:
+            self.contagem_graus[antigo] -= 1
+        if novo:
+            self.contagem_graus[novo] += 1
+        self._desatualizado = True
+
+    def ajustar_arestas(self, delta):
+        self.qtd_arestas += delta
+        self._desatualizado = True
+
+    def ajustar_vertices(self, delta):
+        self.qtd_vertices += delta
+        self._desatualizado = True
+
+    def atualizar_resumo(self):
+        """
+        Recalcula grau médio, grau máximo e distribuição a partir de `contagem_graus`.
+        """
+        if not self._desatualizado:
+            return
+        soma_grau = sum(grau * qtd for grau, qtd in self.contagem_graus.items())
+        self.grau_maximo = max((grau for grau, qtd in self.contagem_graus.items() if qtd), default=0)
+        divisor = self.qtd_vertices or 1
+        self.grau_medio = soma_grau / divisor
+        self.distribuicao = {
+            grau: self.contagem_graus.get(grau, 0) / divisor for grau in range(1, self.grau_maximo + 1)
+        }
+        self._desatualizado = False
+
+    def formatar(self):
+        """
+        Retorna o texto das informações no formato gravado em 'saida.txt'.
+        """
+        mensagem = f"Quantidade de vertices: {self.qtd_vertices}\n"
+        mensagem += f"Quantidade de arestas: {self.qtd_arestas}\n"
+        mensagem += f"Grau medio: {self.grau_medio}\n"
+        mensagem += ''.join(f'{grau} {fracao}\n' for grau, fracao in self.distribuicao.items())
+        return mensagem
+
+
+def _graus_numpy(adjacencia, reversa=None):
+    offsets, vizinhos, _ = adjacencia.buffers()
+    graus = np.diff(np.asarray(offsets))
+    if reversa is not None:
+        # Grafo dirigido: grau de saída mais grau de entrada (um laço soma 1 em cada)
+        graus = graus + np.diff(np.asarray(reversa.offsets))
+        return graus
+    vizinhos = np.asarray(vizinhos)
+    # Um laço aparece uma única vez na linha do vértice, mas soma 2 ao grau
+    linha = np.repeat(np.arange(adjacencia.qtd_indices), graus)
+    graus += np.bincount(linha[vizinhos == linha], minlength=adjacencia.qtd_indices)
+    return graus
+
+
+def _graus_python(adjacencia, reversa=None):
+    graus = array('q', bytes(8 * adjacencia.qtd_indices))
+    if reversa is not None:
+        for v, vizinhos in adjacencia.items():
+            graus[v] = len(vizinhos)
+        for v, vizinhos in reversa.items():
+            graus[v] += len(vizinhos)
+        return graus
+    for v, vizinhos in adjacencia.items():
+        graus[v] = len(vizinhos) + (1 if v in vizinhos else 0)
+    return graus
+
+
+def calcular_estatisticas(adjacencia, qtd_vertices, reversa=None):
+    """
+    Calcula as estatísticas de grau em uma única passada sobre a adjacência.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        qtd_vertices (int): Quantidade de vértices declarada no arquivo de entrada.
+        reversa (AdjacenciaCSR | AdjacenciaDict): Adjacência de entrada de um grafo dirigido; o grau
+                                                  de cada vértice passa a ser saída mais entrada.
+
+    Retorna:
+        EstatisticasGrafo: As estatísticas calculadas.
+    """
+
+    if np is not None and hasattr(adjacencia, 'offsets') and (reversa is None or hasattr(reversa, 'offsets')):
+        graus = _graus_numpy(adjacencia, reversa)
+        soma_grau = int(graus.sum())
+        contagem_graus = Counter(dict(enumerate(np.bincount(graus).tolist()))) if len(graus) else Counter()
+    else:
+        graus = _graus_python(adjacencia, reversa)
+        soma_grau = sum(graus)
+        contagem_graus = Counter(graus)
+
+    contagem_graus.pop(0, None)
+    grau_maximo = max((grau for grau, qtd in contagem_graus.items() if qtd), default=0)
+    divisor = qtd_vertices or 1
+
+    # Cada aresta contribui com 2 para a soma dos graus (inclusive laços)
+    return EstatisticasGrafo(
+        qtd_vertices=qtd_vertices,
+        qtd_arestas=soma_grau // 2,
+        graus=graus,
+        grau_medio=soma_grau / divisor,
+        grau_maximo=grau_maximo,
+        distribuicao={grau: contagem_graus.get(grau, 0) / divisor for grau in range(1, grau_maximo + 1)},
+        contagem_graus=contagem_graus,
+    )
+
+
+class MetadadosPesos:
+    """
+    Propriedades dos pesos das arestas, mantidas incrementalmente para consultas em O(1).
+
+    As contagens são feitas por entrada da adjacência (em grafos não direcionados cada aresta
+    aparece nos dois extremos; em grafos dirigidos, apenas na linha de origem). Mínimo e máximo
+    vêm de um multiconjunto {peso: quantidade} com dois heaps de remoção preguiçosa: um peso que
+    deixa de existir só é descartado do topo do heap quando chega lá, em O(log E) amortizado.
+
+    Atributos:
+        qtd (int): Quantidade de entradas contabilizadas.
+        qtd_negativos (int): Entradas com peso negativo.
+        qtd_nao_unitarios (int): Entradas com peso diferente de 1.
+        qtd_nao_inteiros (int): Entradas com peso fracionário.
+    """
+
+    def __init__(self):
+        self.qtd = 0
+        self.qtd_negativos = 0
+        self.qtd_nao_unitarios = 0
+        self.qtd_nao_inteiros = 0
+        self._contagem = Counter()
+        self._heap_minimo = []
+        self._heap_maximo = []  # pesos com sinal trocado
+
+    @classmethod
+    def de_adjacencia(cls, adjacencia):
+        """
+        Calcula os metadados a partir de todos os pesos da adjacência, em uma passada.
+        """
+        metadados = cls()
+        if np is not None and hasattr(adjacencia, 'buffers'):
+            offsets, _, pesos = adjacencia.buffers()
+            pesos = np.asarray(pesos)[:offsets[-1]]
+            metadados.qtd = len(pesos)
+            metadados.qtd_negativos = int(np.count_nonzero(pesos < 0))
+            metadados.qtd_nao_unitarios = int(np.count_nonzero(pesos != 1))
+            metadados.qtd_nao_inteiros = int(np.count_nonzero(pesos != np.floor(pesos)))
+            valores, contagens = np.unique(pesos, return_counts=True)
+            metadados._contagem.update(dict(zip(valores.tolist(), contagens.tolist())))
+            # Uma lista crescente já é um heap válido
+            metadados._heap_minimo = valores.tolist()
+            metadados._heap_maximo = (-valores[::-1]).tolist()
+        else:
+            for vizinhos in adjacencia.values():
+                for peso in vizinhos.values():
+                    metadados.adicionar(peso)
+        return metadados
+
+    def adicionar(self, peso):
+        self.qtd += 1
+        if peso < 0:
+            self.qtd_negativos += 1
+        if peso != 1:
+            self.qtd_nao_unitarios += 1
+        if not float(peso).is_integer():
+            self.qtd_nao_inteiros += 1
+        self._contagem[peso] += 1
+        if self._contagem[peso] == 1:
+            heapq.heappush(self._heap_minimo, peso)
+            heapq.heappush(self._heap_maximo, -peso)
+
+    def remover(self, peso):
+        self.qtd -= 1
+        if peso < 0:
+            self.qtd_negativos -= 1
+        if peso != 1:
+            self.qtd_nao_unitarios -= 1
+        if not float(peso).is_integer():
+            self.qtd_nao_inteiros -= 1
+        self._contagem[peso] -= 1
+        if not self._contagem[peso]:
+            del self._contagem[peso]
+            # Os heaps guardam pesos já removidos até chegarem ao topo; quando acumulam
+            # mais entradas mortas que vivas, são reconstruídos a partir do multiconjunto
+            if len(self._heap_minimo) + len(self._heap_maximo) > 4 * len(self._contagem) + 32:
+                self._heap_minimo = sorted(self._contagem)
+                self._heap_maximo = [-peso for peso in reversed(self._heap_minimo)]
+
+    @staticmethod
+    def _topo(heap, contagem, sinal):
+        while heap and sinal * heap[0] not in contagem:
+            heapq.heappop(heap)
+        return sinal * heap[0] if heap else sinal * math.inf
+
+    @property
+    def minimo(self):
+        return self._topo(self._heap_minimo, self._contagem, 1)
+
+    @property
+    def maximo(self):
+        return self._topo(self._heap_maximo, self._contagem, -1)
+
+    @property
+    def tem_negativos(self):
+        return self.qtd_negativos > 0
+
+    @property
+    def todos_unitarios(self):
+        return self.qtd_nao_unitarios == 0
+
+    @property
+    def inteiros(self):
+        return self.qtd_nao_inteiros == 0
@@ -0,0 +1,138 @@
+import csv
+import os
+
+try:
+    from .adjacencia import AdjacenciaCSR
+    from .relatorios import _escrever_linhas, abrir_destino
+except ImportError:
+    from adjacencia import AdjacenciaCSR
+    from relatorios import _escrever_linhas, abrir_destino
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: necessário apenas para exportar em NPZ
+    np = None
+
+# Extensões reconhecidas por `formato_da_extensao`
+FORMATOS_EXPORTACAO = {'.csv': 'csv', '.mtx': 'mtx', '.npz': 'npz'}
+
+
+def formato_da_extensao(destino):
+    """
+    Deduz o formato de exportação pela extensão de `destino` ('csv', 'mtx' ou 'npz').
+
+    Exceções:
+        ValueError: Se a extensão não for reconhecida (ou `destino` não for um caminho).
+    """
+    extensao = os.path.splitext(os.fspath(destino))[1].lower() if not hasattr(destino, 'write') else ''
+    if extensao not in FORMATOS_EXPORTACAO:
+        raise ValueError(
+            f"Formato de exportação não reconhecido para {destino!r}. Opções: {', '.join(FORMATOS_EXPORTACAO.values())}"
+        )
+    return FORMATOS_EXPORTACAO[extensao]
+
+
+def _arestas(adjacencia):
+    """
+    Gera as arestas (u, v, peso) da adjacência, uma única vez cada em grafos não dirigidos.
+    """
+    dirigido = adjacencia.dirigido
+    for u in sorted(adjacencia):
+        for v, peso in adjacencia[u].items():
+            if dirigido or v >= u:
+                yield u, v, peso
+
+
+def exportar_csv(adjacencia, tabela, destino, modo='w'):
+    """
+    Exporta o grafo como lista de arestas em CSV, com cabeçalho 'origem,destino,peso'.
+
+    Os vértices aparecem pelos rótulos. Em grafos não dirigidos cada aresta aparece uma vez.
+    As linhas são gravadas pelo `csv.writer` (em C) sobre um arquivo com buffer grande.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        tabela (TabelaVertices): Tradução dos índices para os rótulos.
+        destino (str | os.PathLike | file): Caminho ou objeto gravável em modo texto.
+        modo (str): Modo de abertura quando `destino` é um caminho (padrão: 'w').
+    """
+    rotulo = tabela.rotulo
+    with abrir_destino(destino, modo) as arquivo:
+        escritor = csv.writer(arquivo, lineterminator='\n')
+        escritor.writerow(('origem', 'destino', 'peso'))
+        escritor.writerows((rotulo(u), rotulo(v), peso) for u, v, peso in _arestas(adjacencia))
+
+
+def exportar_matrix_market(adjacencia, qtd_indices, destino, ponderado=True, modo='w'):
+    """
+    Exporta a matriz de adjacência no formato coordenado Matrix Market (.mtx).
+
+    A linha e a coluna `i + 1` correspondem ao vértice de índice `i`, como em `matriz_densa`.
+    Grafos não dirigidos são gravados como matriz simétrica (só o triângulo inferior); grafos
+    sem pesos, como padrão de esparsidade ('pattern'). O arquivo é lido, por exemplo, por
+    `scipy.io.mmread`.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        qtd_indices (int): Dimensão da matriz (quantidade de índices de vértice).
+        destino (str | os.PathLike | file): Caminho ou objeto gravável em modo texto.
+        ponderado (bool): Grava os pesos (campo 'real'); caso contrário, só as posições.
+        modo (str): Modo de abertura quando `destino` é um caminho (padrão: 'w').
+    """
+    simetria = 'general' if adjacencia.dirigido else 'symmetric'
+    campo = 'real' if ponderado else 'pattern'
+    # O cabeçalho traz a quantidade de entradas: as arestas são contadas antes de gravar
+    qtd_entradas = sum(1 for _ in _arestas(adjacencia))
+    if adjacencia.dirigido:
+        entradas = _arestas(adjacencia)
+    else:
+        # Simétrica: só o triângulo inferior, (v, u) com v >= u
+        entradas = ((v, u, peso) for u, v, peso in _arestas(adjacencia))
+    if ponderado:
+        linhas = (f'{i + 1} {j + 1} {peso}\n' for i, j, peso in entradas)
+    else:
+        linhas = (f'{i + 1} {j + 1}\n' for i, j, _ in entradas)
+
+    with abrir_destino(destino, modo) as arquivo:
+        arquivo.write(f'%%MatrixMarket matrix coordinate {campo} {simetria}\n')
+        arquivo.write(f'{qtd_indices} {qtd_indices} {qtd_entradas}\n')
+        _escrever_linhas(arquivo, linhas)
+
+
+def exportar_npz(adjacencia, tabela, destino, ponderado=True, compactar=False):
+    """
+    Exporta os vetores CSR do grafo em um arquivo NPZ do NumPy.
+
+    O arquivo contém 'offsets', 'vizinhos' e 'pesos' (a linha do vértice de índice `i` é
+    vizinhos[offsets[i]:offsets[i + 1]]), 'rotulos' (o rótulo de cada índice) e os indicadores
+    'dirigido' e 'ponderado'. Com o backend CSR os buffers são gravados sem conversão; com
+    `scipy.sparse.csr_matrix((pesos, vizinhos, offsets))` o grafo volta a ser uma matriz.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        tabela (TabelaVertices): Tradução dos índices para os rótulos.
+        destino (str | os.PathLike | file): Caminho ou objeto gravável em modo binário.
+        ponderado (bool): Indica se os pesos vieram do arquivo de entrada.
+        compactar (bool): Usa `numpy.savez_compressed` (menor, porém mais lento).
+
+    Exceções:
+        ImportError: Se o NumPy não estiver instalado.
+    """
+    if np is None:
+        raise ImportError("A exportação em NPZ requer o pacote numpy")
+    dirigido = adjacencia.dirigido
+    if not isinstance(adjacencia, AdjacenciaCSR):
+        adjacencia = AdjacenciaCSR.de_adjacencia(adjacencia, adjacencia.qtd_indices)
+    offsets, vizinhos, pesos = adjacencia.buffers()
+    offsets = np.asarray(offsets)
+    qtd_indices = len(offsets) - 1
+    salvar = np.savez_compressed if compactar else np.savez
+    salvar(
+        destino,
+        offsets=offsets,
+        vizinhos=np.asarray(vizinhos)[:offsets[-1]] if qtd_indices else np.zeros(0, np.int64),
+        pesos=np.asarray(pesos)[:offsets[-1]] if qtd_indices else np.zeros(0),
+        rotulos=np.asarray(tabela.rotulos(range(qtd_indices))),
+        dirigido=np.bool_(dirigido),
+        ponderado=np.bool_(ponderado),
+    )
@@ -1,29 +1,162 @@
-from collections import defaultdict, deque
+from array import array
 import sys
-import heapq
+import math
+import mmap
+import os
+import tempfile
+import threading
+
+try:
+    from .adjacencia import AdjacenciaCSR, AdjacenciaDict
+    from .analise import centralidade_grau, centralidade_proximidade, nucleos_k, pagerank
+    from .arvore_geradora import agrupar_por_componente, kruskal, prim
+    from .caminhos import (
+        LIMITE_DIAL, CicloNegativo, arvore_0_1, arvore_bfs, arvore_dial, arvore_dijkstra, arvore_spfa,
+        bfs_bidirecional, bfs_ponto_a_ponto, dijkstra_bidirecional, dijkstra_ponto_a_ponto, potenciais_johnson,
+        reconstruir_caminho,
+    )
+    from .paralelo import calcular_linhas, calcular_lote_paralelo
+    from .cache import ArvoreCaminhos, CacheArvores, CacheArvoresPorThread
+    from .carregador import ler_arestas
+    from .componentes import componentes_fortes, uniao_da_adjacencia
+    from .distancias import RAZAO_FLOYD, floyd_warshall_blocos, preencher_matriz_inicial
+    from .estatisticas import MetadadosPesos, calcular_estatisticas
+    from .exportacao import exportar_csv, exportar_matrix_market, exportar_npz, formato_da_extensao
+    from .matriz import MatrizDensa, MatrizEsparsa, formatar_linha
+    from .metricas import cronometrar, metricas_ativas
+    from .percursos import PoolBuffers, iterar_largura, iterar_profundidade, largura_por_niveis, pico_fila_largura
+    from .persistencia import FLAG_DIRIGIDO, FLAG_PONDERADO, carregar_snapshot, salvar_snapshot
+    from .relatorios import (
+        escrever_busca, escrever_caminho, escrever_caminhos, escrever_componentes, escrever_informacoes,
+        escrever_lista, escrever_matriz,
+    )
+    from .resultados import (
+        MatrizDistancias, ResultadoBusca, ResultadoCaminho, ResultadoCaminhos,
+        ResultadoArvoreGeradora, ResultadoPageRank,
+    )
+    from .vertices import TabelaVertices
+except ImportError:
+    from adjacencia import AdjacenciaCSR, AdjacenciaDict
+    from analise import centralidade_grau, centralidade_proximidade, nucleos_k, pagerank
+    from arvore_geradora import agrupar_por_componente, kruskal, prim
+    from caminhos import (
+        LIMITE_DIAL, CicloNegativo, arvore_0_1, arvore_bfs, arvore_dial, arvore_dijkstra, arvore_spfa,
+        bfs_bidirecional, bfs_ponto_a_ponto, dijkstra_bidirecional, dijkstra_ponto_a_ponto, potenciais_johnson,
+        reconstruir_caminho,
+    )
+    from paralelo import calcular_linhas, calcular_lote_paralelo
+    from cache import ArvoreCaminhos, CacheArvores, CacheArvoresPorThread
+    from carregador import ler_arestas
+    from componentes import componentes_fortes, uniao_da_adjacencia
+    from distancias import RAZAO_FLOYD, floyd_warshall_blocos, preencher_matriz_inicial
+    from estatisticas import MetadadosPesos, calcular_estatisticas
+    from exportacao import exportar_csv, exportar_matrix_market, exportar_npz, formato_da_extensao
+    from matriz import MatrizDensa, MatrizEsparsa, formatar_linha
+    from metricas import cronometrar, metricas_ativas
+    from percursos import PoolBuffers, iterar_largura, iterar_profundidade, largura_por_niveis, pico_fila_largura
+    from persistencia import FLAG_DIRIGIDO, FLAG_PONDERADO, carregar_snapshot, salvar_snapshot
+    from relatorios import (
+        escrever_busca, escrever_caminho, escrever_caminhos, escrever_componentes, escrever_informacoes,
+        escrever_lista, escrever_matriz,
+    )
+    from resultados import (
+        MatrizDistancias, ResultadoBusca, ResultadoCaminho, ResultadoCaminhos,
+        ResultadoArvoreGeradora, ResultadoPageRank,
+    )
+    from vertices import TabelaVertices
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele a BFS por níveis recai na fila
+    np = None
+
+BACKENDS = {
+    'csr': AdjacenciaCSR,
+    'dict': AdjacenciaDict,
+}
+
+# Modos de `busca_largura`: fila vértice a vértice, níveis vetorizados e níveis com troca de direção
+MODOS_LARGURA = ('fila', 'niveis', 'direcional')
 
 class Grafo:
-    def __init__(self):
+    def __init__(self, arquivo='entrada.txt', backend='csr', progresso=None, capacidade_cache=32, dirigido=False):
         """
         Inicializa um grafo com as estruturas necessárias para armazenar os vértices,
         arestas e pesos. Também chama uma função que armazena o grafo em uma estrutura de dados.
 
+        Parâmetros:
+            arquivo (str | os.PathLike | file): Caminho ou objeto de arquivo com a lista de arestas
+                           (padrão: 'entrada.txt'). Arquivos gzip ou bz2 são aceitos. Com None
+                           o grafo começa vazio (usado, por exemplo, por `Grafo.carregar`).
+            backend (str): Estrutura usada para guardar a adjacência. 'csr' (padrão) usa buffers
+                           contíguos no formato CSR; 'dict' usa o `defaultdict(dict)` original.
+            progresso (callable): Função opcional chamada durante a leitura como
+                           `progresso(bytes_lidos, arestas_lidas)`.
+            capacidade_cache (int): Quantidade de árvores de caminhos mínimos mantidas em cache (padrão: 32).
+            dirigido (bool): Trata cada linha 'u v' como a aresta u->v, sem espelhá-la (padrão: False).
+
         Atributos:
-            grafo (dict): Representação do grafo onde as chaves são os vértices e os valores
-                          são os vértices adjacentes com seus respectivos pesos.
+            arquivo (str | os.PathLike | file): Origem das arestas do grafo.
+            grafo (AdjacenciaCSR | AdjacenciaDict): Representação do grafo onde as chaves são os índices
+                          dos vértices e os valores são os índices adjacentes com seus respectivos pesos.
+                          Em grafos dirigidos, guarda apenas as arestas de saída.
+            reverso (AdjacenciaCSR | AdjacenciaDict | None): Em grafos dirigidos, as arestas de entrada de
+                          cada vértice (o grafo transposto), mantidas junto com `grafo`; None caso contrário.
+            vertices (TabelaVertices): Tradução entre os rótulos dos vértices (como aparecem no arquivo)
+                          e os índices densos 0..n-1 usados internamente por todos os algoritmos.
             qtdVertices (int): A quantidade de vértices no grafo.
-            visitado (list): Lista de vértices visitados para algoritmos de busca.
-            matriz_adjacencia (list): Matriz de adjacência para representar as arestas do grafo.
+            ponderado (bool): Indica se alguma aresta do arquivo de entrada informou peso.
+            matriz_adjacencia (MatrizDensa): Matriz de adjacência densa, construída apenas no primeiro acesso.
+            pesos (MetadadosPesos): Propriedades dos pesos (negativos, unitários, inteiros, mínimo e máximo),
+                          calculadas na carga para que a escolha do algoritmo de caminho mínimo seja O(1).
+            cache_arvores (CacheArvores): Árvores de caminhos mínimos das origens consultadas recentemente.
         """
-        # self.grafo = {}
-        self.grafo = defaultdict(dict)
+        if backend not in BACKENDS:
+            raise ValueError(f"Backend desconhecido: {backend!r}. Opções: {', '.join(BACKENDS)}")
+
+        self.arquivo = arquivo
+        self.backend = backend
+        self.dirigido = dirigido
+        self.grafo = None
+        self.reverso = None
+        self.vertices = TabelaVertices.faixa(1, 0)
         self.qtdVertices = 0
-        self.visitado = []
+        self.ponderado = False
         self.lista_adjacencia = {}
-        self.matriz_adjacencia = []
-        self.armazenar_grafo()
+        self._versao = 0
+        self._matriz_densa = None
+        self._estatisticas = None
+        self._uniao = None
+        self._componentes = None
+        self._componentes_fortes = None
+        self._vertices_listados = None
+        self._potenciais = {}
+        self._csr_convertidas = {}
+        self._buffers = PoolBuffers()
+        self._snapshot = None
+        self.pesos = None
+        self.cache_arvores = CacheArvores(capacidade_cache)
+        self._cache_reverso = CacheArvores(capacidade_cache)
+
+        if arquivo is None:
+            self.grafo = BACKENDS[backend].de_arestas([], [], [], 0, dirigido)
+            if dirigido:
+                self.reverso = BACKENDS[backend].de_arestas([], [], [], 0, dirigido)
+            self.pesos = MetadadosPesos.de_adjacencia(self.grafo)
+        else:
+            self.armazenar_grafo(progresso=progresso)
+
+    def _ler_entrada(self, progresso=None):
+        """
+        Lê as arestas de `self.arquivo` com o carregador em blocos.
 
-    def armazenar_grafo(self):
+        Objetos de arquivo posicionáveis são rebobinados, permitindo releituras.
+        """
+        if hasattr(self.arquivo, 'seekable') and self.arquivo.seekable():
+            self.arquivo.seek(0)
+        return ler_arestas(self.arquivo, progresso=progresso)
+
+    def armazenar_grafo(self, progresso=None):
         """
         Lê o arquivo de entrada e armazena o grafo.
 
@@ -35,104 +168,395 @@ class Grafo:
         - Primeira linha: número de vértices (inteiro).
         - Linhas seguintes: vértice1 vértice2 [peso], onde 'peso' é opcional.
 
-        O grafo será armazenado tanto como uma matriz de adjacência quanto como um dicionário 
-        de listas de adjacência.
+        O grafo é armazenado na estrutura de adjacência escolhida em `backend` (CSR ou
+        dicionário de listas de adjacência). A matriz de adjacência densa não é alocada aqui:
+        ela só é construída quando `matriz_adjacencia` ou `matriz_densa` forem acessadas,
+        mantendo o uso de memória em O(V + E). Em grafos dirigidos as arestas não são espelhadas:
+        `grafo` guarda as arestas de saída e `reverso` as de entrada.
+
+        A leitura é feita por `ler_arestas`, que processa o arquivo em blocos grandes e
+        converte todos os números de cada bloco de uma só vez. Os rótulos dos vértices são
+        internados em `vertices`: com rótulos 1..n (o caso comum) o vértice `v` recebe o índice
+        `v - 1` sem nenhuma tabela auxiliar; rótulos esparsos, inteiros de 64 bits ou textuais
+        também são aceitos.
+
+        Com a instrumentação ligada (veja `metricas.instrumentar`), cada fase é cronometrada:
+        'armazenar_grafo.leitura', '.indices', '.adjacencia' e '.pesos'.
+
+        Parâmetros:
+            progresso (callable): Função opcional chamada como `progresso(bytes_lidos, arestas_lidas)`.
+        """
+
+        with cronometrar('armazenar_grafo.leitura'):
+            arestas = self._ler_entrada(progresso)
+        self.qtdVertices = arestas.qtd_vertices
+        self.ponderado = arestas.ponderado
+        self._invalidar_caches()
+
+        # A adjacência é indexada pelos índices densos dos vértices
+        with cronometrar('armazenar_grafo.indices'):
+            self.vertices, origens, destinos = TabelaVertices.de_arestas(
+                arestas.origens, arestas.destinos, arestas.qtd_vertices
+            )
+        with cronometrar('armazenar_grafo.adjacencia'):
+            construir = BACKENDS[self.backend].de_arestas
+            self.grafo = construir(origens, destinos, arestas.pesos, len(self.vertices), self.dirigido)
+            if self.dirigido:
+                # Índice reverso: as mesmas arestas com os extremos trocados, para buscas pela entrada
+                self.reverso = construir(destinos, origens, arestas.pesos, len(self.vertices), True)
+        with cronometrar('armazenar_grafo.pesos'):
+            self.pesos = MetadadosPesos.de_adjacencia(self.grafo)
+
+        metricas = metricas_ativas()
+        if metricas is not None:
+            metricas.incrementar('arestas_lidas', len(arestas.origens))
+
+    def _invalidar_caches(self):
+        """
+        Descarta as estruturas derivadas da adjacência (matriz densa, estatísticas, componentes).
+
+        Deve ser chamada sempre que o grafo for substituído por inteiro; `_versao` identifica
+        o estado atual do grafo para quem guarda resultados fora da instância.
+        """
+        self._registrar_alteracao()
+        self._estatisticas = None
+        self._uniao = None
+
+    def _registrar_alteracao(self):
+        """
+        Marca uma alteração incremental: avança `_versao` e descarta apenas o que não é mantido
+        incrementalmente (matriz densa, rótulos dos componentes, potenciais de Johnson, cópias CSR
+        das buscas vetorizadas e árvores de caminhos em cache).
+        """
+        self._versao += 1
+        self._matriz_densa = None
+        self._componentes = None
+        self._componentes_fortes = None
+        self._vertices_listados = None
+        self._potenciais.clear()
+        self._csr_convertidas.clear()
+        self.cache_arvores.limpar()
+        self._cache_reverso.limpar()
+
+    def _indice(self, v):
+        """
+        Traduz o rótulo `v` para o índice denso, com a mensagem de erro das consultas.
+        """
+        try:
+            return self.vertices.indice(v)
+        except KeyError:
+            raise KeyError(f'Não existe o vértice {v} no grafo') from None
+
+    def _adicionar_vertice(self, v):
+        # Retorna o índice do vértice e se ele foi criado agora
+        if v in self.vertices:
+            return self.vertices.indice(v), False
+        indice = self.vertices.internar(v)
+        self.grafo.qtd_indices = max(self.grafo.qtd_indices, indice + 1)
+        if self.reverso is not None:
+            self.reverso.qtd_indices = max(self.reverso.qtd_indices, indice + 1)
+        self.qtdVertices += 1
+        if self._estatisticas is not None:
+            self._estatisticas.ajustar_vertices(1)
+        return indice, True
+
+    def adicionar_vertice(self, v=None):
+        """
+        Adiciona um vértice isolado ao grafo.
+
+        Parâmetros:
+            v (int | str): Rótulo do novo vértice (padrão: o maior rótulo inteiro mais 1). Vértices
+                     que já pertencem ao grafo não são alterados.
+
+        Retorna:
+            int | str: O rótulo do vértice.
+        """
+        if v is None:
+            v = self.vertices.proximo_rotulo()
+        if self._adicionar_vertice(v)[1]:
+            self._registrar_alteracao()
+        return v
+
+    def _adicionar_aresta(self, u, v, peso):
+        u = self._adicionar_vertice(u)[0]
+        v = self._adicionar_vertice(v)[0]
+        anterior = self.grafo.adicionar(u, v, peso)
+        if self.reverso is not None:
+            self.reverso.adicionar(v, u, peso)
+
+        entradas = 1 if u == v or self.dirigido else 2
+        for _ in range(entradas):
+            if anterior is not None:
+                self.pesos.remover(anterior)
+            self.pesos.adicionar(peso)
+
+        if anterior is None:
+            if self._estatisticas is not None:
+                self._estatisticas.ajustar_grau(u, 1)
+                self._estatisticas.ajustar_grau(v, 1)
+                self._estatisticas.ajustar_arestas(1)
+            if self._uniao is not None:
+                self._uniao.garantir(max(u, v) + 1)
+                self._uniao.presente[u] = self._uniao.presente[v] = 1
+                self._uniao.unir(u, v)
+        return anterior
+
+    def _remover_aresta(self, u, v, verificar_conexao=True):
+        if u not in self.vertices or v not in self.vertices:
+            raise KeyError((u, v))
+        u, v = self.vertices.indice(u), self.vertices.indice(v)
+        peso = self.grafo.remover(u, v)
+        if self.reverso is not None:
+            self.reverso.remover(v, u)
+
+        for _ in range(1 if u == v or self.dirigido else 2):
+            self.pesos.remover(peso)
+        if self._estatisticas is not None:
+            self._estatisticas.ajustar_grau(u, -1)
+            self._estatisticas.ajustar_grau(v, -1)
+            self._estatisticas.ajustar_arestas(-1)
+
+        if self._uniao is not None:
+            # A união e busca não desfaz uniões: se a remoção separou o componente, ela é refeita na próxima consulta
+            if self.dirigido:
+                # A conexão fraca exigiria uma busca sem direção: os rótulos são recalculados na próxima consulta
+                separou = True
+            elif u == v:
+                separou = u not in self.grafo
+            elif not verificar_conexao or u not in self.grafo or v not in self.grafo:
+                separou = True
+            else:
+                separou = bfs_bidirecional(self.grafo, u, v)[1] == math.inf
+            if separou:
+                self._uniao = None
+        return peso
+
+    def adicionar_aresta(self, u, v, peso=None):
+        """
+        Adiciona a aresta u-v ao grafo (ou atualiza seu peso, se ela já existir).
+
+        A adjacência, os graus, os metadados de pesos e a união e busca dos componentes são
+        atualizados incrementalmente; vértices novos são criados automaticamente.
+
+        Parâmetros:
+            u (int | str): Rótulo de um extremo da aresta.
+            v (int | str): Rótulo do outro extremo.
+            peso (float): Peso da aresta (padrão: 1, sem tornar o grafo ponderado).
+
+        Retorna:
+            float | None: O peso anterior da aresta, ou None se ela não existia.
+        """
+        if peso is not None:
+            self.ponderado = True
+        anterior = self._adicionar_aresta(u, v, 1.0 if peso is None else float(peso))
+        self._registrar_alteracao()
+        return anterior
+
+    def remover_aresta(self, u, v):
+        """
+        Remove a aresta u-v do grafo.
+
+        Os vértices continuam no grafo. Para manter os componentes, uma BFS bidirecional entre
+        u e v verifica se eles continuam conectados; a busca termina ao se encontrarem, e se o
+        componente foi separado os rótulos são recalculados na próxima consulta.
+
+        Retorna:
+            float: O peso da aresta removida.
+
+        Exceções:
+            KeyError: Se a aresta não existir.
+        """
+        peso = self._remover_aresta(u, v)
+        self._registrar_alteracao()
+        return peso
+
+    def aplicar_lote(self, arestas, remover=False):
+        """
+        Adiciona (ou remove) várias arestas de uma vez, com uma única invalidação dos caches.
+
+        Parâmetros:
+            arestas (iterable): Tuplas (u, v) ou (u, v, peso).
+            remover (bool): Remove as arestas em vez de adicioná-las. Nesse caso a conectividade
+                            não é verificada aresta a aresta: os componentes são recalculados na
+                            próxima consulta.
+
+        Retorna:
+            int: A quantidade de arestas processadas.
+        """
+        qtd = 0
+        try:
+            for aresta in arestas:
+                if remover:
+                    self._remover_aresta(aresta[0], aresta[1], verificar_conexao=False)
+                elif len(aresta) >= 3:
+                    self.ponderado = True
+                    self._adicionar_aresta(aresta[0], aresta[1], float(aresta[2]))
+                else:
+                    self._adicionar_aresta(aresta[0], aresta[1], 1.0)
+                qtd += 1
+        finally:
+            if qtd:
+                self._registrar_alteracao()
+        return qtd
+
+    def salvar(self, caminho):
+        """
+        Grava o grafo em um snapshot binário que pode ser reaberto com `Grafo.carregar`.
+
+        O arquivo guarda um cabeçalho versionado, a quantidade de vértices, os buffers CSR
+        (offsets, vizinhos e pesos) e a tabela de rótulos dos vértices. Em grafos dirigidos, o
+        índice reverso também é gravado, então a abertura não precisa transpor as arestas.
+        Grafos no backend 'dict' são convertidos para CSR na gravação.
+
+        Parâmetros:
+            caminho (str | os.PathLike): Arquivo de destino.
+        """
+
+        adjacencia = self.grafo
+        if not isinstance(adjacencia, AdjacenciaCSR):
+            adjacencia = AdjacenciaCSR.de_adjacencia(adjacencia, adjacencia.qtd_indices)
+
+        offsets, vizinhos, pesos = adjacencia.buffers()
+        secoes = {'offsets': offsets, 'vizinhos': vizinhos, 'pesos': pesos, **self.vertices.como_secoes()}
+        if self.reverso is not None:
+            reverso = self.reverso
+            if not isinstance(reverso, AdjacenciaCSR):
+                reverso = AdjacenciaCSR.de_adjacencia(reverso, reverso.qtd_indices)
+            offsets, vizinhos, pesos = reverso.buffers()
+            secoes.update({'offsets_entrada': offsets, 'vizinhos_entrada': vizinhos, 'pesos_entrada': pesos})
+        flags = (FLAG_PONDERADO if self.ponderado else 0) | (FLAG_DIRIGIDO if self.dirigido else 0)
+        salvar_snapshot(caminho, secoes, self.qtdVertices, flags)
+
+    @classmethod
+    def carregar(cls, caminho, mmap=True, backend='csr'):
+        """
+        Abre um grafo gravado com `salvar`, sem reprocessar a lista de arestas em texto.
+
+        Com `mmap=True` (padrão) os buffers CSR apontam diretamente para o arquivo mapeado em
+        memória: a abertura não copia as arestas, e processos que carregam o mesmo snapshot
+        compartilham as páginas físicas em modo somente leitura.
+
+        Parâmetros:
+            caminho (str | os.PathLike): Arquivo de snapshot.
+            mmap (bool): Mapeia o arquivo em vez de copiá-lo para a memória.
+            backend (str): 'csr' (padrão) ou 'dict'. O backend 'dict' sempre copia os dados.
+
+        Retorna:
+            Grafo: O grafo carregado.
+        """
+
+        secoes, qtd_vertices, flags = carregar_snapshot(caminho, mmap=mmap and backend == 'csr')
+        dirigido = bool(flags & FLAG_DIRIGIDO)
+        adjacencia = AdjacenciaCSR(secoes['offsets'], secoes['vizinhos'], secoes['pesos'], dirigido)
+        reverso = None
+        if dirigido:
+            reverso = AdjacenciaCSR(secoes['offsets_entrada'], secoes['vizinhos_entrada'], secoes['pesos_entrada'], True)
+
+        grafo = cls(arquivo=None, backend=backend, dirigido=dirigido)
+        grafo.qtdVertices = qtd_vertices
+        grafo.ponderado = bool(flags & FLAG_PONDERADO)
+        grafo.vertices = TabelaVertices.de_secoes(secoes, adjacencia.qtd_indices)
+        if backend == 'csr':
+            grafo.grafo = adjacencia
+            grafo.reverso = reverso
+            # Permite que processos trabalhadores mapeiem o mesmo arquivo
+            grafo._snapshot = (os.fspath(caminho), grafo._versao)
+        else:
+            grafo.grafo = BACKENDS[backend].de_adjacencia(adjacencia, adjacencia.qtd_indices)
+            if reverso is not None:
+                grafo.reverso = BACKENDS[backend].de_adjacencia(reverso, reverso.qtd_indices)
+        grafo.pesos = MetadadosPesos.de_adjacencia(grafo.grafo)
+        return grafo
+
+    def congelar(self, capacidade_cache=32):
+        """
+        Retorna uma visão somente leitura do estado atual do grafo, para consultas simultâneas.
+
+        A visão compartilha os buffers CSR com o grafo (nada é copiado no backend 'csr') e não é
+        afetada por alterações posteriores dele. Veja `VisaoGrafo`.
+
+        Parâmetros:
+            capacidade_cache (int): Árvores de caminhos mínimos mantidas em cache por thread.
+
+        Retorna:
+            VisaoGrafo: A visão congelada.
+        """
+        return VisaoGrafo(self, capacidade_cache)
+
+    def matriz_densa(self, tipo='d'):
+        """
+        Retorna a matriz de adjacência densa, construindo-a no primeiro acesso.
+
+        A matriz ocupa n² posições (n vértices na tabela `vertices`) em um único buffer tipado;
+        o vértice de índice `i` corresponde à linha e à coluna `i` (o vértice `v` de um arquivo
+        com rótulos 1..n fica na linha `v - 1`).
+
+        Parâmetros:
+            tipo (str): Typecode do buffer: 'd' (float64, padrão) ou 'f' (float32, metade da memória).
+        """
+        if self._matriz_densa is None or self._matriz_densa.dados.typecode != tipo:
+            self._matriz_densa = MatrizDensa.de_adjacencia(self.grafo, len(self.vertices), tipo)
+        return self._matriz_densa
+
+    @property
+    def matriz_adjacencia(self):
+        return self.matriz_densa()
 
+    def matriz_esparsa(self):
         """
+        Retorna uma visão esparsa da matriz de adjacência, sem alocar as n² posições.
 
-        with open('entrada.txt', 'r') as arquivo:
-            # Lê a primeira linha separadamente
-            self.qtdVertices = int(next(arquivo).strip())
-            self.matriz_adjacencia = [[0 for _ in range(self.qtdVertices)] for _ in range(self.qtdVertices)]
+        A visão pode ser percorrida linha a linha (cada linha é montada sob demanda) ou
+        exportada no formato coordenado com `coo()`.
+        """
+        return MatrizEsparsa(self.grafo, len(self.vertices))
 
-            for linha in arquivo:
-                numeros = linha.split()
-                if len(numeros) >= 3:
-                    vertice1 = int(numeros[0])
-                    vertice2 = int(numeros[1])
-                    peso = float(numeros[2])
-                    
-                    self.grafo[vertice1][vertice2] = peso
-                    self.grafo[vertice2][vertice1] = peso
-                    self.matriz_adjacencia[vertice1-1][vertice2-1] = peso
-                    self.matriz_adjacencia[vertice2-1][vertice1-1] = peso
-                elif len(numeros) == 2:
-                    vertice1 = int(numeros[0])
-                    vertice2 = int(numeros[1])
+    def estatisticas(self):
+        """
+        Retorna as estatísticas de grau do grafo (graus, arestas, grau médio e distribuição empírica).
 
-                    self.grafo[vertice1][vertice2] = 1
-                    self.grafo[vertice2][vertice1] = 1
-                    self.matriz_adjacencia[vertice1-1][vertice2-1] = 1
-                    self.matriz_adjacencia[vertice2-1][vertice1-1] = 1
+        O cálculo é feito uma única vez sobre a adjacência em memória e fica guardado na
+        instância; alterações feitas com `adicionar_aresta`, `remover_aresta` e `aplicar_lote`
+        atualizam os graus incrementalmente, de forma que consultas repetidas não percorrem
+        as arestas novamente.
 
-    def informacoes(self):
+        Retorna:
+            EstatisticasGrafo: As estatísticas do grafo.
+        """
+        if self._estatisticas is None:
+            self._estatisticas = calcular_estatisticas(self.grafo, self.qtdVertices, self.reverso)
+        self._estatisticas.atualizar_resumo()
+        return self._estatisticas
+
+    def informacoes(self, arquivo_saida='saida.txt'):
         """
         Gera informações sobre o grafo, como a quantidade de vértices, arestas e grau médio.
 
-        A função lê o arquivo de entrada para contar o número de arestas e calcular o grau médio
-        dos vértices. As informações são gravadas em um arquivo de saída ('saida.txt').
+        As informações vêm de `estatisticas()`, calculadas a partir da adjacência em memória:
+        arestas repetidas no arquivo de entrada contam uma única vez. Opcionalmente, as
+        informações são gravadas em um arquivo de saída ('saida.txt') por `relatorios`.
 
         O arquivo de saída incluirá:
         - A quantidade de vértices.
         - A quantidade de arestas.
         - O grau médio dos vértices.
         - A distribuição empírica dos graus dos vértices.
-        """
 
-        mensagem = ''
-        contagem_arestas = 0
-        soma_grau = 0
+        Parâmetros:
+            arquivo_saida (str | file | None): Arquivo ou objeto gravável onde as informações são gravadas
+                                        (padrão: 'saida.txt'). Com None nada é gravado.
+
+        Retorna:
+            EstatisticasGrafo: As estatísticas do grafo.
+        """
 
-        with open('entrada.txt', 'r') as arquivo:
-            # Lê a primeira linha separadamente
-            qtdVertices = next(arquivo).strip()
-            mensagem += f"Quantidade de vertices: {qtdVertices}\n"
-            contagem_numeros = defaultdict(int)
+        estatisticas = self.estatisticas()
 
-            # Agora lê o restante das linhas
-            for linha in arquivo:
-                contagem_arestas+=1
-                numeros = linha.split()
+        if arquivo_saida is not None:
+            escrever_informacoes(estatisticas, arquivo_saida)
 
-                if len(numeros) == 3:
-                    for numero in numeros[:-1]:  # Ignora o último número
-                        numero = int(numero)  # Converte para inteiro
-                        contagem_numeros[numero] += 1  # Incrementa a contagem para esse número
-                else:
-                    for numero in numeros:
-                        numero = int(numero)  # Converte para inteiro
-                        contagem_numeros[numero] += 1  # Incrementa a contagem para esse número
-                    
-            mensagem += f"Quantidade de arestas: {contagem_arestas}\n"
-
-            # Exibe o número de ocorrências de cada número
-            for numero, contagem in contagem_numeros.items():
-                # Incrementa a soma dos graus de cada vértice para se realizar o cálculo do grau médio posteriormente
-                soma_grau += contagem
-            
-            mensagem += f"Grau medio: {int(soma_grau)/int(qtdVertices)}\n"
-
-            # Resgata o maior valor registrado no dicionário (grau máximo)
-            maior_grau = max(contagem_numeros.values())
-        
-            # Contagem de quantos vértices têm cada grau
-            contagem_graus = defaultdict(int)
-            for grau in contagem_numeros.values():
-                contagem_graus[grau] += 1
-            
-            # DISTRIBUIÇÃO EMPÍRICA
-            for grau in range(1, maior_grau + 1):
-                qtd = contagem_graus.get(grau, 0) # Se o grau não existir, retorna 0
-                mensagem += f'{grau} {int(qtd) / int(qtdVertices)}\n'
-        
-        with open('saida.txt', 'w') as arquivo_saida:
-            arquivo_saida.write('--------------INFORMACOES DO GRAFO--------------\n\n')
+        return estatisticas
 
-        with open('saida.txt', 'a') as arquivo_saida:
-            arquivo_saida.write(f'{mensagem}\n')
-        
-        return print('Arquivo de saida com informacoes gerado')
-    
     def representacao(self):
         """
         Permite ao usuário escolher entre representar o grafo por matriz de adjacência ou lista de adjacência.
@@ -158,346 +582,804 @@ class Grafo:
             except ValueError as e:
                 print(f"Erro de valor: {e}")
 
-    def rep_matriz(self):
+    def rep_matriz(self, densa=False, saida=None):
         """
         Exibe a matriz de adjacência do grafo.
 
-        A matriz de adjacência é impressa no console, mostrando as conexões entre os vértices.
+        A matriz é gerada direto da adjacência em memória e gravada em lotes de linhas, com uma
+        escrita por lote em vez de um `print` por linha. Por padrão as linhas são montadas uma a
+        uma pela visão esparsa, sem alocar a matriz densa; ela só é usada se já tiver sido
+        construída ou se `densa` for True.
+
+        Parâmetros:
+            densa (bool): Força a construção da matriz densa antes da impressão.
+            saida (str | file): Arquivo ou objeto gravável (arquivo, socket via `makefile`, etc.)
+                                onde a matriz é escrita. Padrão: None (`sys.stdout`).
         """
-        print('==================== RESULTADO =========================\n')        
-        print('Matriz de adjacência:\n')
-        
-        # Itera sobre as linhas da matriz e imprime cada uma delas
-        for linha in self.matriz_adjacencia:
-            print(' '.join(map(str, linha)))
-        print()
-    
-    def rep_lista(self):
+
+        if densa or self._matriz_densa is not None:
+            linhas = (formatar_linha(linha, self.ponderado) + '\n' for linha in self.matriz_densa())
+        else:
+            linhas = self.matriz_esparsa().linhas_texto(self.ponderado)
+        escrever_matriz(linhas, sys.stdout if saida is None else saida)
+
+    def rep_lista(self, saida=None):
         """
         Exibe a lista de adjacência do grafo.
 
-        A função lê o arquivo de entrada novamente para construir e imprimir a lista de adjacência
-        do grafo no console.
+        A lista é gerada direto da adjacência em memória (sem reler o arquivo de entrada), um
+        vértice por linha, e gravada em lotes. Em grafos dirigidos cada vértice lista os vizinhos
+        de saída.
+
+        Parâmetros:
+            saida (str | file): Arquivo ou objeto gravável onde a lista é escrita.
+                                Padrão: None (`sys.stdout`).
         """
 
-        with open('entrada.txt', 'r') as arquivo:
-            lista_adjacencia = ''
+        escrever_lista(self.grafo, self.vertices, sys.stdout if saida is None else saida)
 
-            # Lê a primeira linha separadamente
-            qtdVertices = int(next(arquivo).strip())
-            relacionamento_numeros = defaultdict(str)
-            numeros_unicos = set()
+    def exportar(self, destino, formato=None, compactar=False):
+        """
+        Exporta o grafo em um formato legível por outras ferramentas.
 
-            for linha in arquivo:
-                numeros = linha.split()
-                vertice1 = numeros[0]
-                vertice2 = numeros[1]
-                    
-                relacionamento_numeros[f'{vertice1}'] += f'-> {vertice2}'
-                relacionamento_numeros[f'{vertice2}'] += f'-> {vertice1}'
+        Formatos:
+        - 'csv': lista de arestas 'origem,destino,peso' com os rótulos dos vértices.
+        - 'mtx': matriz de adjacência no formato coordenado Matrix Market (índices 1..n).
+        - 'npz': vetores CSR do NumPy (offsets, vizinhos, pesos) e os rótulos dos vértices.
 
-                if len(numeros) == 3:
-                    for numero in numeros[:-1]:
-                        numeros_unicos.add(int(numero)) 
-                else:
-                    for numero in numeros:
-                        numeros_unicos.add(int(numero)) 
+        Todos são gerados direto da adjacência em memória; os formatos textuais são gravados
+        em lotes, então o custo fica dominado pela escrita, não pela montagem do texto.
+
+        Parâmetros:
+            destino (str | os.PathLike | file): Arquivo de destino ou objeto gravável.
+            formato (str): 'csv', 'mtx' ou 'npz'. Padrão: None (deduzido da extensão de `destino`).
+            compactar (bool): No formato 'npz', grava o arquivo compactado.
 
-            for numero_unico in numeros_unicos:
-                lista_adjacencia += f'{numero_unico}{relacionamento_numeros[f'{numero_unico}']}\n'
+        Exceções:
+            ValueError: Se o formato for desconhecido ou não puder ser deduzido.
+            ImportError: Se o formato 'npz' for pedido sem o NumPy instalado.
+        """
+
+        if formato is None:
+            formato = formato_da_extensao(destino)
+        if formato == 'csv':
+            exportar_csv(self.grafo, self.vertices, destino)
+        elif formato == 'mtx':
+            exportar_matrix_market(self.grafo, self.grafo.qtd_indices, destino, self.ponderado)
+        elif formato == 'npz':
+            exportar_npz(self.grafo, self.vertices, destino, self.ponderado, compactar)
+        else:
+            raise ValueError(f"Formato desconhecido: {formato!r}. Opções: 'csv', 'mtx', 'npz'")
+
+    def _adjacencias(self, direcao):
+        """
+        Retorna (adjacencia, reversa) para percorrer o grafo na direção pedida.
+
+        'saida' segue as arestas u->v; 'entrada' as segue ao contrário (v->u), usando o índice
+        reverso. Em grafos não dirigidos as duas direções são a mesma adjacência.
+
+        Exceções:
+            ValueError: Se a direção não for 'saida' nem 'entrada'.
+        """
+        if direcao not in ('saida', 'entrada'):
+            raise ValueError(f"Direção desconhecida: {direcao!r}. Opções: 'saida', 'entrada'")
+        if self.reverso is None:
+            return self.grafo, self.grafo
+        if direcao == 'saida':
+            return self.grafo, self.reverso
+        return self.reverso, self.grafo
+
+    def _adjacencias_csr(self, direcao):
+        """
+        Retorna (adjacencia, reversa) como `_adjacencias`, mas sempre em CSR compactado.
 
-            print('\n')
-            print('==================== RESULTADO =========================\n')
-            
-        return print(f'Lista de Adjacencia: \n\n{lista_adjacencia}')
-    
-    def _dfs_componente(self, v, visitado, componente_atual):
+        As buscas vetorizadas leem os buffers CSR diretamente. No backend 'dict', ou com alterações
+        pendentes na sobreposição do CSR, a cópia custa O(V + E); ela é feita uma vez por versão
+        do grafo, como os potenciais de Johnson, sem alterar a adjacência original.
+        """
+        pares = []
+        for adjacencia in self._adjacencias(direcao):
+            if not (isinstance(adjacencia, AdjacenciaCSR) and adjacencia.compactada):
+                chave = 'entrada' if adjacencia is self.reverso else 'saida'
+                if chave not in self._csr_convertidas:
+                    self._csr_convertidas[chave] = AdjacenciaCSR.de_adjacencia(adjacencia, adjacencia.qtd_indices)
+                adjacencia = self._csr_convertidas[chave]
+            pares.append(adjacencia)
+        return tuple(pares)
+
+    def _cache_direcao(self, direcao):
+        self._adjacencias(direcao)
+        return self._cache_reverso if direcao == 'entrada' and self.reverso is not None else self.cache_arvores
+
+    def _indice_busca(self, v):
+        indice = self._indice(v)
+        if indice not in self.grafo and (self.reverso is None or indice not in self.reverso):
+            raise KeyError(f'Não existe o vértice {v} no grafo')
+        return indice
+
+    def _iterar_busca(self, motor, v, profundidade_maxima, parar=None, traduzir=True, direcao='saida'):
         """
-        Realiza uma busca em profundidade (DFS) para encontrar componentes conexos.
+        Executa um motor de busca de `percursos` com buffers do pool, gerando os eventos de visita.
 
-        Este método é utilizado internamente para identificar todos os vértices em um componente conexo,
-        partindo de um vértice específico.
+        O motor trabalha com índices; com `traduzir`, os eventos são convertidos para rótulos.
+        Os buffers voltam ao pool quando a busca termina ou quando o gerador é fechado
+        (por exemplo, por um `break` no laço do chamador).
+        """
+        adjacencia = self._adjacencias(direcao)[0]
+        rotulo = self.vertices.rotulo
+        buffers = self._buffers.obter(self.grafo.qtd_indices)
+        try:
+            for vertice, nivel, pai in motor(adjacencia, v, buffers, profundidade_maxima):
+                if traduzir:
+                    vertice, pai = rotulo(vertice), (None if pai is None else rotulo(pai))
+                yield vertice, nivel, pai
+                if parar is not None and parar(vertice, nivel, pai):
+                    return
+        finally:
+            self._buffers.devolver(buffers)
+
+    def iterar_busca_profundidade(self, v, profundidade_maxima=None, parar=None, direcao='saida'):
+        """
+        Gera os eventos da busca em profundidade (DFS) a partir de um vértice, sob demanda.
+
+        Cada evento é uma tupla (vertice, nivel, pai), com `pai` igual a None para o vértice inicial.
+        Como os eventos são produzidos um a um, o chamador pode interromper a busca a qualquer
+        momento sem pagar pelo restante do grafo.
 
         Parâmetros:
-            v (int): O vértice atual.
-            visitado (list): Lista que rastreia os vértices visitados.
-            componente_atual (list): Lista de vértices que pertencem ao componente conexo atual.
+            v (int): O vértice inicial para a DFS.
+            profundidade_maxima (int): Nível máximo explorado (padrão: sem limite).
+            parar (callable): Predicado `parar(vertice, nivel, pai)`; a busca termina logo após
+                              gerar o primeiro evento para o qual ele retornar True.
+            direcao (str): 'saida' (padrão) segue as arestas; 'entrada' as percorre ao contrário
+                              em grafos dirigidos.
+
+        Exemplos de Uso:
+        ----------------
+        >>> for vertice, nivel, pai in grafo.iterar_busca_profundidade(1, profundidade_maxima=2):
+        ...     print(vertice, nivel, pai)
         """
+        return self._iterar_busca(iterar_profundidade, self._indice_busca(v), profundidade_maxima, parar, direcao=direcao)
 
-        visitado[v] = True
-        componente_atual.append(v)
-        
-        for u in self.grafo[v]:
-            if not visitado[u]:
-                self._dfs_componente(u, visitado, componente_atual)
+    def iterar_busca_largura(self, v, profundidade_maxima=None, parar=None, direcao='saida'):
+        """
+        Gera os eventos da busca em largura (BFS) a partir de um vértice, sob demanda.
+
+        Cada evento é uma tupla (vertice, nivel, pai), com `pai` igual a None para o vértice inicial.
+        Com `profundidade_maxima`, os vértices do último nível não são expandidos: obter apenas os
+        primeiros k níveis custa proporcionalmente ao tamanho desses níveis.
+
+        Parâmetros:
+            v (int): O vértice inicial para a BFS.
+            profundidade_maxima (int): Nível máximo explorado (padrão: sem limite).
+            parar (callable): Predicado `parar(vertice, nivel, pai)`; a busca termina logo após
+                              gerar o primeiro evento para o qual ele retornar True.
+            direcao (str): 'saida' (padrão) segue as arestas; 'entrada' as percorre ao contrário
+                              em grafos dirigidos.
+
+        Exemplos de Uso:
+        ----------------
+        >>> alvo = next(v for v, nivel, pai in grafo.iterar_busca_largura(1) if v == 4)
+        """
+        return self._iterar_busca(iterar_largura, self._indice_busca(v), profundidade_maxima, parar, direcao=direcao)
 
-    def busca_profundidade(self, v, primeira_chamada=True, caminho=[], pai='Nenhum', nivel=0, saida=[]):
+    def busca_profundidade(self, v, arquivo_saida='saida.txt', profundidade_maxima=None, direcao='saida'):
         """
         Realiza a busca em profundidade (DFS) a partir de um vértice.
 
         A função percorre o grafo utilizando DFS, rastreando o caminho, o nível e o pai de cada vértice.
-        Os resultados são armazenados em uma lista e gravados em um arquivo de saída.
+        A busca é iterativa (pilha explícita), portanto não depende do limite de recursão do Python,
+        e cada chamada começa do zero: chamadas repetidas na mesma instância são independentes.
+        O resultado é acrescentado ao arquivo de saída por `relatorios`, em uma escrita com buffer.
 
         Parâmetros:
             v (int): O vértice inicial para a DFS.
-            primeira_chamada (bool): Indica se é a primeira chamada da função (padrão: True).
-            caminho (list): Lista que armazena o caminho percorrido.
-            pai (str): Pai do vértice atual na árvore de DFS (padrão: 'Nenhum').
-            nivel (int): Nível do vértice atual na árvore de DFS (padrão: 0).
-            saida (list): Lista que armazena as informações para o arquivo de saída.
-        """
-
-        if v in self.grafo.keys():
-
-            if not self.visitado:
-                self.visitado = [False] * (len(self.grafo) + 1)
-            
-            self.visitado[v] = True
-            caminho.append(f' {v} ')  # Adiciona o vértice ao caminho
-            saida.append(f'Vertice: {v} -> Nivel: {nivel} | Pai: {pai} \n')
-
-            for u in self.grafo[v]:
-                if not self.visitado[u]:
-                    self.busca_profundidade(u, primeira_chamada=False, caminho=caminho, pai=str(v), nivel=nivel+1, saida=saida)
-
-            if primeira_chamada:
-                # Imprime o caminho ao final da pilha de execuções da chamada recursiva
-                saida.append('\n')
-                saida.append("->".join(map(str, caminho)))
-                
-                with open('saida.txt', 'a') as arquivo_saida:
-                    arquivo_saida.write('--------------BUSCA POR PROFUNDIDADE--------------\n\n')
-                    arquivo_saida.write(f'{"".join(saida)}\n\n')
-                    return print('Arquivo de saida atualizado com informacoes da busca por profundidade')
-        else:
-            print('Não existe esse vértice no grafo, chame a função com outro vértice inicial')
+            arquivo_saida (str | file | None): Arquivo ou objeto gravável ao qual o resultado é acrescentado
+                              (padrão: 'saida.txt'). Com None nada é gravado.
+            profundidade_maxima (int): Nível máximo explorado (padrão: sem limite).
+            direcao (str): 'saida' (padrão) segue as arestas; 'entrada' as percorre ao contrário
+                              em grafos dirigidos.
+
+        Retorna:
+            ResultadoBusca: Vértices na ordem de visita, com nível e pai de cada um.
+
+        Exceções:
+            KeyError: Se o vértice não existir no grafo.
+            ValueError: Se a direção for inválida.
+        """
 
-    def busca_largura(self, v):
+        with cronometrar('busca_profundidade'):
+            eventos = self._iterar_busca(
+                iterar_profundidade, self._indice_busca(v), profundidade_maxima, traduzir=False, direcao=direcao
+            )
+            resultado = ResultadoBusca.de_eventos('profundidade', v, eventos, self.vertices)
+        metricas = metricas_ativas()
+        if metricas is not None:
+            self._registrar_busca(metricas, resultado, profundidade_maxima, direcao)
+        if arquivo_saida is not None:
+            escrever_busca(resultado, arquivo_saida)
+        return resultado
+
+    def busca_largura(self, v, arquivo_saida='saida.txt', profundidade_maxima=None, direcao='saida', modo='fila'):
         """
         Realiza a busca em largura (BFS) a partir de um vértice.
 
         A função percorre o grafo utilizando BFS, rastreando o nível e o pai de cada vértice.
-        Os resultados são armazenados em uma lista e gravados em um arquivo de saída.
+        O resultado é acrescentado ao arquivo de saída por `relatorios`, em uma escrita com buffer.
+
+        Com `modo='niveis'`, a busca é síncrona por níveis (`largura_por_niveis`): cada nível é
+        expandido de uma vez sobre os vetores CSR com NumPy, com a mesma ordem, níveis e pais da
+        fila. Em grafos grandes de diâmetro pequeno isso evita o laço em Python por vértice.
+        `modo='direcional'` ainda alterna para a expansão bottom-up nos níveis com fronteira
+        grande: os níveis são os mesmos, mas a ordem dentro de um nível e a escolha entre pais
+        equivalentes podem mudar. Sem NumPy, os dois modos usam a fila.
 
         Parâmetros:
             v (int): O vértice inicial para a BFS.
+            arquivo_saida (str | file | None): Arquivo ou objeto gravável ao qual o resultado é acrescentado
+                              (padrão: 'saida.txt'). Com None nada é gravado.
+            profundidade_maxima (int): Nível máximo explorado (padrão: sem limite).
+            direcao (str): 'saida' (padrão) segue as arestas; 'entrada' as percorre ao contrário
+                              em grafos dirigidos.
+            modo (str): 'fila' (padrão), 'niveis' ou 'direcional'.
+
+        Retorna:
+            ResultadoBusca: Vértices na ordem de visita, com nível e pai de cada um.
+
+        Exceções:
+            KeyError: Se o vértice não existir no grafo.
+            ValueError: Se a direção ou o modo forem inválidos.
+        """
+
+        if modo not in MODOS_LARGURA:
+            raise ValueError(f"Modo desconhecido: {modo!r}. Opções: {', '.join(MODOS_LARGURA)}")
+        indice = self._indice_busca(v)
+        metricas = metricas_ativas()
+        with cronometrar('busca_largura'):
+            if modo != 'fila' and np is not None:
+                adjacencia, reversa = self._adjacencias_csr(direcao)
+                vetores = largura_por_niveis(
+                    adjacencia, indice, profundidade_maxima, reversa, modo == 'direcional', metricas
+                )
+                resultado = ResultadoBusca('largura', v, *(array('q', x.tobytes()) for x in vetores), self.vertices)
+            else:
+                eventos = self._iterar_busca(iterar_largura, indice, profundidade_maxima, traduzir=False, direcao=direcao)
+                resultado = ResultadoBusca.de_eventos('largura', v, eventos, self.vertices)
+        if metricas is not None:
+            if modo == 'fila' or np is None:
+                self._registrar_busca(metricas, resultado, profundidade_maxima, direcao)
+                metricas.registrar_maximo('pico_fila', pico_fila_largura(resultado.ordem, resultado.pais))
+            else:
+                metricas.incrementar('vertices_visitados', len(resultado))
+        if arquivo_saida is not None:
+            escrever_busca(resultado, arquivo_saida)
+        return resultado
+
+    def _registrar_busca(self, metricas, resultado, profundidade_maxima, direcao):
         """
+        Registra os vértices visitados por uma busca e as arestas examinadas a partir deles.
 
-        if v in self.grafo.keys():
-
-            visitadoLargura = [False] * (len(self.grafo) + 1)
-
-            fila = deque([v])  # Usamos deque para operações eficientes de fila
-            nivel = {v: 0}  # Dicionário para rastrear o nível de cada vértice
-            pai = {v: 'Nenhum'} # Dicionário para rastrear o pai de cada vértice
-            resultado = []
-
-            while fila:
-                vAtual = fila.popleft()  # Remove o primeiro elemento da fila
-                if not visitadoLargura[vAtual]:
-                    resultado.append(vAtual)
-                    visitadoLargura[vAtual] = True
-                    for i in self.grafo[vAtual]:
-                        if not visitadoLargura[i]:
-                            fila.append(i)
-                            pai[i] = str(vAtual)
-                            nivel[i] = nivel[vAtual] + 1
-            
-            with open('saida.txt', 'a') as arquivo_saida:
-                saida = ''
-                for vertice in resultado:
-                    saida += (f"Vertice: {vertice} -> Nivel: {nivel[vertice]} | Pai: {pai[vertice]}\n")
-                saida += f'\n'+ " -> ".join(map(str, resultado))
-                arquivo_saida.write('--------------BUSCA POR LARGURA--------------\n\n')
-                arquivo_saida.write(f'{saida}\n\n')
-                return print('Arquivo de saida atualizado com informacoes da busca por largura')
+        As arestas são contadas pelo grau dos vértices expandidos (os que estão abaixo da
+        profundidade máxima), depois da busca, para que o laço da busca não tenha contadores.
+        """
+        adjacencia = self._adjacencias(direcao)[0]
+        if profundidade_maxima is None:
+            expandidos = resultado.ordem
         else:
-            print('Não existe esse vértice no grafo, chame a função com outro vértice inicial')
+            expandidos = (v for v, nivel in zip(resultado.ordem, resultado.niveis) if nivel < profundidade_maxima)
+        metricas.incrementar('vertices_visitados', len(resultado))
+        metricas.incrementar('arestas_relaxadas', sum(len(adjacencia[v]) for v in expandidos if v in adjacencia))
 
-    def encontrar_componentes_conexos(self):
+    def encontrar_componentes_conexos(self, saida=None):
         """
-        Encontra e exibe os componentes conexos do grafo.
+        Encontra os componentes conexos do grafo.
+
+        As arestas da adjacência são unidas em uma `UniaoBusca` (compressão de caminho e união por
+        posto) sobre os índices densos dos vértices; o resultado traduz os índices de volta para os
+        rótulos. Nada é exibido, a menos que `saida` seja informada.
 
-        A função identifica todos os componentes conexos no grafo, utilizando DFS.
-        Cada componente é impresso com a lista de vértices que o compõem.
+        Em grafos dirigidos a direção das arestas é ignorada (componentes fracamente conexos);
+        veja `componentes_fortemente_conexos`.
 
+        Para entradas grandes demais para montar a adjacência, veja `componentes_de_arestas`.
+
+        Parâmetros:
+            saida (str | file): Arquivo ou objeto gravável (por exemplo, `sys.stdout`) onde a lista
+                                de componentes é escrita no formato textual. Padrão: None (sem saída).
+
+        Retorna:
+            ResultadoComponentes: Rótulo do componente de cada vértice e o tamanho de cada componente.
         """
 
-        visitado = [False] * (len(self.grafo) + 1)
-        componentes = []
-        componentes_contagem = {}
-        
-        # Realiza a DFS para encontrar todos os componentes conexos
-        for v in self.grafo:
-            if not visitado[v]:
-                componente_atual = []
-                self._dfs_componente(v, visitado, componente_atual)
-                componentes.append(componente_atual)
-        
-        print(f"\nNúmero de componentes conexos do grafo: {len(componentes)}")
+        # A união e busca é mantida entre consultas e atualizada pelas inserções de arestas
+        if self._componentes is None:
+            with cronometrar('encontrar_componentes_conexos'):
+                if self._uniao is None:
+                    self._uniao = uniao_da_adjacencia(self.grafo)
+                self._componentes = self._uniao.componentes(self.vertices)
+        resultado = self._componentes
+        if saida is not None:
+            escrever_componentes(resultado, saida)
+        return resultado
+
+    def componentes_fortemente_conexos(self, saida=None):
+        """
+        Encontra os componentes fortemente conexos do grafo dirigido.
 
-        # Preenche o dicionário de contagem de componentes
-        for i, componente in enumerate(componentes):
-            tamanho_componente = len(componente)
-            componentes_contagem[i + 1] = tamanho_componente  # Associa o componente ao seu tamanho
+        Usa o algoritmo de Tarjan em versão iterativa (`componentes_fortes`), em uma única passagem
+        sobre as arestas de saída. O resultado fica guardado até a próxima alteração do grafo.
+        Em grafos não dirigidos coincide com `encontrar_componentes_conexos`.
 
-        # Imprime cada componente e seu respectivo tamanho
-        for i, componente in enumerate(componentes):
-            tamanho_componente = componentes_contagem[i + 1]
-            print(f"Componente {i + 1} -> Lista de vértices: {componente} | Tamanho: {tamanho_componente}")
-        
-        print('')
+        Parâmetros:
+            saida (str | file): Arquivo ou objeto gravável onde a lista de componentes é escrita
+                                no formato textual. Padrão: None (sem saída).
+
+        Retorna:
+            ResultadoComponentes: Componente de cada vértice e o tamanho de cada componente.
+        """
+
+        if not self.dirigido:
+            return self.encontrar_componentes_conexos(saida)
+        if self._componentes_fortes is None:
+            self._componentes_fortes = componentes_fortes(self.grafo, self.vertices)
+        resultado = self._componentes_fortes
+        if saida is not None:
+            escrever_componentes(resultado, saida, descricao='componentes fortemente conexos')
+        return resultado
+
+    def pagerank(self, amortecimento=0.85, tolerancia=1e-6, max_iteracoes=100, ponderado=False):
+        """
+        Calcula o PageRank dos vértices por iteração de potência vetorizada (veja `analise.pagerank`).
+
+        Em grafos dirigidos segue as arestas de saída; em não dirigidos, as duas direções.
+
+        Parâmetros:
+            amortecimento (float): Probabilidade de seguir uma aresta em vez de saltar (padrão: 0.85).
+            tolerancia (float): Tolerância por vértice do critério de parada (norma L1).
+            max_iteracoes (int): Limite de iterações; `convergiu` indica se a tolerância foi atingida.
+            ponderado (bool): Divide o PageRank proporcionalmente aos pesos das arestas.
+
+        Retorna:
+            ResultadoPageRank: Valores indexados pelo índice denso (o vértice `vertices.rotulo(i)`),
+                               iterações executadas e erro final.
+
+        Exceções:
+            ImportError: Se o NumPy não estiver instalado.
+        """
+
+        with cronometrar('pagerank'):
+            valores, iteracoes, erro, convergiu = pagerank(
+                self.grafo, amortecimento, tolerancia, max_iteracoes, ponderado
+            )
+        return ResultadoPageRank(valores, iteracoes, erro, convergiu, self.vertices)
+
+    def centralidade_grau(self, direcao=None):
+        """
+        Calcula a centralidade de grau: o grau de cada vértice dividido por V - 1.
+
+        O grau total vem de `estatisticas`, mantido entre consultas (laços contam 2 e, em grafos
+        dirigidos, o grau é saída mais entrada).
+
+        Parâmetros:
+            direcao (str): None (padrão) para o grau total, ou 'saida' / 'entrada' para só um sentido.
+
+        Retorna:
+            numpy.ndarray: Centralidade de cada vértice, indexada pelo índice denso.
+
+        Exceções:
+            ValueError: Se a direção for desconhecida.
+            ImportError: Se o NumPy não estiver instalado.
+        """
+
+        if direcao is None:
+            graus = self.estatisticas().graus
+        else:
+            adjacencia = self._adjacencias(direcao)[0]
+            if isinstance(adjacencia, AdjacenciaCSR):
+                graus = np.diff(np.asarray(adjacencia.offsets))
+            else:
+                graus = [adjacencia.grau(v) for v in range(adjacencia.qtd_indices)]
+        return centralidade_grau(graus, self.grafo.qtd_indices)
+
+    def centralidade_proximidade(self, vertices=None, direcao='entrada'):
+        """
+        Calcula a centralidade de proximidade (closeness), com a correção de Wasserman e Faust.
+
+        Usa as mesmas distâncias de `calcular_caminho_minimo`: a BFS por níveis quando todos os
+        pesos são 1 e o Dijkstra (com os potenciais de Johnson, se houver pesos negativos) caso
+        contrário. O custo é uma busca por vértice calculado; em grafos grandes, use `vertices`
+        para calcular só parte deles.
+
+        Parâmetros:
+            vertices (iterable): Vértices calculados (padrão: todos, na ordem dos índices).
+            direcao (str): 'entrada' (padrão) mede as distâncias dos outros vértices *até* cada
+                           vértice, como no NetworkX; 'saida', as distâncias a partir dele. Em
+                           grafos não dirigidos as duas coincidem.
+
+        Retorna:
+            numpy.ndarray: Proximidade de cada vértice pedido, na mesma ordem (com o padrão,
+                           indexada pelo índice denso).
+
+        Exceções:
+            KeyError: Se algum vértice não existir.
+            CicloNegativo: Se o grafo tiver um ciclo de peso negativo.
+            ImportError: Se o NumPy não estiver instalado.
+        """
+
+        adjacencia = self._adjacencias_csr(direcao)[0]
+        indices = None if vertices is None else [self._indice(v) for v in vertices]
+        unitario = self.pesos.todos_unitarios
+        potenciais = None
+        if self.pesos.tem_negativos:
+            potenciais = self._potenciais_direcao(direcao, exigir=True)
+        with cronometrar('centralidade_proximidade'):
+            return centralidade_proximidade(adjacencia, indices, unitario, potenciais)
+
+    def nucleos_k(self):
+        """
+        Calcula o número de núcleo (k-core) de cada vértice em O(V + E) (veja `analise.nucleos_k`).
+
+        Em grafos dirigidos o grau considerado é saída mais entrada; laços são ignorados.
+
+        Retorna:
+            numpy.ndarray: Número de núcleo de cada vértice (int64), indexado pelo índice denso.
+
+        Exceções:
+            ImportError: Se o NumPy não estiver instalado.
+        """
+
+        with cronometrar('nucleos_k'):
+            return nucleos_k(self.grafo, self.reverso)
+
+    def arvore_geradora_minima(self, algoritmo='kruskal'):
+        """
+        Calcula a floresta geradora mínima do grafo, usando os pesos lidos do arquivo de entrada.
+
+        'kruskal' ordena todas as arestas de uma vez e as une com uma `UniaoBusca`, descartando
+        em bloco as que fechariam ciclo (veja `arvore_geradora.kruskal`); 'prim' cresce cada
+        árvore com um heap preguiçoso. Em grafos desconexos o resultado tem uma árvore por
+        componente, na numeração de `encontrar_componentes_conexos`. Em grafos dirigidos a
+        direção das arestas é ignorada, como nos componentes fracamente conexos.
+
+        Parâmetros:
+            algoritmo (str): 'kruskal' (padrão) ou 'prim'.
+
+        Retorna:
+            ResultadoArvoreGeradora: Peso total e arestas (índices densos e pesos) de cada árvore.
+
+        Exceções:
+            ValueError: Se o algoritmo for desconhecido.
+        """
+
+        if algoritmo not in ('kruskal', 'prim'):
+            raise ValueError(f"Algoritmo desconhecido: {algoritmo!r}. Opções: 'kruskal', 'prim'")
+        componentes = self.encontrar_componentes_conexos()
+        with cronometrar('arvore_geradora_minima'):
+            if algoritmo == 'kruskal':
+                # Uma floresta completa tem (vértices com arestas - componentes) arestas
+                arestas = kruskal(self.grafo, sum(componentes.tamanhos) - len(componentes))
+            else:
+                arestas = prim(self.grafo, self.reverso)
+            origens, destinos, pesos, inicios = agrupar_por_componente(
+                *arestas, componentes.rotulos, len(componentes)
+            )
+        return ResultadoArvoreGeradora(
+            origens, destinos, pesos, inicios, algoritmo.capitalize(), self.vertices
+        )
 
     def tem_pesos_negativos(self):
         """
         Verifica se o grafo possui arestas com pesos negativos.
 
-        Esta função é utilizada para determinar se o algoritmo de Dijkstra pode ser aplicado.
+        Esta função é utilizada para determinar se o Dijkstra precisa da reponderação de Johnson.
+        A resposta vem de `pesos`, mantido desde a carga, então a consulta é O(1).
 
         Retorna:
             bool: True se houver pesos negativos, False caso contrário.
         """
 
-        for u in self.grafo:
-            for v in self.grafo[u]:
-                if self.grafo[u][v] < 0:
-                    return True
-        return False
-
-    def _calcular_bfs(self, origem, destino):
-        visitado = {v: False for v in self.grafo}
-        distancias = {v: sys.maxsize for v in self.grafo}
-        antecessor = {v: None for v in self.grafo}
-
-        fila = deque([origem])
-        visitado[origem] = True
-        distancias[origem] = 0
-
-        while fila:
-            u = fila.popleft()
-
-            for v in self.grafo[u]:
-                if not visitado[v]:
-                    visitado[v] = True
-                    distancias[v] = distancias[u] + 1
-                    antecessor[v] = u
-                    fila.append(v)
-                    if v == destino:
-                        break
-
-        caminho = []
-        atual = destino
-        while atual is not None:
-            caminho.insert(0, atual)
-            atual = antecessor[atual]
-
-        print(f"Caminho mínimo de {origem} para {destino} usando BFS: {caminho}")
-        print(f"Distância: {distancias[destino]}")
-
-        return caminho, distancias[destino]
-
-    def _calcular_dijkstra(self, origem, destino):
-        distancias = {v: sys.maxsize for v in self.grafo}
-        distancias[origem] = 0
-        antecessor = {v: None for v in self.grafo}
-        pq = [(0, origem)]
-
-        while pq:
-            dist_u, u = heapq.heappop(pq)
-
-            if dist_u > distancias[u]:
-                continue
-
-            for v in self.grafo[u]:
-                peso = self.grafo[u][v]
-                if distancias[u] + peso < distancias[v]:
-                    distancias[v] = distancias[u] + peso
-                    antecessor[v] = u
-                    heapq.heappush(pq, (distancias[v], v))
-
-        caminho = []
-        atual = destino
-        if distancias[destino] != sys.maxsize:
-            while atual is not None:
-                caminho.insert(0, atual)
-                atual = antecessor[atual]
-            print(f"Caminho mínimo de {origem} para {destino} usando Dijkstra: {caminho}")
-            print(f"Distância: {distancias[destino]}")
-        else:
-            print(f"{destino} não é acessível a partir de {origem}")
-
-    def _calcular_bfs_para_todos(self, origem):
-        # Implementação de BFS para todos os vértices
-        visitado = {v: False for v in self.grafo}
-        distancias = {v: sys.maxsize for v in self.grafo}
-        antecessor = {v: None for v in self.grafo}
-
-        fila = deque([origem])
-        visitado[origem] = True
-        distancias[origem] = 0
-
-        while fila:
-            u = fila.popleft()
-
-            for v in self.grafo[u]:
-                if not visitado[v]:
-                    visitado[v] = True
-                    distancias[v] = distancias[u] + 1
-                    antecessor[v] = u
-                    fila.append(v)
-
-        # Exibe as distâncias
-        for destino in distancias:
-            if distancias[destino] != sys.maxsize:
-                caminho = []
-                atual = destino
-                while atual is not None:
-                    caminho.insert(0, atual)
-                    atual = antecessor[atual]
-
-                print(f"Caminho mínimo de {origem} para {destino} usando BFS: {caminho}")
-                print(f"Distância: {distancias[destino]}")
-            else:
-                print(f"{destino} não é acessível a partir de {origem}")
-
-        return distancias
-
-    def _calcular_dijkstra_para_todos(self, origem):
-        distancias = {v: sys.maxsize for v in self.grafo}
-        distancias[origem] = 0
-        antecessor = {v: None for v in self.grafo}
-        pq = [(0, origem)]
-
-        while pq:
-            dist_u, u = heapq.heappop(pq)
-
-            if dist_u > distancias[u]:
-                continue
-
-            for v in self.grafo[u]:
-                peso = self.grafo[u][v]
-                if distancias[u] + peso < distancias[v]:
-                    distancias[v] = distancias[u] + peso
-                    antecessor[v] = u
-                    heapq.heappush(pq, (distancias[v], v))
-
-        # Exibe as distâncias
-        for destino in distancias:
-            if distancias[destino] != sys.maxsize:
-                caminho = []
-                atual = destino
-                while atual is not None:
-                    caminho.insert(0, atual)
-                    atual = antecessor[atual]
-
-                print(f"Caminho mínimo de {origem} para {destino} usando Dijkstra: {caminho}")
-                print(f"Distância: {distancias[destino]}")
+        return self.pesos.tem_negativos
+
+    def _algoritmo_pesos(self):
+        """
+        Escolhe, sem percorrer as arestas, o algoritmo de caminho mínimo adequado aos pesos do grafo.
+
+        Retorna:
+            str: 'bfs' (todos os pesos 1), '0-1' (pesos 0 ou 1), 'dial' (inteiros pequenos
+                 não negativos) ou 'dijkstra'.
+        """
+        pesos = self.pesos
+        if pesos.todos_unitarios:
+            return 'bfs'
+        if pesos.inteiros and pesos.minimo >= 0:
+            if pesos.maximo <= 1:
+                return '0-1'
+            if pesos.maximo <= LIMITE_DIAL:
+                return 'dial'
+        return 'dijkstra'
+
+    def _arvore_ponderada(self, origem, algoritmo, destino=None, adjacencia=None):
+        """
+        Executa a BFS 0-1 ou o algoritmo de Dial e retorna (distancias, antecessor, nome).
+        """
+        adjacencia = self.grafo if adjacencia is None else adjacencia
+        if algoritmo == '0-1':
+            return (*arvore_0_1(adjacencia, origem, destino), 'BFS 0-1')
+        return (*arvore_dial(adjacencia, origem, self.pesos.maximo, destino), 'Dial')
+
+    def _potenciais_direcao(self, direcao, exigir=False):
+        """
+        Retorna os potenciais de Johnson da direção, calculados uma vez por versão do grafo.
+
+        Se o grafo tiver um ciclo negativo, retorna None (as consultas recorrem ao SPFA, que só
+        falha quando o ciclo é alcançável a partir da origem) ou, com `exigir`, levanta `CicloNegativo`.
+        """
+        adjacencia = self._adjacencias(direcao)[0]
+        chave = 'entrada' if adjacencia is self.reverso else 'saida'
+        if chave not in self._potenciais:
+            try:
+                self._potenciais[chave] = potenciais_johnson(adjacencia, adjacencia.qtd_indices)
+            except CicloNegativo as erro:
+                self._potenciais[chave] = erro
+        potenciais = self._potenciais[chave]
+        if isinstance(potenciais, CicloNegativo):
+            if exigir:
+                raise CicloNegativo(self.vertices.rotulos(potenciais.ciclo))
+            return None
+        return potenciais
+
+    def _calcular_pesos_negativos(self, origem, destino, direcao='saida'):
+        # Com os potenciais em cache, a consulta é um Dijkstra que para no destino
+        potenciais = self._potenciais_direcao(direcao)
+        if potenciais is None:
+            arvore = self._arvore_caminhos(origem, direcao)
+            return self._resultado_caminho(
+                origem, destino, arvore.caminho(destino), arvore.distancia(destino), arvore.algoritmo
+            )
+        adjacencia = self._adjacencias(direcao)[0]
+        caminho, distancia = dijkstra_ponto_a_ponto(
+            adjacencia, origem, destino, potenciais=potenciais, metricas=metricas_ativas()
+        )
+        return self._resultado_caminho(origem, destino, caminho, distancia, 'Dijkstra (Johnson)')
+
+    def _resultado_caminho(self, origem, destino, caminho, distancia, algoritmo):
+        # Os motores devolvem índices; o resultado é entregue com os rótulos
+        rotulo = self.vertices.rotulo
+        return ResultadoCaminho(rotulo(origem), rotulo(destino), self.vertices.rotulos(caminho), distancia, algoritmo)
+
+    def _calcular_bfs(self, origem, destino, bidirecional=False, direcao='saida'):
+        # A busca para assim que o destino é alcançado; só os vértices explorados são registrados
+        adjacencia, reversa = self._adjacencias(direcao)
+        if bidirecional:
+            caminho, distancia = bfs_bidirecional(adjacencia, origem, destino, reversa)
+            return self._resultado_caminho(origem, destino, caminho, distancia, 'BFS bidirecional')
+        caminho, distancia = bfs_ponto_a_ponto(adjacencia, origem, destino)
+        return self._resultado_caminho(origem, destino, caminho, distancia, 'BFS')
+
+    def _calcular_dijkstra(self, origem, destino, bidirecional=False, heuristica=None, algoritmo='dijkstra',
+                           direcao='saida'):
+        # A busca para assim que o destino é fixado; só os vértices explorados são registrados
+        adjacencia, reversa = self._adjacencias(direcao)
+        if heuristica is None and not bidirecional and algoritmo in ('0-1', 'dial'):
+            distancias, antecessor, nome = self._arvore_ponderada(origem, algoritmo, destino, adjacencia)
+            if destino in distancias:
+                caminho = reconstruir_caminho(antecessor, destino)
+                return self._resultado_caminho(origem, destino, caminho, distancias[destino], nome)
+            return self._resultado_caminho(origem, destino, [], math.inf, nome)
+        if heuristica is not None:
+            # A heurística do usuário recebe rótulos, não índices
+            rotulo = self.vertices.rotulo
+            estimativa = lambda v, alvo: heuristica(rotulo(v), rotulo(alvo))
+            caminho, distancia = dijkstra_ponto_a_ponto(
+                adjacencia, origem, destino, estimativa, metricas=metricas_ativas()
+            )
+            return self._resultado_caminho(origem, destino, caminho, distancia, 'A*')
+        if bidirecional:
+            caminho, distancia = dijkstra_bidirecional(adjacencia, origem, destino, reversa, metricas_ativas())
+            return self._resultado_caminho(origem, destino, caminho, distancia, 'Dijkstra bidirecional')
+        caminho, distancia = dijkstra_ponto_a_ponto(adjacencia, origem, destino, metricas=metricas_ativas())
+        return self._resultado_caminho(origem, destino, caminho, distancia, 'Dijkstra')
+
+    def arvore_caminhos(self, origem, direcao='saida'):
+        """
+        Retorna a árvore de caminhos mínimos de `origem` para todos os vértices alcançáveis.
+
+        As árvores ficam em `cache_arvores` (LRU): consultas repetidas da mesma origem não refazem
+        a busca, e qualquer alteração do grafo invalida o cache. As árvores da direção 'entrada'
+        de grafos dirigidos têm um cache próprio.
+
+        A árvore é indexada pelos índices densos dos vértices (veja `vertices`).
+
+        Parâmetros:
+            origem (int | str): Rótulo do vértice de origem.
+            direcao (str): 'saida' (padrão) segue as arestas; 'entrada' as segue ao contrário,
+                           dando as distâncias de cada vértice até `origem`.
+
+        Retorna:
+            ArvoreCaminhos: Distâncias e antecessores; `caminho(destino)` custa O(tamanho do caminho).
+        """
+        return self._arvore_caminhos(self._indice(origem), direcao)
+
+    def _arvore_caminhos(self, origem, direcao='saida'):
+        cache = self._cache_direcao(direcao)
+        arvore = cache.obter(origem, self._versao)
+        metricas = metricas_ativas()
+        if metricas is not None:
+            metricas.incrementar('cache_arvores_acertos' if arvore is not None else 'cache_arvores_faltas')
+        if arvore is not None:
+            return arvore
+
+        adjacencia = self._adjacencias(direcao)[0]
+        algoritmo = self._algoritmo_pesos()
+        if self.tem_pesos_negativos():
+            potenciais = self._potenciais_direcao(direcao)
+            if potenciais is not None:
+                distancias, antecessor = arvore_dijkstra(adjacencia, origem, potenciais, metricas)
+                nome = 'Dijkstra (Johnson)'
             else:
-                print(f"{destino} não é acessível a partir de {origem}")
+                try:
+                    distancias, antecessor = arvore_spfa(adjacencia, origem)
+                except CicloNegativo as erro:
+                    raise CicloNegativo(self.vertices.rotulos(erro.ciclo)) from None
+                nome = 'Bellman-Ford (SPFA)'
+        elif algoritmo == 'bfs':
+            distancias, antecessor = arvore_bfs(adjacencia, origem)
+            nome = 'BFS'
+        elif algoritmo == 'dijkstra':
+            distancias, antecessor = arvore_dijkstra(adjacencia, origem, metricas=metricas)
+            nome = 'Dijkstra'
+        else:
+            distancias, antecessor, nome = self._arvore_ponderada(origem, algoritmo, adjacencia=adjacencia)
 
-        return distancias
+        arvore = ArvoreCaminhos(origem, distancias, antecessor, nome)
+        cache.guardar(arvore, self._versao)
+        return arvore
 
-    def calcular_caminho_minimo(self, origem, destino=None):
+    def caminhos_minimos_lote(self, origens, workers=None, arquivo_saida=None, tipo='d'):
+        """
+        Calcula as distâncias mínimas de várias origens para todos os vértices.
+
+        As origens são distribuídas entre `workers` processos. Todos eles mapeiam o mesmo snapshot
+        binário do grafo (o próprio arquivo de `Grafo.carregar`, ou um snapshot temporário) e gravam
+        suas linhas diretamente em uma matriz compartilhada, então o grafo não é copiado para cada
+        processo e os resultados não trafegam entre eles.
+
+        Com pesos negativos, cada linha é um Dijkstra sobre os pesos reduzidos de Johnson; os
+        potenciais são calculados uma vez (e reaproveitados enquanto o grafo não mudar).
+
+        Parâmetros:
+            origens (sequence): Rótulos dos vértices de origem; a linha `i` da matriz corresponde a `origens[i]`.
+            workers (int): Quantidade de processos (padrão: os.cpu_count()). Com 1, o cálculo é feito
+                           no próprio processo.
+            arquivo_saida (str | os.PathLike): Se informado, a matriz é gravada nesse arquivo e devolvida
+                           mapeada em memória, permitindo resultados maiores que a RAM.
+            tipo (str): 'd' para float64 (padrão) ou 'f' para float32 (metade do espaço).
+
+        Retorna:
+            MatrizDistancias: Matriz len(origens) x qtd_indices, com a coluna `j` para o vértice de
+                           índice `j`; vértices inalcançáveis têm distância infinita.
+
+        Exceções:
+            CicloNegativo: Se o grafo tiver um ciclo de peso negativo.
+        """
+
+        # Pesos negativos: os potenciais de Johnson vão junto para cada processo
+        potenciais = self._potenciais_direcao('saida', exigir=True) if self.tem_pesos_negativos() else None
+
+        rotulos = list(origens)
+        origens = [self._indice(origem) for origem in rotulos]
+        qtd_colunas = self.grafo.qtd_indices
+
+        unitario = self.pesos.todos_unitarios
+        workers = min(workers or os.cpu_count() or 1, len(origens))
+        tamanho = len(origens) * qtd_colunas * array(tipo).itemsize
+
+        if not tamanho or (workers == 1 and arquivo_saida is None):
+            # Matriz vazia (sem origens ou sem vértices): um arquivo vazio não pode ser mapeado
+            if arquivo_saida is not None:
+                open(arquivo_saida, 'wb').close()
+            dados = array(tipo, bytes(tamanho))
+            calcular_linhas(self.grafo, origens, memoryview(dados), 0, qtd_colunas, unitario, potenciais)
+            return MatrizDistancias(rotulos, qtd_colunas, dados, tipo, self.vertices)
+
+        temporario = arquivo_saida is None
+        if temporario:
+            descritor, arquivo_saida = tempfile.mkstemp(suffix='.dist')
+            os.close(descritor)
+        with open(arquivo_saida, 'wb') as arquivo:
+            arquivo.truncate(tamanho)
+
+        if workers == 1:
+            with open(arquivo_saida, 'r+b') as arquivo, mmap.mmap(arquivo.fileno(), 0) as mapeamento:
+                with memoryview(mapeamento).cast(tipo) as linhas:
+                    calcular_linhas(self.grafo, origens, linhas, 0, qtd_colunas, unitario, potenciais)
+                mapeamento.flush()
+        else:
+            caminho_grafo, snapshot_temporario = self._snapshot_compartilhado()
+            try:
+                calcular_lote_paralelo(
+                    caminho_grafo, arquivo_saida, origens, qtd_colunas, tipo, unitario, workers, potenciais
+                )
+            finally:
+                if snapshot_temporario:
+                    os.remove(caminho_grafo)
+
+        matriz = MatrizDistancias.abrir(arquivo_saida, rotulos, qtd_colunas, tipo, self.vertices)
+        if temporario:
+            # O mapeamento continua válido depois que o arquivo temporário é removido
+            os.remove(arquivo_saida)
+        return matriz
+
+    def caminhos_minimos_todos(self, arquivo_saida=None, tipo='d', workers=None, metodo=None):
+        """
+        Calcula as distâncias mínimas entre todos os pares de vértices.
+
+        Grafos densos usam o Floyd-Warshall em blocos, vetorizado com NumPy, direto sobre a matriz
+        de resultado (`floyd_warshall_blocos`); grafos esparsos usam um Dijkstra (ou BFS) por
+        origem, distribuído entre processos por `caminhos_minimos_lote`. Com `arquivo_saida`, a
+        matriz é criada no arquivo e devolvida mapeada em memória: resultados maiores que a RAM
+        podem ser produzidos e consultados linha a linha sem carregar o arquivo inteiro.
+
+        Parâmetros:
+            arquivo_saida (str | os.PathLike): Arquivo onde a matriz é gravada (padrão: em memória).
+            tipo (str): 'd' para float64 (padrão) ou 'f' para float32 (metade do espaço).
+            workers (int): Processos usados pelo Dijkstra repetido (veja `caminhos_minimos_lote`).
+            metodo (str): 'floyd', 'dijkstra' ou None (padrão) para escolher pela densidade do grafo:
+                          Floyd-Warshall quando V² <= RAZAO_FLOYD * E e o NumPy está disponível.
+
+        Retorna:
+            MatrizDistancias: Matriz V x V; a linha `i` e a coluna `j` correspondem aos vértices de
+                              índice `i` e `j` (as origens estão na ordem dos índices).
+
+        Exceções:
+            CicloNegativo: Se o grafo tiver um ciclo de peso negativo.
+            ValueError: Se o método for desconhecido.
+            ImportError: Se o método 'floyd' for pedido sem o NumPy instalado.
+        """
+
+        if metodo not in (None, 'floyd', 'dijkstra'):
+            raise ValueError(f"Método desconhecido: {metodo!r}. Opções: 'floyd', 'dijkstra'")
+        n = self.grafo.qtd_indices
+        if metodo is None:
+            arestas = sum(self.grafo.grau(v) for v in self.grafo) if self.grafo else 0
+            metodo = 'floyd' if np is not None and n * n <= RAZAO_FLOYD * arestas else 'dijkstra'
+        rotulos = self.vertices.rotulos(range(n))
+        if metodo == 'dijkstra' or not n:
+            return self.caminhos_minimos_lote(rotulos, workers, arquivo_saida, tipo)
+        if np is None:
+            raise ImportError("O método 'floyd' requer o pacote numpy")
+
+        dtype = np.float64 if tipo == 'd' else np.float32
+        if arquivo_saida is None:
+            dist = np.empty((n, n), dtype=dtype)
+        else:
+            dist = np.memmap(arquivo_saida, dtype=dtype, mode='w+', shape=(n, n))
+        preencher_matriz_inicial(self.grafo, dist)
+        floyd_warshall_blocos(dist)
+        if n and not (dist.diagonal() >= 0).all():
+            # O Floyd-Warshall só acusa o ciclo; o SPFA dos potenciais de Johnson o recupera
+            self._potenciais.pop('saida', None)
+            self._potenciais_direcao('saida', exigir=True)
+
+        if arquivo_saida is None:
+            return MatrizDistancias(rotulos, n, dist.reshape(-1), tipo, self.vertices)
+        dist.flush()
+        del dist
+        return MatrizDistancias.abrir(arquivo_saida, rotulos, n, tipo, self.vertices)
+
+    def _snapshot_compartilhado(self):
+        """
+        Retorna o caminho de um snapshot binário do estado atual do grafo e se ele é temporário.
+        """
+        if self._snapshot is not None and self._snapshot[1] == self._versao:
+            return self._snapshot[0], False
+        descritor, caminho = tempfile.mkstemp(suffix='.grafo')
+        os.close(descritor)
+        self.salvar(caminho)
+        return caminho, True
+
+    def calcular_caminho_minimo(self, origem, destino=None, bidirecional=False, heuristica=None, saida=None,
+                                direcao='saida'):
         """
         Calcula o caminho mínimo em um grafo a partir de um vértice de origem.
 
@@ -507,11 +1389,29 @@ class Grafo:
         - Calcula o caminho mínimo do vértice de origem para todos os outros vértices no grafo.
         - Se o grafo não tiver pesos ou se todos os pesos forem iguais a 1, utiliza o algoritmo de Busca em Largura (BFS).
         - Se o grafo tiver pesos positivos, utiliza o algoritmo de Dijkstra.
+        - Se todos os pesos forem 0 ou 1, utiliza a BFS 0-1; se forem inteiros até `LIMITE_DIAL`,
+          utiliza o algoritmo de Dial (fila de baldes).
 
         2. Se os parâmetros `origem` e `destino` forem fornecidos:
         - Calcula o caminho mínimo entre o vértice de origem e o vértice de destino.
         - Se o grafo não tiver pesos ou se todos os pesos forem iguais a 1, utiliza o algoritmo de Busca em Largura (BFS).
         - Se o grafo tiver pesos positivos, utiliza o algoritmo de Dijkstra.
+        - A busca termina assim que o destino é alcançado, e só os vértices explorados são registrados:
+          o custo depende da região percorrida, não do tamanho do grafo.
+        - Com `bidirecional=True`, a BFS ou o Dijkstra avançam a partir dos dois extremos ao mesmo tempo.
+        - Com `heuristica`, o caminho ponderado é calculado por A*.
+
+        3. Se o grafo tiver pesos negativos:
+        - Os potenciais de Johnson são calculados uma vez por versão do grafo (um SPFA a partir de
+          uma origem virtual) e todas as consultas seguintes usam o Dijkstra sobre os pesos reduzidos,
+          não negativos. `bidirecional` e `heuristica` são ignorados nesse caso.
+        - Se o grafo tiver um ciclo negativo, cada origem é resolvida por Bellman-Ford com fila
+          (SPFA), que só falha se o ciclo for alcançável a partir dela. Em grafos não dirigidos,
+          toda aresta negativa forma um ciclo negativo (ida e volta).
+
+        A escolha do algoritmo consulta `pesos`, calculado na carga do grafo: nenhuma consulta
+        percorre as arestas antes de iniciar a busca. O cálculo não faz nenhuma saída; o texto
+        com os caminhos só é gerado quando `saida` é informada.
 
         Parâmetros:
         ----------
@@ -521,18 +1421,37 @@ class Grafo:
         destino : int, opcional
             O vértice de destino para o qual o caminho mínimo será calculado.
             Se não for fornecido, a função calcula o caminho mínimo do vértice de origem para todos os outros vértices.
+
+        bidirecional : bool, opcional
+            Usa a busca bidirecional nas consultas entre dois vértices (padrão: False).
+
+        heuristica : callable, opcional
+            Função `heuristica(vertice, destino)` que estima a distância restante até o destino.
+            Precisa ser admissível (nunca superestimar). Quando informada, grafos ponderados usam A*.
+
+        saida : str | file, opcional
+            Arquivo ou objeto gravável (por exemplo, `sys.stdout`) onde os caminhos são escritos
+            no formato textual. Padrão: None (sem saída).
+
+        direcao : str, opcional
+            Em grafos dirigidos, 'saida' (padrão) segue as arestas u->v e 'entrada' as percorre ao
+            contrário: o caminho devolvido vai de `origem` a `destino` no grafo transposto.
         
         Retorna:
         --------
         Se `destino` for fornecido:
-            tuple: Um par contendo o caminho mínimo como uma lista de vértices e a distância mínima entre `origem` e `destino`.
+            ResultadoCaminho: O caminho mínimo e a distância entre `origem` e `destino`; pode ser desempacotado
+                   como a tupla (caminho, distancia). Se o destino não for alcançável, o caminho é vazio e a distância é infinita.
         
         Se `destino` não for fornecido:
-            dict: Um dicionário onde as chaves são os vértices e os valores são as distâncias mínimas do vértice de origem para cada um dos outros vértices.
+            ResultadoCaminhos: Mapeamento somente leitura {vertice: distancia} a partir da origem (infinita para
+                   vértices inalcançáveis), com `caminho(destino)` para reconstruir cada caminho.
         
         Exceções:
         ---------
-        Se o grafo contiver pesos negativos, a função imprime uma mensagem de erro e não realiza o cálculo, pois o algoritmo de Dijkstra não é adequado para grafos com pesos negativos.
+        CicloNegativo: Se um ciclo de peso negativo for alcançável a partir da origem (`ciclo` traz os vértices).
+        ValueError: Se a direção for inválida.
+        KeyError: Se a origem ou o destino não forem vértices do grafo.
 
         Exemplos de Uso:
         ----------------
@@ -542,46 +1461,146 @@ class Grafo:
         >>> grafo.calcular_caminho_minimo(1, 4)
         Calcula o caminho mínimo do vértice 1 para o vértice 4.
 
+        >>> grafo.calcular_caminho_minimo(1, 4, bidirecional=True)
+        Calcula o mesmo caminho avançando a partir dos dois vértices.
+
+        >>> grafo.calcular_caminho_minimo(1, saida=sys.stdout)
+        Calcula os caminhos a partir do vértice 1 e os exibe no console.
+
         """
         
+        with cronometrar('calcular_caminho_minimo'):
+            return self._calcular_caminho_minimo(origem, destino, bidirecional, heuristica, saida, direcao)
+
+    def _listar_vertices(self):
+        """
+        Retorna os índices listados por `ResultadoCaminhos`, em ordem crescente e imutáveis.
+
+        Em grafos não dirigidos são os vértices com arestas, copiados uma vez por versão do grafo
+        para que resultados antigos não acompanhem as alterações; em grafos dirigidos um vértice
+        pode ter apenas arestas de entrada, e todos os índices são listados.
+        """
+        if self.reverso is not None:
+            return range(self.grafo.qtd_indices)
+        if self._vertices_listados is None:
+            self._vertices_listados = array('q', sorted(self.grafo))
+        return self._vertices_listados
+
+    def _calcular_caminho_minimo(self, origem, destino, bidirecional, heuristica, saida, direcao):
+        origem = self._indice(origem)
         if destino is None:
-            
-            # Se apenas o parâmetro `origem` foi passado, calcular caminhos mínimos de `origem` para todos os vértices
-            if self.tem_pesos_negativos():
-                print("Erro: O grafo possui pesos, porém o algoritmo de Dijkstra não pode ser usado com pesos negativos.")
-                return
-
-            if all(peso == 1 for adj in self.grafo.values() for peso in adj.values()):
-                # Se todos os pesos são 1, use BFS
-                return self._calcular_bfs_para_todos(origem)
-            else:
-                # Caso contrário, use Dijkstra
-                return self._calcular_dijkstra_para_todos(origem)
+            # BFS, BFS 0-1, Dial ou Dijkstra, conforme os pesos; origens repetidas vêm do cache
+            resultado = ResultadoCaminhos(
+                self._arvore_caminhos(origem, direcao), self._listar_vertices(), self.vertices
+            )
+            if saida is not None:
+                escrever_caminhos(resultado, saida)
+            return resultado
+
+        # Se a árvore da origem já está em cache, o caminho sai dela sem nova busca
+        destino = self._indice(destino)
+        arvore = self._cache_direcao(direcao).obter(origem, self._versao)
+        if arvore is not None:
+            resultado = self._resultado_caminho(
+                origem, destino, arvore.caminho(destino), arvore.distancia(destino), arvore.algoritmo
+            )
+        elif self.tem_pesos_negativos():
+            # Pesos negativos: Dijkstra sobre os pesos reduzidos de Johnson (ou SPFA, se houver ciclo negativo)
+            resultado = self._calcular_pesos_negativos(origem, destino, direcao)
+        elif self._algoritmo_pesos() == 'bfs':
+            # Se todos os pesos são 1, use BFS
+            resultado = self._calcular_bfs(origem, destino, bidirecional, direcao)
         else:
-            
-            # Se `origem` e `destino` foram passados, calcular caminho mínimo entre esses dois vértices
-            if self.tem_pesos_negativos():
-                print("Erro: O grafo possui pesos, porém o algoritmo de Dijkstra não pode ser usado com pesos negativos.")
-                return
-
-            if all(peso == 1 for adj in self.grafo.values() for peso in adj.values()):
-                # Se todos os pesos são 1, use BFS
-                return self._calcular_bfs(origem, destino)
-            else:
-                # Caso contrário, use Dijkstra
-                return self._calcular_dijkstra(origem, destino)
+            # Caso contrário, use Dijkstra (ou A*, se houver heurística), BFS 0-1 ou Dial
+            resultado = self._calcular_dijkstra(
+                origem, destino, bidirecional, heuristica, self._algoritmo_pesos(), direcao
+            )
+
+        if saida is not None:
+            escrever_caminho(resultado, saida)
+        return resultado
+
+class VisaoGrafo(Grafo):
+    """
+    Visão congelada e somente leitura de um `Grafo`, segura para consultas em várias threads.
+
+    Todas as consultas do `Grafo` (buscas, caminhos mínimos, componentes, estatísticas) funcionam
+    na visão. O estado de trabalho de cada busca fica em buffers obtidos por chamada de um pool
+    por thread, e o cache de árvores de caminhos mínimos também é por thread
+    (`CacheArvoresPorThread`). As estruturas que o `Grafo` monta sob demanda e guarda na
+    instância (estatísticas, componentes conexos e fortemente conexos, lista de vértices dos
+    caminhos, potenciais de Johnson) são montadas na criação da visão, em O(V + E); a única
+    exceção é a matriz densa, de O(V²), montada no primeiro acesso sob uma trava. Assim, um grafo
+    carregado atende muitas consultas simultâneas sem cópias e sem travas nas consultas.
+
+    A visão guarda a própria adjacência CSR. Se o grafo não tem alterações pendentes na
+    sobreposição, ela se apoia nos mesmos buffers dele; como o `AdjacenciaCSR` nunca altera os
+    buffers no lugar (alterações vão para a sobreposição e a compactação gera buffers novos),
+    alterações posteriores do grafo não chegam à visão. Caso contrário, e no backend 'dict', a
+    adjacência é copiada para um CSR novo, em O(V + E). Congelar não altera o grafo original.
+
+    Métodos que alteram o grafo levantam `TypeError`.
+    """
+
+    def __init__(self, grafo, capacidade_cache=32):
+        super().__init__(arquivo=None, backend='csr', capacidade_cache=capacidade_cache, dirigido=grafo.dirigido)
+        self.cache_arvores = CacheArvoresPorThread(capacidade_cache)
+        self._cache_reverso = CacheArvoresPorThread(capacidade_cache)
+
+        self.arquivo = grafo.arquivo
+        self.qtdVertices = grafo.qtdVertices
+        self.ponderado = grafo.ponderado
+        self.vertices = TabelaVertices(grafo.vertices.base, grafo.vertices.extras)
+        self.grafo = self._congelar_adjacencia(grafo.grafo)
+        self.reverso = None if grafo.reverso is None else self._congelar_adjacencia(grafo.reverso)
+        self.pesos = MetadadosPesos.de_adjacencia(self.grafo)
+        if grafo._snapshot is not None and grafo._snapshot[1] == grafo._versao:
+            self._snapshot = (grafo._snapshot[0], self._versao)
+
+        # Tudo o que seria calculado sob demanda por mais de uma thread é calculado agora
+        self._trava_matriz = threading.Lock()
+        self.estatisticas()
+        self.encontrar_componentes_conexos()._agrupar()
+        if self.dirigido:
+            self.componentes_fortemente_conexos()._agrupar()
+        self._listar_vertices()
+        if self.tem_pesos_negativos():
+            for direcao in ('saida', 'entrada'):
+                self._potenciais_direcao(direcao)
+
+    @staticmethod
+    def _congelar_adjacencia(adjacencia):
+        if isinstance(adjacencia, AdjacenciaCSR) and adjacencia.compactada:
+            # Sem sobreposição, os buffers do original são compartilhados: ele só os troca, nunca os altera
+            return AdjacenciaCSR(*adjacencia.buffers(), adjacencia.dirigido)
+        congelada = AdjacenciaCSR.de_adjacencia(adjacencia, adjacencia.qtd_indices)
+        congelada.dirigido = adjacencia.dirigido
+        return congelada
+
+    def matriz_densa(self, tipo='d'):
+        with self._trava_matriz:
+            return super().matriz_densa(tipo)
+
+    def _somente_leitura(self, *args, **kwargs):
+        raise TypeError('VisaoGrafo é somente leitura: altere o Grafo original e congele-o novamente')
+
+    armazenar_grafo = adicionar_vertice = adicionar_aresta = remover_aresta = aplicar_lote = _somente_leitura
+
+    def congelar(self, capacidade_cache=32):
+        return self
+
 
 def main():
    
     grafo = Grafo()
 
-    # grafo.calcular_caminho_minimo(0)
-    # grafo.calcular_caminho_minimo(1,4)
+    # grafo.calcular_caminho_minimo(0, saida=sys.stdout)
+    # grafo.calcular_caminho_minimo(1, 4, saida=sys.stdout)
     grafo.representacao()
     grafo.informacoes()
     # grafo.busca_profundidade(2)
     # grafo.busca_largura(1)
-    # grafo.encontrar_componentes_conexos()
+    # grafo.encontrar_componentes_conexos(saida=sys.stdout)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,145 @@
+from array import array
+
+
+def formatar_peso(peso, ponderado=True):
+    """
+    Converte um valor da matriz de adjacência em texto.
+
+    Ausência de aresta é exibida como `0`. Em grafos não ponderados as arestas
+    são exibidas como `1`, como na matriz original de listas de inteiros.
+    """
+    if peso == 0:
+        return '0'
+    if not ponderado and float(peso).is_integer():
+        return str(int(peso))
+    return str(peso)
+
+
+def formatar_linha(linha, ponderado=True):
+    return ' '.join(formatar_peso(peso, ponderado) for peso in linha)
+
+
+class MatrizDensa:
+    """
+    Matriz de adjacência densa guardada em um único buffer tipado (row-major).
+
+    Ocupa `n * n * itemsize` bytes em vez de `n` listas de objetos Python. O acesso
+    `matriz[i][j]` continua funcionando como na lista de listas: `matriz[i]` devolve
+    uma `memoryview` da linha, sem cópia.
+
+    Atributos:
+        n (int): Quantidade de linhas (e colunas) da matriz.
+        dados (array): Buffer contíguo com as n * n posições.
+    """
+
+    def __init__(self, n, tipo='d'):
+        self.n = n
+        self.dados = array(tipo, bytes(array(tipo).itemsize * n * n))
+        self._dados = memoryview(self.dados)
+
+    @classmethod
+    def de_adjacencia(cls, adjacencia, n, tipo='d'):
+        """
+        Preenche a matriz a partir da estrutura de adjacência do grafo.
+
+        O vértice de índice `i` (veja `TabelaVertices`) ocupa a linha e a coluna `i`.
+
+        Parâmetros:
+            adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo, indexada pelos índices densos.
+            n (int): Quantidade de vértices (índices 0..n-1).
+            tipo (str): Typecode do buffer ('d' para float64, 'f' para float32).
+        """
+        matriz = cls(n, tipo)
+        dados = matriz.dados
+        for u in adjacencia:
+            if u < n:
+                base = u * n
+                for v, peso in adjacencia[u].items():
+                    if v < n:
+                        dados[base + v] = peso
+        return matriz
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        return self._dados[i * self.n:(i + 1) * self.n]
+
+    def __iter__(self):
+        return (self[i] for i in range(self.n))
+
+    def bytes_utilizados(self):
+        return self._dados.nbytes
+
+
+class MatrizEsparsa:
+    """
+    Visão esparsa da matriz de adjacência, apoiada diretamente na adjacência do grafo.
+
+    Não guarda nenhuma cópia das arestas: a memória total permanece O(V + E). As linhas
+    densas são montadas uma de cada vez, sob demanda, para impressão ou exportação.
+
+    Atributos:
+        n (int): Quantidade de linhas (e colunas) da matriz.
+    """
+
+    def __init__(self, adjacencia, n):
+        self.adjacencia = adjacencia
+        self.n = n
+
+    def linha(self, i):
+        """
+        Retorna a linha `i` (vértice de índice `i`) como lista densa de tamanho `n`.
+        """
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        linha = [0] * self.n
+        if i in self.adjacencia:
+            for v, peso in self.adjacencia[i].items():
+                if v < self.n:
+                    linha[v] = peso
+        return linha
+
+    def coo(self):
+        """
+        Gera as entradas não nulas no formato coordenado, como tuplas (linha, coluna, peso).
+        """
+        for u in sorted(self.adjacencia):
+            if u < self.n:
+                for v, peso in sorted(self.adjacencia[u].items()):
+                    if v < self.n:
+                        yield u, v, peso
+
+    def linhas_texto(self, ponderado=True):
+        """
+        Gera cada linha da matriz já formatada como texto ('0 1 0 ...\n').
+
+        Cada linha parte de uma lista de '0' pré-montada na qual só as posições dos vizinhos são
+        substituídas, e o texto sai de um único `join`: o custo por linha é uma cópia e um join
+        em C, em vez de uma conversão de peso por posição.
+
+        Parâmetros:
+            ponderado (bool): Exibe os pesos; caso contrário as arestas aparecem como `1`.
+        """
+        zeros = ['0'] * self.n
+        vazia = ' '.join(zeros) + '\n'
+        for i in range(self.n):
+            if i not in self.adjacencia:
+                yield vazia
+                continue
+            linha = zeros.copy()
+            for v, peso in self.adjacencia[i].items():
+                if v < self.n:
+                    linha[v] = formatar_peso(peso, ponderado)
+            yield ' '.join(linha) + '\n'
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, i):
+        return self.linha(i)
+
+    def __iter__(self):
+        return (self.linha(i) for i in range(self.n))
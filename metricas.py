@@ -0,0 +1,169 @@
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+import heapq
+import time
+
+# Métricas que recebem as medições do contexto atual (thread ou tarefa asyncio); None desliga tudo
+_ATIVAS = ContextVar('metricas_grafo', default=None)
+_SEM_MEDICAO = nullcontext()
+
+
+class Metricas:
+    """
+    Contadores, máximos e tempos por fase coletados pelas operações do `Grafo`.
+
+    A coleta é opcional (veja `instrumentar`). Desligada, cada operação faz apenas uma consulta
+    à variável de contexto; os laços internos dos algoritmos não têm nenhum contador. Os valores
+    que dependem do laço são obtidos de outra forma: as operações do heap passam por funções
+    contadoras só quando a coleta está ligada, e o restante (vértices fixados, arestas relaxadas,
+    pico da fila da BFS) é calculado a partir do resultado da busca.
+
+    Contadores usados pelos algoritmos:
+        vertices_fixados: Vértices retirados do heap com a distância final (Dijkstra e variantes).
+        vertices_visitados: Vértices alcançados pelas buscas em largura e profundidade.
+        arestas_relaxadas: Arestas examinadas a partir dos vértices fixados ou expandidos.
+        heap_insercoes, heap_remocoes: Operações no heap de prioridades.
+        heap_obsoletas: Entradas retiradas do heap e descartadas por já estarem superadas.
+        arestas_lidas: Arestas lidas do arquivo de entrada.
+        niveis_top_down, niveis_bottom_up: Níveis expandidos em cada direção pela BFS por níveis.
+
+    Atributos:
+        contadores (dict): Totais acumulados, por nome.
+        maximos (dict): Maiores valores observados (por exemplo, 'pico_heap' e 'pico_fila').
+        tempos (dict): Tempo total, em segundos, de cada operação ou fase ('armazenar_grafo.leitura').
+        chamadas (dict): Quantas vezes cada operação ou fase foi cronometrada.
+    """
+
+    def __init__(self):
+        self.contadores = {}
+        self.maximos = {}
+        self.tempos = {}
+        self.chamadas = {}
+
+    def incrementar(self, nome, quantidade=1):
+        self.contadores[nome] = self.contadores.get(nome, 0) + quantidade
+
+    def registrar_maximo(self, nome, valor):
+        if valor > self.maximos.get(nome, valor - 1):
+            self.maximos[nome] = valor
+
+    @contextmanager
+    def cronometro(self, nome):
+        """
+        Soma em `tempos[nome]` o tempo de parede do bloco `with`.
+        """
+        inicio = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.tempos[nome] = self.tempos.get(nome, 0.0) + time.perf_counter() - inicio
+            self.chamadas[nome] = self.chamadas.get(nome, 0) + 1
+
+    def operacoes_heap(self):
+        """
+        Retorna (inserir, remover): `heapq.heappush` e `heapq.heappop` que contam as operações
+        e registram o tamanho máximo do heap em 'pico_heap'.
+        """
+        contadores, maximos = self.contadores, self.maximos
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        def inserir(heap, item):
+            heappush(heap, item)
+            contadores['heap_insercoes'] = contadores.get('heap_insercoes', 0) + 1
+            if len(heap) > maximos.get('pico_heap', 0):
+                maximos['pico_heap'] = len(heap)
+
+        def remover(heap):
+            contadores['heap_remocoes'] = contadores.get('heap_remocoes', 0) + 1
+            return heappop(heap)
+
+        return inserir, remover
+
+    def mesclar(self, outras):
+        """
+        Acumula nestas métricas os valores de `outras` (somando contadores e tempos).
+        """
+        for nome, valor in outras.contadores.items():
+            self.incrementar(nome, valor)
+        for nome, valor in outras.maximos.items():
+            self.registrar_maximo(nome, valor)
+        for nome, valor in outras.tempos.items():
+            self.tempos[nome] = self.tempos.get(nome, 0.0) + valor
+        for nome, valor in outras.chamadas.items():
+            self.chamadas[nome] = self.chamadas.get(nome, 0) + valor
+
+    def limpar(self):
+        self.contadores.clear()
+        self.maximos.clear()
+        self.tempos.clear()
+        self.chamadas.clear()
+
+    def como_dict(self):
+        """
+        Retorna uma cópia das métricas como dicionário serializável em JSON.
+        """
+        return {
+            'contadores': dict(self.contadores),
+            'maximos': dict(self.maximos),
+            'tempos': dict(self.tempos),
+            'chamadas': dict(self.chamadas),
+        }
+
+    def __repr__(self):
+        return f'Metricas({self.como_dict()!r})'
+
+
+def metricas_ativas():
+    """
+    Retorna as `Metricas` do contexto atual, ou None se a coleta estiver desligada.
+    """
+    return _ATIVAS.get()
+
+
+def cronometrar(nome):
+    """
+    Cronometra um bloco `with` nas métricas ativas; sem métricas ativas, não mede nada.
+    """
+    metricas = _ATIVAS.get()
+    return _SEM_MEDICAO if metricas is None else metricas.cronometro(nome)
+
+
+def operacoes_heap(metricas):
+    """
+    Retorna (inserir, remover) para o heap: as funções do `heapq` ou, com métricas, as contadoras.
+    """
+    if metricas is None:
+        return heapq.heappush, heapq.heappop
+    return metricas.operacoes_heap()
+
+
+@contextmanager
+def instrumentar(callback=None, metricas=None):
+    """
+    Liga a coleta de métricas das operações do `Grafo` executadas dentro do bloco `with`.
+
+    A coleta vale para o contexto atual (a thread ou a tarefa asyncio que abriu o bloco); os
+    processos de `caminhos_minimos_lote` com vários workers não são medidos por dentro, apenas
+    o tempo total da chamada. Blocos aninhados substituem o externo até saírem.
+
+    Exemplo:
+        with instrumentar() as metricas:
+            grafo.calcular_caminho_minimo(1)
+        print(metricas.contadores['heap_obsoletas'], metricas.tempos['calcular_caminho_minimo'])
+
+    Parâmetros:
+        callback (callable): Chamada ao sair do bloco como `callback(metricas.como_dict())`, por
+                             exemplo para enviar as métricas a um sistema de monitoramento.
+        metricas (Metricas): Instância que acumula as medições (padrão: uma nova).
+
+    Gera:
+        Metricas: As métricas coletadas no bloco.
+    """
+    metricas = Metricas() if metricas is None else metricas
+    token = _ATIVAS.set(metricas)
+    try:
+        yield metricas
+    finally:
+        _ATIVAS.reset(token)
+        if callback is not None:
+            callback(metricas.como_dict())
@@ -0,0 +1,99 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+import math
+import mmap
+import os
+
+try:
+    from .adjacencia import AdjacenciaCSR
+    from .caminhos import preencher_distancias
+    from .persistencia import carregar_snapshot
+except ImportError:
+    from adjacencia import AdjacenciaCSR
+    from caminhos import preencher_distancias
+    from persistencia import carregar_snapshot
+
+# Estado de cada processo trabalhador, preenchido uma única vez por `_inicializar_lote`
+_ESTADO = {}
+
+
+def calcular_linhas(adjacencia, origens, saida, primeira_linha, qtd_colunas, unitario, potenciais=None):
+    """
+    Calcula as distâncias de cada origem e grava cada resultado em uma linha de `saida`.
+
+    As distâncias são calculadas em um vetor float64 reaproveitado entre as origens e
+    depois copiadas para a linha correspondente, que pode ter outro tipo (por exemplo, float32).
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        origens (sequence): Vértices de origem.
+        saida (memoryview): Buffer da matriz de distâncias inteira.
+        primeira_linha (int): Linha da matriz correspondente a `origens[0]`.
+        qtd_colunas (int): Quantidade de colunas da matriz.
+        unitario (bool): Indica que todas as arestas têm peso 1.
+        potenciais (array): Potenciais de Johnson, se o grafo tiver pesos negativos.
+    """
+
+    infinito = array('d', [math.inf]) * qtd_colunas
+    distancias = array('d', infinito)
+    tipo = saida.format
+    for i, origem in enumerate(origens):
+        distancias[:] = infinito
+        preencher_distancias(adjacencia, origem, distancias, unitario, potenciais)
+        inicio = (primeira_linha + i) * qtd_colunas
+        saida[inicio:inicio + qtd_colunas] = distancias if tipo == 'd' else array(tipo, distancias)
+
+
+def _inicializar_lote(caminho_grafo, caminho_saida, qtd_colunas, tipo, unitario, potenciais):
+    """
+    Prepara um processo trabalhador: mapeia o snapshot do grafo e a matriz de saída.
+
+    Todos os trabalhadores mapeiam os mesmos arquivos, então o grafo é compartilhado
+    somente leitura entre eles e cada linha calculada é gravada direto na matriz final.
+    """
+    secoes, _, _ = carregar_snapshot(caminho_grafo, mmap=True)
+    _ESTADO['adjacencia'] = AdjacenciaCSR(secoes['offsets'], secoes['vizinhos'], secoes['pesos'])
+    with open(caminho_saida, 'r+b') as arquivo:
+        _ESTADO['mapeamento'] = mmap.mmap(arquivo.fileno(), 0)
+    _ESTADO['saida'] = memoryview(_ESTADO['mapeamento']).cast(tipo)
+    _ESTADO['qtd_colunas'] = qtd_colunas
+    _ESTADO['unitario'] = unitario
+    _ESTADO['potenciais'] = potenciais
+
+
+def _calcular_bloco(primeira_linha, origens):
+    calcular_linhas(
+        _ESTADO['adjacencia'], origens, _ESTADO['saida'], primeira_linha,
+        _ESTADO['qtd_colunas'], _ESTADO['unitario'], _ESTADO['potenciais'],
+    )
+    return len(origens)
+
+
+def calcular_lote_paralelo(caminho_grafo, caminho_saida, origens, qtd_colunas, tipo, unitario, workers, potenciais=None):
+    """
+    Distribui as origens em blocos entre `workers` processos.
+
+    Parâmetros:
+        caminho_grafo (str): Snapshot do grafo gravado por `Grafo.salvar`.
+        caminho_saida (str): Arquivo já dimensionado para len(origens) * qtd_colunas valores.
+        origens (sequence): Vértices de origem, na ordem das linhas.
+        qtd_colunas (int): Quantidade de colunas da matriz.
+        tipo (str): Typecode dos valores da matriz.
+        unitario (bool): Indica que todas as arestas têm peso 1.
+        workers (int): Quantidade de processos.
+        potenciais (array): Potenciais de Johnson, enviados uma vez para cada processo.
+    """
+
+    # Blocos menores que len/workers equilibram a carga quando algumas origens são mais caras
+    tamanho_bloco = max(1, math.ceil(len(origens) / (workers * 4)))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_inicializar_lote,
+        initargs=(os.fspath(caminho_grafo), os.fspath(caminho_saida), qtd_colunas, tipo, unitario, potenciais),
+    ) as executor:
+        tarefas = [
+            executor.submit(_calcular_bloco, inicio, list(origens[inicio:inicio + tamanho_bloco]))
+            for inicio in range(0, len(origens), tamanho_bloco)
+        ]
+        for tarefa in tarefas:
+            tarefa.result()
@@ -0,0 +1,338 @@
+from array import array
+from collections import deque
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele só há a busca vértice a vértice
+    np = None
+
+try:
+    from .adjacencia import AdjacenciaCSR
+except ImportError:
+    from adjacencia import AdjacenciaCSR
+
+# Heurística de troca de direção da BFS por níveis (Beamer, Asanović e Patterson):
+# desce para bottom-up quando as arestas da fronteira passam de 1/ALFA das arestas ainda não
+# examinadas, e volta para top-down quando a fronteira fica menor que 1/BETA dos vértices
+ALFA_DIRECAO = 14
+BETA_DIRECAO = 24
+
+
+class BuffersBusca:
+    """
+    Vetores de trabalho de uma busca, alocados uma vez para todos os vértices.
+
+    Atributos:
+        visitado (bytearray): 1 para vértices já alcançados pela busca.
+        nivel (array): Nível de cada vértice alcançado na árvore de busca.
+        pai (array): Pai de cada vértice alcançado (-1 para a raiz).
+        alcancados (array): Vértices marcados desde a última limpeza, na ordem em que foram alcançados.
+    """
+
+    def __init__(self, qtd_indices):
+        self.visitado = bytearray(qtd_indices)
+        self.nivel = array('q', bytes(8 * qtd_indices))
+        self.pai = array('q', [-1]) * qtd_indices
+        self.alcancados = array('q')
+
+    def __len__(self):
+        return len(self.visitado)
+
+    def marcar(self, v, nivel, pai):
+        self.visitado[v] = 1
+        self.nivel[v] = nivel
+        self.pai[v] = pai
+        self.alcancados.append(v)
+
+    def limpar(self):
+        """
+        Desmarca apenas os vértices alcançados, em O(alcançados) em vez de O(V).
+
+        `nivel` e `pai` só são lidos para vértices marcados, por isso não precisam ser zerados.
+        """
+        visitado = self.visitado
+        for v in self.alcancados:
+            visitado[v] = 0
+        del self.alcancados[:]
+
+
+class PoolBuffers:
+    """
+    Reaproveita `BuffersBusca` entre buscas sucessivas no mesmo grafo.
+
+    Cada busca obtém um conjunto de buffers exclusivo e o devolve limpo ao terminar,
+    de modo que nenhum estado de uma busca vaza para a seguinte. Cada thread tem a sua
+    própria lista de buffers livres: buscas simultâneas no mesmo grafo, em threads
+    diferentes, nunca disputam os mesmos vetores.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _livres(self):
+        livres = getattr(self._local, 'livres', None)
+        if livres is None:
+            livres = self._local.livres = []
+        return livres
+
+    def obter(self, qtd_indices):
+        livres = self._livres()
+        while livres:
+            buffers = livres.pop()
+            if len(buffers) == qtd_indices:
+                return buffers
+        return BuffersBusca(qtd_indices)
+
+    def devolver(self, buffers):
+        buffers.limpar()
+        self._livres().append(buffers)
+
+
+def iterar_profundidade(adjacencia, origem, buffers, profundidade_maxima=None):
+    """
+    Busca em profundidade iterativa, com pilha explícita de iteradores de vizinhos.
+
+    Visita os vértices exatamente na mesma ordem da versão recursiva, mas sem limite de
+    profundidade: grafos em forma de caminho com milhões de vértices não estouram a pilha
+    do Python. Os vértices já marcados em `buffers.visitado` não são revisitados, o que
+    permite encadear várias buscas (por exemplo, para separar componentes conexos).
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        origem (int): Vértice inicial.
+        buffers (BuffersBusca): Vetores de trabalho; `nivel` e `pai` são preenchidos para os vértices alcançados.
+        profundidade_maxima (int): Se informado, vértices nesse nível não têm os vizinhos examinados.
+
+    Gera:
+        tuple: (vertice, nivel, pai) na ordem de visita; `pai` é None para a origem.
+    """
+
+    visitado, nivel = buffers.visitado, buffers.nivel
+    buffers.marcar(origem, 0, -1)
+    yield origem, 0, None
+
+    # Pilha de (vértice, iterador sobre os vizinhos ainda não examinados)
+    vertices = [origem]
+    iteradores = [iter(adjacencia[origem]) if profundidade_maxima != 0 else iter(())]
+
+    while iteradores:
+        for u in iteradores[-1]:
+            if not visitado[u]:
+                v = vertices[-1]
+                nivel_u = nivel[v] + 1
+                buffers.marcar(u, nivel_u, v)
+                yield u, nivel_u, v
+                vertices.append(u)
+                if profundidade_maxima is None or nivel_u < profundidade_maxima:
+                    iteradores.append(iter(adjacencia[u]))
+                else:
+                    iteradores.append(iter(()))
+                break
+        else:
+            vertices.pop()
+            iteradores.pop()
+
+
+def iterar_largura(adjacencia, origem, buffers, profundidade_maxima=None):
+    """
+    Busca em largura que gera os vértices conforme são retirados da fila.
+
+    Cada vértice é marcado ao entrar na fila, então a fila nunca guarda repetições e o
+    nível/pai de cada vértice é o do primeiro vértice que o descobriu.
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo.
+        origem (int): Vértice inicial.
+        buffers (BuffersBusca): Vetores de trabalho; `nivel` e `pai` são preenchidos para os vértices alcançados.
+        profundidade_maxima (int): Se informado, vértices nesse nível não são expandidos, de modo que
+                                   o custo é proporcional apenas aos níveis percorridos.
+
+    Gera:
+        tuple: (vertice, nivel, pai) na ordem de visita; `pai` é None para a origem.
+    """
+
+    visitado, nivel, pai = buffers.visitado, buffers.nivel, buffers.pai
+    buffers.marcar(origem, 0, -1)
+    fila = deque([origem])
+
+    while fila:
+        v = fila.popleft()
+        nivel_v = nivel[v]
+        yield v, nivel_v, (pai[v] if pai[v] >= 0 else None)
+
+        if profundidade_maxima is not None and nivel_v >= profundidade_maxima:
+            continue
+        for u in adjacencia[v]:
+            if not visitado[u]:
+                buffers.marcar(u, nivel_v + 1, v)
+                fila.append(u)
+
+
+def pico_fila_largura(ordem, pais):
+    """
+    Calcula o maior tamanho atingido pela fila de `iterar_largura`, a partir do resultado da busca.
+
+    Na fila, os vértices entram na ordem de visita e cada um entra quando o pai é retirado;
+    logo, depois de retirar o i-ésimo vértice, a fila guarda os descobertos até ali menos os
+    i + 1 já retirados. Assim a busca não precisa medir a fila a cada passo.
+
+    Parâmetros:
+        ordem (sequence): Vértices na ordem de visita.
+        pais (sequence): Pai de cada vértice de `ordem`, na mesma posição (-1 para a origem).
+    """
+    posicao = {v: i for i, v in enumerate(ordem)}
+    qtd = len(ordem)
+    pico = 1 if qtd else 0
+    descobertos = 1
+    for i in range(qtd):
+        while descobertos < qtd and posicao[pais[descobertos]] <= i:
+            descobertos += 1
+        pico = max(pico, descobertos - i - 1)
+    return pico
+
+
+def _buffers_csr(adjacencia):
+    """
+    Retorna (offsets, vizinhos) da adjacência como vetores NumPy, convertendo outros backends para CSR.
+
+    A conversão (do backend 'dict' ou de um CSR com alterações pendentes) custa O(V + E) a cada
+    chamada: quem faz várias buscas deve converter antes, como `Grafo._adjacencias_csr`, que
+    guarda a cópia por versão do grafo.
+    """
+    if not isinstance(adjacencia, AdjacenciaCSR):
+        adjacencia = AdjacenciaCSR.de_adjacencia(adjacencia, adjacencia.qtd_indices)
+    offsets, vizinhos, _ = adjacencia.buffers()
+    return np.asarray(offsets, dtype=np.int64), np.asarray(vizinhos)
+
+
+def _arestas_de(offsets, vizinhos, vertices):
+    """
+    Junta as linhas CSR de `vertices`, em ordem, sem laço em Python.
+
+    Retorna:
+        tuple: (vizinho de cada aresta, posição em `vertices` do dono de cada aresta).
+    """
+    inicios = offsets[vertices]
+    graus = offsets[vertices + 1] - inicios
+    dono = np.repeat(np.arange(len(vertices)), graus)
+    # Posição de cada aresta no CSR: a posição na concatenação, deslocada pelo início da linha do dono
+    deslocamento = inicios - (np.cumsum(graus) - graus)
+    return vizinhos[np.arange(len(dono)) + deslocamento[dono]], dono
+
+
+def largura_por_niveis(adjacencia, origem, profundidade_maxima=None, reversa=None, otimizar_direcao=False,
+                       metricas=None):
+    """
+    Busca em largura síncrona por níveis: cada nível é expandido de uma vez sobre os vetores CSR.
+
+    Em vez de retirar um vértice por vez da fila, a fronteira inteira é expandida com operações
+    do NumPy: as linhas de todos os vértices da fronteira são concatenadas, os vizinhos já
+    alcançados são descartados e cada vértice novo fica com a primeira ocorrência. Assim a ordem,
+    os níveis e os pais são exatamente os de `iterar_largura`.
+
+    Com `otimizar_direcao`, níveis com fronteira grande são expandidos de baixo para cima
+    (bottom-up): em vez de percorrer as arestas de saída da fronteira, percorre as arestas de
+    entrada dos vértices ainda não alcançados, o que é mais barato quando a fronteira cobre boa
+    parte do grafo. Os níveis não mudam e cada pai é o primeiro vértice da fronteira que alcança
+    o vértice, mas irmãos descobertos nesses níveis ficam em ordem crescente de índice, e não na
+    ordem da linha do pai; como a ordem da fronteira muda, os pais dos níveis seguintes podem
+    diferir dos da fila (continuam formando uma árvore de BFS válida).
+
+    Parâmetros:
+        adjacencia (AdjacenciaCSR | AdjacenciaDict): Adjacência do grafo (outros backends são convertidos
+                                   para CSR a cada chamada).
+        origem (int): Vértice inicial.
+        profundidade_maxima (int): Se informado, vértices nesse nível não são expandidos.
+        reversa (AdjacenciaCSR | AdjacenciaDict): Arestas de entrada, usadas nos passos bottom-up de
+                                   grafos dirigidos (padrão: a própria `adjacencia`, simétrica).
+        otimizar_direcao (bool): Alterna entre top-down e bottom-up conforme o tamanho da fronteira.
+        metricas (Metricas): Recebe, por nível, a direção usada, as arestas examinadas e o tamanho
+                             da fronteira (veja `metricas.instrumentar`).
+
+    Retorna:
+        tuple: (ordem, niveis, pais) como vetores NumPy int64, na ordem de visita; o pai da origem é -1.
+
+    Exceções:
+        ImportError: Se o NumPy não estiver instalado.
+    """
+
+    if np is None:
+        raise ImportError('largura_por_niveis requer o pacote numpy')
+
+    offsets, vizinhos = _buffers_csr(adjacencia)
+    qtd = len(offsets) - 1
+    # int32 basta para os níveis e deixa o vetor consultado a cada aresta com metade do tamanho
+    nivel = np.full(max(qtd, origem + 1), -1, dtype=np.int32)
+    nivel[origem] = 0
+
+    # Menor posição associada a cada vértice no nível corrente (LIVRE para os demais): a primeira
+    # ocorrência na expansão top-down, ou o pai mais cedo na fronteira na expansão bottom-up
+    LIVRE = np.iinfo(np.int64).max
+    menor = np.full(len(nivel), LIVRE, dtype=np.int64)
+
+    fronteira = np.array([origem], dtype=np.int64)
+    ordens, niveis, pais = [fronteira], [np.zeros(1, dtype=np.int64)], [np.full(1, -1, dtype=np.int64)]
+
+    if otimizar_direcao:
+        offsets_r, vizinhos_r = (offsets, vizinhos) if reversa is None else _buffers_csr(reversa)
+        graus = np.diff(offsets)
+        graus_r = np.diff(offsets_r)
+        posicao = np.full(len(nivel), LIVRE, dtype=np.int64)
+        # Arestas de entrada dos vértices ainda não alcançados (m_u na heurística)
+        nao_examinadas = int(graus_r.sum()) - (int(graus_r[origem]) if origem < qtd else 0)
+    bottom_up = False
+
+    profundidade = 0
+    while len(fronteira) and (profundidade_maxima is None or profundidade < profundidade_maxima):
+        dentro = fronteira[fronteira < qtd]
+
+        if otimizar_direcao:
+            if bottom_up:
+                bottom_up = len(fronteira) * BETA_DIRECAO >= qtd
+            else:
+                bottom_up = int(graus[dentro].sum()) * ALFA_DIRECAO > nao_examinadas
+
+        if bottom_up:
+            # Cada vértice não alcançado procura, entre as arestas de entrada, a que vem da
+            # posição mais baixa da fronteira: é o pai que a expansão top-down escolheria
+            posicao[fronteira] = np.arange(len(fronteira))
+            restantes = np.flatnonzero(nivel[:len(offsets_r) - 1] < 0)
+            origens, dono = _arestas_de(offsets_r, vizinhos_r, restantes)
+            posicao_pai = posicao[origens]
+            validos = posicao_pai != LIVRE
+            filhos, posicao_pai = restantes[dono[validos]], posicao_pai[validos]
+            np.minimum.at(menor, filhos, posicao_pai)
+            proxima = filhos[menor[filhos] == posicao_pai]
+            # `filhos` está em ordem de índice: a ordenação estável mantém essa ordem entre irmãos
+            proxima = proxima[np.argsort(menor[proxima], kind='stable')]
+            pai = fronteira[menor[proxima]]
+            menor[filhos] = LIVRE
+            posicao[fronteira] = LIVRE
+            examinadas = len(origens)
+        else:
+            alvos, dono = _arestas_de(offsets, vizinhos, dentro)
+            novos = nivel[alvos] < 0
+            alvos, dono = alvos[novos], dono[novos]
+            # Primeira ocorrência de cada vértice, na ordem em que a fila o descobriria
+            sequencia = np.arange(len(alvos))
+            np.minimum.at(menor, alvos, sequencia)
+            primeiros = menor[alvos] == sequencia
+            menor[alvos] = LIVRE
+            proxima, pai = alvos[primeiros].astype(np.int64), dentro[dono[primeiros]]
+            examinadas = len(novos)
+
+        if metricas is not None:
+            metricas.incrementar('niveis_bottom_up' if bottom_up else 'niveis_top_down')
+            metricas.incrementar('arestas_relaxadas', examinadas)
+            metricas.registrar_maximo('pico_fronteira', len(fronteira))
+        profundidade += 1
+        nivel[proxima] = profundidade
+        if otimizar_direcao:
+            nao_examinadas -= int(graus_r[proxima].sum())
+        ordens.append(proxima)
+        niveis.append(np.full(len(proxima), profundidade, dtype=np.int64))
+        pais.append(pai)
+        fronteira = proxima
+
+    return np.concatenate(ordens), np.concatenate(niveis), np.concatenate(pais)
@@ -0,0 +1,113 @@
+from array import array
+import mmap as _mmap
+import struct
+import sys
+
+MAGICA = b'GRAFOCSR'
+VERSAO = 2
+ALINHAMENTO = 64
+
+FLAG_PONDERADO = 1
+FLAG_DIRIGIDO = 2
+
+# magica, versao, flags, qtd_vertices, qtd_secoes, ordem dos bytes
+CABECALHO = struct.Struct('<8sIIQI4s')
+# nome, typecode, deslocamento, quantidade de itens
+SECAO = struct.Struct('<16s8sQQ')
+
+
+def _typecode(buffer):
+    """
+    Normaliza o formato de um buffer (array, memoryview ou ndarray) para um typecode de `array`.
+    """
+    visao = memoryview(buffer)
+    formato = visao.format.lstrip('@=<>!')
+    if formato in ('d', 'f', 'B'):
+        return formato
+    if formato in ('b', 'h', 'i', 'l', 'q'):
+        return {4: 'i', 8: 'q'}[visao.itemsize]
+    raise ValueError(f'Formato de buffer não suportado no snapshot: {visao.format!r}')
+
+
+def _alinhar(posicao):
+    return (posicao + ALINHAMENTO - 1) // ALINHAMENTO * ALINHAMENTO
+
+
+def salvar_snapshot(caminho, secoes, qtd_vertices, flags=0):
+    """
+    Grava buffers tipados em um arquivo binário versionado.
+
+    Layout do arquivo:
+    - Cabeçalho: assinatura, versão, flags, quantidade de vértices, quantidade de seções e ordem dos bytes.
+    - Diretório: nome, typecode, deslocamento e quantidade de itens de cada seção.
+    - Seções: os bytes de cada buffer, alinhados em 64 bytes para permitir mapeamento direto.
+
+    Parâmetros:
+        caminho (str | os.PathLike): Arquivo de destino.
+        secoes (dict): Buffers a gravar, indexados pelo nome da seção.
+        qtd_vertices (int): Quantidade de vértices declarada no grafo.
+        flags (int): Combinação das constantes FLAG_*.
+    """
+
+    ordem = b'LE' if sys.byteorder == 'little' else b'BE'
+    diretorio = []
+    posicao = _alinhar(CABECALHO.size + SECAO.size * len(secoes))
+    for nome, buffer in secoes.items():
+        visao = memoryview(buffer)
+        diretorio.append((nome, _typecode(buffer), posicao, len(visao), visao))
+        posicao = _alinhar(posicao + visao.nbytes)
+
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(CABECALHO.pack(MAGICA, VERSAO, flags, qtd_vertices, len(secoes), ordem))
+        for nome, typecode, deslocamento, quantidade, _ in diretorio:
+            arquivo.write(SECAO.pack(nome.encode(), typecode.encode(), deslocamento, quantidade))
+        for _, _, deslocamento, _, visao in diretorio:
+            arquivo.write(bytes(deslocamento - arquivo.tell()))
+            arquivo.write(visao.cast('B'))
+
+
+def carregar_snapshot(caminho, mmap=True):
+    """
+    Lê um arquivo gravado por `salvar_snapshot`.
+
+    Com `mmap=True` o arquivo é mapeado em memória somente leitura e cada seção é devolvida
+    como uma `memoryview` sobre o mapeamento: nada é copiado, a abertura custa apenas a leitura
+    do cabeçalho e vários processos que abrem o mesmo arquivo compartilham as mesmas páginas físicas.
+    Com `mmap=False` as seções são copiadas para objetos `array`.
+
+    Parâmetros:
+        caminho (str | os.PathLike): Arquivo de snapshot.
+        mmap (bool): Mapeia o arquivo em vez de copiá-lo para a memória.
+
+    Retorna:
+        tuple: (secoes, qtd_vertices, flags), onde `secoes` é um dicionário nome -> buffer.
+    """
+
+    with open(caminho, 'rb') as arquivo:
+        magica, versao, flags, qtd_vertices, qtd_secoes, ordem = CABECALHO.unpack(arquivo.read(CABECALHO.size))
+        if magica != MAGICA:
+            raise ValueError(f'{caminho} não é um snapshot de grafo')
+        if versao > VERSAO:
+            raise ValueError(f'Snapshot na versão {versao}; esta biblioteca lê até a versão {VERSAO}')
+        if ordem.rstrip(b'\0') != (b'LE' if sys.byteorder == 'little' else b'BE'):
+            raise ValueError('Snapshot gravado em uma máquina com ordem de bytes diferente')
+
+        diretorio = [SECAO.unpack(arquivo.read(SECAO.size)) for _ in range(qtd_secoes)]
+
+        secoes = {}
+        if mmap:
+            mapeamento = _mmap.mmap(arquivo.fileno(), 0, access=_mmap.ACCESS_READ)
+            bruto = memoryview(mapeamento)
+        for nome, typecode, deslocamento, quantidade in diretorio:
+            nome = nome.rstrip(b'\0').decode()
+            typecode = typecode.rstrip(b'\0').decode()
+            tamanho = quantidade * array(typecode).itemsize
+            if mmap:
+                secoes[nome] = bruto[deslocamento:deslocamento + tamanho].cast(typecode)
+            else:
+                arquivo.seek(deslocamento)
+                buffer = array(typecode)
+                buffer.frombytes(arquivo.read(tamanho))
+                secoes[nome] = buffer
+
+    return secoes, qtd_vertices, flags
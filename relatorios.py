@@ -0,0 +1,147 @@
+from contextlib import contextmanager
+import os
+
+# Quantidade de linhas acumuladas antes de cada escrita no destino
+LINHAS_POR_ESCRITA = 4096
+TAMANHO_BUFFER = 1 << 20
+
+
+@contextmanager
+def abrir_destino(destino, modo='a'):
+    """
+    Abre `destino` para escrita com buffer grande, ou usa o próprio objeto se ele já for gravável.
+
+    Objetos de arquivo (inclusive `sys.stdout`) não são fechados ao final.
+    """
+    if hasattr(destino, 'write'):
+        yield destino
+    else:
+        with open(os.fspath(destino), modo, buffering=TAMANHO_BUFFER) as arquivo:
+            yield arquivo
+
+
+def _escrever_linhas(arquivo, linhas):
+    """
+    Grava as linhas em lotes, com uma única chamada de `write` por lote.
+    """
+    lote = []
+    for linha in linhas:
+        lote.append(linha)
+        if len(lote) >= LINHAS_POR_ESCRITA:
+            arquivo.write(''.join(lote))
+            lote.clear()
+    if lote:
+        arquivo.write(''.join(lote))
+
+
+def escrever_informacoes(estatisticas, destino, modo='w'):
+    """
+    Grava as estatísticas do grafo no formato de 'saida.txt'.
+    """
+    with abrir_destino(destino, modo) as arquivo:
+        arquivo.write('--------------INFORMACOES DO GRAFO--------------\n\n')
+        arquivo.write(f'{estatisticas.formatar()}\n')
+
+
+def _linhas_profundidade(resultado):
+    yield '--------------BUSCA POR PROFUNDIDADE--------------\n\n'
+    for vertice, nivel, pai in resultado:
+        yield f'Vertice: {vertice} -> Nivel: {nivel} | Pai: {"Nenhum" if pai is None else pai} \n'
+    # O caminho percorrido vem ao final, na ordem de visita
+    yield '\n'
+    yield '->'.join(f' {u} ' for u in resultado.vertices())
+    yield '\n\n'
+
+
+def _linhas_largura(resultado):
+    yield '--------------BUSCA POR LARGURA--------------\n\n'
+    for vertice, nivel, pai in resultado:
+        yield f"Vertice: {vertice} -> Nivel: {nivel} | Pai: {'Nenhum' if pai is None else pai}\n"
+    yield '\n' + ' -> '.join(map(str, resultado.vertices()))
+    yield '\n\n'
+
+
+def escrever_busca(resultado, destino, modo='a'):
+    """
+    Grava um `ResultadoBusca` no formato de 'saida.txt' (DFS ou BFS, conforme `resultado.tipo`).
+    """
+    linhas = _linhas_profundidade(resultado) if resultado.tipo == 'profundidade' else _linhas_largura(resultado)
+    with abrir_destino(destino, modo) as arquivo:
+        _escrever_linhas(arquivo, linhas)
+
+
+def _linha_caminho(origem, destino, caminho, distancia, algoritmo):
+    if caminho:
+        return f'Caminho mínimo de {origem} para {destino} usando {algoritmo}: {caminho}\nDistância: {distancia}\n'
+    return f'{destino} não é acessível a partir de {origem}\n'
+
+
+def escrever_caminho(resultado, destino, modo='a'):
+    """
+    Grava um `ResultadoCaminho` (consulta entre dois vértices).
+    """
+    with abrir_destino(destino, modo) as arquivo:
+        arquivo.write(_linha_caminho(
+            resultado.origem, resultado.destino, resultado.caminho, resultado.distancia, resultado.algoritmo
+        ))
+
+
+def escrever_caminhos(resultado, destino, modo='a'):
+    """
+    Grava um `ResultadoCaminhos`: o caminho e a distância da origem para cada vértice do grafo.
+    """
+    origem, algoritmo = resultado.origem, resultado.algoritmo
+    linhas = (
+        _linha_caminho(origem, v, resultado.caminho(v), resultado[v], algoritmo)
+        for v in resultado
+    )
+    with abrir_destino(destino, modo) as arquivo:
+        _escrever_linhas(arquivo, linhas)
+
+
+def escrever_componentes(resultado, destino, modo='a', descricao='componentes conexos'):
+    """
+    Grava um `ResultadoComponentes`: a quantidade de componentes e os vértices de cada um.
+    """
+    def linhas():
+        yield f'\nNúmero de {descricao} do grafo: {len(resultado)}\n'
+        for i, componente in enumerate(resultado):
+            yield f'Componente {i + 1} -> Lista de vértices: {componente} | Tamanho: {len(componente)}\n'
+        yield '\n'
+
+    with abrir_destino(destino, modo) as arquivo:
+        _escrever_linhas(arquivo, linhas())
+
+
+def escrever_matriz(linhas, destino, modo='w'):
+    """
+    Grava a matriz de adjacência, recebendo as linhas já formatadas (veja `MatrizEsparsa.linhas_texto`).
+    """
+    def texto():
+        yield '==================== RESULTADO =========================\n\n'
+        yield 'Matriz de adjacência:\n\n'
+        yield from linhas
+        yield '\n'
+
+    with abrir_destino(destino, modo) as arquivo:
+        _escrever_linhas(arquivo, texto())
+
+
+def escrever_lista(adjacencia, tabela, destino, modo='w'):
+    """
+    Grava a lista de adjacência direto da estrutura em memória, um vértice por linha.
+
+    Cada linha é montada com um único `join` sobre os vizinhos, na ordem dos índices dos vértices
+    (a ordem crescente dos rótulos inteiros).
+    """
+    rotulo = tabela.rotulo
+
+    def texto():
+        yield '\n\n==================== RESULTADO =========================\n\n'
+        yield 'Lista de Adjacencia: \n\n'
+        for u in sorted(adjacencia):
+            yield f"{rotulo(u)}{''.join([f'-> {rotulo(v)}' for v in adjacencia[u]])}\n"
+        yield '\n'
+
+    with abrir_destino(destino, modo) as arquivo:
+        _escrever_linhas(arquivo, texto())
@@ -0,0 +1,424 @@
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Mapping
+import math
+import mmap as _mmap
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: usado apenas em `como_numpy`
+    np = None
+
+
+class MatrizDistancias:
+    """
+    Distâncias mínimas de um conjunto de origens para todos os vértices, em um buffer tipado.
+
+    A linha `i` guarda as distâncias a partir de `origens[i]` e a coluna `j` corresponde ao
+    vértice de índice denso `j` (veja `TabelaVertices`). Vértices inalcançáveis ficam com distância
+    infinita. O buffer pode estar em memória (`array`) ou mapeado de um arquivo em disco.
+
+    Atributos:
+        origens (list): Rótulos dos vértices de origem, na ordem das linhas.
+        qtd_colunas (int): Quantidade de colunas (quantidade de índices de vértice).
+        tipo (str): Typecode dos valores ('d' para float64, 'f' para float32).
+        dados (buffer): Os len(origens) * qtd_colunas valores, linha a linha.
+        tabela (TabelaVertices): Tradução dos rótulos para colunas (None: o rótulo já é a coluna).
+    """
+
+    def __init__(self, origens, qtd_colunas, dados, tipo='d', tabela=None):
+        self.origens = list(origens)
+        self.qtd_colunas = qtd_colunas
+        self.tipo = tipo
+        self.dados = dados
+        self.tabela = tabela
+        self._dados = memoryview(dados)
+        self._linha_de = {origem: i for i, origem in enumerate(self.origens)}
+
+    @classmethod
+    def abrir(cls, caminho, origens, qtd_colunas, tipo='d', tabela=None):
+        """
+        Reabre, mapeada em memória, uma matriz gravada em disco por `caminhos_minimos_lote`.
+        """
+        with open(caminho, 'rb') as arquivo:
+            mapeamento = _mmap.mmap(arquivo.fileno(), 0, access=_mmap.ACCESS_READ)
+        return cls(origens, qtd_colunas, memoryview(mapeamento).cast(tipo), tipo, tabela)
+
+    def __len__(self):
+        return len(self.origens)
+
+    def linha(self, i):
+        """
+        Retorna a linha `i` (distâncias a partir de `origens[i]`) como `memoryview`, sem cópia.
+        """
+        if not 0 <= i < len(self.origens):
+            raise IndexError(i)
+        return self._dados[i * self.qtd_colunas:(i + 1) * self.qtd_colunas]
+
+    def distancias_de(self, origem):
+        return self.linha(self._linha_de[origem])
+
+    def distancia(self, origem, destino):
+        coluna = destino if self.tabela is None else self.tabela.indice(destino)
+        return self._dados[self._linha_de[origem] * self.qtd_colunas + coluna]
+
+    def como_numpy(self):
+        """
+        Retorna a matriz como `numpy.ndarray` de forma (len(origens), qtd_colunas), sem cópia.
+        """
+        if np is None:
+            raise ImportError('como_numpy requer o pacote numpy')
+        return np.frombuffer(self._dados, dtype=np.float64 if self.tipo == 'd' else np.float32).reshape(
+            len(self.origens), self.qtd_colunas
+        )
+
+    def bytes_utilizados(self):
+        return self._dados.nbytes
+
+
+class ResultadoCaminho:
+    """
+    Caminho mínimo entre dois vértices.
+
+    Pode ser desempacotado como a tupla (caminho, distancia) devolvida pelas versões anteriores.
+
+    Atributos:
+        origem (int): Vértice inicial.
+        destino (int): Vértice final.
+        caminho (list): Vértices do caminho, da origem ao destino ([] se inalcançável).
+        distancia (float): Distância mínima (infinita se inalcançável).
+        algoritmo (str): Nome do algoritmo usado.
+    """
+
+    def __init__(self, origem, destino, caminho, distancia, algoritmo):
+        self.origem = origem
+        self.destino = destino
+        self.caminho = caminho
+        self.distancia = distancia
+        self.algoritmo = algoritmo
+
+    def __iter__(self):
+        return iter((self.caminho, self.distancia))
+
+    def __repr__(self):
+        return f'ResultadoCaminho(origem={self.origem}, destino={self.destino}, distancia={self.distancia})'
+
+    @property
+    def alcancavel(self):
+        return self.distancia != math.inf
+
+
+class ResultadoCaminhos(Mapping):
+    """
+    Caminhos mínimos de uma origem para todos os vértices do grafo.
+
+    Funciona como um dicionário {vertice: distancia} somente leitura, com distância infinita para
+    os vértices inalcançáveis. Os dados vêm da árvore de caminhos mínimos (possivelmente do cache),
+    portanto criar o resultado não percorre o grafo. A árvore é indexada pelos índices densos; as
+    chaves e os caminhos são traduzidos para os rótulos pela `tabela`.
+
+    Atributos:
+        origem: Rótulo do vértice de origem.
+        arvore (ArvoreCaminhos): Distâncias e antecessores dos vértices alcançados.
+        vertices (range | array): Índices listados, em ordem crescente. A sequência é fixada na
+                                  criação (alterações posteriores do grafo não a afetam) e sempre
+                                  inclui a origem.
+        tabela (TabelaVertices): Tradução entre rótulos e índices (None: rótulo e índice coincidem).
+    """
+
+    def __init__(self, arvore, vertices, tabela=None):
+        self.origem = arvore.origem if tabela is None else tabela.rotulo(arvore.origem)
+        self.arvore = arvore
+        i = bisect_left(vertices, arvore.origem)
+        if i == len(vertices) or vertices[i] != arvore.origem:
+            # Origem sem arestas: entra na sua posição da ordem
+            vertices = array('q', vertices[:i]) + array('q', [arvore.origem]) + array('q', vertices[i:])
+        self.vertices = vertices
+        self.tabela = tabela
+
+    def _listado(self, indice):
+        i = bisect_left(self.vertices, indice)
+        return i < len(self.vertices) and self.vertices[i] == indice
+
+    def _indice(self, vertice):
+        return vertice if self.tabela is None else self.tabela.indice(vertice)
+
+    @property
+    def algoritmo(self):
+        return self.arvore.algoritmo
+
+    def __getitem__(self, vertice):
+        indice = self._indice(vertice)
+        if indice not in self.arvore and not self._listado(indice):
+            raise KeyError(vertice)
+        return self.arvore.distancia(indice)
+
+    def __iter__(self):
+        if self.tabela is None:
+            return iter(self.vertices)
+        return map(self.tabela.rotulo, self.vertices)
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __repr__(self):
+        return f'ResultadoCaminhos(origem={self.origem}, alcancados={len(self.arvore)})'
+
+    def caminho(self, destino):
+        """
+        Caminho até `destino` em O(tamanho do caminho); [] se ele não for alcançável.
+        """
+        caminho = self.arvore.caminho(self._indice(destino))
+        return caminho if self.tabela is None else self.tabela.rotulos(caminho)
+
+    def como_arrays(self, qtd_indices):
+        """
+        Retorna (distancias, pais) como vetores tipados indexados pelo índice denso do vértice.
+
+        Vértices inalcançáveis têm distância infinita e pai -1 (a origem também tem pai -1).
+        """
+        distancias = array('d', [math.inf]) * qtd_indices
+        pais = array('q', [-1]) * qtd_indices
+        for v, distancia in self.arvore.distancias.items():
+            distancias[v] = distancia
+        for v, pai in self.arvore.antecessor.items():
+            if pai is not None:
+                pais[v] = pai
+        return distancias, pais
+
+
+class ResultadoBusca:
+    """
+    Vértices visitados por uma busca (DFS ou BFS), na ordem de visita.
+
+    Os vetores guardam os índices densos dos vértices; a iteração e `vertices()` devolvem os rótulos.
+
+    Atributos:
+        tipo (str): 'profundidade' ou 'largura'.
+        origem: Rótulo do vértice inicial.
+        ordem (array): Índices dos vértices na ordem de visita.
+        niveis (array): Nível de cada vértice de `ordem`, na mesma posição.
+        pais (array): Índice do pai de cada vértice de `ordem`, na mesma posição (-1 para a origem).
+        tabela (TabelaVertices): Tradução dos índices para rótulos (None: rótulo e índice coincidem).
+    """
+
+    def __init__(self, tipo, origem, ordem, niveis, pais, tabela=None):
+        self.tipo = tipo
+        self.origem = origem
+        self.ordem = ordem
+        self.niveis = niveis
+        self.pais = pais
+        self.tabela = tabela
+
+    @classmethod
+    def de_eventos(cls, tipo, origem, eventos, tabela=None):
+        """
+        Consome os eventos (indice, nivel, pai) de um gerador de percurso.
+        """
+        ordem, niveis, pais = array('q'), array('q'), array('q')
+        for vertice, nivel, pai in eventos:
+            ordem.append(vertice)
+            niveis.append(nivel)
+            pais.append(-1 if pai is None else pai)
+        return cls(tipo, origem, ordem, niveis, pais, tabela)
+
+    def __len__(self):
+        return len(self.ordem)
+
+    def vertices(self):
+        """
+        Retorna os rótulos dos vértices na ordem de visita.
+        """
+        return self.ordem.tolist() if self.tabela is None else self.tabela.rotulos(self.ordem)
+
+    def __iter__(self):
+        """
+        Gera os eventos (vertice, nivel, pai) com rótulos, com `pai` igual a None para a origem.
+        """
+        rotulo = (lambda i: i) if self.tabela is None else self.tabela.rotulo
+        for vertice, nivel, pai in zip(self.ordem, self.niveis, self.pais):
+            yield rotulo(vertice), nivel, (None if pai < 0 else rotulo(pai))
+
+
+class ResultadoComponentes:
+    """
+    Componentes conexos do grafo, como um vetor compacto de rótulos.
+
+    Os componentes são numerados de 0 em diante na ordem do menor índice de cada um. A lista de
+    vértices de cada componente só é montada quando pedida (`componente`, iteração), por uma
+    ordenação por contagem sobre os rótulos.
+
+    Atributos:
+        rotulos (array): Componente de cada vértice, indexado pelo índice denso (-1 para índices sem aresta).
+        tamanhos (array): Quantidade de vértices de cada componente.
+        tabela (TabelaVertices): Tradução entre rótulos de vértice e índices (None: rótulo e índice coincidem).
+    """
+
+    def __init__(self, rotulos, tamanhos, tabela=None):
+        self.rotulos = rotulos
+        self.tamanhos = tamanhos
+        self.tabela = tabela
+        self._ordem = None
+        self._inicios = None
+
+    def __len__(self):
+        return len(self.tamanhos)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self.componente(i)
+
+    def _agrupar(self):
+        """
+        Agrupa os vértices por componente (formato CSR), em ordem crescente de índice dentro de cada um.
+        """
+        inicios = array('q', [0])
+        for tamanho in self.tamanhos:
+            inicios.append(inicios[-1] + tamanho)
+
+        if np is not None:
+            rotulos = np.asarray(self.rotulos)
+            presentes = np.flatnonzero(rotulos >= 0)
+            ordem = presentes[np.argsort(rotulos[presentes], kind='stable')]
+            self._ordem = array('q', ordem.astype(np.int64).tobytes())
+        else:
+            ordem = array('q', bytes(8 * inicios[-1]))
+            proxima = array('q', inicios)
+            for v, rotulo in enumerate(self.rotulos):
+                if rotulo >= 0:
+                    ordem[proxima[rotulo]] = v
+                    proxima[rotulo] += 1
+            self._ordem = ordem
+        self._inicios = inicios
+
+    def componente(self, i):
+        """
+        Retorna os rótulos dos vértices do componente `i`, em ordem crescente de índice.
+        """
+        if self._ordem is None:
+            self._agrupar()
+        indices = self._ordem[self._inicios[i]:self._inicios[i + 1]]
+        return indices.tolist() if self.tabela is None else self.tabela.rotulos(indices)
+
+    def tamanho(self, i):
+        return self.tamanhos[i]
+
+    def rotulo(self, vertice):
+        """
+        Retorna o componente do vértice (pelo rótulo).
+        """
+        return self.rotulos[vertice if self.tabela is None else self.tabela.indice(vertice)]
+
+    def histograma(self):
+        """
+        Retorna {tamanho: quantidade de componentes com esse tamanho}, em ordem crescente de tamanho.
+        """
+        if np is not None:
+            valores, contagens = np.unique(np.asarray(self.tamanhos), return_counts=True)
+            return dict(zip(valores.tolist(), contagens.tolist()))
+        return dict(sorted(Counter(self.tamanhos).items()))
+
+
+class ResultadoPageRank:
+    """
+    PageRank de cada vértice, calculado por iteração de potência (veja `analise.pagerank`).
+
+    Atributos:
+        valores (numpy.ndarray): PageRank de cada vértice, indexado pelo índice denso; soma 1.
+        iteracoes (int): Iterações executadas.
+        erro (float): Diferença, na norma L1, entre as duas últimas iterações.
+        convergiu (bool): Indica se o erro ficou abaixo da tolerância antes do limite de iterações.
+        tabela (TabelaVertices): Tradução entre rótulos de vértice e índices (None: rótulo e índice coincidem).
+    """
+
+    def __init__(self, valores, iteracoes, erro, convergiu, tabela=None):
+        self.valores = valores
+        self.iteracoes = iteracoes
+        self.erro = erro
+        self.convergiu = convergiu
+        self.tabela = tabela
+
+    def __len__(self):
+        return len(self.valores)
+
+    def __getitem__(self, vertice):
+        """
+        Retorna o PageRank do vértice (pelo rótulo).
+        """
+        return float(self.valores[vertice if self.tabela is None else self.tabela.indice(vertice)])
+
+    def maiores(self, k=10):
+        """
+        Retorna os `k` vértices de maior PageRank como lista de (vertice, valor), em ordem decrescente.
+        """
+        indices = np.argsort(-self.valores, kind='stable')[:k].tolist()
+        rotulos = indices if self.tabela is None else self.tabela.rotulos(indices)
+        return list(zip(rotulos, self.valores[indices].tolist()))
+
+
+class ResultadoArvoreGeradora:
+    """
+    Floresta geradora mínima: uma árvore para cada componente conexo do grafo.
+
+    As arestas ficam em vetores tipados, agrupadas por árvore: a árvore `i` cobre o componente `i`
+    de `Grafo.encontrar_componentes_conexos` (mesma numeração) e ocupa as posições
+    inicios[i]:inicios[i + 1]. Componentes de um único vértice têm árvore vazia.
+
+    Atributos:
+        origens (array): Índice denso da extremidade de cada aresta já na árvore quando ela foi escolhida.
+        destinos (array): Índice denso da outra extremidade de cada aresta.
+        pesos (array): Peso de cada aresta.
+        inicios (array): Posição da primeira aresta de cada árvore (com uma posição final a mais).
+        peso_total (float): Soma dos pesos de todas as árvores.
+        algoritmo (str): 'Kruskal' ou 'Prim'.
+        tabela (TabelaVertices): Tradução dos índices para rótulos (None: rótulo e índice coincidem).
+    """
+
+    def __init__(self, origens, destinos, pesos, inicios, algoritmo, tabela=None):
+        self.origens = origens
+        self.destinos = destinos
+        self.pesos = pesos
+        self.inicios = inicios
+        self.peso_total = math.fsum(pesos)
+        self.algoritmo = algoritmo
+        self.tabela = tabela
+
+    def __len__(self):
+        return len(self.pesos)
+
+    def _arestas(self, inicio, fim):
+        rotulo = (lambda i: i) if self.tabela is None else self.tabela.rotulo
+        for u, v, peso in zip(self.origens[inicio:fim], self.destinos[inicio:fim], self.pesos[inicio:fim]):
+            yield rotulo(u), rotulo(v), peso
+
+    def __iter__(self):
+        """
+        Gera as arestas (u, v, peso) com rótulos, árvore por árvore.
+        """
+        return self._arestas(0, len(self))
+
+    @property
+    def qtd_arvores(self):
+        return len(self.inicios) - 1
+
+    def arvore(self, i):
+        """
+        Retorna as arestas (u, v, peso) da árvore do componente `i`, com rótulos.
+        """
+        return list(self._arestas(self.inicios[i], self.inicios[i + 1]))
+
+    def peso_arvore(self, i):
+        return math.fsum(self.pesos[self.inicios[i]:self.inicios[i + 1]])
+
+    def como_numpy(self):
+        """
+        Retorna (origens, destinos, pesos) como vetores NumPy sobre os mesmos buffers, sem cópia.
+        """
+        if np is None:
+            raise ImportError('como_numpy requer o pacote numpy')
+        return (
+            np.frombuffer(self.origens, dtype=np.int64),
+            np.frombuffer(self.destinos, dtype=np.int64),
+            np.frombuffer(self.pesos, dtype=np.float64),
+        )
@@ -5,6 +5,9 @@ setup(
     version='0.2',
     packages=find_packages(),
     install_requires=[],  # Dependências que sua biblioteca precisa
+    extras_require={
+        'numpy': ['numpy'],  # Acelera a construção e os algoritmos vetorizados
+    },
     description='Uma biblioteca de exemplo em Python',
     author='Lucas Firmino Batista',
     author_email='seuemail@example.com',
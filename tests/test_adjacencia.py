@@ -0,0 +1,181 @@
+import io
+import random
+import unittest
+
+from adjacencia import AdjacenciaCSR, AdjacenciaDict
+from grafo import Grafo
+
+try:
+    import numpy as np
+except ImportError:  # Os casos com inteiros do NumPy são pulados sem ele
+    np = None
+
+
+def linhas(adjacencia):
+    return {v: dict(adjacencia[v].items()) for v in adjacencia}
+
+
+class TestConstrucao(unittest.TestCase):
+    """
+    Os dois backends montam as mesmas linhas a partir da mesma lista de arestas.
+    """
+
+    ORIGENS = [0, 1, 0, 2, 3, 1]
+    DESTINOS = [1, 2, 1, 2, 0, 0]
+    PESOS = [1.0, 2.0, 5.0, 3.0, 4.0, 6.0]
+
+    def test_backends_equivalentes(self):
+        for dirigido in (False, True):
+            csr = AdjacenciaCSR.de_arestas(self.ORIGENS, self.DESTINOS, self.PESOS, 4, dirigido)
+            dicionario = AdjacenciaDict.de_arestas(self.ORIGENS, self.DESTINOS, self.PESOS, 4, dirigido)
+            with self.subTest(dirigido=dirigido):
+                self.assertEqual(linhas(csr), linhas(dicionario))
+                # A ordem dos vizinhos é a da primeira ocorrência de cada aresta
+                self.assertEqual(list(csr[0]), list(dicionario[0]))
+                self.assertEqual(len(csr), len(dicionario))
+                self.assertEqual([csr.grau(v) for v in range(4)], [dicionario.grau(v) for v in range(4)])
+
+    def test_arestas_repetidas_e_lacos(self):
+        csr = AdjacenciaCSR.de_arestas(self.ORIGENS, self.DESTINOS, self.PESOS, 4)
+        # 0-1 aparece duas vezes e depois como 1-0: fica o último peso
+        self.assertEqual(csr[0][1], 6.0)
+        self.assertEqual(csr[1][0], 6.0)
+        # O laço 2-2 entra uma única vez na linha
+        self.assertEqual(list(csr[2]), [1, 2])
+        self.assertEqual(csr.grau(2), 2)
+        self.assertEqual(list(csr.offsets), [0, 2, 4, 6, 7])
+
+    def test_de_adjacencia(self):
+        dicionario = AdjacenciaDict.de_arestas(self.ORIGENS, self.DESTINOS, self.PESOS, 5, True)
+        csr = AdjacenciaCSR.de_adjacencia(dicionario, 5)
+        self.assertTrue(csr.dirigido)
+        self.assertEqual(linhas(csr), linhas(dicionario))
+        self.assertEqual(linhas(AdjacenciaDict.de_adjacencia(csr, 5)), linhas(dicionario))
+        self.assertNotIn(4, csr)
+        self.assertEqual(len(csr[4]), 0)
+
+
+class TestConsultas(unittest.TestCase):
+    """
+    Consultas de pertinência e de peso nas linhas do CSR.
+    """
+
+    def test_peso_por_busca_binaria(self):
+        rng = random.Random(1)
+        origens = [rng.randrange(30) for _ in range(300)]
+        destinos = [rng.randrange(30) for _ in range(300)]
+        pesos = [float(rng.randint(1, 9)) for _ in range(300)]
+        csr = AdjacenciaCSR.de_arestas(origens, destinos, pesos, 30)
+        dicionario = AdjacenciaDict.de_arestas(origens, destinos, pesos, 30)
+        for u in range(30):
+            for v in range(-1, 31):
+                with self.subTest(u=u, v=v):
+                    self.assertEqual(v in csr[u], v in dicionario[u])
+                    self.assertEqual(csr[u].get(v), dicionario[u].get(v))
+        # A iteração continua na ordem da linha, não na ordem do índice
+        self.assertEqual([list(csr[u]) for u in range(30)], [list(dicionario[u]) for u in range(30)])
+
+    def test_rotulos_que_nao_sao_indices(self):
+        csr = AdjacenciaCSR.de_arestas([0], [1], [2.0], 2)
+        self.assertNotIn('0', csr)
+        self.assertNotIn(None, csr)
+        self.assertNotIn('1', csr[0])
+        self.assertNotIn(1.5, csr[0])
+        with self.assertRaises(KeyError):
+            csr[0]['1']
+
+    @unittest.skipIf(np is None, 'requer o NumPy')
+    def test_inteiros_do_numpy(self):
+        csr = AdjacenciaCSR.de_arestas([0, 1], [1, 2], [2.0, 3.0], 3)
+        for tipo in (np.int32, np.int64, np.uint8):
+            with self.subTest(tipo=tipo):
+                self.assertIn(tipo(1), csr)
+                self.assertIn(tipo(2), csr[1])
+                self.assertEqual(csr[tipo(1)][tipo(2)], 3.0)
+        csr.adicionar(2, 0, 4.0)
+        self.assertIn(np.int64(2), csr)
+        self.assertEqual(csr[np.int64(2)][np.int64(0)], 4.0)
+
+    def test_indice_acompanha_a_compactacao(self):
+        csr = AdjacenciaCSR.de_arestas([0, 0], [2, 1], [1.0, 2.0], 3)
+        self.assertEqual(csr[0][1], 2.0)
+        csr.adicionar(0, 3, 5.0)
+        csr.remover(0, 2)
+        csr.compactar()
+        self.assertEqual(list(csr[0]), [1, 3])
+        self.assertEqual(csr[0][3], 5.0)
+        self.assertNotIn(2, csr[0])
+
+
+class TestAlteracoes(unittest.TestCase):
+    """
+    Inserções e remoções no CSR ficam na sobreposição até a compactação.
+    """
+
+    def test_sobreposicao_e_compactacao(self):
+        csr = AdjacenciaCSR.de_arestas([0, 1], [1, 2], [1.0, 2.0], 3)
+        dicionario = AdjacenciaDict.de_arestas([0, 1], [1, 2], [1.0, 2.0], 3)
+        for adjacencia in (csr, dicionario):
+            self.assertIsNone(adjacencia.adicionar(2, 4, 7.0))
+            self.assertEqual(adjacencia.adicionar(0, 1, 3.0), 1.0)
+            self.assertEqual(adjacencia.remover(1, 2), 2.0)
+            with self.assertRaises(KeyError):
+                adjacencia.remover(1, 2)
+        self.assertFalse(csr.compactada)
+        self.assertEqual(csr.qtd_indices, 5)
+        self.assertEqual(linhas(csr), linhas(dicionario))
+
+        csr.compactar()
+        self.assertTrue(csr.compactada)
+        self.assertEqual(linhas(csr), linhas(dicionario))
+        self.assertEqual(list(csr.offsets), [0, 1, 2, 3, 3, 4])
+
+    def test_ler_buffers_nao_compacta(self):
+        csr = AdjacenciaCSR.de_arestas([0, 1], [1, 2], [1.0, 2.0], 3)
+        csr.adicionar(2, 0, 3.0)
+        csr.remover(0, 1)
+        alteradas = dict(csr._alteradas)
+        esperadas = linhas(csr)
+        offsets, vizinhos, pesos = csr.buffers()
+        self.assertEqual(linhas(AdjacenciaCSR(offsets, vizinhos, pesos)), esperadas)
+        self.assertEqual(list(csr.offsets), list(offsets))
+        # A leitura devolve uma cópia compactada e deixa a sobreposição intacta
+        self.assertFalse(csr.compactada)
+        self.assertEqual(csr._alteradas, alteradas)
+        csr.compactar()
+        self.assertTrue(csr.compactada)
+        self.assertEqual(list(csr.offsets), list(offsets))
+        self.assertEqual(linhas(csr), esperadas)
+
+    def test_compactacao_automatica(self):
+        csr = AdjacenciaCSR.de_arestas([0], [1], [1.0], 2)
+        csr.MINIMO_COMPACTACAO = 8
+        for v in range(2, 12):
+            csr.adicionar(0, v, 1.0)
+        # As entradas alteradas passaram do limite: a sobreposição já foi incorporada aos buffers
+        self.assertLess(len(csr._alteradas), 10)
+        self.assertEqual(sorted(csr[0]), list(range(1, 12)))
+
+
+class TestGrafoNosDoisBackends(unittest.TestCase):
+
+    ENTRADA = '5\n1 2 4\n2 3 1\n1 3 7\n4 5 2\n'
+
+    def test_mesmas_respostas(self):
+        csr = Grafo(io.StringIO(self.ENTRADA), backend='csr')
+        dicionario = Grafo(io.StringIO(self.ENTRADA), backend='dict')
+        self.assertIsInstance(csr.grafo, AdjacenciaCSR)
+        self.assertIsInstance(dicionario.grafo, AdjacenciaDict)
+        self.assertEqual(linhas(csr.grafo), linhas(dicionario.grafo))
+        for origem in (1, 4):
+            self.assertEqual(dict(csr.calcular_caminho_minimo(origem)), dict(dicionario.calcular_caminho_minimo(origem)))
+        self.assertEqual(csr.calcular_caminho_minimo(1, 3).distancia, 5)
+        self.assertEqual(csr.estatisticas().formatar(), dicionario.estatisticas().formatar())
+
+    def test_backend_desconhecido(self):
+        with self.assertRaises(ValueError):
+            Grafo(io.StringIO(self.ENTRADA), backend='lista')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+import io
+import math
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from grafo import Grafo
+
+CONFIGURACOES = [(backend, dirigido) for backend in ('csr', 'dict') for dirigido in (False, True)]
+
+
+def arestas_aleatorias(rng, n, m, dirigido, ponderado):
+    """
+    Sorteia até `m` arestas (u, v, peso) entre os vértices 1..n, sem laços nem repetições.
+    """
+    arestas = {}
+    for _ in range(m):
+        u, v = rng.randint(1, n), rng.randint(1, n)
+        if u != v and (u, v) not in arestas and (dirigido or (v, u) not in arestas):
+            arestas[(u, v)] = rng.randint(1, 9) if ponderado else 1
+    return [(u, v, peso) for (u, v), peso in arestas.items()]
+
+
+def montar(n, arestas, ponderado, backend, dirigido):
+    linhas = [f'{u} {v} {peso}' if ponderado else f'{u} {v}' for u, v, peso in arestas]
+    # Rótulos dentro do cabeçalho: todos os vértices 1..n existem, mesmo sem arestas
+    return Grafo(io.StringIO(f'{n}\n' + ''.join(f'{linha}\n' for linha in linhas)), backend=backend, dirigido=dirigido)
+
+
+def distancias(n, arestas, dirigido, origem):
+    pares = list(arestas) + ([] if dirigido else [(v, u, peso) for u, v, peso in arestas])
+    resultado = {v: math.inf for v in range(1, n + 1)}
+    resultado[origem] = 0
+    for _ in range(n):
+        for u, v, peso in pares:
+            resultado[v] = min(resultado[v], resultado[u] + peso)
+    return resultado
+
+
+def pagerank_denso(n, arestas, dirigido, ponderado, amortecimento=0.85, iteracoes=1000):
+    """
+    PageRank de referência pela matriz de transição densa, com os vértices sem saída espalhados igualmente.
+    """
+    transicao = np.zeros((n, n))
+    for u, v, peso in arestas:
+        for a, b in ((u, v), (v, u)) if not dirigido else ((u, v),):
+            transicao[a - 1, b - 1] += peso if ponderado else 1
+    saida = transicao.sum(axis=1)
+    valores = np.full(n, 1.0 / n)
+    for _ in range(iteracoes):
+        sem_saida = valores[saida == 0].sum()
+        por_linha = np.divide(valores, saida, out=np.zeros(n), where=saida > 0)
+        valores = amortecimento * (por_linha @ transicao + sem_saida / n) + (1 - amortecimento) / n
+    return valores
+
+
+def nucleos_por_remocao(n, arestas):
+    """
+    Número de núcleo de cada vértice: o maior k tal que ele sobrevive à remoção repetida dos vértices
+    de grau < k. Cada arco conta para as duas extremidades, como o grau de saída mais entrada.
+    """
+    nucleo = [0] * n
+    k = 1
+    while True:
+        vivos = set(range(1, n + 1))
+        while True:
+            grau = {v: 0 for v in vivos}
+            for u, v, _ in arestas:
+                if u in vivos and v in vivos:
+                    grau[u] += 1
+                    grau[v] += 1
+            removidos = {v for v in vivos if grau[v] < k}
+            if not removidos:
+                break
+            vivos -= removidos
+        if not vivos:
+            return nucleo
+        for v in vivos:
+            nucleo[v - 1] = k
+        k += 1
+
+
+@unittest.skipIf(np is None, 'as medidas de análise requerem o NumPy')
+class TestAnalise(unittest.TestCase):
+    """
+    PageRank, centralidades e núcleos comparados a implementações de referência.
+    """
+
+    def test_pagerank(self):
+        rng = random.Random(71)
+        for caso in range(30):
+            n = rng.randint(1, 10)
+            ponderado = caso % 2 == 0
+            for backend, dirigido in CONFIGURACOES:
+                arestas = arestas_aleatorias(rng, n, 2 * n, dirigido, ponderado)
+                grafo = montar(n, arestas, ponderado, backend, dirigido)
+                with self.subTest(caso=caso, backend=backend, dirigido=dirigido):
+                    resultado = grafo.pagerank(tolerancia=1e-12, max_iteracoes=1000, ponderado=ponderado)
+                    self.assertTrue(resultado.convergiu)
+                    self.assertAlmostEqual(float(resultado.valores.sum()), 1.0)
+                    np.testing.assert_allclose(
+                        resultado.valores, pagerank_denso(n, arestas, dirigido, ponderado), atol=1e-9
+                    )
+                    self.assertEqual(resultado[1], float(resultado.valores[0]))
+
+    def test_pagerank_maiores_e_sem_arestas(self):
+        grafo = Grafo(io.StringIO('4\n1 2\n3 2\n4 2\n'), dirigido=True)
+        resultado = grafo.pagerank()
+        self.assertEqual(resultado.maiores(1)[0][0], 2)
+        self.assertEqual([v for v, _ in resultado.maiores()], [2, 1, 3, 4])
+        vazio = Grafo(io.StringIO('3\n')).pagerank()
+        self.assertEqual(vazio.valores.dtype, np.float64)
+        self.assertEqual(len(vazio), len(Grafo(io.StringIO('3\n')).vertices))
+
+    def test_centralidade_grau(self):
+        rng = random.Random(72)
+        for caso in range(20):
+            n = rng.randint(2, 10)
+            for backend, dirigido in CONFIGURACOES:
+                arestas = arestas_aleatorias(rng, n, 2 * n, dirigido, False)
+                grafo = montar(n, arestas, False, backend, dirigido)
+                saida = [sum(u == v for u, _, _ in arestas) for v in range(1, n + 1)]
+                entrada = [sum(w == v for _, w, _ in arestas) for v in range(1, n + 1)]
+                with self.subTest(caso=caso, backend=backend, dirigido=dirigido):
+                    np.testing.assert_allclose(grafo.centralidade_grau(), np.add(saida, entrada) / (n - 1))
+                    if dirigido:
+                        np.testing.assert_allclose(grafo.centralidade_grau('saida'), np.divide(saida, n - 1))
+                        np.testing.assert_allclose(grafo.centralidade_grau('entrada'), np.divide(entrada, n - 1))
+
+    def test_centralidade_proximidade(self):
+        rng = random.Random(73)
+        for caso in range(20):
+            n = rng.randint(2, 9)
+            ponderado = caso % 2 == 0
+            for backend, dirigido in CONFIGURACOES:
+                arestas = arestas_aleatorias(rng, n, 2 * n, dirigido, ponderado)
+                grafo = montar(n, arestas, ponderado, backend, dirigido)
+                tabela = {u: distancias(n, arestas, dirigido, u) for u in range(1, n + 1)}
+                for direcao in ('entrada', 'saida'):
+                    esperado = []
+                    for v in range(1, n + 1):
+                        if direcao == 'entrada':
+                            finitas = [tabela[u][v] for u in range(1, n + 1) if u != v]
+                        else:
+                            finitas = [tabela[v][u] for u in range(1, n + 1) if u != v]
+                        finitas = [d for d in finitas if d != math.inf]
+                        soma = sum(finitas)
+                        esperado.append(len(finitas) ** 2 / (soma * (n - 1)) if soma else 0.0)
+                    with self.subTest(caso=caso, backend=backend, dirigido=dirigido, direcao=direcao):
+                        np.testing.assert_allclose(grafo.centralidade_proximidade(direcao=direcao), esperado)
+                        np.testing.assert_allclose(
+                            grafo.centralidade_proximidade([n, 1], direcao=direcao), [esperado[-1], esperado[0]]
+                        )
+
+    def test_nucleos_k(self):
+        rng = random.Random(74)
+        for caso in range(30):
+            n = rng.randint(1, 10)
+            for backend, dirigido in CONFIGURACOES:
+                arestas = arestas_aleatorias(rng, n, 3 * n, dirigido, False)
+                grafo = montar(n, arestas, False, backend, dirigido)
+                with self.subTest(caso=caso, backend=backend, dirigido=dirigido):
+                    self.assertEqual(grafo.nucleos_k().tolist(), nucleos_por_remocao(n, arestas))
+
+
+@unittest.skipIf(np is not None, 'só sem numpy')
+class TestSemNumpy(unittest.TestCase):
+
+    def test_exigem_numpy(self):
+        grafo = Grafo(io.StringIO('3\n1 2\n2 3\n'))
+        for medida in (grafo.pagerank, grafo.centralidade_grau, grafo.centralidade_proximidade, grafo.nucleos_k):
+            with self.subTest(medida=medida.__name__):
+                with self.assertRaises(ImportError):
+                    medida()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import io
+import random
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from grafo import Grafo
+
+CONFIGURACOES = [(backend, dirigido) for backend in ('csr', 'dict') for dirigido in (False, True)]
+ALGORITMOS = ('kruskal', 'prim')
+
+
+def arestas_aleatorias(rng, n, m, dirigido):
+    """
+    Sorteia até `m` arestas (u, v, peso) entre os vértices 1..n, com pesos de -3 a 9, sem laços nem repetições.
+    """
+    arestas = {}
+    for _ in range(m):
+        u, v = rng.randint(1, n), rng.randint(1, n)
+        if u != v and (u, v) not in arestas and (dirigido or (v, u) not in arestas):
+            arestas[(u, v)] = rng.randint(-3, 9)
+    return [(u, v, peso) for (u, v), peso in arestas.items()]
+
+
+def montar(n, arestas, backend='csr', dirigido=False):
+    texto = f'{n}\n' + ''.join(f'{u} {v} {peso}\n' for u, v, peso in arestas)
+    return Grafo(io.StringIO(texto), backend=backend, dirigido=dirigido)
+
+
+def peso_floresta_minima(n, arestas):
+    """
+    Peso da floresta geradora mínima por um Kruskal simples, ignorando a direção das arestas.
+    """
+    pai = list(range(n + 1))
+
+    def raiz(x):
+        while pai[x] != x:
+            x = pai[x]
+        return x
+
+    total = 0
+    for u, v, peso in sorted(arestas, key=lambda aresta: aresta[2]):
+        ru, rv = raiz(u), raiz(v)
+        if ru != rv:
+            pai[ru] = rv
+            total += peso
+    return total
+
+
+class TestArvoreGeradora(unittest.TestCase):
+    """
+    Florestas geradoras mínimas de Kruskal e de Prim comparadas a um Kruskal de referência.
+    """
+
+    def test_floresta_minima(self):
+        rng = random.Random(75)
+        for caso in range(40):
+            n = rng.randint(1, 12)
+            for backend, dirigido in CONFIGURACOES:
+                arestas = arestas_aleatorias(rng, n, rng.randint(0, 3 * n), dirigido)
+                grafo = montar(n, arestas, backend, dirigido)
+                for algoritmo in ALGORITMOS:
+                    with self.subTest(caso=caso, backend=backend, dirigido=dirigido, algoritmo=algoritmo):
+                        resultado = grafo.arvore_geradora_minima(algoritmo)
+                        self.assertEqual(resultado.peso_total, peso_floresta_minima(n, arestas))
+                        self.assertEqual(resultado.algoritmo, algoritmo.capitalize())
+
+    def test_uma_arvore_por_componente(self):
+        rng = random.Random(76)
+        for caso in range(20):
+            n = rng.randint(2, 12)
+            for backend, dirigido in CONFIGURACOES:
+                grafo = montar(n, arestas_aleatorias(rng, n, n, dirigido), backend, dirigido)
+                componentes = grafo.encontrar_componentes_conexos()
+                for algoritmo in ALGORITMOS:
+                    with self.subTest(caso=caso, backend=backend, dirigido=dirigido, algoritmo=algoritmo):
+                        resultado = grafo.arvore_geradora_minima(algoritmo)
+                        self.assertEqual(resultado.qtd_arvores, len(componentes))
+                        self.assertEqual(len(resultado), sum(componentes.tamanhos) - len(componentes))
+                        for i in range(resultado.qtd_arvores):
+                            arvore = resultado.arvore(i)
+                            self.assertEqual(len(arvore), componentes.tamanho(i) - 1)
+                            if arvore:
+                                self.assertEqual({x for u, v, _ in arvore for x in (u, v)}, set(componentes.componente(i)))
+                            self.assertEqual(resultado.peso_arvore(i), sum(peso for _, _, peso in arvore))
+                        self.assertEqual(list(resultado), [a for i in range(resultado.qtd_arvores) for a in resultado.arvore(i)])
+
+    def test_rotulos(self):
+        grafo = Grafo(io.StringIO('4\nrecife olinda 2\nolinda paulista 3\nrecife paulista 1\nigarassu igarassu 5\n'))
+        for algoritmo in ALGORITMOS:
+            with self.subTest(algoritmo=algoritmo):
+                resultado = grafo.arvore_geradora_minima(algoritmo)
+                self.assertEqual(resultado.peso_total, 3)
+                self.assertEqual(
+                    sorted(frozenset((u, v)) for u, v, _ in resultado),
+                    sorted([frozenset(('recife', 'paulista')), frozenset(('recife', 'olinda'))]),
+                )
+
+    def test_algoritmo_desconhecido(self):
+        with self.assertRaises(ValueError):
+            montar(2, [(1, 2, 1)]).arvore_geradora_minima('boruvka')
+
+    @unittest.skipIf(np is None, 'requer numpy')
+    def test_como_numpy(self):
+        resultado = montar(4, [(1, 2, 4), (2, 3, 1.5), (1, 3, 2)]).arvore_geradora_minima()
+        origens, destinos, pesos = resultado.como_numpy()
+        self.assertEqual((origens.dtype, destinos.dtype, pesos.dtype), (np.int64, np.int64, np.float64))
+        self.assertEqual(sorted(pesos.tolist()), [1.5, 2.0])
+        self.assertEqual(len(origens), len(destinos))
+
+    @unittest.skipIf(np is not None, 'só sem numpy')
+    def test_como_numpy_sem_numpy(self):
+        resultado = montar(3, [(1, 2, 1), (2, 3, 2)]).arvore_geradora_minima('prim')
+        self.assertEqual(resultado.peso_total, 3)
+        with self.assertRaises(ImportError):
+            resultado.como_numpy()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import contextlib
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+
+import benchmark
+
+try:
+    import networkx
+except ImportError:
+    networkx = None
+
+
+def calado(_mensagem):
+    pass
+
+
+class TestGeradores(unittest.TestCase):
+
+    def test_mesma_semente_mesmo_grafo(self):
+        for nome, gerar in benchmark.GERADORES.items():
+            with self.subTest(gerador=nome):
+                self.assertEqual(gerar(200, random.Random(7)), gerar(200, random.Random(7)))
+
+    def test_formatos(self):
+        aleatorio = random.Random(1)
+        arestas = benchmark.gerar_erdos_renyi(100, aleatorio)
+        self.assertEqual(len(arestas), 100 * benchmark.GRAU_MEDIO // 2)
+        self.assertEqual(len(set(arestas)), len(arestas))
+        self.assertTrue(all(u < v for u, v in arestas))
+
+        self.assertEqual(len(benchmark.gerar_grade(100, aleatorio)), 2 * 10 * 9)
+        self.assertEqual(benchmark.gerar_caminho(5, aleatorio), [(1, 2), (2, 3), (3, 4), (4, 5)])
+
+        arestas = benchmark.gerar_lei_potencia(100, aleatorio)
+        inicial = benchmark.ARESTAS_POR_VERTICE + 1
+        self.assertEqual(len(arestas), inicial * (inicial - 1) // 2 + (100 - inicial) * benchmark.ARESTAS_POR_VERTICE)
+        self.assertEqual(max(v for aresta in arestas for v in aresta), 100)
+
+
+class TestExecucao(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def test_uma_linha_por_operacao(self):
+        resultados = benchmark.executar(['caminho', 'grade'], ['pequena'], [False, True], 1, 1, 'csr', False, calado)
+        self.assertEqual(len(resultados), 2 * 2 * len(benchmark.OPERACOES))
+        for linha in resultados:
+            self.assertEqual(linha['biblioteca'], 'grafos')
+            self.assertGreaterEqual(linha['tempo_s'], 0)
+            self.assertIsNone(linha['confere'])
+
+    @unittest.skipIf(networkx is None, 'requer networkx')
+    def test_confere_com_networkx(self):
+        resultados = benchmark.executar(['erdos_renyi'], ['pequena'], [False, True], 3, 1, 'dict', True, calado)
+        conferidas = [linha for linha in resultados if linha['biblioteca'] == 'grafos' and linha['confere'] is not None]
+        self.assertEqual(len(conferidas), 2 * (len(benchmark.OPERACOES) - 1))
+        self.assertTrue(all(linha['confere'] for linha in conferidas))
+
+    def test_regressoes(self):
+        linha = {'gerador': 'caminho', 'escala': 'pequena', 'ponderado': False, 'biblioteca': 'grafos',
+                 'operacao': 'busca_largura', 'tempo_s': 1.0}
+        self.assertEqual(benchmark.comparar([dict(linha, tempo_s=1.1)], [linha], 0.2), [])
+        regressoes = benchmark.comparar([dict(linha, tempo_s=1.5)], [linha], 0.2)
+        self.assertEqual([(anterior, atual) for _, anterior, atual in regressoes], [(1.0, 1.5)])
+
+    def executar_main(self, argumentos):
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()) as erros:
+            codigo = benchmark.main(argumentos)
+        return codigo, erros.getvalue()
+
+    def test_main_grava_e_compara(self):
+        saida = os.path.join(self.pasta.name, 'resultado.json')
+        argumentos = ['--geradores', 'caminho', '--escalas', 'pequena', '--pesos', 'nao', '--repeticoes', '1']
+        self.assertEqual(self.executar_main(argumentos + ['--saida', saida]), (0, ''))
+        with open(saida, encoding='utf-8') as arquivo:
+            relatorio = json.load(arquivo)
+        self.assertEqual(set(relatorio), {'ambiente', 'parametros', 'resultados'})
+        self.assertEqual(len(relatorio['resultados']), len(benchmark.OPERACOES))
+
+        # Uma execução anterior com tempos zerados faz toda operação medida parecer uma regressão
+        for linha in relatorio['resultados']:
+            linha['tempo_s'] = 0.0
+        with open(saida, 'w', encoding='utf-8') as arquivo:
+            json.dump(relatorio, arquivo)
+        codigo, erros = self.executar_main(argumentos + ['--comparar', saida])
+        self.assertEqual(codigo, 1)
+        self.assertEqual(erros.count('REGRESSÃO'), len(benchmark.OPERACOES))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import io
+import math
+import threading
+import unittest
+
+from cache import ArvoreCaminhos, CacheArvores, CacheArvoresPorThread
+from grafo import Grafo
+
+
+def arvore(origem, tamanho=1):
+    distancias = {origem + i: float(i) for i in range(tamanho)}
+    antecessor = {origem + i: (origem + i - 1 if i else None) for i in range(tamanho)}
+    return ArvoreCaminhos(origem, distancias, antecessor, 'BFS')
+
+
+class TestCacheArvores(unittest.TestCase):
+
+    def test_descarta_a_usada_ha_mais_tempo(self):
+        cache = CacheArvores(capacidade=2)
+        cache.guardar(arvore(1), 0)
+        cache.guardar(arvore(2), 0)
+        self.assertIsNotNone(cache.obter(1, 0))  # 1 passa a ser a mais recente
+        cache.guardar(arvore(3), 0)
+        self.assertEqual((1 in cache, 2 in cache, 3 in cache), (True, False, True))
+        self.assertIsNone(cache.obter(2, 0))
+        self.assertEqual(cache.contadores(), {'acertos': 1, 'falhas': 1, 'descartes': 1, 'arvores': 2})
+
+    def test_limite_de_vertices(self):
+        cache = CacheArvores(capacidade=10, max_vertices=5)
+        cache.guardar(arvore(1, 3), 0)
+        cache.guardar(arvore(10, 2), 0)
+        self.assertEqual(len(cache), 2)
+        cache.guardar(arvore(20, 2), 0)
+        self.assertEqual((1 in cache, 10 in cache, 20 in cache), (False, True, True))
+        # Uma árvore maior que o limite ainda é guardada sozinha
+        cache.guardar(arvore(30, 8), 0)
+        self.assertEqual(len(cache), 1)
+        # Guardar de novo a mesma origem substitui a árvore sem contar duas vezes
+        cache.guardar(arvore(30, 4), 0)
+        self.assertEqual(len(cache.obter(30, 0)), 4)
+
+    def test_versao_nova_esvazia(self):
+        cache = CacheArvores()
+        cache.guardar(arvore(1), 0)
+        self.assertIsNone(cache.obter(1, 1))
+        self.assertEqual(len(cache), 0)
+
+    def test_capacidade_zero(self):
+        cache = CacheArvores(capacidade=0)
+        cache.guardar(arvore(1), 0)
+        self.assertEqual(len(cache), 0)
+
+    def test_um_cache_por_thread(self):
+        cache = CacheArvoresPorThread(capacidade=4)
+        cache.guardar(arvore(1), 0)
+        vistos = []
+        thread = threading.Thread(target=lambda: vistos.append(cache.obter(1, 0)))
+        thread.start()
+        thread.join()
+        self.assertEqual(vistos, [None])
+        self.assertIsNotNone(cache.obter(1, 0))
+
+
+class TestArvoresDoGrafo(unittest.TestCase):
+
+    ENTRADA = '4\n1 2 3\n2 3 4\n3 4 5\n'
+
+    def test_consultas_repetidas_usam_o_cache(self):
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = Grafo(io.StringIO(self.ENTRADA), backend=backend, capacidade_cache=2)
+                primeira = grafo.arvore_caminhos(1)
+                self.assertIs(grafo.arvore_caminhos(1), primeira)
+                self.assertEqual(primeira.distancia(grafo.vertices.indice(4)), 12)
+                self.assertEqual(grafo.vertices.rotulos(primeira.caminho(grafo.vertices.indice(4))), [1, 2, 3, 4])
+                self.assertEqual(grafo.cache_arvores.contadores()['acertos'], 1)
+
+                grafo.adicionar_aresta(1, 4, 1)
+                atualizada = grafo.arvore_caminhos(1)
+                self.assertIsNot(atualizada, primeira)
+                self.assertEqual(atualizada.distancia(grafo.vertices.indice(4)), 1)
+
+    def test_direcao_entrada_tem_cache_proprio(self):
+        grafo = Grafo(io.StringIO(self.ENTRADA), dirigido=True)
+        saida, entrada = grafo.arvore_caminhos(2), grafo.arvore_caminhos(2, direcao='entrada')
+        self.assertIsNot(saida, entrada)
+        indice = grafo.vertices.indice
+        self.assertEqual(saida.distancia(indice(4)), 9)
+        self.assertEqual(saida.distancia(indice(1)), math.inf)
+        self.assertEqual(entrada.distancia(indice(1)), 3)
+        self.assertIs(grafo.arvore_caminhos(2, direcao='entrada'), entrada)
+
+
+if __name__ == '__main__':
+    unittest.main()
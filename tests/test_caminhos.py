@@ -0,0 +1,262 @@
+import gc
+import io
+import math
+import os
+import random
+import tempfile
+import unittest
+
+from caminhos import CicloNegativo
+from grafo import Grafo
+from metricas import instrumentar
+from resultados import MatrizDistancias
+
+
+def arestas_aleatorias(rng, n, m, dirigido, ponderado, minimo=1, maximo=9):
+    """
+    Sorteia até `m` arestas (u, v, peso) entre os vértices 1..n, sem laços nem repetições.
+    """
+    arestas = {}
+    for _ in range(m):
+        u, v = rng.randint(1, n), rng.randint(1, n)
+        if u != v and (u, v) not in arestas and (dirigido or (v, u) not in arestas):
+            arestas[(u, v)] = rng.randint(minimo, maximo) if ponderado else 1
+    return [(u, v, peso) for (u, v), peso in arestas.items()]
+
+
+def montar(n, arestas, ponderado, backend='csr', dirigido=False):
+    linhas = [f'{u} {v} {peso}' if ponderado else f'{u} {v}' for u, v, peso in arestas]
+    return Grafo(io.StringIO(f'{n}\n' + '\n'.join(linhas) + '\n'), backend=backend, dirigido=dirigido)
+
+
+def bellman_ford(n, arestas, dirigido, origem):
+    """
+    Distâncias de referência {vertice: distancia}, ou None se um ciclo negativo for alcançável.
+    """
+    pares = list(arestas) + ([] if dirigido else [(v, u, peso) for u, v, peso in arestas])
+    distancias = {v: math.inf for v in range(1, n + 1)}
+    distancias[origem] = 0
+    for _ in range(n):
+        for u, v, peso in pares:
+            if distancias[u] + peso < distancias[v]:
+                distancias[v] = distancias[u] + peso
+    if any(distancias[u] + peso < distancias[v] for u, v, peso in pares):
+        return None
+    return distancias
+
+
+def custo(arestas, dirigido, caminho):
+    pesos = {(u, v): peso for u, v, peso in arestas}
+    if not dirigido:
+        pesos.update({(v, u): peso for u, v, peso in arestas})
+    return sum(pesos[par] for par in zip(caminho, caminho[1:]))
+
+
+class TestCaminhoMinimo(unittest.TestCase):
+    """
+    Consultas ponto a ponto (com parada antecipada, bidirecionais e A*) comparadas ao Bellman-Ford.
+    """
+
+    def conferir(self, arestas, dirigido, resultado, esperado):
+        if esperado == math.inf:
+            self.assertEqual(resultado.distancia, math.inf)
+            return
+        self.assertAlmostEqual(resultado.distancia, esperado)
+        self.assertEqual(resultado.caminho[0], resultado.origem)
+        self.assertEqual(resultado.caminho[-1], resultado.destino)
+        self.assertAlmostEqual(custo(arestas, dirigido, resultado.caminho), esperado)
+
+    def test_ponto_a_ponto_e_bidirecional(self):
+        rng = random.Random(11)
+        for caso in range(30):
+            ponderado = caso % 3 != 0
+            n = rng.randint(2, 12)
+            for backend in ('csr', 'dict'):
+                for dirigido in (False, True):
+                    arestas = arestas_aleatorias(rng, n, rng.randint(1, 3 * n), dirigido, ponderado)
+                    grafo = montar(n, arestas, ponderado, backend, dirigido)
+                    for origem in range(1, n + 1):
+                        esperado = bellman_ford(n, arestas, dirigido, origem)
+                        for destino in range(1, n + 1):
+                            with self.subTest(caso=caso, backend=backend, dirigido=dirigido, origem=origem, destino=destino):
+                                for bidirecional in (False, True):
+                                    resultado = grafo.calcular_caminho_minimo(origem, destino, bidirecional=bidirecional)
+                                    self.conferir(arestas, dirigido, resultado, esperado[destino])
+
+    def test_parada_antecipada(self):
+        # Um caminho longo com pesos fracionários (Dijkstra): a consulta 1 -> 3 fixa só o começo dele
+        n = 2000
+        grafo = montar(n, [(v, v + 1, 2.5) for v in range(1, n)], True)
+        with instrumentar() as metricas:
+            self.assertEqual(grafo.calcular_caminho_minimo(1, 3).distancia, 5)
+        self.assertLess(metricas.contadores['vertices_fixados'], 10)
+        with instrumentar() as metricas:
+            self.assertEqual(grafo.calcular_caminho_minimo(1, 3, bidirecional=True).caminho, [1, 2, 3])
+        self.assertLess(metricas.contadores.get('vertices_fixados', 0), 10)
+
+    def test_a_estrela_com_heuristica_inconsistente(self):
+        # h(2) = 5 é admissível (a distância real de 2 a 4 é 11), mas não consistente: o vértice 3
+        # é fixado primeiro pelo caminho direto e precisa ser reaberto
+        arestas = [(1, 2, 1), (1, 3, 4), (2, 3, 1), (3, 4, 10)]
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = montar(4, arestas, True, backend)
+                resultado = grafo.calcular_caminho_minimo(1, 4, heuristica=lambda v, destino: 5 if v == 2 else 0)
+                self.assertEqual(resultado.distancia, 12)
+                self.assertEqual(resultado.caminho, [1, 2, 3, 4])
+
+    def test_a_estrela_com_heuristicas_admissiveis(self):
+        rng = random.Random(13)
+        for caso in range(20):
+            n = rng.randint(2, 12)
+            for dirigido in (False, True):
+                arestas = arestas_aleatorias(rng, n, 3 * n, dirigido, True)
+                grafo = montar(n, arestas, True, 'csr', dirigido)
+                destino = rng.randint(1, n)
+                invertidas = [(v, u, peso) for u, v, peso in arestas] if dirigido else arestas
+                ate_destino = bellman_ford(n, invertidas, dirigido, destino)
+                # Uma fração aleatória da distância real: admissível e, em geral, inconsistente
+                fracoes = {v: rng.random() for v in range(1, n + 1)}
+
+                def heuristica(v, _destino):
+                    return 0 if ate_destino[v] == math.inf else fracoes[v] * ate_destino[v]
+
+                for origem in range(1, n + 1):
+                    with self.subTest(caso=caso, dirigido=dirigido, origem=origem):
+                        esperado = bellman_ford(n, arestas, dirigido, origem)[destino]
+                        resultado = grafo.calcular_caminho_minimo(origem, destino, heuristica=heuristica)
+                        self.conferir(arestas, dirigido, resultado, esperado)
+
+    def test_destino_inalcancavel(self):
+        grafo = montar(4, [(1, 2, 3), (3, 4, 1)], True)
+        for bidirecional in (False, True):
+            with self.subTest(bidirecional=bidirecional):
+                self.assertEqual(grafo.calcular_caminho_minimo(1, 4, bidirecional=bidirecional).distancia, math.inf)
+
+
+class TestPesosNegativos(unittest.TestCase):
+    """
+    Pesos negativos (potenciais de Johnson e SPFA) comparados ao Bellman-Ford, com ciclos negativos detectados.
+    """
+
+    def conferir_ciclo(self, arestas, erro):
+        ciclo = erro.exception.ciclo
+        self.assertGreater(len(ciclo), 1)
+        self.assertLess(custo(arestas, True, ciclo + ciclo[:1]), 0)
+
+    def test_comparados_ao_bellman_ford(self):
+        rng = random.Random(81)
+        for caso in range(40):
+            n = rng.randint(2, 10)
+            arestas = arestas_aleatorias(rng, n, 2 * n, True, True, minimo=-3)
+            for backend in ('csr', 'dict'):
+                grafo = montar(n, arestas, True, backend, True)
+                for origem in range(1, n + 1):
+                    esperado = bellman_ford(n, arestas, True, origem)
+                    with self.subTest(caso=caso, backend=backend, origem=origem):
+                        if esperado is None:
+                            with self.assertRaises(CicloNegativo) as erro:
+                                grafo.calcular_caminho_minimo(origem)
+                            self.conferir_ciclo(arestas, erro)
+                            continue
+                        arvore = grafo.calcular_caminho_minimo(origem)
+                        self.assertEqual(dict(arvore), {v: esperado[v] for v in arvore})
+                        for destino in range(1, n + 1):
+                            resultado = grafo.calcular_caminho_minimo(origem, destino)
+                            self.assertEqual(resultado.distancia, esperado[destino])
+                            if resultado.alcancavel:
+                                self.assertEqual(custo(arestas, True, resultado.caminho), esperado[destino])
+
+    def test_ciclo_fora_do_alcance(self):
+        arestas = [(1, 2, -1), (3, 4, -2), (4, 3, 1), (2, 5, 3)]
+        grafo = montar(5, arestas, True, dirigido=True)
+        self.assertEqual(dict(grafo.calcular_caminho_minimo(1)), {1: 0, 2: -1, 3: math.inf, 4: math.inf, 5: 2})
+        self.assertEqual(grafo.calcular_caminho_minimo(1, 5).caminho, [1, 2, 5])
+        with self.assertRaises(CicloNegativo) as erro:
+            grafo.calcular_caminho_minimo(3, 4)
+        self.conferir_ciclo(arestas, erro)
+        with self.assertRaises(CicloNegativo):
+            grafo.caminhos_minimos_lote([1, 4], workers=1)
+
+    def test_nao_dirigido(self):
+        # Ida e volta pela aresta negativa já é um ciclo negativo
+        grafo = montar(3, [(1, 2, -1)], True)
+        self.assertTrue(grafo.tem_pesos_negativos())
+        with self.assertRaises(CicloNegativo) as erro:
+            grafo.calcular_caminho_minimo(1)
+        self.assertEqual(sorted(erro.exception.ciclo), [1, 2])
+        self.assertIsInstance(erro.exception, ValueError)
+        self.assertEqual(dict(grafo.calcular_caminho_minimo(3)), {1: math.inf, 2: math.inf, 3: 0})
+
+    def test_lote(self):
+        rng = random.Random(82)
+        arestas = [(u, v, peso) for u, v, peso in arestas_aleatorias(rng, 12, 30, True, True, minimo=-2) if u < v]
+        grafo = montar(12, arestas, True, dirigido=True)
+        origens = list(range(1, 13))
+        matriz = grafo.caminhos_minimos_lote(origens, workers=1)
+        for origem in origens:
+            esperado = bellman_ford(12, arestas, True, origem)
+            for v in origens:
+                self.assertEqual(matriz.distancia(origem, v), esperado[v])
+
+
+class TestLote(unittest.TestCase):
+    """
+    Distâncias de várias origens (`caminhos_minimos_lote`) em memória, em disco e em processos.
+    """
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        # As matrizes mapeadas precisam ser liberadas antes de apagar os arquivos
+        gc.collect()
+        self.pasta.cleanup()
+
+    def conferir(self, matriz, n, arestas, dirigido, origens):
+        self.assertEqual(matriz.origens, origens)
+        for origem in origens:
+            esperado = bellman_ford(n, arestas, dirigido, origem)
+            for v in range(1, n + 1):
+                self.assertEqual(matriz.distancia(origem, v), esperado[v])
+
+    def test_em_memoria_e_em_arquivo(self):
+        rng = random.Random(15)
+        for caso in range(10):
+            n = rng.randint(2, 10)
+            ponderado = caso % 2 == 0
+            for backend in ('csr', 'dict'):
+                for dirigido in (False, True):
+                    arestas = arestas_aleatorias(rng, n, 3 * n, dirigido, ponderado)
+                    grafo = montar(n, arestas, ponderado, backend, dirigido)
+                    origens = list(range(n, 0, -1))
+                    caminho = os.path.join(self.pasta.name, f'lote{caso}{backend}{dirigido}.dist')
+                    with self.subTest(caso=caso, backend=backend, dirigido=dirigido):
+                        self.conferir(grafo.caminhos_minimos_lote(origens, workers=1), n, arestas, dirigido, origens)
+                        matriz = grafo.caminhos_minimos_lote(origens, workers=1, arquivo_saida=caminho)
+                        self.conferir(matriz, n, arestas, dirigido, origens)
+                        reaberta = MatrizDistancias.abrir(caminho, origens, matriz.qtd_colunas, tabela=grafo.vertices)
+                        self.conferir(reaberta, n, arestas, dirigido, origens)
+                        del matriz, reaberta
+
+    def test_varios_processos(self):
+        arestas = arestas_aleatorias(random.Random(16), 30, 90, False, True)
+        grafo = montar(30, arestas, True)
+        origens = list(range(1, 31))
+        self.conferir(grafo.caminhos_minimos_lote(origens, workers=2), 30, arestas, False, origens)
+        caminho = os.path.join(self.pasta.name, 'processos.dist')
+        matriz = grafo.caminhos_minimos_lote(origens, workers=2, arquivo_saida=caminho, tipo='f')
+        self.assertEqual(matriz.bytes_utilizados(), 30 * matriz.qtd_colunas * 4)
+        self.conferir(matriz, 30, arestas, False, origens)
+        del matriz
+
+    def test_sem_origens(self):
+        grafo = montar(3, [(1, 2, 1)], False)
+        caminho = os.path.join(self.pasta.name, 'vazia.dist')
+        self.assertEqual(len(grafo.caminhos_minimos_lote([], workers=1)), 0)
+        self.assertEqual(len(grafo.caminhos_minimos_lote([], workers=1, arquivo_saida=caminho)), 0)
+        self.assertEqual(os.path.getsize(caminho), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+import bz2
+import gzip
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from carregador import ListaArestas, iterar_blocos_arestas, ler_arestas, ler_intervalo
+
+
+def referencia(texto):
+    """
+    Leitura linha a linha do formato, sem caminho rápido: (qtd_vertices, arestas, ponderado).
+    """
+    linhas = texto.split('\n')
+    arestas, ponderado = [], False
+    for linha in linhas[1:]:
+        numeros = linha.split()
+        if len(numeros) >= 3:
+            arestas.append((numeros[0], numeros[1], float(numeros[2])))
+            ponderado = True
+        elif len(numeros) == 2:
+            arestas.append((numeros[0], numeros[1], 1.0))
+    return int(linhas[0]), arestas, ponderado
+
+
+def como_tuplas(arestas):
+    return [(str(u), str(v), p) for u, v, p in zip(arestas.origens, arestas.destinos, arestas.pesos)]
+
+
+class TestFormato(unittest.TestCase):
+
+    def test_com_e_sem_peso(self):
+        arestas = ler_arestas(io.StringIO('4\n1 2 3.5\n2 3 1\n'))
+        self.assertEqual(arestas.qtd_vertices, 4)
+        self.assertEqual(list(arestas.origens), [1, 2])
+        self.assertEqual(list(arestas.destinos), [2, 3])
+        self.assertEqual(list(arestas.pesos), [3.5, 1.0])
+        self.assertTrue(arestas.ponderado)
+
+        arestas = ler_arestas(io.StringIO('3\n1 2\n2 3\n'))
+        self.assertEqual(list(arestas.pesos), [1.0, 1.0])
+        self.assertFalse(arestas.ponderado)
+
+    def test_rotulos_textuais(self):
+        arestas = ler_arestas(io.StringIO('3\n1 2\n2 b\nb c 4\n'))
+        self.assertTrue(arestas.textual)
+        self.assertEqual(arestas.origens, ['1', '2', 'b'])
+        self.assertEqual(arestas.destinos, ['2', 'b', 'c'])
+
+    def test_linhas_com_colunas_misturadas(self):
+        # A contagem total de tokens coincide com a de um bloco uniforme de 2 ou 3 colunas
+        for texto in (
+            '4\n4\n1 2 3\n',
+            '4\n1 2 7 x\n3 4\n',
+            '5\n1 2 3 9\n4\n',
+            '5\n1\n2 3\n4 5 6 7\n1 2\n',
+            '5\n1 2\n\n3 4 1\n5 1 2\n',
+            '5\n  1   2\t3 \r\n2 4 5\r\n',
+        ):
+            with self.subTest(texto=texto):
+                qtd_vertices, esperadas, ponderado = referencia(texto)
+                arestas = ler_arestas(io.StringIO(texto))
+                self.assertEqual(arestas.qtd_vertices, qtd_vertices)
+                self.assertEqual(como_tuplas(arestas), esperadas)
+                self.assertEqual(arestas.ponderado, ponderado)
+                self.assertFalse(arestas.textual)
+
+    def test_colunas_misturadas_aleatorias(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            linhas = [' '.join(str(rng.randint(1, 9)) for _ in range(rng.randint(0, 4))) for _ in range(rng.randint(1, 8))]
+            texto = '9\n' + '\n'.join(linhas) + '\n'
+            with self.subTest(texto=texto):
+                self.assertEqual(como_tuplas(ler_arestas(io.StringIO(texto))), referencia(texto)[1])
+
+
+class TestBlocos(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(7)
+        linhas = []
+        for _ in range(500):
+            u, v = rng.randint(1, 60), rng.randint(1, 60)
+            linhas.append(f'{u} {v} {rng.randint(1, 9)}' if rng.random() < 0.7 else f'{u} {v}')
+        self.texto = '60\n' + '\n'.join(linhas) + '\n'
+        self.esperadas = referencia(self.texto)[1]
+
+    def test_tamanhos_de_bloco(self):
+        for tamanho in (7, 64, 1000, 1 << 20):
+            with self.subTest(tamanho=tamanho):
+                arestas = ler_arestas(io.BytesIO(self.texto.encode()), tamanho_bloco=tamanho)
+                self.assertEqual(arestas.qtd_vertices, 60)
+                self.assertEqual(como_tuplas(arestas), self.esperadas)
+
+    def test_blocos_e_progresso(self):
+        chamadas = []
+        blocos = list(iterar_blocos_arestas(io.BytesIO(self.texto.encode()), 256, lambda b, a: chamadas.append((b, a))))
+        self.assertGreater(len(blocos), 1)
+        self.assertTrue(all(isinstance(bloco, ListaArestas) and bloco.qtd_vertices == 60 for bloco in blocos))
+        self.assertEqual(sum(len(bloco) for bloco in blocos), len(self.esperadas))
+        self.assertEqual(chamadas[-1], (len(self.texto), len(self.esperadas)))
+
+    def test_sem_arestas(self):
+        blocos = list(iterar_blocos_arestas(io.StringIO('5\n')))
+        self.assertEqual(len(blocos), 1)
+        self.assertEqual(blocos[0].qtd_vertices, 5)
+        self.assertEqual(len(blocos[0]), 0)
+
+    def test_arquivos_compactados(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            for nome, abrir in (('g.txt', open), ('g.gz', gzip.open), ('g.bz2', bz2.open)):
+                caminho = os.path.join(pasta, nome)
+                with abrir(caminho, 'wb') as arquivo:
+                    arquivo.write(self.texto.encode())
+                with self.subTest(nome=nome):
+                    self.assertEqual(como_tuplas(ler_arestas(caminho, tamanho_bloco=512)), self.esperadas)
+
+    def test_intervalos_cobrem_cada_linha_uma_vez(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, 'g.txt')
+            with open(caminho, 'w') as arquivo:
+                arquivo.write(self.texto)
+            tamanho = os.path.getsize(caminho)
+            cortes = sorted({0, 1, 100, 101, tamanho // 3, tamanho // 2, tamanho - 1, tamanho})
+            lidas = []
+            for inicio, fim in zip(cortes, cortes[1:]):
+                for arestas in ler_intervalo(caminho, inicio, fim, tamanho_bloco=50):
+                    lidas.extend(como_tuplas(arestas))
+            self.assertEqual(lidas, self.esperadas)
+
+
+if __name__ == '__main__':
+    unittest.main()
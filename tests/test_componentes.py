@@ -0,0 +1,152 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from componentes import UniaoBusca, componentes_de_arestas
+from grafo import Grafo
+
+
+def arestas_aleatorias(rng, n, m):
+    return [(rng.randint(1, n), rng.randint(1, n)) for _ in range(m)]
+
+
+def particao_referencia(arestas):
+    """
+    Componentes dos vértices que aparecem nas arestas, por busca em largura sobre conjuntos.
+    """
+    vizinhos = {}
+    for u, v in arestas:
+        vizinhos.setdefault(u, set()).add(v)
+        vizinhos.setdefault(v, set()).add(u)
+    componentes, vistos = [], set()
+    for inicio in vizinhos:
+        if inicio in vistos:
+            continue
+        componente, fila = {inicio}, [inicio]
+        for u in fila:
+            for v in vizinhos[u] - componente:
+                componente.add(v)
+                fila.append(v)
+        vistos |= componente
+        componentes.append(componente)
+    return sorted(componentes, key=lambda c: min(c, key=str))
+
+
+def particao(resultado):
+    return sorted((set(componente) for componente in resultado), key=lambda c: min(c, key=str))
+
+
+class TestUniaoBusca(unittest.TestCase):
+
+    def test_unir_e_encontrar(self):
+        uniao = UniaoBusca(6)
+        self.assertTrue(uniao.unir(0, 1))
+        self.assertTrue(uniao.unir(2, 1))
+        self.assertFalse(uniao.unir(0, 2))
+        self.assertEqual(uniao.encontrar(0), uniao.encontrar(2))
+        self.assertNotEqual(uniao.encontrar(0), uniao.encontrar(3))
+
+    def test_cresce_sob_demanda(self):
+        uniao = UniaoBusca()
+        uniao.unir_arestas([0, 7], [3, 9])
+        uniao.unir_arestas([3], [9])
+        self.assertEqual(len(uniao), 10)
+        resultado = uniao.componentes()
+        # Os ids que não apareceram em arestas ficam fora dos componentes
+        self.assertEqual(list(resultado), [[0, 3, 7, 9]])
+        self.assertEqual(resultado.rotulo(5), -1)
+
+    def test_unir_floresta(self):
+        parcial = UniaoBusca()
+        parcial.unir_arestas([1, 4], [2, 5])
+        uniao = UniaoBusca()
+        uniao.unir_arestas([2, 6], [4, 7])
+        uniao.unir_floresta(parcial.pai, parcial.presente)
+        self.assertEqual(list(uniao.componentes()), [[1, 2, 4, 5], [6, 7]])
+
+
+class TestComponentesGrafo(unittest.TestCase):
+
+    def test_comparados_a_busca_em_largura(self):
+        rng = random.Random(31)
+        for caso in range(60):
+            n = rng.randint(1, 15)
+            arestas = arestas_aleatorias(rng, n, rng.randint(0, n))
+            texto = f'{n}\n' + ''.join(f'{u} {v}\n' for u, v in arestas)
+            esperado = particao_referencia(arestas)
+            for backend in ('csr', 'dict'):
+                with self.subTest(caso=caso, backend=backend):
+                    resultado = Grafo(io.StringIO(texto), backend=backend).encontrar_componentes_conexos()
+                    self.assertEqual(particao(resultado), esperado)
+                    self.assertEqual(sorted(resultado.tamanhos), sorted(len(c) for c in esperado))
+                    for componente in esperado:
+                        self.assertEqual(len({resultado.rotulo(v) for v in componente}), 1)
+
+    def test_rotulos_esparsos(self):
+        # Ids maiores que a quantidade de vértices não estouram o vetor de rótulos
+        grafo = Grafo(io.StringIO('4\n1 1000000\n7 8\n1000000 3\n'))
+        self.assertEqual(particao(grafo.encontrar_componentes_conexos()), [{1, 3, 1000000}, {7, 8}])
+
+    def test_histograma_e_saida(self):
+        grafo = Grafo(io.StringIO('6\n1 2\n2 3\n4 5\n6 6\n'))
+        saida = io.StringIO()
+        resultado = grafo.encontrar_componentes_conexos(saida)
+        self.assertEqual(resultado.histograma(), {1: 1, 2: 1, 3: 1})
+        self.assertEqual(saida.getvalue(), (
+            '\nNúmero de componentes conexos do grafo: 3\n'
+            'Componente 1 -> Lista de vértices: [1, 2, 3] | Tamanho: 3\n'
+            'Componente 2 -> Lista de vértices: [4, 5] | Tamanho: 2\n'
+            'Componente 3 -> Lista de vértices: [6] | Tamanho: 1\n\n'
+        ))
+
+
+class TestComponentesDeArestas(unittest.TestCase):
+    """
+    Componentes calculados direto do arquivo de arestas, em um ou vários processos.
+    """
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, 'arestas.txt')
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def gravar(self, linhas):
+        with open(self.caminho, 'w') as arquivo:
+            arquivo.write(f'{len(linhas)}\n' + ''.join(f'{linha}\n' for linha in linhas))
+
+    def test_comparados_a_busca_em_largura(self):
+        rng = random.Random(33)
+        for caso in range(10):
+            n = rng.randint(1, 200)
+            arestas = arestas_aleatorias(rng, n, rng.randint(1, n))
+            self.gravar([f'{u} {v}' for u, v in arestas])
+            esperado = particao_referencia(arestas)
+            for workers in (1, 3):
+                with self.subTest(caso=caso, workers=workers):
+                    resultado = componentes_de_arestas(self.caminho, workers=workers, tamanho_bloco=64)
+                    self.assertEqual(particao(resultado), esperado)
+
+    def test_rotulos_grandes_e_textuais(self):
+        arestas = [(1, 2), (2 ** 40, 5), ('a', 1), (5, 'b'), ('c', 'c')]
+        self.gravar([f'{u} {v}' for u, v in arestas])
+        esperado = [{'1', '2', 'a'}, {str(2 ** 40), '5', 'b'}, {'c'}]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                resultado = componentes_de_arestas(self.caminho, workers=workers, tamanho_bloco=16)
+                self.assertEqual(particao(resultado), sorted(esperado, key=lambda c: min(c, key=str)))
+                self.assertEqual(resultado.histograma(), {1: 1, 3: 2})
+
+    def test_ids_grandes_sem_texto(self):
+        self.gravar(['1 2', f'{2 ** 40} 1', '7 8'])
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                resultado = componentes_de_arestas(self.caminho, workers=workers)
+                self.assertEqual(particao(resultado), [{1, 2, 2 ** 40}, {7, 8}])
+
+
+if __name__ == '__main__':
+    unittest.main()
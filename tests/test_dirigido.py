@@ -0,0 +1,151 @@
+import io
+import math
+import random
+import unittest
+
+from grafo import Grafo
+
+
+def arestas_aleatorias(rng, n, m):
+    """
+    Sorteia até `m` arcos (u, v, peso) distintos entre os vértices 1..n, sem laços.
+    """
+    arcos = {}
+    for _ in range(m):
+        u, v = rng.randint(1, n), rng.randint(1, n)
+        if u != v:
+            arcos[(u, v)] = rng.randint(1, 9)
+    return [(u, v, peso) for (u, v), peso in arcos.items()]
+
+
+def montar(n, arestas, backend='csr'):
+    texto = f'{n}\n' + ''.join(f'{u} {v} {peso}\n' for u, v, peso in arestas)
+    return Grafo(io.StringIO(texto), backend=backend, dirigido=True)
+
+
+def distancias_referencia(n, arestas, origem):
+    distancias = {v: math.inf for v in range(1, n + 1)}
+    distancias[origem] = 0
+    for _ in range(n):
+        for u, v, peso in arestas:
+            distancias[v] = min(distancias[v], distancias[u] + peso)
+    return distancias
+
+
+def alcance(n, arestas):
+    """
+    Conjunto dos vértices alcançáveis a partir de cada vértice (fecho transitivo).
+    """
+    alcancaveis = {v: {v} for v in range(1, n + 1)}
+    for _ in range(n):
+        for u, v, _ in arestas:
+            alcancaveis[u] |= alcancaveis[v]
+    return alcancaveis
+
+
+class TestDirecoes(unittest.TestCase):
+    """
+    Consultas nas direções de saída e de entrada comparadas ao Bellman-Ford sobre os arcos (ou os arcos invertidos).
+    """
+
+    def test_caminhos_nas_duas_direcoes(self):
+        rng = random.Random(71)
+        for caso in range(30):
+            n = rng.randint(2, 10)
+            arestas = arestas_aleatorias(rng, n, 2 * n)
+            invertidas = [(v, u, peso) for u, v, peso in arestas]
+            for backend in ('csr', 'dict'):
+                grafo = montar(n, arestas, backend)
+                for origem in range(1, n + 1):
+                    saida = distancias_referencia(n, arestas, origem)
+                    entrada = distancias_referencia(n, invertidas, origem)
+                    with self.subTest(caso=caso, backend=backend, origem=origem):
+                        arvore = grafo.calcular_caminho_minimo(origem)
+                        self.assertEqual({v: arvore[v] for v in arvore}, {v: saida[v] for v in arvore})
+                        arvore = grafo.calcular_caminho_minimo(origem, direcao='entrada')
+                        self.assertEqual({v: arvore[v] for v in arvore}, {v: entrada[v] for v in arvore})
+                        for destino in range(1, n + 1):
+                            for bidirecional in (False, True):
+                                self.assertEqual(
+                                    grafo.calcular_caminho_minimo(origem, destino, bidirecional=bidirecional).distancia,
+                                    saida[destino],
+                                )
+                            self.assertEqual(
+                                grafo.calcular_caminho_minimo(origem, destino, direcao='entrada').distancia,
+                                entrada[destino],
+                            )
+
+    def test_buscas_nas_duas_direcoes(self):
+        grafo = Grafo(io.StringIO('4\n1 2\n2 3\n4 2\n'), dirigido=True)
+        self.assertEqual(grafo.busca_largura(2, None).vertices(), [2, 3])
+        self.assertEqual(sorted(grafo.busca_largura(2, None, direcao='entrada').vertices()), [1, 2, 4])
+        self.assertEqual(grafo.busca_profundidade(3, None, direcao='entrada').vertices()[:2], [3, 2])
+        self.assertEqual(grafo.busca_profundidade(3, None).vertices(), [3])
+
+    def test_destino_sem_arcos_de_saida(self):
+        grafo = Grafo(io.StringIO('3\n1 2\n2 3\n'), dirigido=True)
+        self.assertEqual(grafo.calcular_caminho_minimo(1, 3).caminho, [1, 2, 3])
+        self.assertEqual(grafo.calcular_caminho_minimo(3, 1).distancia, math.inf)
+
+
+class TestComponentesDirigidos(unittest.TestCase):
+
+    def test_fortemente_conexos(self):
+        rng = random.Random(72)
+        for caso in range(60):
+            n = rng.randint(1, 12)
+            arestas = arestas_aleatorias(rng, n, rng.randint(0, 2 * n))
+            alcancaveis = alcance(n, arestas)
+            com_arcos = {x for u, v, _ in arestas for x in (u, v)}
+            esperado = sorted(
+                {frozenset(v for v in com_arcos if u in alcancaveis[v] and v in alcancaveis[u]) for u in com_arcos},
+                key=min,
+            )
+            for backend in ('csr', 'dict'):
+                with self.subTest(caso=caso, backend=backend):
+                    resultado = montar(n, arestas, backend).componentes_fortemente_conexos()
+                    self.assertEqual(sorted((set(c) for c in resultado), key=min), [set(c) for c in esperado])
+
+    def test_fracamente_conexos(self):
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = Grafo(io.StringIO('5\n1 2\n3 2\n4 5\n'), backend=backend, dirigido=True)
+                self.assertEqual(list(grafo.encontrar_componentes_conexos()), [[1, 2, 3], [4, 5]])
+                self.assertEqual(len(grafo.componentes_fortemente_conexos()), 5)
+                grafo.adicionar_aresta(2, 1)
+                self.assertEqual(sorted(map(sorted, grafo.componentes_fortemente_conexos())), [[1, 2], [3], [4], [5]])
+
+
+class TestAlteracoesDirigidas(unittest.TestCase):
+
+    def test_reverso_acompanha_alteracoes(self):
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = Grafo(io.StringIO('3\n1 2 4\n2 3 1\n'), backend=backend, dirigido=True)
+                grafo.adicionar_aresta(3, 1, 2)
+                self.assertEqual(grafo.calcular_caminho_minimo(1, direcao='entrada')[3], 2)
+                self.assertEqual(grafo.remover_aresta(1, 2), 4)
+                # Só o arco 1 -> 2 foi removido
+                with self.assertRaises(KeyError):
+                    grafo.remover_aresta(1, 2)
+                self.assertEqual(grafo.calcular_caminho_minimo(2, 1).distancia, 3)
+                self.assertEqual(grafo.calcular_caminho_minimo(1, 2).distancia, math.inf)
+                self.assertEqual(grafo.calcular_caminho_minimo(2, direcao='entrada')[1], math.inf)
+
+    def test_consultas_nao_criam_linhas(self):
+        # No backend dict, vértices sem arcos de saída não têm linha e as consultas não devem criá-las
+        grafo = Grafo(io.StringIO('5\n1 2 1\n2 3 1\n'), backend='dict', dirigido=True)
+        linhas, reversas = sorted(grafo.grafo), sorted(grafo.reverso)
+        grafo.calcular_caminho_minimo(1)
+        grafo.calcular_caminho_minimo(1, 5)
+        grafo.calcular_caminho_minimo(1, 3, bidirecional=True)
+        grafo.calcular_caminho_minimo(3, direcao='entrada')
+        grafo.busca_largura(1, None)
+        grafo.busca_profundidade(1, None)
+        grafo.encontrar_componentes_conexos()
+        grafo.componentes_fortemente_conexos()
+        self.assertEqual((sorted(grafo.grafo), sorted(grafo.reverso)), (linhas, reversas))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+import gc
+import io
+import math
+import os
+import random
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from caminhos import CicloNegativo
+from distancias import floyd_warshall_blocos, preencher_matriz_inicial
+from grafo import Grafo
+
+
+def floyd_referencia(n, arestas, dirigido):
+    """
+    Floyd-Warshall direto sobre listas, para comparação.
+    """
+    dist = [[0 if i == j else math.inf for j in range(n)] for i in range(n)]
+    # Como na carga do grafo, uma aresta repetida fica com o último peso
+    for u, v, peso in arestas:
+        dist[u - 1][v - 1] = peso
+        if not dirigido:
+            dist[v - 1][u - 1] = peso
+    for k in range(n):
+        for i in range(n):
+            for j in range(n):
+                if dist[i][k] + dist[k][j] < dist[i][j]:
+                    dist[i][j] = dist[i][k] + dist[k][j]
+    return dist
+
+
+def montar(n, arestas, dirigido=False, backend='csr'):
+    texto = f'{n}\n' + ''.join(f'{u} {v} {peso}\n' for u, v, peso in arestas)
+    return Grafo(io.StringIO(texto), backend=backend, dirigido=dirigido)
+
+
+def arestas_aleatorias(rng, n, m, minimo=1):
+    arestas = {}
+    for _ in range(m):
+        u, v = rng.randint(1, n), rng.randint(1, n)
+        if u != v:
+            arestas[(u, v)] = rng.randint(minimo, 9)
+    return [(u, v, peso) for (u, v), peso in arestas.items()]
+
+
+@unittest.skipIf(np is None, 'requer numpy')
+class TestFloydWarshallBlocos(unittest.TestCase):
+
+    def test_blocos_de_tamanhos_variados(self):
+        rng = random.Random(91)
+        for caso in range(10):
+            n = rng.randint(1, 40)
+            arestas = arestas_aleatorias(rng, n, 2 * n)
+            esperado = floyd_referencia(n, arestas, True)
+            grafo = montar(n, arestas, dirigido=True)
+            for tamanho_bloco in (1, 3, 8, 128):
+                with self.subTest(caso=caso, tamanho_bloco=tamanho_bloco):
+                    dist = np.empty((n, n))
+                    preencher_matriz_inicial(grafo.grafo, dist)
+                    floyd_warshall_blocos(dist, tamanho_bloco)
+                    self.assertEqual(dist.tolist(), esperado)
+
+
+class TestTodosOsPares(unittest.TestCase):
+    """
+    `caminhos_minimos_todos` pelos dois métodos, comparado ao Floyd-Warshall direto.
+    """
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        # A matriz mapeada precisa ser liberada antes de apagar o arquivo
+        gc.collect()
+        self.pasta.cleanup()
+
+    def metodos(self):
+        return ('floyd', 'dijkstra', None) if np is not None else ('dijkstra', None)
+
+    def conferir(self, matriz, esperado):
+        n = len(esperado)
+        self.assertEqual(len(matriz), n)
+        for i in range(n):
+            self.assertEqual(list(matriz.linha(i)), esperado[i])
+
+    def test_metodos_concordam(self):
+        rng = random.Random(92)
+        for caso in range(10):
+            n = rng.randint(2, 15)
+            for dirigido in (False, True):
+                arestas = arestas_aleatorias(rng, n, rng.randint(1, 4 * n), minimo=-2 if dirigido else 1)
+                # Só arcos de vértices menores para maiores: sem ciclos, mesmo com pesos negativos
+                arestas = [(u, v, peso) for u, v, peso in arestas if u < v] if dirigido else arestas
+                esperado = floyd_referencia(n, arestas, dirigido)
+                for backend in ('csr', 'dict'):
+                    grafo = montar(n, arestas, dirigido, backend)
+                    for metodo in self.metodos():
+                        with self.subTest(caso=caso, dirigido=dirigido, backend=backend, metodo=metodo):
+                            self.conferir(grafo.caminhos_minimos_todos(workers=1, metodo=metodo), esperado)
+
+    def test_em_arquivo_e_float32(self):
+        arestas = [(1, 2, 1.5), (2, 3, 2), (3, 4, 0.25), (1, 4, 9)]
+        esperado = floyd_referencia(4, arestas, False)
+        grafo = montar(4, arestas)
+        for metodo in self.metodos():
+            with self.subTest(metodo=metodo):
+                caminho = os.path.join(self.pasta.name, f'{metodo}.dist')
+                matriz = grafo.caminhos_minimos_todos(caminho, tipo='f', workers=1, metodo=metodo)
+                self.assertEqual(os.path.getsize(caminho), 4 * 4 * 4)
+                self.assertEqual(matriz.bytes_utilizados(), 4 * 4 * 4)
+                self.conferir(matriz, esperado)
+                self.assertEqual(matriz.distancia(1, 4), 3.75)
+                del matriz
+
+    def test_ciclo_negativo(self):
+        grafo = montar(3, [(1, 2, 1), (2, 3, -3), (3, 1, 1)], dirigido=True)
+        for metodo in self.metodos():
+            with self.subTest(metodo=metodo):
+                with self.assertRaises(CicloNegativo) as erro:
+                    grafo.caminhos_minimos_todos(workers=1, metodo=metodo)
+                self.assertEqual(sorted(erro.exception.ciclo), [1, 2, 3])
+
+    def test_metodo_desconhecido(self):
+        with self.assertRaises(ValueError):
+            montar(2, [(1, 2, 1)]).caminhos_minimos_todos(metodo='johnson')
+
+    @unittest.skipIf(np is not None, 'só sem numpy')
+    def test_floyd_sem_numpy(self):
+        with self.assertRaises(ImportError):
+            montar(2, [(1, 2, 1)]).caminhos_minimos_todos(metodo='floyd')
+
+
+if __name__ == '__main__':
+    unittest.main()
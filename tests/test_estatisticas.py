@@ -0,0 +1,144 @@
+import io
+import math
+import random
+import unittest
+
+from adjacencia import AdjacenciaCSR, AdjacenciaDict
+from estatisticas import MetadadosPesos, calcular_estatisticas
+from grafo import Grafo
+
+
+class TestMetadadosPesos(unittest.TestCase):
+
+    def conferir(self, metadados, pesos):
+        self.assertEqual(metadados.qtd, len(pesos))
+        self.assertEqual(metadados.minimo, min(pesos, default=math.inf))
+        self.assertEqual(metadados.maximo, max(pesos, default=-math.inf))
+        self.assertEqual(metadados.tem_negativos, any(peso < 0 for peso in pesos))
+        self.assertEqual(metadados.todos_unitarios, all(peso == 1 for peso in pesos))
+        self.assertEqual(metadados.inteiros, all(float(peso).is_integer() for peso in pesos))
+
+    def test_de_adjacencia(self):
+        origens, destinos, pesos = [0, 1, 2, 3], [1, 2, 3, 3], [4.0, -1.5, 2.0, 7.0]
+        for construir in (AdjacenciaCSR.de_arestas, AdjacenciaDict.de_arestas):
+            with self.subTest(backend=construir):
+                adjacencia = construir(origens, destinos, pesos, 4, True)
+                self.conferir(MetadadosPesos.de_adjacencia(adjacencia), pesos)
+        # Em grafos não direcionados cada aresta conta nos dois extremos (o laço, uma vez)
+        metadados = MetadadosPesos.de_adjacencia(AdjacenciaCSR.de_arestas(origens, destinos, pesos, 4))
+        self.assertEqual(metadados.qtd, 7)
+        self.conferir(MetadadosPesos.de_adjacencia(AdjacenciaCSR.de_arestas([], [], [], 3)), [])
+
+    def test_remocoes_dos_extremos(self):
+        rng = random.Random(5)
+        pesos = [float(rng.randint(-5, 20)) for _ in range(50)]
+        metadados = MetadadosPesos()
+        for peso in pesos:
+            metadados.adicionar(peso)
+        self.conferir(metadados, pesos)
+        for _ in range(2000):
+            if pesos and rng.random() < 0.5:
+                # Remove de preferência o mínimo ou o máximo atual
+                peso = rng.choice([min(pesos), max(pesos), rng.choice(pesos)])
+                pesos.remove(peso)
+                metadados.remover(peso)
+            else:
+                peso = rng.choice([float(rng.randint(-5, 20)), rng.randint(0, 40) / 4])
+                pesos.append(peso)
+                metadados.adicionar(peso)
+            self.conferir(metadados, pesos)
+        # Os heaps de remoção preguiçosa não crescem sem limite
+        self.assertLessEqual(len(metadados._heap_minimo) + len(metadados._heap_maximo),
+                             4 * len(set(pesos)) + 34)
+
+    def test_esvaziar(self):
+        metadados = MetadadosPesos()
+        metadados.adicionar(3.0)
+        metadados.adicionar(3.0)
+        metadados.remover(3.0)
+        self.assertEqual((metadados.minimo, metadados.maximo), (3.0, 3.0))
+        metadados.remover(3.0)
+        self.assertEqual((metadados.minimo, metadados.maximo), (math.inf, -math.inf))
+        metadados.adicionar(1.0)
+        self.assertEqual((metadados.minimo, metadados.maximo), (1.0, 1.0))
+
+
+class TestEstatisticasGrafo(unittest.TestCase):
+
+    # Arestas distintas 1-2, 2-3, 3-3 (laço) e 4-1; o vértice 5 não tem arestas
+    ENTRADA = '5\n1 2\n2 3\n1 2\n3 3\n4 1\n'
+    GRAUS = {1: 2, 2: 2, 3: 3, 4: 1, 5: 0}
+
+    def conferir(self, grafo, graus):
+        estatisticas = grafo.estatisticas()
+        self.assertEqual({v: int(estatisticas.graus[grafo.vertices.indice(v)]) for v in graus}, graus)
+        soma = sum(graus.values())
+        self.assertEqual(estatisticas.qtd_vertices, len(graus))
+        self.assertEqual(estatisticas.qtd_arestas, soma // 2)
+        self.assertEqual(estatisticas.grau_medio, soma / len(graus))
+        self.assertEqual(estatisticas.grau_maximo, max(graus.values()))
+        self.assertEqual(estatisticas.distribuicao, {
+            grau: sum(1 for g in graus.values() if g == grau) / len(graus) for grau in range(1, max(graus.values()) + 1)
+        })
+
+    def test_graus_e_distribuicao(self):
+        for backend in ('csr', 'dict'):
+            for dirigido in (False, True):
+                with self.subTest(backend=backend, dirigido=dirigido):
+                    # No modo dirigido o grau é saída mais entrada: os números são os mesmos
+                    self.conferir(Grafo(io.StringIO(self.ENTRADA), backend=backend, dirigido=dirigido), self.GRAUS)
+
+    def test_informacoes(self):
+        grafo = Grafo(io.StringIO(self.ENTRADA))
+        saida = io.StringIO()
+        estatisticas = grafo.informacoes(saida)
+        self.assertIs(estatisticas, grafo.estatisticas())
+        self.assertEqual(
+            estatisticas.formatar(),
+            'Quantidade de vertices: 5\nQuantidade de arestas: 4\nGrau medio: 1.6\n1 0.2\n2 0.4\n3 0.2\n',
+        )
+        self.assertIn(estatisticas.formatar(), saida.getvalue())
+
+    def test_mantidas_nas_alteracoes(self):
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = Grafo(io.StringIO(self.ENTRADA), backend=backend)
+                estatisticas = grafo.estatisticas()
+                grafo.adicionar_aresta(5, 6)
+                grafo.adicionar_aresta(1, 2, 7)  # só troca o peso
+                grafo.remover_aresta(3, 3)
+                graus = {**self.GRAUS, 3: 1, 5: 1, 6: 1}
+                self.assertIs(grafo.estatisticas(), estatisticas)
+                self.conferir(grafo, graus)
+                # O resultado incremental coincide com um cálculo do zero
+                do_zero = calcular_estatisticas(grafo.grafo, estatisticas.qtd_vertices)
+                self.assertEqual(estatisticas.formatar(), do_zero.formatar())
+
+
+class TestAlgoritmoPorPesos(unittest.TestCase):
+
+    def test_escolha_acompanha_alteracoes(self):
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = Grafo(io.StringIO('4\n1 2\n2 3\n3 4\n'), backend=backend)
+                self.assertEqual(grafo._algoritmo_pesos(), 'bfs')
+                grafo.adicionar_aresta(1, 3, 0)
+                self.assertEqual(grafo._algoritmo_pesos(), '0-1')
+                grafo.adicionar_aresta(2, 4, 5)
+                self.assertEqual(grafo._algoritmo_pesos(), 'dial')
+                grafo.adicionar_aresta(1, 4, 2.5)
+                self.assertEqual(grafo._algoritmo_pesos(), 'dijkstra')
+                grafo.remover_aresta(1, 4)
+                self.assertEqual(grafo._algoritmo_pesos(), 'dial')
+                # Remover o peso máximo devolve o grafo à BFS 0-1 sem reler as arestas
+                grafo.remover_aresta(2, 4)
+                self.assertEqual(grafo.pesos.maximo, 1.0)
+                self.assertEqual(grafo._algoritmo_pesos(), '0-1')
+                grafo.remover_aresta(1, 3)
+                self.assertEqual(grafo.pesos.minimo, 1.0)
+                self.assertEqual(grafo._algoritmo_pesos(), 'bfs')
+                self.assertEqual(grafo.calcular_caminho_minimo(1, 4).distancia, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
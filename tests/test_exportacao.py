@@ -0,0 +1,132 @@
+import contextlib
+import csv
+import io
+import os
+import tempfile
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from grafo import Grafo
+
+ENTRADA = '4\n1 2 4\n2 3 1.5\n4 4 2\n'
+
+
+class TestRepresentacoes(unittest.TestCase):
+    """
+    `rep_lista` e `rep_matriz` geram o texto da adjacência em memória, sem reler o arquivo de entrada.
+    """
+
+    LISTA = (
+        '\n\n==================== RESULTADO =========================\n\n'
+        'Lista de Adjacencia: \n\n'
+        '1-> 2\n2-> 1-> 3\n3-> 2\n4-> 4\n\n'
+    )
+    MATRIZ = (
+        '==================== RESULTADO =========================\n\n'
+        'Matriz de adjacência:\n\n'
+        '0 4.0 0 0\n4.0 0 1.5 0\n0 1.5 0 0\n0 0 0 2.0\n\n'
+    )
+
+    def test_saida_padrao(self):
+        grafo = Grafo(io.StringIO(ENTRADA))
+        impresso = io.StringIO()
+        with contextlib.redirect_stdout(impresso):
+            grafo.rep_lista()
+            grafo.rep_matriz()
+        self.assertEqual(impresso.getvalue(), self.LISTA + self.MATRIZ)
+
+    def test_mesmo_texto_nos_dois_backends(self):
+        for backend in ('csr', 'dict'):
+            for densa in (False, True):
+                with self.subTest(backend=backend, densa=densa):
+                    grafo = Grafo(io.StringIO(ENTRADA), backend=backend)
+                    lista, matriz = io.StringIO(), io.StringIO()
+                    grafo.rep_lista(lista)
+                    grafo.rep_matriz(densa, matriz)
+                    self.assertEqual((lista.getvalue(), matriz.getvalue()), (self.LISTA, self.MATRIZ))
+
+    def test_sem_pesos_e_em_arquivo(self):
+        grafo = Grafo(io.StringIO('3\n1 2\n3 1\n'), dirigido=True, backend='dict')
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, 'matriz.txt')
+            grafo.rep_matriz(saida=caminho)
+            with open(caminho) as arquivo:
+                self.assertTrue(arquivo.read().endswith('0 1 0\n0 0 0\n1 0 0\n\n'))
+        lista = io.StringIO()
+        grafo.rep_lista(lista)
+        # Só os arcos de saída; o vértice 2 não tem nenhum
+        self.assertTrue(lista.getvalue().endswith('1-> 2\n3-> 1\n\n'))
+
+    def test_nao_rele_a_entrada(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            caminho = os.path.join(pasta, 'entrada.txt')
+            with open(caminho, 'w') as arquivo:
+                arquivo.write(ENTRADA)
+            grafo = Grafo(caminho)
+            os.remove(caminho)
+            lista = io.StringIO()
+            grafo.rep_lista(lista)
+        self.assertEqual(lista.getvalue(), self.LISTA)
+
+
+class TestExportacao(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.grafo = Grafo(io.StringIO(ENTRADA))
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def test_csv(self):
+        caminho = os.path.join(self.pasta.name, 'arestas.csv')
+        self.grafo.exportar(caminho)
+        with open(caminho, newline='') as arquivo:
+            linhas = list(csv.reader(arquivo))
+        self.assertEqual(linhas, [['origem', 'destino', 'peso'], ['1', '2', '4.0'], ['2', '3', '1.5'], ['4', '4', '2.0']])
+
+    def test_matrix_market(self):
+        destino = io.StringIO()
+        self.grafo.exportar(destino, 'mtx')
+        self.assertEqual(destino.getvalue(), (
+            '%%MatrixMarket matrix coordinate real symmetric\n4 4 3\n2 1 4.0\n3 2 1.5\n4 4 2.0\n'
+        ))
+        destino = io.StringIO()
+        Grafo(io.StringIO('3\n1 2\n3 1\n'), dirigido=True).exportar(destino, 'mtx')
+        self.assertEqual(destino.getvalue(), '%%MatrixMarket matrix coordinate pattern general\n3 3 2\n1 2\n3 1\n')
+
+    @unittest.skipIf(np is None, 'requer numpy')
+    def test_npz(self):
+        for backend in ('csr', 'dict'):
+            for compactar in (False, True):
+                with self.subTest(backend=backend, compactar=compactar):
+                    caminho = os.path.join(self.pasta.name, f'{backend}{compactar}.npz')
+                    Grafo(io.StringIO(ENTRADA), backend=backend).exportar(caminho, compactar=compactar)
+                    with np.load(caminho) as dados:
+                        offsets, vizinhos, pesos = dados['offsets'], dados['vizinhos'], dados['pesos']
+                        self.assertEqual(dados['rotulos'].tolist(), [1, 2, 3, 4])
+                        self.assertEqual((bool(dados['dirigido']), bool(dados['ponderado'])), (False, True))
+                    linhas = [
+                        sorted(zip(vizinhos[offsets[i]:offsets[i + 1]].tolist(), pesos[offsets[i]:offsets[i + 1]].tolist()))
+                        for i in range(4)
+                    ]
+                    self.assertEqual(linhas, [[(1, 4.0)], [(0, 4.0), (2, 1.5)], [(1, 1.5)], [(3, 2.0)]])
+
+    @unittest.skipIf(np is not None, 'só sem numpy')
+    def test_npz_sem_numpy(self):
+        with self.assertRaises(ImportError):
+            self.grafo.exportar(os.path.join(self.pasta.name, 'grafo.npz'))
+
+    def test_formato_desconhecido(self):
+        with self.assertRaises(ValueError):
+            self.grafo.exportar(os.path.join(self.pasta.name, 'grafo.xyz'))
+        with self.assertRaises(ValueError):
+            self.grafo.exportar(io.StringIO(), 'xml')
+
+
+if __name__ == '__main__':
+    unittest.main()
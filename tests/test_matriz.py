@@ -0,0 +1,86 @@
+import io
+import unittest
+
+from grafo import Grafo
+from matriz import MatrizDensa, MatrizEsparsa, formatar_linha
+
+ENTRADA = '5\n1 2 4\n2 3 1.5\n1 3 7\n4 4 2\n'
+# Matriz esperada, com o vértice v na linha e na coluna v - 1 (o vértice 5 não tem arestas)
+ESPERADA = [
+    [0, 4, 7, 0, 0],
+    [4, 0, 1.5, 0, 0],
+    [7, 1.5, 0, 0, 0],
+    [0, 0, 0, 2, 0],
+    [0, 0, 0, 0, 0],
+]
+
+
+class TestMatrizDensa(unittest.TestCase):
+
+    def test_construida_no_primeiro_acesso(self):
+        grafo = Grafo(io.StringIO(ENTRADA))
+        self.assertIsNone(grafo._matriz_densa)
+        matriz = grafo.matriz_adjacencia
+        self.assertIsInstance(matriz, MatrizDensa)
+        self.assertIs(grafo.matriz_densa(), matriz)
+        self.assertEqual([list(linha) for linha in matriz], ESPERADA)
+        self.assertEqual(matriz.bytes_utilizados(), 25 * 8)
+
+    def test_float32(self):
+        matriz = Grafo(io.StringIO(ENTRADA), backend='dict').matriz_densa('f')
+        self.assertEqual(matriz.dados.typecode, 'f')
+        self.assertEqual([list(linha) for linha in matriz], ESPERADA)
+        self.assertEqual(matriz.bytes_utilizados(), 25 * 4)
+
+    def test_refeita_depois_de_alteracoes(self):
+        grafo = Grafo(io.StringIO(ENTRADA))
+        grafo.matriz_densa()
+        grafo.adicionar_aresta(5, 1, 3)
+        self.assertIsNone(grafo._matriz_densa)
+        matriz = grafo.matriz_densa()
+        self.assertEqual((matriz[4][0], matriz[0][4]), (3, 3))
+
+    def test_dirigido(self):
+        matriz = Grafo(io.StringIO('3\n1 2 5\n3 1 2\n'), dirigido=True).matriz_densa()
+        self.assertEqual([list(linha) for linha in matriz], [[0, 5, 0], [0, 0, 0], [2, 0, 0]])
+
+    def test_linha_fora_da_matriz(self):
+        matriz = MatrizDensa(2)
+        with self.assertRaises(IndexError):
+            matriz[2]
+
+
+class TestMatrizEsparsa(unittest.TestCase):
+
+    def test_mesmas_linhas_da_densa(self):
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = Grafo(io.StringIO(ENTRADA), backend=backend)
+                esparsa = grafo.matriz_esparsa()
+                self.assertIsInstance(esparsa, MatrizEsparsa)
+                self.assertEqual(len(esparsa), 5)
+                self.assertEqual(list(esparsa), ESPERADA)
+                # A visão esparsa não monta a matriz densa
+                self.assertIsNone(grafo._matriz_densa)
+
+    def test_coo(self):
+        esparsa = Grafo(io.StringIO(ENTRADA)).matriz_esparsa()
+        esperadas = [(i, j, peso) for i, linha in enumerate(ESPERADA) for j, peso in enumerate(linha) if peso]
+        self.assertEqual(list(esparsa.coo()), esperadas)
+
+    def test_linhas_texto(self):
+        esparsa = Grafo(io.StringIO(ENTRADA)).matriz_esparsa()
+        for ponderado in (False, True):
+            with self.subTest(ponderado=ponderado):
+                esperadas = [formatar_linha(map(float, linha), ponderado) + '\n' for linha in ESPERADA]
+                self.assertEqual(list(esparsa.linhas_texto(ponderado)), esperadas)
+        self.assertEqual(next(esparsa.linhas_texto()), '0 4.0 7.0 0 0\n')
+
+    def test_linha_fora_da_matriz(self):
+        esparsa = Grafo(io.StringIO(ENTRADA)).matriz_esparsa()
+        with self.assertRaises(IndexError):
+            esparsa.linha(5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import asyncio
+import heapq
+import io
+import threading
+import unittest
+
+from grafo import Grafo
+from metricas import Metricas, cronometrar, instrumentar, metricas_ativas, operacoes_heap
+
+# Pesos fracionários: o caminho mínimo usa o Dijkstra com heap
+ENTRADA = '5\n1 2 2.5\n2 3 1\n1 3 5\n4 5 1\n'
+
+
+class TestMetricas(unittest.TestCase):
+
+    def test_contadores_maximos_e_mescla(self):
+        metricas = Metricas()
+        metricas.incrementar('a')
+        metricas.incrementar('a', 4)
+        metricas.registrar_maximo('pico', 3)
+        metricas.registrar_maximo('pico', 2)
+        with metricas.cronometro('fase'):
+            pass
+        outras = Metricas()
+        outras.incrementar('a', 2)
+        outras.registrar_maximo('pico', 7)
+        outras.registrar_maximo('negativo', -5)
+        with outras.cronometro('fase'):
+            pass
+        metricas.mesclar(outras)
+        self.assertEqual(metricas.contadores, {'a': 7})
+        self.assertEqual(metricas.maximos, {'pico': 7, 'negativo': -5})
+        self.assertEqual(metricas.chamadas, {'fase': 2})
+        self.assertGreaterEqual(metricas.tempos['fase'], 0)
+        metricas.limpar()
+        self.assertEqual(metricas.como_dict(), {'contadores': {}, 'maximos': {}, 'tempos': {}, 'chamadas': {}})
+
+    def test_operacoes_heap(self):
+        inserir, remover = operacoes_heap(None)
+        self.assertEqual((inserir, remover), (heapq.heappush, heapq.heappop))
+        metricas = Metricas()
+        inserir, remover = operacoes_heap(metricas)
+        heap = []
+        for valor in (3, 1, 2):
+            inserir(heap, valor)
+        self.assertEqual(remover(heap), 1)
+        self.assertEqual(metricas.contadores, {'heap_insercoes': 3, 'heap_remocoes': 1})
+        self.assertEqual(metricas.maximos, {'pico_heap': 3})
+
+
+class TestInstrumentar(unittest.TestCase):
+
+    def test_desligada_por_padrao(self):
+        self.assertIsNone(metricas_ativas())
+        with cronometrar('nada') as medido:
+            self.assertIsNone(medido)
+
+    def test_blocos_aninhados_e_callback(self):
+        enviadas = []
+        with instrumentar(enviadas.append) as externas:
+            with instrumentar() as internas:
+                self.assertIs(metricas_ativas(), internas)
+                with cronometrar('interna'):
+                    pass
+            self.assertIs(metricas_ativas(), externas)
+        self.assertIsNone(metricas_ativas())
+        self.assertEqual(internas.chamadas, {'interna': 1})
+        self.assertEqual(externas.chamadas, {})
+        self.assertEqual(enviadas, [externas.como_dict()])
+
+    def test_acumula_em_metricas_existentes(self):
+        grafo = Grafo(io.StringIO(ENTRADA))
+        metricas = Metricas()
+        for _ in range(2):
+            with instrumentar(metricas=metricas):
+                grafo.busca_largura(1, None)
+        self.assertEqual(metricas.chamadas['busca_largura'], 2)
+
+    def test_isolada_por_thread_e_por_tarefa(self):
+        grafo = Grafo(io.StringIO(ENTRADA))
+        vistas = []
+        with instrumentar() as metricas:
+            thread = threading.Thread(target=lambda: vistas.append(metricas_ativas()))
+            thread.start()
+            thread.join()
+
+            async def consultar(instrumentada):
+                if instrumentada:
+                    with instrumentar() as propria:
+                        grafo.busca_largura(1, None)
+                    return propria
+                await asyncio.sleep(0)
+                return metricas_ativas()
+
+            async def principal():
+                return await asyncio.gather(consultar(True), consultar(False))
+
+            propria, herdada = asyncio.run(principal())
+        self.assertEqual(vistas, [None])
+        self.assertIs(herdada, metricas)
+        self.assertEqual(propria.chamadas, {'busca_largura': 1})
+        self.assertNotIn('busca_largura', metricas.chamadas)
+
+
+class TestMetricasDoGrafo(unittest.TestCase):
+
+    def test_carga(self):
+        with instrumentar() as metricas:
+            Grafo(io.StringIO(ENTRADA))
+        self.assertEqual(metricas.contadores['arestas_lidas'], 4)
+        self.assertEqual(
+            set(metricas.tempos),
+            {'armazenar_grafo.leitura', 'armazenar_grafo.indices', 'armazenar_grafo.adjacencia', 'armazenar_grafo.pesos'},
+        )
+
+    def test_caminho_minimo(self):
+        grafo = Grafo(io.StringIO(ENTRADA))
+        with instrumentar() as metricas:
+            grafo.calcular_caminho_minimo(1)
+            grafo.calcular_caminho_minimo(1)
+        contadores = metricas.contadores
+        # 1, 2 e 3 são fixados; a entrada (5, 3) fica obsoleta depois de 3 ser alcançado por 2
+        self.assertEqual(contadores['vertices_fixados'], 3)
+        self.assertEqual(contadores['heap_obsoletas'], 1)
+        self.assertEqual(contadores['arestas_relaxadas'], 6)
+        self.assertEqual(contadores['heap_remocoes'], contadores['vertices_fixados'] + contadores['heap_obsoletas'])
+        self.assertEqual((contadores['cache_arvores_faltas'], contadores['cache_arvores_acertos']), (1, 1))
+        self.assertEqual(metricas.chamadas['calcular_caminho_minimo'], 2)
+
+    def test_buscas(self):
+        grafo = Grafo(io.StringIO('5\n1 2\n1 3\n1 4\n2 5\n'))
+        with instrumentar() as metricas:
+            grafo.busca_largura(1, None)
+        self.assertEqual(metricas.contadores, {'vertices_visitados': 5, 'arestas_relaxadas': 8})
+        self.assertEqual(metricas.maximos['pico_fila'], 3)
+
+    def test_nada_e_coletado_fora_do_bloco(self):
+        grafo = Grafo(io.StringIO(ENTRADA))
+        with instrumentar() as metricas:
+            grafo.calcular_caminho_minimo(1)
+        antes = metricas.como_dict()
+        grafo.calcular_caminho_minimo(2)
+        grafo.busca_profundidade(1, None)
+        self.assertEqual(metricas.como_dict(), antes)
+
+
+if __name__ == '__main__':
+    unittest.main()
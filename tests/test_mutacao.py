@@ -0,0 +1,144 @@
+import io
+import math
+import random
+import unittest
+
+from grafo import Grafo
+
+
+class GrafoDeReferencia:
+    """
+    Espelho das arestas de um `Grafo` não dirigido alterado aos poucos, para recalcular as respostas por força bruta.
+    """
+
+    def __init__(self):
+        self.arestas = {}
+
+    def chave(self, u, v):
+        return (u, v) if u <= v else (v, u)
+
+    def adicionar(self, u, v, peso):
+        self.arestas[self.chave(u, v)] = peso
+
+    def remover(self, u, v):
+        return self.arestas.pop(self.chave(u, v))
+
+    def com_arestas(self):
+        return {x for u, v in self.arestas for x in (u, v)}
+
+    def distancias(self, origem):
+        distancias = {v: math.inf for v in self.com_arestas() | {origem}}
+        distancias[origem] = 0
+        for _ in range(len(distancias)):
+            for (u, v), peso in self.arestas.items():
+                distancias[v] = min(distancias[v], distancias[u] + peso)
+                distancias[u] = min(distancias[u], distancias[v] + peso)
+        return distancias
+
+    def componentes(self):
+        rotulo = {v: v for v in self.com_arestas()}
+        for _ in range(len(rotulo)):
+            for u, v in self.arestas:
+                rotulo[u] = rotulo[v] = min(rotulo[u], rotulo[v])
+        componentes = {}
+        for v, r in rotulo.items():
+            componentes.setdefault(r, set()).add(v)
+        return sorted(componentes.values(), key=min)
+
+
+class TestMutacao(unittest.TestCase):
+    """
+    Consultas intercaladas com inserções e remoções de arestas, conferidas a cada passo.
+    """
+
+    def conferir(self, grafo, referencia, origem):
+        esperado = referencia.distancias(origem)
+        self.assertEqual(dict(grafo.calcular_caminho_minimo(origem)), esperado)
+        destino = max(esperado)
+        self.assertEqual(grafo.calcular_caminho_minimo(origem, destino).distancia, esperado[destino])
+        self.assertEqual(sorted((set(c) for c in grafo.encontrar_componentes_conexos()), key=min),
+                         referencia.componentes())
+        self.assertEqual(grafo.estatisticas().qtd_arestas, len(referencia.arestas))
+
+    def test_consultas_depois_de_alteracoes(self):
+        rng = random.Random(41)
+        for caso in range(30):
+            n = rng.randint(3, 10)
+            for backend in ('csr', 'dict'):
+                referencia = GrafoDeReferencia()
+                linhas = []
+                for _ in range(n):
+                    u, v, peso = rng.randint(1, n), rng.randint(1, n), rng.randint(1, 9)
+                    referencia.adicionar(u, v, peso)
+                    linhas.append(f'{u} {v} {peso}')
+                grafo = Grafo(io.StringIO(f'{n}\n' + '\n'.join(linhas) + '\n'), backend=backend)
+                # Os rótulos n+1 e n+2 ainda não existem: as inserções também criam vértices
+                total = n + 2
+                for passo in range(25):
+                    with self.subTest(caso=caso, backend=backend, passo=passo):
+                        acao = rng.random()
+                        if acao < 0.3 and referencia.arestas:
+                            u, v = rng.choice(sorted(referencia.arestas))
+                            self.assertEqual(grafo.remover_aresta(v, u), referencia.remover(u, v))
+                        elif acao < 0.4:
+                            lote = [(rng.randint(1, n), rng.randint(1, n), rng.randint(1, 9)) for _ in range(3)]
+                            self.assertEqual(grafo.aplicar_lote(lote), 3)
+                            for u, v, peso in lote:
+                                referencia.adicionar(u, v, peso)
+                        else:
+                            u, v = rng.sample(range(1, total + 1), 2)
+                            peso = rng.randint(1, 9)
+                            grafo.adicionar_aresta(u, v, peso)
+                            referencia.adicionar(u, v, peso)
+                        origem = rng.choice(sorted(referencia.com_arestas() or {1}))
+                        self.conferir(grafo, referencia, origem)
+
+    def test_retornos(self):
+        grafo = Grafo(io.StringIO('3\n1 2 4\n'))
+        self.assertIsNone(grafo.adicionar_aresta(2, 3, 5))
+        self.assertEqual(grafo.adicionar_aresta(3, 2, 6), 5)
+        self.assertEqual(grafo.remover_aresta(2, 3), 6)
+        with self.assertRaises(KeyError):
+            grafo.remover_aresta(2, 3)
+        with self.assertRaises(KeyError):
+            grafo.remover_aresta(1, 99)
+        # Os vértices continuam no grafo depois da remoção
+        self.assertIn(3, grafo.vertices)
+
+    def test_adicionar_vertice(self):
+        grafo = Grafo(io.StringIO('3\n1 2\n'))
+        self.assertEqual(grafo.adicionar_vertice(), 4)
+        self.assertEqual(grafo.adicionar_vertice('x'), 'x')
+        self.assertEqual(grafo.calcular_caminho_minimo('x')['x'], 0)
+        self.assertEqual(grafo.calcular_caminho_minimo(1, 'x').distancia, math.inf)
+
+    def test_remover_em_lote(self):
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = Grafo(io.StringIO('4\n1 2\n2 3\n3 4\n'), backend=backend)
+                self.assertEqual(len(grafo.encontrar_componentes_conexos()), 1)
+                self.assertEqual(grafo.aplicar_lote([(2, 3), (4, 3)], remover=True), 2)
+                self.assertEqual(list(grafo.encontrar_componentes_conexos()), [[1, 2]])
+                self.assertEqual(grafo.estatisticas().qtd_arestas, 1)
+
+    def test_pesos_e_ponderacao(self):
+        grafo = Grafo(io.StringIO('3\n1 2\n2 3\n'))
+        grafo.adicionar_aresta(1, 3)
+        self.assertFalse(grafo.ponderado)
+        grafo.aplicar_lote([(1, 3, 0.5)])
+        self.assertTrue(grafo.ponderado)
+        self.assertEqual(grafo.calcular_caminho_minimo(1, 3).distancia, 0.5)
+
+    def test_remocao_em_ciclo_mantem_a_uniao(self):
+        grafo = Grafo(io.StringIO('3\n1 2\n2 3\n3 1\n'))
+        grafo.encontrar_componentes_conexos()
+        uniao = grafo._uniao
+        grafo.remover_aresta(1, 2)
+        self.assertIs(grafo._uniao, uniao)
+        grafo.remover_aresta(2, 3)
+        self.assertIsNone(grafo._uniao)
+        self.assertEqual(sorted(map(sorted, grafo.encontrar_componentes_conexos())), [[1, 3]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+import io
+import random
+import unittest
+
+from grafo import Grafo
+
+try:
+    import numpy as np
+except ImportError:  # A BFS por níveis exige o NumPy; sem ele os modos recorrem à fila
+    np = None
+
+
+def grafo_aleatorio(semente, backend='csr', dirigido=False, qtd_vertices=40, qtd_arestas=90):
+    rng = random.Random(semente)
+    linhas = [f'{rng.randint(1, qtd_vertices)} {rng.randint(1, qtd_vertices)}' for _ in range(qtd_arestas)]
+    texto = f'{qtd_vertices}\n' + '\n'.join(linhas) + '\n'
+    return Grafo(io.StringIO(texto), backend=backend, dirigido=dirigido)
+
+
+def profundidade_recursiva(grafo, origem):
+    """
+    DFS recursiva de referência sobre a adjacência do grafo, na ordem das linhas: [(vertice, nivel, pai)].
+    """
+    eventos, visitados = [], set()
+
+    def visitar(u, nivel, pai):
+        visitados.add(u)
+        eventos.append((grafo.vertices.rotulo(u), nivel, None if pai is None else grafo.vertices.rotulo(pai)))
+        for w in grafo.grafo[u]:
+            if w not in visitados:
+                visitar(w, nivel + 1, u)
+
+    visitar(grafo.vertices.indice(origem), 0, None)
+    return eventos
+
+
+class TestProfundidadeIterativa(unittest.TestCase):
+
+    def test_mesma_ordem_da_recursiva(self):
+        for semente in range(6):
+            for backend in ('csr', 'dict'):
+                for dirigido in (False, True):
+                    grafo = grafo_aleatorio(semente, backend, dirigido)
+                    for indice in list(grafo.grafo)[:5]:
+                        origem = grafo.vertices.rotulo(indice)
+                        with self.subTest(semente=semente, backend=backend, dirigido=dirigido, origem=origem):
+                            self.assertEqual(list(grafo.busca_profundidade(origem, None)), profundidade_recursiva(grafo, origem))
+
+    def test_caminho_mais_longo_que_o_limite_de_recursao(self):
+        n = 200000
+        texto = f'{n}\n' + ''.join(f'{v} {v + 1}\n' for v in range(1, n))
+        grafo = Grafo(io.StringIO(texto))
+        resultado = grafo.busca_profundidade(1, None)
+        self.assertEqual(len(resultado), n)
+        self.assertEqual(resultado.vertices()[-1], n)
+        self.assertEqual(max(resultado.niveis), n - 1)
+
+    def test_chamadas_repetidas_independentes(self):
+        grafo = Grafo(io.StringIO('5\n1 2\n2 3\n4 5\n'))
+        self.assertEqual(grafo.busca_profundidade(1, None).vertices(), [1, 2, 3])
+        self.assertEqual(grafo.busca_profundidade(4, None).vertices(), [4, 5])
+        self.assertEqual(grafo.busca_profundidade(3, None).vertices(), [3, 2, 1])
+
+    def test_profundidade_maxima(self):
+        grafo = Grafo(io.StringIO('6\n1 2\n2 3\n3 4\n1 5\n5 6\n'))
+        self.assertEqual(list(grafo.busca_profundidade(1, None, profundidade_maxima=1)), [(1, 0, None), (2, 1, 1), (5, 1, 1)])
+        self.assertEqual(grafo.busca_profundidade(1, None, profundidade_maxima=0).vertices(), [1])
+
+    def test_vertice_inexistente(self):
+        grafo = Grafo(io.StringIO('3\n1 2\n'))
+        with self.assertRaises(KeyError):
+            grafo.busca_profundidade(9, None)
+
+
+class TestEventosSobDemanda(unittest.TestCase):
+
+    ENTRADA = '7\n1 2\n1 3\n2 4\n3 5\n4 6\n5 7\n'
+
+    def test_mesmos_eventos_das_buscas(self):
+        for backend in ('csr', 'dict'):
+            grafo = Grafo(io.StringIO(self.ENTRADA), backend=backend)
+            with self.subTest(backend=backend):
+                self.assertEqual(list(grafo.iterar_busca_largura(1)), list(grafo.busca_largura(1, None)))
+                self.assertEqual(list(grafo.iterar_busca_profundidade(1)), list(grafo.busca_profundidade(1, None)))
+                self.assertEqual(
+                    list(grafo.iterar_busca_largura(1)),
+                    [(1, 0, None), (2, 1, 1), (3, 1, 1), (4, 2, 2), (5, 2, 3), (6, 3, 4), (7, 3, 5)],
+                )
+
+    def test_parar(self):
+        grafo = Grafo(io.StringIO(self.ENTRADA))
+        eventos = list(grafo.iterar_busca_largura(1, parar=lambda v, nivel, pai: v == 4))
+        self.assertEqual(eventos[-1], (4, 2, 2))
+        self.assertEqual(len(eventos), 4)
+        eventos = list(grafo.iterar_busca_profundidade(1, parar=lambda v, nivel, pai: nivel == 2))
+        self.assertEqual(eventos, [(1, 0, None), (2, 1, 1), (4, 2, 2)])
+
+    def test_profundidade_maxima(self):
+        grafo = Grafo(io.StringIO(self.ENTRADA))
+        self.assertEqual([v for v, _, _ in grafo.iterar_busca_largura(1, profundidade_maxima=1)], [1, 2, 3])
+        self.assertEqual([v for v, _, _ in grafo.iterar_busca_profundidade(1, profundidade_maxima=2)], [1, 2, 4, 3, 5])
+
+    def test_interromper_devolve_os_buffers(self):
+        grafo = Grafo(io.StringIO(self.ENTRADA))
+        eventos = grafo.iterar_busca_largura(1)
+        # Nada é percorrido antes do primeiro `next`
+        self.assertEqual(grafo._buffers._livres(), [])
+        self.assertEqual(next(eventos), (1, 0, None))
+        self.assertEqual(grafo._buffers._livres(), [])
+        for vertice, _, _ in eventos:
+            if vertice == 3:
+                break
+        eventos.close()
+        self.assertEqual(len(grafo._buffers._livres()), 1)
+        # Os buffers devolvidos voltam limpos: a próxima busca enxerga o grafo inteiro
+        self.assertEqual(len(list(grafo.iterar_busca_profundidade(7))), 7)
+        self.assertEqual(len(grafo._buffers._livres()), 1)
+
+
+@unittest.skipIf(np is None, 'requer o NumPy')
+class TestLarguraPorNiveis(unittest.TestCase):
+
+    def test_mesmos_eventos_da_fila(self):
+        for semente in range(6):
+            for backend in ('csr', 'dict'):
+                for dirigido in (False, True):
+                    grafo = grafo_aleatorio(semente, backend, dirigido)
+                    origem = grafo.vertices.rotulo(next(iter(grafo.grafo)))
+                    for direcao in ('saida', 'entrada'):
+                        with self.subTest(semente=semente, backend=backend, dirigido=dirigido, direcao=direcao):
+                            fila = grafo.busca_largura(origem, None, direcao=direcao)
+                            niveis = grafo.busca_largura(origem, None, direcao=direcao, modo='niveis')
+                            self.assertEqual(list(niveis), list(fila))
+
+    def test_direcional_mantem_os_niveis(self):
+        for semente in range(6):
+            grafo = grafo_aleatorio(semente, dirigido=semente % 2 == 1, qtd_vertices=200, qtd_arestas=1500)
+            origem = grafo.vertices.rotulo(next(iter(grafo.grafo)))
+            fila = grafo.busca_largura(origem, None)
+            direcional = grafo.busca_largura(origem, None, modo='direcional')
+            with self.subTest(semente=semente):
+                niveis = {v: nivel for v, nivel, _ in fila}
+                self.assertEqual({v: nivel for v, nivel, _ in direcional}, niveis)
+                for v, nivel, pai in direcional:
+                    if pai is not None:
+                        # Cada pai está no nível anterior e tem a aresta até o filho
+                        self.assertEqual(niveis[pai], nivel - 1)
+                        self.assertIn(grafo.vertices.indice(v), grafo.grafo[grafo.vertices.indice(pai)])
+
+    def test_profundidade_maxima(self):
+        grafo = Grafo(io.StringIO('6\n1 2\n2 3\n3 4\n4 5\n5 6\n'))
+        for modo in ('fila', 'niveis', 'direcional'):
+            with self.subTest(modo=modo):
+                self.assertEqual(grafo.busca_largura(1, None, profundidade_maxima=2, modo=modo).vertices(), [1, 2, 3])
+
+    def test_modo_desconhecido(self):
+        grafo = Grafo(io.StringIO('2\n1 2\n'))
+        with self.assertRaises(ValueError):
+            grafo.busca_largura(1, None, modo='paralelo')
+
+
+@unittest.skipIf(np is None, 'requer o NumPy')
+class TestConversaoParaCSR(unittest.TestCase):
+
+    def test_dict_convertido_uma_vez_por_versao(self):
+        grafo = Grafo(io.StringIO('4\n1 2\n2 3\n'), backend='dict', dirigido=True)
+        grafo.busca_largura(1, None, modo='niveis')
+        convertida = grafo._csr_convertidas['saida']
+        grafo.busca_largura(2, None, modo='direcional')
+        self.assertIs(grafo._csr_convertidas['saida'], convertida)
+
+        grafo.adicionar_aresta(3, 4)
+        self.assertEqual(grafo._csr_convertidas, {})
+        self.assertEqual(grafo.busca_largura(1, None, modo='niveis').vertices(), [1, 2, 3, 4])
+        self.assertEqual(grafo.busca_largura(4, None, direcao='entrada', modo='niveis').vertices(), [4, 3, 2, 1])
+        self.assertIsNot(grafo._csr_convertidas['saida'], convertida)
+
+    def test_csr_com_alteracoes_pendentes_nao_e_compactado(self):
+        grafo = Grafo(io.StringIO('4\n1 2\n2 3\n'))
+        grafo.adicionar_aresta(3, 4)
+        self.assertFalse(grafo.grafo.compactada)
+        self.assertEqual(grafo.busca_largura(1, None, modo='niveis').vertices(), [1, 2, 3, 4])
+        self.assertFalse(grafo.grafo.compactada)
+        self.assertIn('saida', grafo._csr_convertidas)
+
+    def test_csr_compactado_dispensa_a_copia(self):
+        grafo = Grafo(io.StringIO('4\n1 2\n2 3\n'))
+        grafo.busca_largura(1, None, modo='niveis')
+        self.assertEqual(grafo._csr_convertidas, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+from array import array
+import gc
+import io
+import os
+import random
+import struct
+import tempfile
+import unittest
+
+from grafo import Grafo
+from persistencia import ALINHAMENTO, CABECALHO, SECAO, VERSAO, carregar_snapshot, salvar_snapshot
+
+
+class TestArquivo(unittest.TestCase):
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, 'secoes.snap')
+
+    def tearDown(self):
+        # As seções mapeadas precisam ser liberadas antes de apagar o arquivo
+        gc.collect()
+        self.pasta.cleanup()
+
+    def test_secoes_ida_e_volta(self):
+        secoes = {
+            'inteiros': array('q', [0, -3, 2 ** 40]),
+            'reais': array('d', [1.5, -0.25]),
+            'bytes': array('B', b'abc'),
+            'vazia': array('i'),
+        }
+        salvar_snapshot(self.caminho, secoes, 7, flags=3)
+        for mmap in (True, False):
+            with self.subTest(mmap=mmap):
+                lidas, qtd_vertices, flags = carregar_snapshot(self.caminho, mmap=mmap)
+                self.assertEqual((qtd_vertices, flags), (7, 3))
+                self.assertEqual(set(lidas), set(secoes))
+                for nome, buffer in secoes.items():
+                    self.assertEqual(list(lidas[nome]), list(buffer))
+                    self.assertEqual(memoryview(lidas[nome]).format, buffer.typecode)
+                del lidas
+
+    def test_secoes_alinhadas(self):
+        salvar_snapshot(self.caminho, {'a': array('B', b'x'), 'b': array('d', [1.0])}, 1)
+        with open(self.caminho, 'rb') as arquivo:
+            qtd_secoes = CABECALHO.unpack(arquivo.read(CABECALHO.size))[4]
+            deslocamentos = [SECAO.unpack(arquivo.read(SECAO.size))[2] for _ in range(qtd_secoes)]
+        self.assertTrue(all(deslocamento % ALINHAMENTO == 0 for deslocamento in deslocamentos))
+
+    def test_arquivo_invalido(self):
+        with open(self.caminho, 'wb') as arquivo:
+            arquivo.write(b'5\n1 2\n'.ljust(CABECALHO.size))
+        with self.assertRaises(ValueError):
+            carregar_snapshot(self.caminho)
+
+    def test_versao_futura(self):
+        salvar_snapshot(self.caminho, {}, 0)
+        with open(self.caminho, 'r+b') as arquivo:
+            arquivo.seek(8)
+            arquivo.write(struct.pack('<I', VERSAO + 1))
+        with self.assertRaises(ValueError):
+            carregar_snapshot(self.caminho)
+
+
+class TestSnapshotGrafo(unittest.TestCase):
+    """
+    `Grafo.salvar` seguido de `Grafo.carregar` preserva as arestas, os rótulos e as respostas.
+    """
+
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, 'grafo.snap')
+
+    def tearDown(self):
+        gc.collect()
+        self.pasta.cleanup()
+
+    def conferir_igual(self, original, carregado):
+        self.assertEqual(carregado.dirigido, original.dirigido)
+        self.assertEqual(carregado.ponderado, original.ponderado)
+        self.assertEqual(carregado.qtdVertices, original.qtdVertices)
+        self.assertEqual(list(carregado.vertices), list(original.vertices))
+        for v in original.vertices:
+            if original._indice(v) in original.grafo:
+                self.assertEqual(dict(carregado.calcular_caminho_minimo(v)), dict(original.calcular_caminho_minimo(v)))
+        self.assertEqual(
+            sorted(sorted(c) for c in carregado.encontrar_componentes_conexos()),
+            sorted(sorted(c) for c in original.encontrar_componentes_conexos()),
+        )
+        self.assertEqual(carregado.estatisticas().qtd_arestas, original.estatisticas().qtd_arestas)
+
+    def test_ida_e_volta(self):
+        rng = random.Random(51)
+        for caso in range(8):
+            n = rng.randint(2, 10)
+            ponderado = caso % 2 == 0
+            linhas = []
+            for _ in range(2 * n):
+                u, v = rng.randint(1, n), rng.randint(1, n)
+                linhas.append(f'{u} {v} {rng.randint(1, 9)}' if ponderado else f'{u} {v}')
+            texto = f'{n}\n' + '\n'.join(linhas) + '\n'
+            for backend in ('csr', 'dict'):
+                for dirigido in (False, True):
+                    original = Grafo(io.StringIO(texto), backend=backend, dirigido=dirigido)
+                    if caso % 3 == 0:
+                        # Alterações ainda não compactadas também são gravadas
+                        original.adicionar_aresta(1, n + 1, 3)
+                    original.salvar(self.caminho)
+                    for backend_carga in ('csr', 'dict'):
+                        for mmap in (True, False):
+                            with self.subTest(caso=caso, backend=backend, dirigido=dirigido,
+                                              backend_carga=backend_carga, mmap=mmap):
+                                carregado = Grafo.carregar(self.caminho, mmap=mmap, backend=backend_carga)
+                                self.conferir_igual(original, carregado)
+                                del carregado
+
+    def test_alterar_depois_de_carregar(self):
+        for dirigido in (False, True):
+            Grafo(io.StringIO('4\n1 2 4\n2 3 1\n3 4 1\n'), dirigido=dirigido).salvar(self.caminho)
+            for mmap in (True, False):
+                with self.subTest(dirigido=dirigido, mmap=mmap):
+                    carregado = Grafo.carregar(self.caminho, mmap=mmap)
+                    carregado.adicionar_aresta(1, 4, 1)
+                    carregado.remover_aresta(2, 3)
+                    self.assertEqual(carregado.calcular_caminho_minimo(1, 4).distancia, 1)
+                    self.assertEqual(carregado.calcular_caminho_minimo(1, 2).distancia, 4)
+                    # O arquivo mapeado não é alterado
+                    self.assertEqual(Grafo.carregar(self.caminho).calcular_caminho_minimo(1, 4).distancia, 6)
+                    del carregado
+
+    def test_rotulos_esparsos_e_textuais(self):
+        original = Grafo(io.StringIO('3\n10 5000 2\n5000 1000000000000 3\n'))
+        original.adicionar_aresta('a', 10, 1)
+        original.salvar(self.caminho)
+        carregado = Grafo.carregar(self.caminho)
+        self.assertEqual(sorted(carregado.vertices, key=str), sorted(original.vertices, key=str))
+        self.assertEqual(carregado.calcular_caminho_minimo('a', 10 ** 12).distancia, 6)
+        del carregado
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+import contextlib
+import io
+import math
+import os
+import tempfile
+import unittest
+
+from grafo import Grafo
+import relatorios
+from relatorios import escrever_busca, escrever_caminho, escrever_caminhos
+
+# O vértice 4 não tem arestas e o 5 só existe na contagem de vértices
+ENTRADA = '5\n1 2 2\n2 3 1\n1 3 5\n4 4 1\n'
+
+
+class ArquivoContador(io.StringIO):
+
+    def __init__(self):
+        super().__init__()
+        self.escritas = 0
+
+    def write(self, texto):
+        self.escritas += 1
+        return super().write(texto)
+
+
+class TestSemEfeitosColaterais(unittest.TestCase):
+
+    def test_consultas_sem_saida_nao_escrevem(self):
+        pasta = tempfile.TemporaryDirectory()
+        anterior = os.getcwd()
+        os.chdir(pasta.name)
+        try:
+            impresso = io.StringIO()
+            with contextlib.redirect_stdout(impresso):
+                grafo = Grafo(io.StringIO(ENTRADA))
+                grafo.calcular_caminho_minimo(1)
+                grafo.calcular_caminho_minimo(1, 3)
+                grafo.busca_profundidade(1, None)
+                grafo.busca_largura(1, None)
+                grafo.encontrar_componentes_conexos()
+            self.assertEqual(impresso.getvalue(), '')
+            self.assertEqual(os.listdir('.'), [])
+        finally:
+            os.chdir(anterior)
+            pasta.cleanup()
+
+
+class TestResultadoCaminho(unittest.TestCase):
+
+    def setUp(self):
+        self.grafo = Grafo(io.StringIO(ENTRADA))
+
+    def test_desempacotar(self):
+        resultado = self.grafo.calcular_caminho_minimo(1, 3)
+        caminho, distancia = resultado
+        self.assertEqual((caminho, distancia), ([1, 2, 3], 3))
+        self.assertEqual((resultado.origem, resultado.destino), (1, 3))
+        self.assertTrue(resultado.alcancavel)
+
+    def test_inalcancavel(self):
+        resultado = self.grafo.calcular_caminho_minimo(1, 4)
+        self.assertEqual(list(resultado), [[], math.inf])
+        self.assertFalse(resultado.alcancavel)
+
+
+class TestResultadoCaminhos(unittest.TestCase):
+
+    def setUp(self):
+        self.grafo = Grafo(io.StringIO(ENTRADA))
+
+    def test_dicionario_de_distancias(self):
+        resultado = self.grafo.calcular_caminho_minimo(1)
+        self.assertEqual(dict(resultado), {1: 0, 2: 2, 3: 3, 4: math.inf})
+        self.assertEqual(resultado.caminho(3), [1, 2, 3])
+        self.assertEqual(resultado.caminho(4), [])
+        with self.assertRaises(KeyError):
+            resultado[9]
+
+    def test_origem_sem_arestas_e_listada(self):
+        resultado = self.grafo.calcular_caminho_minimo(5)
+        self.assertEqual(resultado[5], 0)
+        self.assertIn(5, list(resultado))
+        self.assertEqual(resultado[1], math.inf)
+
+    def test_fixado_na_criacao(self):
+        resultado = self.grafo.calcular_caminho_minimo(1)
+        self.grafo.adicionar_aresta(3, 6, 1)
+        self.grafo.adicionar_aresta(1, 4, 1)
+        self.assertEqual(dict(resultado), {1: 0, 2: 2, 3: 3, 4: math.inf})
+        self.assertEqual(self.grafo.calcular_caminho_minimo(1)[6], 4)
+
+    def test_como_arrays(self):
+        resultado = self.grafo.calcular_caminho_minimo(2)
+        indice = self.grafo.vertices.indice
+        distancias, pais = resultado.como_arrays(len(self.grafo.vertices))
+        self.assertEqual(distancias[indice(1)], 2)
+        self.assertEqual(distancias[indice(4)], math.inf)
+        self.assertEqual((pais[indice(2)], pais[indice(4)]), (-1, -1))
+        self.assertEqual(pais[indice(1)], indice(2))
+
+    def test_rotulos_textuais(self):
+        grafo = Grafo(io.StringIO('3\nx y 1\ny z 2\n'))
+        resultado = grafo.calcular_caminho_minimo('x')
+        self.assertEqual(dict(resultado), {'x': 0, 'y': 1, 'z': 3})
+        self.assertEqual(resultado.caminho('z'), ['x', 'y', 'z'])
+
+
+class TestResultadoBusca(unittest.TestCase):
+
+    def test_eventos_com_rotulos(self):
+        grafo = Grafo(io.StringIO(ENTRADA))
+        profundidade = grafo.busca_profundidade(1, None)
+        self.assertEqual(profundidade.tipo, 'profundidade')
+        self.assertEqual(list(profundidade), [(1, 0, None), (2, 1, 1), (3, 2, 2)])
+        largura = grafo.busca_largura(1, None)
+        self.assertEqual(list(largura), [(1, 0, None), (2, 1, 1), (3, 1, 1)])
+        self.assertEqual((largura.vertices(), len(largura)), ([1, 2, 3], 3))
+
+
+class TestRelatorios(unittest.TestCase):
+    """
+    A camada de relatórios reproduz os formatos de 'saida.txt' a partir dos resultados.
+    """
+
+    def setUp(self):
+        self.grafo = Grafo(io.StringIO(ENTRADA))
+
+    def test_caminhos(self):
+        destino = io.StringIO()
+        escrever_caminho(self.grafo.calcular_caminho_minimo(1, 3), destino)
+        escrever_caminho(self.grafo.calcular_caminho_minimo(1, 4), destino)
+        self.assertEqual(destino.getvalue(), (
+            'Caminho mínimo de 1 para 3 usando Dial: [1, 2, 3]\nDistância: 3.0\n'
+            '4 não é acessível a partir de 1\n'
+        ))
+        # O parâmetro `saida` da consulta usa o mesmo formato
+        saida = io.StringIO()
+        self.grafo.calcular_caminho_minimo(1, 3, saida=saida)
+        self.assertEqual(saida.getvalue(), 'Caminho mínimo de 1 para 3 usando Dial: [1, 2, 3]\nDistância: 3.0\n')
+
+    def test_buscas(self):
+        destino = io.StringIO()
+        escrever_busca(self.grafo.busca_profundidade(1, None), destino)
+        escrever_busca(self.grafo.busca_largura(1, None), destino)
+        self.assertEqual(destino.getvalue(), (
+            '--------------BUSCA POR PROFUNDIDADE--------------\n\n'
+            'Vertice: 1 -> Nivel: 0 | Pai: Nenhum \n'
+            'Vertice: 2 -> Nivel: 1 | Pai: 1 \n'
+            'Vertice: 3 -> Nivel: 2 | Pai: 2 \n'
+            '\n 1 -> 2 -> 3 \n\n'
+            '--------------BUSCA POR LARGURA--------------\n\n'
+            'Vertice: 1 -> Nivel: 0 | Pai: Nenhum\n'
+            'Vertice: 2 -> Nivel: 1 | Pai: 1\n'
+            'Vertice: 3 -> Nivel: 1 | Pai: 1\n'
+            '\n1 -> 2 -> 3\n\n'
+        ))
+
+    def test_escritas_em_lotes(self):
+        n = 3 * relatorios.LINHAS_POR_ESCRITA
+        grafo = Grafo(io.StringIO(f'{n}\n' + ''.join(f'1 {v}\n' for v in range(2, n + 1))))
+        destino = ArquivoContador()
+        escrever_caminhos(grafo.calcular_caminho_minimo(1), destino)
+        self.assertEqual(len(destino.getvalue().splitlines()), 2 * n)
+        self.assertLessEqual(destino.escritas, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
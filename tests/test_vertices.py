@@ -0,0 +1,107 @@
+from array import array
+import io
+import math
+import random
+import unittest
+
+from grafo import Grafo
+from vertices import TabelaVertices
+
+
+def distancias_referencia(arestas, origem):
+    # Uma aresta repetida na entrada fica com o último peso lido
+    pesos = {frozenset((u, v)): (u, v, peso) for u, v, peso in arestas}
+    arestas = list(pesos.values())
+    vertices = {x for u, v, _ in arestas for x in (u, v)}
+    distancias = {v: math.inf for v in vertices}
+    distancias[origem] = 0
+    for _ in range(len(vertices)):
+        for u, v, peso in arestas:
+            distancias[v] = min(distancias[v], distancias[u] + peso)
+            distancias[u] = min(distancias[u], distancias[v] + peso)
+    return distancias
+
+
+class TestTabelaVertices(unittest.TestCase):
+
+    def test_faixa(self):
+        tabela = TabelaVertices.faixa(1, 4)
+        self.assertEqual((tabela.indice(1), tabela.indice(4), tabela.rotulo(2)), (0, 3, 3))
+        self.assertNotIn(5, tabela)
+        self.assertNotIn(True, tabela)
+        # O próximo inteiro estende a faixa; outros rótulos vão para o final
+        self.assertEqual(tabela.internar(5), 4)
+        self.assertIsInstance(tabela.base, range)
+        self.assertEqual(tabela.internar('x'), 5)
+        self.assertEqual(list(tabela), [1, 2, 3, 4, 5, 'x'])
+        self.assertEqual(tabela.proximo_rotulo(), 6)
+
+    def test_de_arestas_dentro_do_cabecalho(self):
+        # Rótulos dentro de 1..n mantêm todos os vértices declarados, mesmo os isolados
+        tabela, origens, destinos = TabelaVertices.de_arestas(array('q', [1, 2]), array('q', [2, 4]), 6)
+        self.assertEqual(list(tabela), [1, 2, 3, 4, 5, 6])
+        self.assertEqual((list(origens), list(destinos)), ([0, 1], [1, 3]))
+
+    def test_de_arestas_fora_do_cabecalho(self):
+        tabela, origens, destinos = TabelaVertices.de_arestas(array('q', [7, 8]), array('q', [8, 9]), 3)
+        self.assertEqual(list(tabela), [7, 8, 9])
+        self.assertEqual((list(origens), list(destinos)), ([0, 1], [1, 2]))
+        tabela, origens, destinos = TabelaVertices.de_arestas(array('q', [10, 5000]), array('q', [5000, 2 ** 40]), 3)
+        self.assertEqual(list(tabela), [10, 5000, 2 ** 40])
+        self.assertEqual((list(origens), list(destinos)), ([0, 1], [1, 2]))
+        self.assertNotIn(11, tabela)
+        with self.assertRaises(KeyError):
+            tabela.indice(11)
+
+    def test_rotulos_textuais(self):
+        tabela, origens, destinos = TabelaVertices.de_arestas(['b', 'a'], ['a', 'c'])
+        self.assertEqual(list(tabela), ['b', 'a', 'c'])
+        self.assertEqual(tabela.rotulos(destinos), ['a', 'c'])
+        self.assertEqual(tabela.proximo_rotulo(), 1)
+
+
+class TestRotulosEsparsos(unittest.TestCase):
+    """
+    Grafos com rótulos fora da faixa do cabeçalho respondem como o mesmo grafo com rótulos 1..n.
+    """
+
+    def test_sem_indices_fantasmas(self):
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = Grafo(io.StringIO('3\n1 500\n500 1000\n'), backend=backend)
+                self.assertEqual(list(grafo.vertices), [1, 500, 1000])
+                self.assertEqual(grafo.grafo.qtd_indices, 3)
+                self.assertNotIn(2, grafo.vertices)
+                with self.assertRaises(KeyError):
+                    grafo.calcular_caminho_minimo(2)
+                self.assertEqual(grafo.calcular_caminho_minimo(1, 1000).caminho, [1, 500, 1000])
+
+    def test_mesmas_respostas_com_rotulos_espalhados(self):
+        rng = random.Random(61)
+        for caso in range(30):
+            n = rng.randint(2, 10)
+            traduzir = dict(zip(range(1, n + 1), sorted(rng.sample(range(2, 10 ** 9), n))))
+            arestas = [(rng.randint(1, n), rng.randint(1, n), rng.randint(1, 9)) for _ in range(2 * n)]
+            espalhadas = [(traduzir[u], traduzir[v], peso) for u, v, peso in arestas]
+            texto = f'{n}\n' + ''.join(f'{u} {v} {peso}\n' for u, v, peso in espalhadas)
+            origem = espalhadas[0][0]
+            esperado = distancias_referencia(espalhadas, origem)
+            for backend in ('csr', 'dict'):
+                with self.subTest(caso=caso, backend=backend):
+                    grafo = Grafo(io.StringIO(texto), backend=backend)
+                    self.assertEqual(sorted(grafo.vertices), sorted(esperado))
+                    self.assertEqual(dict(grafo.calcular_caminho_minimo(origem)), esperado)
+
+    def test_rotulos_textuais(self):
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = Grafo(io.StringIO('3\nrecife olinda 2\nolinda paulista 3\n'), backend=backend)
+                self.assertEqual(sorted(grafo.vertices), ['olinda', 'paulista', 'recife'])
+                self.assertEqual(grafo.calcular_caminho_minimo('recife', 'paulista').distancia, 5)
+                self.assertEqual(grafo.busca_largura('paulista', None).vertices(), ['paulista', 'olinda', 'recife'])
+                grafo.adicionar_aresta('recife', 7, 1)
+                self.assertEqual(grafo.calcular_caminho_minimo(7, 'olinda').caminho, [7, 'recife', 'olinda'])
+
+
+if __name__ == '__main__':
+    unittest.main()
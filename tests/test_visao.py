@@ -0,0 +1,135 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import io
+import math
+import os
+import random
+import unittest
+
+from consultas import ExecutorConsultas
+from grafo import Grafo, VisaoGrafo
+
+
+def grafo_aleatorio(semente, n=60, m=180, backend='csr', dirigido=False):
+    rng = random.Random(semente)
+    linhas = [f'{rng.randint(1, n)} {rng.randint(1, n)} {rng.randint(1, 9)}' for _ in range(m)]
+    return Grafo(io.StringIO(f'{n}\n' + '\n'.join(linhas) + '\n'), backend=backend, dirigido=dirigido)
+
+
+class TestVisaoCongelada(unittest.TestCase):
+
+    def test_nao_ve_alteracoes_posteriores(self):
+        for backend in ('csr', 'dict'):
+            for dirigido in (False, True):
+                with self.subTest(backend=backend, dirigido=dirigido):
+                    grafo = Grafo(io.StringIO('4\n1 2 1\n2 3 2\n'), backend=backend, dirigido=dirigido)
+                    grafo.adicionar_aresta(3, 4, 1)
+                    visao = grafo.congelar()
+                    self.assertIsInstance(visao, VisaoGrafo)
+                    grafo.remover_aresta(2, 3)
+                    grafo.adicionar_aresta(1, 4, 10)
+                    self.assertEqual(visao.calcular_caminho_minimo(1, 4).distancia, 4)
+                    self.assertEqual(grafo.calcular_caminho_minimo(1, 4).distancia, 10)
+                    self.assertEqual(len(visao.encontrar_componentes_conexos()), 1)
+                    self.assertEqual(visao.estatisticas().qtd_arestas, 3)
+
+    def test_somente_leitura(self):
+        visao = Grafo(io.StringIO('3\n1 2\n')).congelar()
+        alteracoes = (
+            lambda: visao.adicionar_aresta(1, 3),
+            lambda: visao.remover_aresta(1, 2),
+            lambda: visao.adicionar_vertice(),
+            lambda: visao.aplicar_lote([(2, 3)]),
+            lambda: visao.armazenar_grafo(),
+        )
+        for alterar in alteracoes:
+            with self.assertRaises(TypeError):
+                alterar()
+        self.assertIs(visao.congelar(), visao)
+
+    def test_compartilha_os_buffers(self):
+        grafo = grafo_aleatorio(1)
+        visao = grafo.congelar()
+        self.assertIs(visao.grafo._buffer_vizinhos, grafo.grafo._buffer_vizinhos)
+        # Com alterações pendentes, a visão copia e o original continua sem compactar
+        grafo.adicionar_aresta(1, 61, 1)
+        copia = grafo.congelar()
+        self.assertFalse(grafo.grafo.compactada)
+        self.assertIsNot(copia.grafo._buffer_vizinhos, grafo.grafo._buffer_vizinhos)
+        self.assertEqual(copia.calcular_caminho_minimo(61, 1).distancia, 1)
+
+    def test_pesos_negativos(self):
+        grafo = Grafo(io.StringIO('3\n1 2 4\n2 3 -2\n1 3 3\n'), dirigido=True)
+        visao = grafo.congelar()
+        self.assertEqual(set(visao._potenciais), {'saida', 'entrada'})
+        self.assertEqual(visao.calcular_caminho_minimo(1, 3).distancia, 2)
+        self.assertEqual(visao.calcular_caminho_minimo(3, direcao='entrada')[1], 2)
+
+    def test_consultas_em_varias_threads(self):
+        for backend in ('csr', 'dict'):
+            with self.subTest(backend=backend):
+                grafo = grafo_aleatorio(2, backend=backend)
+                consultas = [(origem, destino) for origem in range(1, 61, 3) for destino in range(1, 61, 7)]
+                esperado = {
+                    consulta: grafo.calcular_caminho_minimo(*consulta).distancia for consulta in consultas
+                }
+                largura = {origem: grafo.busca_largura(origem, None).vertices() for origem, _ in consultas}
+                visao = grafo.congelar(capacidade_cache=4)
+
+                def consultar(consulta):
+                    origem, destino = consulta
+                    return (
+                        visao.calcular_caminho_minimo(origem, destino).distancia,
+                        visao.calcular_caminho_minimo(origem)[destino],
+                        visao.busca_largura(origem, None).vertices(),
+                    )
+
+                with ThreadPoolExecutor(max_workers=8) as executor:
+                    respostas = list(executor.map(consultar, consultas * 3))
+                for consulta, (distancia, da_arvore, ordem) in zip(consultas * 3, respostas):
+                    self.assertEqual(distancia, esperado[consulta])
+                    self.assertEqual(da_arvore, esperado[consulta])
+                    self.assertEqual(ordem, largura[consulta[0]])
+
+
+class TestExecutorConsultas(unittest.TestCase):
+
+    def consultar(self, executor):
+        async def principal():
+            return await asyncio.gather(
+                executor.caminho_minimo(1, 3),
+                executor.distancias(1),
+                executor.busca_largura(1),
+                executor.busca_profundidade(4, direcao='entrada'),
+            )
+
+        return asyncio.run(principal())
+
+    def conferir(self, respostas):
+        caminho, distancias, largura, profundidade = respostas
+        self.assertEqual((caminho.caminho, caminho.distancia), ([1, 2, 3], 3))
+        self.assertEqual(distancias, {1: 0, 2: 1, 3: 3, 4: math.inf})
+        self.assertEqual(largura, [(1, 0, None), (2, 1, 1), (3, 1, 1)])
+        self.assertEqual(profundidade, [(4, 0, None)])
+
+    def grafo(self):
+        return Grafo(io.StringIO('4\n1 2 1\n2 3 2\n1 3 5\n4 4 1\n'), dirigido=True)
+
+    def test_threads(self):
+        with ExecutorConsultas(self.grafo(), workers=2) as executor:
+            self.conferir(self.consultar(executor))
+
+    def test_processos(self):
+        executor = ExecutorConsultas(self.grafo(), workers=2, processos=True)
+        temporario = executor._temporario
+        try:
+            self.conferir(self.consultar(executor))
+        finally:
+            executor.fechar()
+        # O snapshot temporário mapeado pelos processos é removido ao fechar
+        self.assertIsNotNone(temporario)
+        self.assertFalse(os.path.exists(temporario))
+
+
+if __name__ == '__main__':
+    unittest.main()
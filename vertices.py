@@ -0,0 +1,249 @@
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele a tradução é feita rótulo a rótulo
+    np = None
+
+
+class TabelaVertices:
+    """
+    Tabela de internação: associa os rótulos externos dos vértices a índices densos 0..n-1.
+
+    Todos os algoritmos trabalham com os índices, que endereçam diretamente os vetores da
+    adjacência e das buscas; os rótulos só aparecem na entrada e na saída do `Grafo`.
+
+    Rótulos inteiros formam a base da tabela, em ordem crescente, de modo que a ordem dos índices
+    é a ordem dos rótulos. Se a base é uma faixa contínua (o caso comum, vértices 1..n), ela é
+    guardada como `range` e a tradução é aritmética; caso contrário, como vetor ordenado consultado
+    por busca binária. Rótulos de outros tipos (por exemplo, strings) e vértices criados depois
+    da carga são acrescentados ao final, com um dicionário para a consulta reversa.
+
+    Atributos:
+        base (range | array): Rótulos inteiros ordenados, com índices 0..len(base)-1.
+        extras (list): Rótulos acrescentados depois da base, na ordem de inserção.
+    """
+
+    def __init__(self, base=range(0), extras=()):
+        self.base = base
+        self.extras = []
+        self._indice_extra = {}
+        for rotulo in extras:
+            self.internar(rotulo)
+
+    @classmethod
+    def faixa(cls, inicio, quantidade):
+        """
+        Tabela com os rótulos inicio..inicio+quantidade-1 (índice = rótulo - inicio).
+        """
+        return cls(range(inicio, inicio + quantidade))
+
+    @classmethod
+    def de_arestas(cls, origens, destinos, qtd_vertices=0):
+        """
+        Interna os rótulos de uma lista de arestas e traduz as extremidades para índices.
+
+        Com rótulos inteiros que cabem na faixa do cabeçalho (1..qtd_vertices, ou
+        0..qtd_vertices-1 se algum rótulo for 0), todos os vértices declarados entram na tabela,
+        mesmo isolados, e a tradução é só uma subtração. Se algum rótulo cai fora dessa faixa, a
+        tabela tem exatamente os rótulos das arestas: como faixa, se forem contínuos, ou como
+        vetor ordenado, sem índices para os rótulos ausentes entre eles.
+
+        Parâmetros:
+            origens (sequence): Rótulo do primeiro vértice de cada aresta.
+            destinos (sequence): Rótulo do segundo vértice de cada aresta.
+            qtd_vertices (int): Quantidade de vértices declarada no cabeçalho.
+
+        Retorna:
+            tuple: (tabela, origens, destinos), com as extremidades como vetores de índices.
+        """
+
+        if isinstance(origens, list) or isinstance(destinos, list):
+            # Rótulos genéricos: índices na ordem da primeira ocorrência
+            tabela = cls()
+            internar = tabela.internar
+            indices_o = array('q', (internar(r) for r in origens))
+            indices_d = array('q', (internar(r) for r in destinos))
+            return tabela, indices_o, indices_d
+
+        if np is not None:
+            o = np.asarray(origens, dtype=np.int64)
+            d = np.asarray(destinos, dtype=np.int64)
+            minimo = int(min(o.min(), d.min())) if len(o) else 1
+            maximo = int(max(o.max(), d.max())) if len(o) else 0
+        else:
+            minimo = min(min(origens, default=1), min(destinos, default=1))
+            maximo = max(max(origens, default=0), max(destinos, default=0))
+
+        inicio = 0 if minimo == 0 else 1
+        if minimo >= inicio and maximo < inicio + qtd_vertices or not len(origens):
+            tabela = cls.faixa(inicio, qtd_vertices)
+        else:
+            # Rótulos fora da faixa do cabeçalho: ele passa a valer só como contagem, e apenas os
+            # rótulos que aparecem nas arestas recebem índice (nenhum índice fantasma entre eles)
+            if np is not None:
+                rotulos = np.unique(np.concatenate((o, d)))
+                if int(rotulos[-1]) - int(rotulos[0]) + 1 == len(rotulos):
+                    tabela = cls.faixa(int(rotulos[0]), len(rotulos))
+                    return tabela, tabela.indices(o), tabela.indices(d)
+                return cls(array('q', rotulos.tobytes())), *cls._indices_ordenados(rotulos, o, d)
+            rotulos = sorted(set(origens).union(destinos))
+            if rotulos[-1] - rotulos[0] + 1 == len(rotulos):
+                tabela = cls.faixa(rotulos[0], len(rotulos))
+            else:
+                tabela = cls(array('q', rotulos))
+
+        return tabela, tabela.indices(origens), tabela.indices(destinos)
+
+    @staticmethod
+    def _indices_ordenados(rotulos, origens, destinos):
+        return (
+            array('q', np.searchsorted(rotulos, origens).astype(np.int64).tobytes()),
+            array('q', np.searchsorted(rotulos, destinos).astype(np.int64).tobytes()),
+        )
+
+    def __len__(self):
+        return len(self.base) + len(self.extras)
+
+    def __iter__(self):
+        yield from self.base
+        yield from self.extras
+
+    def __contains__(self, rotulo):
+        try:
+            self.indice(rotulo)
+        except KeyError:
+            return False
+        return True
+
+    def indice(self, rotulo):
+        """
+        Retorna o índice denso do rótulo.
+
+        Exceções:
+            KeyError: Se o rótulo não estiver na tabela.
+        """
+        if isinstance(rotulo, int) and not isinstance(rotulo, bool) or np is not None and isinstance(rotulo, np.integer):
+            rotulo = int(rotulo)
+            base = self.base
+            if isinstance(base, range):
+                if rotulo in base:
+                    return rotulo - base.start
+            else:
+                i = bisect_left(base, rotulo)
+                if i < len(base) and base[i] == rotulo:
+                    return i
+        try:
+            return self._indice_extra[rotulo]
+        except (KeyError, TypeError):
+            raise KeyError(rotulo) from None
+
+    def rotulo(self, indice):
+        """
+        Retorna o rótulo externo do índice denso.
+        """
+        if indice < len(self.base):
+            return self.base[indice]
+        return self.extras[indice - len(self.base)]
+
+    def internar(self, rotulo):
+        """
+        Retorna o índice do rótulo, acrescentando-o ao final da tabela se ele ainda não existir.
+        """
+        try:
+            return self.indice(rotulo)
+        except KeyError:
+            indice = len(self)
+            base = self.base
+            if isinstance(base, range) and not self.extras and rotulo == base.stop and type(rotulo) is int:
+                # O próximo inteiro da faixa apenas a estende, mantendo a tradução aritmética
+                self.base = range(base.start, base.stop + 1)
+                return indice
+            self.extras.append(rotulo)
+            self._indice_extra[rotulo] = indice
+            return indice
+
+    def indices(self, rotulos):
+        """
+        Traduz uma sequência de rótulos para um vetor de índices.
+
+        Exceções:
+            KeyError: Se algum rótulo não estiver na tabela.
+        """
+        base = self.base
+        if isinstance(base, range) and not self.extras and not isinstance(rotulos, list):
+            inicio = base.start
+            if np is not None:
+                valores = np.asarray(rotulos, dtype=np.int64)
+                if len(valores) and (valores.min() < inicio or valores.max() >= base.stop):
+                    raise KeyError(int(valores[(valores < inicio) | (valores >= base.stop)][0]))
+                return array('q', (valores - inicio).tobytes())
+            if len(rotulos) and (min(rotulos) < inicio or max(rotulos) >= base.stop):
+                raise KeyError(next(r for r in rotulos if r not in base))
+            return array('q', (r - inicio for r in rotulos))
+        indice = self.indice
+        return array('q', (indice(r) for r in rotulos))
+
+    def rotulos(self, indices):
+        """
+        Traduz uma sequência de índices para a lista dos rótulos correspondentes.
+        """
+        base = self.base
+        if isinstance(base, range) and not self.extras:
+            inicio = base.start
+            return [inicio + i for i in indices]
+        rotulo = self.rotulo
+        return [rotulo(i) for i in indices]
+
+    def proximo_rotulo(self):
+        """
+        Sugere um rótulo inteiro livre: o maior rótulo inteiro da tabela mais 1.
+        """
+        inteiros = [r for r in self.extras if type(r) is int]
+        if len(self.base):
+            inteiros.append(self.base[-1])
+        return max(inteiros, default=0) + 1
+
+    def como_secoes(self):
+        """
+        Retorna os buffers que representam a tabela em um snapshot (veja `persistencia`).
+
+        A base é gravada como [início, quantidade] quando é uma faixa, ou como o vetor ordenado;
+        os rótulos acrescentados são gravados como texto UTF-8 com offsets e o tipo de cada um.
+        """
+        if isinstance(self.base, range):
+            secoes = {'rotulos_faixa': array('q', [self.base.start, len(self.base)])}
+        else:
+            secoes = {'rotulos_base': self.base}
+        if self.extras:
+            textos = [str(rotulo).encode() for rotulo in self.extras]
+            offsets = array('q', [0])
+            for texto in textos:
+                offsets.append(offsets[-1] + len(texto))
+            secoes['rotulos_extras'] = array('B', b''.join(textos))
+            secoes['rotulos_offsets'] = offsets
+            secoes['rotulos_tipos'] = array('B', [type(rotulo) is int for rotulo in self.extras])
+        return secoes
+
+    @classmethod
+    def de_secoes(cls, secoes, qtd_indices):
+        """
+        Reconstrói a tabela gravada por `como_secoes`.
+
+        Snapshots sem rótulos (versão 1) usavam o próprio id como índice: a tabela é a faixa 0..qtd_indices-1.
+        """
+        if 'rotulos_faixa' in secoes:
+            inicio, quantidade = secoes['rotulos_faixa']
+            tabela = cls.faixa(inicio, quantidade)
+        elif 'rotulos_base' in secoes:
+            tabela = cls(secoes['rotulos_base'])
+        else:
+            return cls.faixa(0, qtd_indices)
+        if 'rotulos_extras' in secoes:
+            textos = bytes(secoes['rotulos_extras'])
+            offsets = secoes['rotulos_offsets']
+            for i, inteiro in enumerate(secoes['rotulos_tipos']):
+                texto = textos[offsets[i]:offsets[i + 1]].decode()
+                tabela.internar(int(texto) if inteiro else texto)
+        return tabela